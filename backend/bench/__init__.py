@@ -0,0 +1,34 @@
+"""
+Load generation and latency benchmarks for the fractal API
+
+Runs scenario profiles (scenarios.PROFILES) against a local base URL:
+either the FastAPI gateway (server.py, port 8001) or the TypeScript
+backend directly (port 8002). Records p50/p95/p99 latency, throughput and
+error rate per endpoint, writes machine-readable baselines and compares a
+run against them.
+
+    cd backend
+    python -m bench list
+    python -m bench run dashboard --target direct --duration 30 --save
+    python -m bench run dashboard --target direct --duration 30 --compare
+
+See bench/README.md for the profiles, baseline format and thresholds.
+"""
+from .baseline import Thresholds, compare, load_baseline, save_baseline
+from .loadgen import LoadConfig, run_scenario
+from .scenarios import PROFILES, Endpoint, Scenario
+from .stats import EndpointStats, RunResult
+
+__all__ = [
+    "PROFILES",
+    "Endpoint",
+    "Scenario",
+    "LoadConfig",
+    "run_scenario",
+    "EndpointStats",
+    "RunResult",
+    "Thresholds",
+    "compare",
+    "load_baseline",
+    "save_baseline",
+]
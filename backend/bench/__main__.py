@@ -0,0 +1,135 @@
+"""
+Benchmark CLI
+
+    python -m bench list
+    python -m bench run <scenario> [--target proxy|direct] [--base-url URL]
+                        [--concurrency N] [--duration S] [--warmup S] [--requests N]
+                        [--save] [--compare] [--baseline PATH] [--json PATH]
+    python -m bench compare <baseline.json> <run.json>
+
+Exit code 1 when --compare / compare finds a regression.
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from .baseline import Thresholds, baseline_path, compare, load_baseline, save_baseline
+from .loadgen import LoadConfig, run_scenario
+from .scenarios import PROFILES, TARGETS
+from .stats import RunResult, format_table
+
+
+def _thresholds(args) -> Thresholds:
+    return Thresholds(
+        latency_pct=args.latency_pct / 100.0,
+        min_delta_ms=args.min_delta_ms,
+        throughput_pct=args.throughput_pct / 100.0,
+        error_rate_abs=args.error_rate_pct / 100.0,
+    )
+
+
+def _report(regressions) -> int:
+    if not regressions:
+        print("No regressions against baseline")
+        return 0
+    print(f"{len(regressions)} regression(s) against baseline:")
+    for r in regressions:
+        print(f"  {r}")
+    return 1
+
+
+def cmd_list(_args) -> int:
+    for name, s in PROFILES.items():
+        print(f"{name:<14} {s.description}")
+        print(f"{'':<14} concurrency={s.concurrency} duration={s.duration:.0f}s "
+              f"endpoints={', '.join(e.name for e in s.endpoints)}")
+    return 0
+
+
+def cmd_run(args) -> int:
+    scenario = PROFILES[args.scenario]
+    base_url = args.base_url or TARGETS[args.target]
+    target = args.target
+
+    config = LoadConfig(
+        base_url=base_url,
+        target=target,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        warmup=args.warmup,
+        max_requests=args.requests,
+        check_ok=not args.no_check_ok,
+        seed=args.seed,
+    )
+    result = asyncio.run(run_scenario(scenario, config))
+    print(format_table(result))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result.to_dict(), f, indent=2, sort_keys=True)
+        print(f"Run written to {args.json}")
+
+    status = 0
+    if args.compare:
+        baseline = load_baseline(scenario.name, target, args.baseline)
+        if baseline is None:
+            print(f"No baseline at {args.baseline or baseline_path(scenario.name, target)}")
+        else:
+            if baseline.concurrency != result.concurrency:
+                print(f"Warning: baseline ran at concurrency={baseline.concurrency}, "
+                      f"this run at {result.concurrency}")
+            status = _report(compare(baseline, result, _thresholds(args)))
+
+    if args.save:
+        print(f"Baseline written to {save_baseline(result, args.baseline)}")
+    return status
+
+
+def cmd_compare(args) -> int:
+    with open(args.baseline_file) as f:
+        baseline = RunResult.from_dict(json.load(f))
+    with open(args.run_file) as f:
+        current = RunResult.from_dict(json.load(f))
+    return _report(compare(baseline, current, _thresholds(args)))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m bench", description="Fractal API load benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="List scenario profiles")
+
+    run = sub.add_parser("run", help="Run a scenario")
+    run.add_argument("scenario", choices=sorted(PROFILES))
+    run.add_argument("--target", choices=sorted(TARGETS), default="direct",
+                     help="proxy = server.py on 8001, direct = TS backend on 8002")
+    run.add_argument("--base-url", help="Override the target base URL (baseline still keyed by --target)")
+    run.add_argument("--concurrency", type=int)
+    run.add_argument("--duration", type=float, help="Measured seconds")
+    run.add_argument("--warmup", type=float, help="Unmeasured seconds before measuring")
+    run.add_argument("--requests", type=int, help="Stop after N measured requests")
+    run.add_argument("--seed", type=int, default=42)
+    run.add_argument("--no-check-ok", action="store_true", help='Do not treat "ok": false as an error')
+    run.add_argument("--save", action="store_true", help="Save this run as the baseline")
+    run.add_argument("--compare", action="store_true", help="Compare against the saved baseline")
+    run.add_argument("--baseline", help="Baseline file (default bench/baselines/<scenario>.<target>.json)")
+    run.add_argument("--json", help="Also write this run to a JSON file")
+
+    cmp_ = sub.add_parser("compare", help="Compare two saved runs")
+    cmp_.add_argument("baseline_file")
+    cmp_.add_argument("run_file")
+
+    for p in (run, cmp_):
+        p.add_argument("--latency-pct", type=float, default=20.0, help="Allowed p50/p95/p99 growth (%%)")
+        p.add_argument("--min-delta-ms", type=float, default=5.0, help="Ignore latency growth below this")
+        p.add_argument("--throughput-pct", type=float, default=15.0, help="Allowed total throughput drop (%%)")
+        p.add_argument("--error-rate-pct", type=float, default=1.0, help="Allowed error rate growth (points)")
+
+    args = parser.parse_args(argv)
+    handlers = {"list": cmd_list, "run": cmd_run, "compare": cmd_compare}
+    return handlers[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Baselines: save a run as JSON and compare later runs against it
+
+Baselines live in bench/baselines/<scenario>.<target>.json. A metric
+regresses when it is worse than the baseline by more than the relative
+threshold AND (for latencies) by more than min_delta_ms, so tiny
+endpoints do not flap on scheduler noise.
+"""
+import json
+import os
+from dataclasses import dataclass
+from typing import List, Optional
+
+from .stats import EndpointStats, RunResult
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+
+@dataclass
+class Thresholds:
+    latency_pct: float = 0.20        # p50/p95/p99 may grow by 20%
+    min_delta_ms: float = 5.0
+    throughput_pct: float = 0.15     # total throughput may drop by 15%
+    error_rate_abs: float = 0.01     # error rate may grow by 1 point
+
+
+@dataclass
+class Regression:
+    endpoint: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return (self.current - self.baseline) / self.baseline if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        return (f"{self.endpoint}.{self.metric}: {self.baseline:.2f} -> {self.current:.2f} "
+                f"({self.change * 100:+.1f}%)")
+
+
+def baseline_path(scenario: str, target: str, directory: Optional[str] = None) -> str:
+    return os.path.join(directory or BASELINE_DIR, f"{scenario}.{target}.json")
+
+
+def save_baseline(result: RunResult, path: Optional[str] = None) -> str:
+    path = path or baseline_path(result.scenario, result.target)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(result.to_dict(), f, indent=2, sort_keys=True)
+        f.write("\n")
+    return path
+
+
+def load_baseline(scenario: str, target: str, path: Optional[str] = None) -> Optional[RunResult]:
+    path = path or baseline_path(scenario, target)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return RunResult.from_dict(json.load(f))
+
+
+def _compare_endpoint(base: EndpointStats, cur: EndpointStats, t: Thresholds,
+                      throughput: bool) -> List[Regression]:
+    out: List[Regression] = []
+    if cur.requests == 0:
+        return out
+
+    for metric in ("p50_ms", "p95_ms", "p99_ms"):
+        b, c = getattr(base, metric), getattr(cur, metric)
+        if c - b > t.min_delta_ms and c > b * (1 + t.latency_pct):
+            out.append(Regression(cur.name, metric, b, c))
+
+    if cur.error_rate - base.error_rate > t.error_rate_abs:
+        out.append(Regression(cur.name, "error_rate", base.error_rate, cur.error_rate))
+
+    if throughput and cur.throughput_rps < base.throughput_rps * (1 - t.throughput_pct):
+        out.append(Regression(cur.name, "throughput_rps", base.throughput_rps, cur.throughput_rps))
+    return out
+
+
+def compare(baseline: RunResult, current: RunResult, thresholds: Optional[Thresholds] = None) -> List[Regression]:
+    """
+    Regressions of `current` against `baseline`. Throughput is only judged
+    on the total: per-endpoint rates follow the weighted mix.
+    """
+    t = thresholds or Thresholds()
+    regressions = _compare_endpoint(baseline.total, current.total, t, throughput=True)
+    for name, cur in current.endpoints.items():
+        base = baseline.endpoints.get(name)
+        if base is not None and base.requests > 0:
+            regressions.extend(_compare_endpoint(base, cur, t, throughput=False))
+    return regressions
@@ -0,0 +1,128 @@
+"""
+Async closed-loop load generator
+
+`concurrency` workers share one httpx.AsyncClient (pool sized to the
+workers). Each worker picks an endpoint by weight, sends it, records the
+latency and repeats until the run ends. Requests started during the
+warmup are sent but not recorded; every request started inside the
+measure window is recorded whenever it finishes, so slow requests still
+in flight at the deadline count toward latency and throughput.
+
+A request counts as an error on a transport error / timeout, a non-2xx
+status, or (check_ok) a JSON body with "ok": false - the fractal routes
+report most failures that way with status 200.
+"""
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+import httpx
+
+from .scenarios import Endpoint, Scenario
+from .stats import Recorder, RunResult
+
+
+@dataclass
+class LoadConfig:
+    base_url: str
+    target: str = "custom"
+    concurrency: Optional[int] = None      # None = scenario default
+    duration: Optional[float] = None
+    warmup: Optional[float] = None
+    max_requests: Optional[int] = None     # stop after this many measured requests
+    check_ok: bool = True
+    seed: int = 42
+
+
+def _is_error(endpoint: Endpoint, response: httpx.Response, check_ok: bool) -> bool:
+    if not 200 <= response.status_code < 300:
+        return True
+    if check_ok and response.headers.get("content-type", "").startswith("application/json"):
+        try:
+            body = response.json()
+        except ValueError:
+            return True
+        return isinstance(body, dict) and body.get("ok") is False
+    return False
+
+
+async def _send(client: httpx.AsyncClient, endpoint: Endpoint) -> httpx.Response:
+    return await client.request(
+        endpoint.method,
+        endpoint.path,
+        params=endpoint.params or None,
+        json=endpoint.json,
+        timeout=endpoint.timeout,
+    )
+
+
+async def run_scenario(scenario: Scenario, config: LoadConfig) -> RunResult:
+    concurrency = config.concurrency or scenario.concurrency
+    duration = scenario.duration if config.duration is None else config.duration
+    warmup = scenario.warmup if config.warmup is None else config.warmup
+
+    endpoints = scenario.endpoints
+    weights = [e.weight for e in endpoints]
+    recorders: Dict[str, Recorder] = {e.name: Recorder() for e in endpoints}
+    total = Recorder()
+
+    loop_start = time.perf_counter()
+    measure_start = loop_start + warmup
+    deadline = measure_start + duration
+    measured = 0
+    last_finish = measure_start
+    done = asyncio.Event()
+
+    async def worker(worker_id: int, client: httpx.AsyncClient):
+        nonlocal measured, last_finish
+        rng = random.Random(config.seed + worker_id)
+        while not done.is_set():
+            endpoint = rng.choices(endpoints, weights)[0]
+            started = time.perf_counter()
+            try:
+                response = await _send(client, endpoint)
+                status = str(response.status_code)
+                ok = not _is_error(endpoint, response, config.check_ok)
+                size = len(response.content)
+            except httpx.TimeoutException:
+                status, ok, size = "timeout", False, 0
+            except httpx.HTTPError as e:
+                status, ok, size = type(e).__name__, False, 0
+            finished = time.perf_counter()
+
+            # Every request started inside the measure window, however late it finishes
+            if measure_start <= started < deadline:
+                last_finish = max(last_finish, finished)
+                latency_ms = (finished - started) * 1000.0
+                recorders[endpoint.name].record(latency_ms, status, ok, size)
+                total.record(latency_ms, status, ok, size)
+                measured += 1
+                if config.max_requests and measured >= config.max_requests:
+                    done.set()
+
+            if finished >= deadline:
+                done.set()
+            elif scenario.think_time > 0:
+                await asyncio.sleep(scenario.think_time)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    started_at = datetime.now(timezone.utc).isoformat()
+    async with httpx.AsyncClient(base_url=config.base_url, limits=limits) as client:
+        await asyncio.gather(*(worker(i, client) for i in range(concurrency)))
+
+    # Real span of the measured requests: the last one may finish past the deadline
+    elapsed = (last_finish if measured else min(time.perf_counter(), deadline)) - measure_start
+    return RunResult(
+        scenario=scenario.name,
+        target=config.target,
+        base_url=config.base_url,
+        concurrency=concurrency,
+        duration_s=round(elapsed, 3),
+        started_at=started_at,
+        endpoints={name: r.summarize(name, elapsed) for name, r in recorders.items()},
+        total=total.summarize("TOTAL", elapsed),
+        meta={"warmup_s": warmup, "think_time_s": scenario.think_time, "seed": config.seed},
+    )
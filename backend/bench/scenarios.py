@@ -0,0 +1,103 @@
+"""
+Scenario profiles for the fractal API benchmarks
+
+A scenario is a weighted mix of endpoints plus default load settings.
+Paths are relative to the base URL and include the /api prefix, so the
+same profile runs through the gateway (8001) and against the TS backend
+(8002).
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# Base URLs per target
+TARGETS = {
+    "proxy": "http://127.0.0.1:8001",    # backend/server.py (FastAPI gateway)
+    "direct": "http://127.0.0.1:8002",   # TypeScript backend
+}
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    name: str
+    path: str
+    method: str = "GET"
+    params: Dict[str, Any] = field(default_factory=dict)
+    json: Optional[Dict[str, Any]] = None
+    weight: float = 1.0
+    timeout: float = 60.0
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    description: str
+    endpoints: List[Endpoint]
+    concurrency: int = 16
+    duration: float = 30.0       # seconds of measured load
+    warmup: float = 3.0          # seconds of unmeasured load first
+    think_time: float = 0.0      # per-worker pause between requests (seconds)
+
+
+# ═══════════════════════════════════════════════════════════════
+# PROFILES
+# ═══════════════════════════════════════════════════════════════
+
+# What the fractal terminal / chart pages poll
+DASHBOARD = Scenario(
+    name="dashboard",
+    description="Dashboard polling: terminal, chart, signal, overlay, health",
+    concurrency=32,
+    think_time=0.05,
+    endpoints=[
+        Endpoint("terminal", "/api/fractal/v2.1/terminal",
+                 params={"symbol": "BTC", "set": "extended", "focus": "30d"}, weight=4),
+        Endpoint("signal", "/api/fractal/v2.1/signal", params={"symbol": "BTC"}, weight=3),
+        Endpoint("chart", "/api/fractal/v2.1/chart", params={"symbol": "BTC", "limit": 365}, weight=2),
+        Endpoint("overlay", "/api/fractal/v2.1/overlay",
+                 params={"symbol": "BTC", "windowLen": 60, "topK": 10, "aftermathDays": 30}, weight=2),
+        Endpoint("health", "/api/fractal/health", weight=1),
+    ],
+)
+
+# Short simulations, a few at a time
+SIM_BATCH = Scenario(
+    name="sim-batch",
+    description="Simulation batch: quick / gated / attribution sims over one year",
+    concurrency=4,
+    duration=120.0,
+    warmup=0.0,
+    endpoints=[
+        Endpoint("sim-quick", "/api/fractal/v2/sim/quick", method="POST",
+                 json={"symbol": "BTC", "start": "2023-01-01", "end": "2024-01-01", "stepDays": 7},
+                 weight=2, timeout=900.0),
+        Endpoint("sim-gated", "/api/fractal/admin/sim/gated", method="POST",
+                 json={"symbol": "BTC", "from": "2023-01-01", "to": "2024-01-01", "stepDays": 7,
+                       "mode": "FROZEN", "experiment": "E0",
+                       "gateConfig": {"minEnter": 0.25, "minFlip": 0.40, "minFull": 0.70, "softGate": True}},
+                 weight=1, timeout=900.0),
+        Endpoint("sim-attribution", "/api/fractal/admin/sim/attribution", method="POST",
+                 json={"symbol": "BTC", "from": "2023-01-01", "to": "2024-01-01", "stepDays": 7,
+                       "mode": "FROZEN", "experiment": "E0", "attribution": True},
+                 weight=1, timeout=900.0),
+    ],
+)
+
+# Admin UI reads; no writes, so it is safe to run against a shared database
+ADMIN_MIXED = Scenario(
+    name="admin-mixed",
+    description="Mixed admin reads: overview, status, snapshots, reliability, jobs",
+    concurrency=8,
+    think_time=0.1,
+    endpoints=[
+        Endpoint("admin-overview", "/api/fractal/v2.1/admin/overview", params={"symbol": "BTC"}, weight=3),
+        Endpoint("admin-status", "/api/fractal/v2.1/admin/status", weight=2),
+        Endpoint("snapshot-latest", "/api/fractal/v2.1/admin/snapshot/latest", params={"symbol": "BTC"}, weight=2),
+        Endpoint("snapshot-count", "/api/fractal/v2.1/admin/snapshot/count", params={"symbol": "BTC"}, weight=1),
+        Endpoint("reliability-history", "/api/fractal/v2.1/admin/reliability/history", weight=1),
+        Endpoint("shadow-divergence", "/api/fractal/v2.1/admin/shadow-divergence", params={"symbol": "BTC"}, weight=1),
+        Endpoint("jobs-list", "/api/fractal/v2.1/admin/jobs/list", weight=1),
+        Endpoint("signal", "/api/fractal/v2.1/signal", params={"symbol": "BTC"}, weight=1),
+    ],
+)
+
+PROFILES: Dict[str, Scenario] = {s.name: s for s in (DASHBOARD, SIM_BATCH, ADMIN_MIXED)}
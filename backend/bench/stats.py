@@ -0,0 +1,109 @@
+"""
+Latency / throughput statistics for a benchmark run
+"""
+import math
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list (0 for an empty list)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class Recorder:
+    """Collects raw samples for one endpoint during a run"""
+
+    def __init__(self):
+        self.latencies_ms: List[float] = []
+        self.errors = 0
+        self.status_counts: Dict[str, int] = {}
+        self.bytes = 0
+
+    def record(self, latency_ms: float, status: str, ok: bool, size: int = 0):
+        self.latencies_ms.append(latency_ms)
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        self.bytes += size
+        if not ok:
+            self.errors += 1
+
+    def summarize(self, name: str, elapsed_s: float) -> "EndpointStats":
+        lat = sorted(self.latencies_ms)
+        n = len(lat)
+        return EndpointStats(
+            name=name,
+            requests=n,
+            errors=self.errors,
+            error_rate=self.errors / n if n else 0.0,
+            throughput_rps=n / elapsed_s if elapsed_s > 0 else 0.0,
+            mean_ms=sum(lat) / n if n else 0.0,
+            p50_ms=percentile(lat, 50),
+            p95_ms=percentile(lat, 95),
+            p99_ms=percentile(lat, 99),
+            max_ms=lat[-1] if lat else 0.0,
+            bytes=self.bytes,
+            status_counts=dict(sorted(self.status_counts.items())),
+        )
+
+
+@dataclass
+class EndpointStats:
+    name: str
+    requests: int
+    errors: int
+    error_rate: float
+    throughput_rps: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    bytes: int = 0
+    status_counts: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class RunResult:
+    scenario: str
+    target: str
+    base_url: str
+    concurrency: int
+    duration_s: float
+    started_at: str
+    endpoints: Dict[str, EndpointStats]
+    total: EndpointStats
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RunResult":
+        data = dict(data)
+        data["endpoints"] = {k: EndpointStats(**v) for k, v in data["endpoints"].items()}
+        data["total"] = EndpointStats(**data["total"])
+        return cls(**data)
+
+
+def format_table(result: RunResult) -> str:
+    """Plain-text table of a run, one row per endpoint plus the total"""
+    header = f"{'endpoint':<22}{'reqs':>8}{'err%':>7}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"
+    lines = [
+        f"{result.scenario} @ {result.base_url} ({result.target}), "
+        f"concurrency={result.concurrency}, {result.duration_s:.1f}s",
+        header,
+        "-" * len(header),
+    ]
+    rows = list(result.endpoints.values()) + [result.total]
+    for s in rows:
+        if s is result.total:
+            lines.append("-" * len(header))
+        lines.append(
+            f"{s.name:<22}{s.requests:>8}{s.error_rate * 100:>6.1f}%{s.throughput_rps:>9.1f}"
+            f"{s.p50_ms:>9.1f}{s.p95_ms:>9.1f}{s.p99_ms:>9.1f}{s.max_ms:>9.1f}"
+        )
+    lines.append("(latencies in ms)")
+    return "\n".join(lines)
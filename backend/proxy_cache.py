@@ -0,0 +1,193 @@
+"""
+Response cache for idempotent GETs proxied to the TypeScript backend
+
+- Keyed by method + path + normalized (sorted) query
+- Per-route TTLs (CACHE_ROUTES); routes not listed are never cached
+- Bounded by entry count and total bytes, LRU eviction
+- Single-flight: concurrent identical misses share one upstream request
+- Strong ETag per body for If-None-Match / 304 (not_modified)
+- purge() drops everything (called after admin writes); fetches that
+  started before a purge are not stored
+"""
+import asyncio
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Cacheable GET routes (path relative to /api/), first match wins; TTL in seconds
+CACHE_ROUTES = [
+    (r"^fractal/v2\.1/admin/", None),
+    (r"^fractal/signal", 10.0),
+    (r"^fractal/overlay", 30.0),
+    (r"^fractal/v2\.1/chart", 30.0),
+    (r"^fractal/v2\.1/", 15.0),
+]
+
+_CACHE_ROUTES = [(re.compile(pattern), ttl) for pattern, ttl in CACHE_ROUTES]
+
+
+def cache_ttl(path: str) -> Optional[float]:
+    """TTL for a GET /api/{path}, None if not cacheable"""
+    for pattern, ttl in _CACHE_ROUTES:
+        if pattern.search(path):
+            return ttl
+    return None
+
+
+def cache_key(method: str, path: str, query: Iterable[Tuple[str, str]]) -> str:
+    return f"{method} /api/{path}?" + "&".join(f"{k}={v}" for k, v in sorted(query))
+
+
+@dataclass
+class CachedResponse:
+    status_code: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+    etag: str = ""
+    expires_at: float = 0.0
+
+    def __post_init__(self):
+        if not self.etag:
+            self.etag = '"' + hashlib.blake2b(self.body, digest_size=12).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def not_modified(response: CachedResponse, if_none_match: str) -> bool:
+    """True if the client's If-None-Match already covers this 200 response"""
+    return response.status_code == 200 and bool(if_none_match) and etag_matches(if_none_match, response.etag)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    stores: int = 0
+    evictions: int = 0
+    purges: int = 0
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entry_bytes: int = 4 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.clock = clock
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Task[CachedResponse]"] = {}
+        self._bytes = 0
+        self._generation = 0
+        self._stats = CacheStats()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self.clock():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def fetch(
+        self,
+        key: str,
+        ttl: float,
+        load: Callable[[], Awaitable[CachedResponse]],
+    ) -> Tuple[CachedResponse, str]:
+        """
+        Cached response or one load() shared by all concurrent callers.
+        Returns (response, "HIT" | "MISS" | "COALESCED"). Only 200s are stored.
+        """
+        entry = self.get(key)
+        if entry is not None:
+            self._stats.hits += 1
+            return entry, "HIT"
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._stats.coalesced += 1
+            return await asyncio.shield(inflight), "COALESCED"
+
+        # The load runs as its own task so a disconnecting first caller
+        # does not cancel it for the others
+        self._stats.misses += 1
+        task = asyncio.ensure_future(self._load(key, ttl, load, self._generation))
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._inflight[key] = task
+        return await asyncio.shield(task), "MISS"
+
+    def purge(self) -> int:
+        """
+        Drop all entries and forget in-flight loads: those finish for their
+        own callers but are not stored, and later requests start a new load
+        """
+        count = len(self._entries)
+        self._entries.clear()
+        self._inflight.clear()
+        self._bytes = 0
+        self._generation += 1
+        self._stats.purges += 1
+        return count
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "maxEntries": self.max_entries,
+            "maxBytes": self.max_bytes,
+            "inflight": len(self._inflight),
+            **asdict(self._stats),
+        }
+
+    # Private
+
+    async def _load(
+        self,
+        key: str,
+        ttl: float,
+        load: Callable[[], Awaitable[CachedResponse]],
+        generation: int,
+    ) -> CachedResponse:
+        try:
+            response = await load()
+        finally:
+            # After a purge the key may belong to a newer load
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+        if response.status_code == 200 and generation == self._generation:
+            self._store(key, response, ttl)
+        return response
+
+    def _store(self, key: str, response: CachedResponse, ttl: float):
+        size = len(response.body)
+        if size > self.max_entry_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        response.expires_at = self.clock() + ttl
+        self._entries[key] = response
+        self._bytes += size
+        self._stats.stores += 1
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._stats.evictions += 1
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.body)
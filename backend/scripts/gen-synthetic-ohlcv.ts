@@ -0,0 +1,113 @@
+#!/usr/bin/env npx tsx
+/**
+ * Synthetic OHLCV dataset for offline fractal benchmarks
+ *
+ *   npx tsx scripts/gen-synthetic-ohlcv.ts --symbols SYN1,SYN2 --timeframes 1d,1h \
+ *     --years 160 --seed 42 --out /tmp/synthetic.ndjson
+ *   MONGODB_URI=mongodb://localhost:27017/fractal_bench \
+ *     npx tsx scripts/gen-synthetic-ohlcv.ts --symbols BTC --years 160 --mongo --replace
+ *
+ * Options:
+ *   --symbols      comma list (default SYN1)
+ *   --timeframes   comma list of 1d,4h,1h,15m,5m,1m (default 1d)
+ *   --years        history length ending at --to (default 16, roughly the real BTC history)
+ *   --to           last date (default today, UTC)
+ *   --seed         PRNG seed (default 42)
+ *   --gap-rate / --restatement-rate   override the defect rates
+ *   --out PATH     write an NDJSON fixture
+ *   --mongo        upsert into fractal_canonical_ohlcv (MONGODB_URI, default
+ *                  fractal_bench); refused on the app database (fractal_dev)
+ *   --replace      with --mongo: delete the symbol/timeframe first
+ */
+
+import mongoose from 'mongoose';
+import {
+  generateSyntheticSeries,
+  SYNTHETIC_TIMEFRAME_MS,
+  SyntheticConfig,
+  SyntheticSeries,
+  SyntheticTimeframe,
+} from '../src/modules/fractal/data/synthetic.generator.js';
+import { loadSyntheticToCanonical, writeSyntheticFixture } from '../src/modules/fractal/data/synthetic.loader.js';
+
+// Synthetic candles never go to the app database (backend/.env points MONGODB_URI there)
+const BENCH_MONGODB_URI = 'mongodb://localhost:27017/fractal_bench';
+const APP_DB_NAME = 'fractal_dev';
+
+function parseArgs(argv: string[]): Record<string, string | true> {
+  const args: Record<string, string | true> = {};
+  for (let i = 0; i < argv.length; i++) {
+    if (!argv[i].startsWith('--')) continue;
+    const key = argv[i].slice(2);
+    const next = argv[i + 1];
+    if (next !== undefined && !next.startsWith('--')) {
+      args[key] = next;
+      i++;
+    } else {
+      args[key] = true;
+    }
+  }
+  return args;
+}
+
+async function main() {
+  const args = parseArgs(process.argv.slice(2));
+  const str = (key: string, fallback: string) => (typeof args[key] === 'string' ? args[key] as string : fallback);
+
+  const symbols = str('symbols', 'SYN1').split(',').filter(Boolean);
+  const timeframes = str('timeframes', '1d').split(',').filter(Boolean) as SyntheticTimeframe[];
+  for (const tf of timeframes) {
+    if (!(tf in SYNTHETIC_TIMEFRAME_MS)) throw new Error(`Unknown timeframe ${tf}`);
+  }
+  if (!args.out && !args.mongo) throw new Error('Nothing to do: pass --out PATH and/or --mongo');
+
+  const years = Number(str('years', '16'));
+  const to = new Date(str('to', new Date().toISOString().slice(0, 10)) + 'T00:00:00Z');
+  const from = new Date(to.getTime() - years * 365.25 * 24 * 60 * 60 * 1000);
+
+  const config: Partial<SyntheticConfig> = { seed: Number(str('seed', '42')) };
+  if (typeof args['gap-rate'] === 'string') config.gapRate = Number(args['gap-rate']);
+  if (typeof args['restatement-rate'] === 'string') config.restatementRate = Number(args['restatement-rate']);
+
+  console.log(`[Synthetic] ${symbols.join(',')} × ${timeframes.join(',')}, ${years}y ` +
+    `(${from.toISOString().slice(0, 10)} → ${to.toISOString().slice(0, 10)}), seed ${config.seed}`);
+
+  if (args.mongo) {
+    await mongoose.connect(process.env.MONGODB_URI || BENCH_MONGODB_URI);
+    const dbName = mongoose.connection.name;
+    if (dbName === APP_DB_NAME) {
+      await mongoose.disconnect();
+      throw new Error(`Refusing to write synthetic candles to the app database ${dbName}: point MONGODB_URI at a bench database`);
+    }
+    console.log(`[Synthetic] Mongo database: ${dbName}`);
+  }
+
+  const all: SyntheticSeries[] = [];
+  for (const symbol of symbols) {
+    for (const timeframe of timeframes) {
+      const t0 = Date.now();
+      const series = generateSyntheticSeries({ symbol, timeframe, from, to }, config);
+      console.log(`[Synthetic] ${symbol} ${timeframe}: ${series.candles.length} candles, ` +
+        `${series.gaps.length} gaps, ${series.restatements.length} restatements, ` +
+        `${series.regimes.length} regimes (${Date.now() - t0}ms)`);
+
+      if (args.mongo) {
+        const res = await loadSyntheticToCanonical(series, { replace: args.replace === true });
+        console.log(`[Synthetic]   loaded ${res.candles} (+${res.restated} restated) in ${res.durationMs}ms`);
+      }
+      if (args.out) all.push(series);
+    }
+  }
+
+  if (typeof args.out === 'string') {
+    const lines = await writeSyntheticFixture(args.out, all);
+    console.log(`[Synthetic] Fixture written: ${args.out} (${lines} lines)`);
+  }
+
+  if (args.mongo) await mongoose.disconnect();
+}
+
+main().catch(e => {
+  console.error('Error:', e);
+  process.exit(1);
+});
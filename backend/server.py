@@ -2,18 +2,72 @@
 FastAPI wrapper for TypeScript Fractal Backend
 Proxies all /api/* requests to Node.js TypeScript backend running on port 8002
 """
+import hmac
+import json
 import os
+import re
 import subprocess
 import threading
 import time
 import httpx
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from contextlib import asynccontextmanager
+from proxy_cache import CachedResponse, ResponseCache, cache_key, cache_ttl, not_modified
 
 TS_BACKEND_URL = "http://127.0.0.1:8002"
 ts_process = None
 
+# Response cache for polled read-only GETs (see proxy_cache.CACHE_ROUTES)
+PROXY_CACHE_ENABLED = os.environ.get("PROXY_CACHE_ENABLED", "true").lower() != "false"
+response_cache = ResponseCache()
+
+# Writes to admin routes can change any cached read
+ADMIN_WRITE = re.compile(r"(^|/)admin/")
+
+# Connection pool to the TS backend (one client for the app lifetime)
+PROXY_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=32,
+    keepalive_expiry=60.0,
+)
+
+# Per-route read timeouts (seconds), first match wins; None = no limit.
+# Async job submit / status / cancel return at once and their SSE stream
+# stays open; other /admin/jobs/* routes (daily-run, daily-run-tg) run the
+# job inline and keep the default.
+ROUTE_TIMEOUTS = [
+    (r"^fractal/v2\.1/admin/jobs/job-[^/]+/events$", None),
+    (r"^fractal/v2\.1/admin/jobs(/list|/job-[^/]+(/cancel)?)?$", 30.0),
+    (r"^fractal/admin/sim/", 900.0),
+    (r"^fractal/v2/sim/", 900.0),
+    (r"optimize|sweep|certify|simulat", 900.0),
+]
+DEFAULT_TIMEOUT = 60.0
+CONNECT_TIMEOUT = 5.0
+
+_ROUTE_TIMEOUTS = [(re.compile(pattern), timeout) for pattern, timeout in ROUTE_TIMEOUTS]
+
+# Hop-by-hop headers are never forwarded (RFC 7230 6.1)
+HOP_BY_HOP = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailer", "transfer-encoding", "upgrade", "host",
+}
+# Set again by uvicorn on the way out
+RESPONSE_SKIP = HOP_BY_HOP | {"date", "server"}
+
+
+def route_timeout(path: str) -> httpx.Timeout:
+    """Timeout for a proxied /api/{path}"""
+    read = DEFAULT_TIMEOUT
+    for pattern, timeout in _ROUTE_TIMEOUTS:
+        if pattern.search(path):
+            read = timeout
+            break
+    return httpx.Timeout(connect=CONNECT_TIMEOUT, read=read, write=read, pool=CONNECT_TIMEOUT)
+
 
 def start_ts_backend():
     """Start TypeScript backend in background"""
@@ -70,8 +124,14 @@ def start_ts_backend():
 async def lifespan(app: FastAPI):
     # Startup
     threading.Thread(target=start_ts_backend, daemon=True).start()
+    app.state.http = httpx.AsyncClient(
+        base_url=TS_BACKEND_URL,
+        limits=PROXY_LIMITS,
+        timeout=httpx.Timeout(DEFAULT_TIMEOUT, connect=CONNECT_TIMEOUT),
+    )
     yield
     # Shutdown
+    await app.state.http.aclose()
     global ts_process
     if ts_process:
         ts_process.terminate()
@@ -94,51 +154,126 @@ async def root():
     return {"ok": True, "message": "Fractal Backend Proxy", "ts_backend": TS_BACKEND_URL}
 
 
+def error_response(status_code: int, error: str) -> Response:
+    return Response(
+        content=json.dumps({"ok": False, "error": error}),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def upstream_error(e: Exception) -> Response:
+    if isinstance(e, httpx.ConnectError):
+        return error_response(503, "TypeScript backend not ready")
+    if isinstance(e, httpx.TimeoutException):
+        return error_response(504, "TypeScript backend timed out")
+    return error_response(500, str(e))
+
+
+@app.get("/api/_proxy/cache")
+async def proxy_cache_stats():
+    return {"ok": True, "enabled": PROXY_CACHE_ENABLED, **response_cache.stats()}
+
+
+def purge_authorized(request: Request) -> bool:
+    """
+    Same Bearer secret as the TS admin cron routes (FRACTAL_CRON_SECRET);
+    without a configured secret only local callers may purge
+    """
+    secret = os.environ.get("FRACTAL_CRON_SECRET")
+    if secret:
+        auth = request.headers.get("authorization", "")
+        return hmac.compare_digest(auth.encode(), f"Bearer {secret}".encode())
+    host = request.client.host if request.client else ""
+    return host in ("127.0.0.1", "::1", "localhost")
+
+
+@app.post("/api/_proxy/cache/purge")
+async def proxy_cache_purge(request: Request):
+    if not purge_authorized(request):
+        return error_response(401, "Unauthorized")
+    return {"ok": True, "purged": response_cache.purge()}
+
+
+async def cached_get(request: Request, path: str, ttl: float) -> Response:
+    """GET through the response cache (buffered, coalesced, ETag-aware)"""
+    client: httpx.AsyncClient = request.app.state.http
+
+    async def load() -> CachedResponse:
+        # Shared by every coalesced caller: no per-client headers, and no
+        # Accept-Encoding so the stored body is plain
+        resp = await client.get(
+            f"/api/{path}",
+            params=request.query_params,
+            headers={"accept": "application/json", "accept-encoding": "identity"},
+            timeout=route_timeout(path),
+        )
+        return CachedResponse(
+            status_code=resp.status_code,
+            headers=[
+                (k, v) for k, v in resp.headers.items()
+                if k.lower() not in RESPONSE_SKIP | {"content-length", "content-encoding"}
+            ],
+            body=resp.content,
+        )
+
+    key = cache_key("GET", path, request.query_params.multi_items())
+    try:
+        cached, outcome = await response_cache.fetch(key, ttl, load)
+    except Exception as e:
+        return upstream_error(e)
+
+    headers = dict(cached.headers)
+    headers["x-proxy-cache"] = outcome
+    if cached.status_code == 200:
+        headers["etag"] = cached.etag
+        headers["cache-control"] = "no-cache"
+        if not_modified(cached, request.headers.get("if-none-match", "")):
+            return Response(status_code=304, headers={
+                k: v for k, v in headers.items() if k in ("etag", "cache-control", "x-proxy-cache")
+            })
+
+    return Response(content=cached.body, status_code=cached.status_code, headers=headers)
+
+
 @app.api_route("/api/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH"])
 async def proxy_api(request: Request, path: str):
-    """Proxy all /api/* requests to TypeScript backend"""
-    # Longer timeout for simulation/optimization endpoints
-    long_timeout_keywords = ["optimize", "sweep", "certify", "sim"]
-    timeout = 900.0 if any(kw in path for kw in long_timeout_keywords) else 60.0
-    
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        url = f"{TS_BACKEND_URL}/api/{path}"
-        
-        # Forward query params
-        if request.query_params:
-            url += f"?{request.query_params}"
-        
-        # Forward body for POST/PUT/PATCH
-        body = None
-        if request.method in ["POST", "PUT", "PATCH"]:
-            body = await request.body()
-        
-        try:
-            resp = await client.request(
-                method=request.method,
-                url=url,
-                content=body,
-                headers={
-                    k: v for k, v in request.headers.items()
-                    if k.lower() not in ["host", "content-length"]
-                },
-            )
-            
-            return Response(
-                content=resp.content,
-                status_code=resp.status_code,
-                headers=dict(resp.headers),
-                media_type=resp.headers.get("content-type"),
-            )
-        except httpx.ConnectError:
-            return Response(
-                content='{"ok": false, "error": "TypeScript backend not ready"}',
-                status_code=503,
-                media_type="application/json",
-            )
-        except Exception as e:
-            return Response(
-                content=f'{{"ok": false, "error": "{str(e)}"}}',
-                status_code=500,
-                media_type="application/json",
-            )
+    """Proxy all /api/* requests to TypeScript backend (streamed both ways)"""
+    client: httpx.AsyncClient = request.app.state.http
+
+    if PROXY_CACHE_ENABLED and request.method == "GET":
+        ttl = cache_ttl(path)
+        if ttl is not None:
+            return await cached_get(request, path, ttl)
+
+    # Body is streamed through; Content-Length is kept so upstream
+    # still receives a sized (non-chunked) request
+    has_body = request.method in ["POST", "PUT", "PATCH"]
+    upstream = client.build_request(
+        method=request.method,
+        url=f"/api/{path}",
+        params=request.query_params,
+        content=request.stream() if has_body else None,
+        headers={
+            k: v for k, v in request.headers.items()
+            if k.lower() not in HOP_BY_HOP and (has_body or k.lower() != "content-length")
+        },
+        timeout=route_timeout(path),
+    )
+
+    try:
+        resp = await client.send(upstream, stream=True)
+    except Exception as e:
+        return upstream_error(e)
+
+    if request.method != "GET" and ADMIN_WRITE.search(path):
+        response_cache.purge()
+
+    # Raw (still encoded) bytes go straight to the client, so the upstream
+    # Content-Encoding / Content-Length stay valid
+    return StreamingResponse(
+        resp.aiter_raw(),
+        status_code=resp.status_code,
+        headers={k: v for k, v in resp.headers.items() if k.lower() not in RESPONSE_SKIP},
+        background=BackgroundTask(resp.aclose),
+    )
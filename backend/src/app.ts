@@ -250,6 +250,12 @@ export function buildApp(): FastifyInstance {
       const { priceLayerRoutes } = await import('./modules/price-layer/index.js');
       await priceLayerRoutes(fastify);
       console.log('[BOOT] Price layer module registered successfully');
+      
+      // Catch up horizon snapshots that came due while we were down
+      const { priceLayerService } = await import('./modules/price-layer/index.js');
+      priceLayerService.startScheduler().catch(err =>
+        console.error('[BOOT] Price layer scheduler failed to start:', err)
+      );
     } catch (err) {
       console.error('[BOOT] Failed to register price layer module:', err);
     }
@@ -0,0 +1,98 @@
+/**
+ * Rolling Kernels Tests
+ *
+ * Streaming kernels must agree with naive per-window recomputation, and
+ * windows that are not full give NaN rather than a shorter window.
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+  rollingMean,
+  rollingStd,
+  rollingMax,
+  rollingMin,
+  rollingSlope,
+  drawdown,
+  rangeMean,
+  rangeStd,
+  rangeMax,
+  rangeMaxDrawdown,
+} from '../rolling.kernels.js';
+import { randomWalk } from './seeded.fixtures.js';
+
+function naiveStd(a: number[]): number {
+  if (a.length < 2) return 0;
+  const m = a.reduce((s, x) => s + x, 0) / a.length;
+  return Math.sqrt(a.reduce((s, x) => s + (x - m) ** 2, 0) / (a.length - 1));
+}
+
+function naiveSlope(y: number[]): number {
+  const n = y.length;
+  if (n < 2) return 0;
+  const xMean = (n - 1) / 2;
+  const yMean = y.reduce((s, x) => s + x, 0) / n;
+  let num = 0;
+  let den = 0;
+  for (let i = 0; i < n; i++) {
+    num += (i - xMean) * (y[i] - yMean);
+    den += (i - xMean) ** 2;
+  }
+  return num / den;
+}
+
+describe('rolling kernels', () => {
+  const x = randomWalk(1500, 17);
+
+  it('should match per-window mean / std / min / max / slope', () => {
+    const n = 20;
+    const mean = rollingMean(x, n);
+    const std = rollingStd(x, n, { partial: true });
+    const max = rollingMax(x, n);
+    const min = rollingMin(x, n);
+    const slope = rollingSlope(x, n, { partial: true });
+
+    for (let i = 0; i < x.length; i++) {
+      const w = x.slice(Math.max(0, i - n + 1), i + 1);
+      if (i < n - 1) expect(mean[i]).toBeNaN();
+      else expect(mean[i]).toBeCloseTo(w.reduce((s, v) => s + v, 0) / n, 9);
+      expect(std[i]).toBeCloseTo(naiveStd(w), 9);
+      expect(max[i]).toBe(Math.max(...w));
+      expect(min[i]).toBe(Math.min(...w));
+      expect(slope[i]).toBeCloseTo(naiveSlope(w), 9);
+    }
+  });
+
+  it('should mark incomplete windows as NaN unless partial', () => {
+    const std = rollingStd(x, 10);
+    const slope = rollingSlope(x, 10);
+    expect(std[8]).toBeNaN();
+    expect(slope[8]).toBeNaN();
+    expect(std[9]).toBeCloseTo(naiveStd(x.slice(0, 10)), 9);
+  });
+
+  it('should give NaN for ranges that do not fit, like rollingMean', () => {
+    const n = 20;
+    const mean = rollingMean(x, n);
+    for (let end = 1; end <= 40; end++) {
+      const m = rangeMean(x, end - n, end);
+      if (end < n) expect(m).toBeNaN();
+      else expect(m).toBeCloseTo(mean[end - 1], 9);
+    }
+    expect(rangeMean(x, x.length - 5, x.length + 1)).toBeNaN();
+    expect(rangeMean(x, 10, 10)).toBeNaN();
+    expect(rangeStd(x, -1, 10)).toBeNaN();
+    expect(rangeStd(x, 0, 1)).toBe(0);
+    expect(rangeStd(x, 0, 10)).toBeCloseTo(naiveStd(x.slice(0, 10)), 12);
+    expect(rangeMax(x, -3, 5)).toBeNaN();
+    expect(rangeMax(x, 0, 5)).toBe(Math.max(...x.slice(0, 5)));
+  });
+
+  it('should track drawdown from the running peak', () => {
+    const closes = [100, 120, 90, 130, 65, 80];
+    expect(Array.from(drawdown(closes))).toEqual([0, 0, 90 / 120 - 1, 0, 65 / 130 - 1, 80 / 130 - 1]);
+    expect(rangeMaxDrawdown(closes, 0, closes.length)).toBeCloseTo(0.5);
+    expect(rangeMaxDrawdown(closes, 0, 3)).toBeCloseTo(0.25);
+    // A lookback longer than the series covers all of it
+    expect(rangeMaxDrawdown(closes, -10, closes.length)).toBeCloseTo(0.5);
+  });
+});
@@ -0,0 +1,82 @@
+/**
+ * Seeded Test Fixtures
+ *
+ * Deterministic random walks and candles shared by the kernel, engine and
+ * indicator tests. Every fixture draws from the same Park-Miller LCG, so a
+ * (length, seed) pair always gives the same series.
+ */
+
+export interface FixtureCandle {
+  ts: number;
+  open: number;
+  high: number;
+  low: number;
+  close: number;
+  volume: number;
+}
+
+export interface WalkOptions {
+  start?: number;                  // first price before any step
+  vol?: number;                    // width of the uniform log-return
+  drift?: (i: number) => number;   // added to step i's log-return
+}
+
+export interface CandleOptions extends WalkOptions {
+  startTs?: number;
+  stepMs?: number;
+  volume?: [base: number, span: number];
+}
+
+/**
+ * Uniform draws in (0, 1) from the 16807 LCG
+ */
+export function lcg(seed: number): () => number {
+  return () => (seed = (seed * 16807) % 2147483647) / 2147483647;
+}
+
+/**
+ * n closes, each one log-return step after the previous (the start price
+ * itself is not included)
+ */
+export function randomWalk(n: number, seed: number, opts: WalkOptions = {}): number[] {
+  const { start = 100, vol = 0.1, drift } = opts;
+  const rand = lcg(seed);
+  const closes: number[] = [];
+  let p = start;
+  for (let i = 0; i < n; i++) {
+    p *= Math.exp((rand() - 0.5) * vol + (drift ? drift(i) : 0));
+    closes.push(p);
+  }
+  return closes;
+}
+
+/**
+ * n candles along a random walk: open at the previous close, wicks up to
+ * 1% beyond the body, uniform volume
+ */
+export function randomCandles(n: number, seed: number, opts: CandleOptions = {}): FixtureCandle[] {
+  const {
+    start = 100,
+    vol = 0.03,
+    drift,
+    startTs = Date.UTC(2026, 0, 1),
+    stepMs = 3600_000,
+    volume: [volBase, volSpan] = [1000, 5000],
+  } = opts;
+  const rand = lcg(seed);
+  const out: FixtureCandle[] = [];
+  let price = start;
+  for (let i = 0; i < n; i++) {
+    const open = price;
+    price *= Math.exp((rand() - 0.5) * vol + (drift ? drift(i) : 0));
+    out.push({
+      ts: startTs + i * stepMs,
+      open,
+      high: Math.max(open, price) * (1 + rand() * 0.01),
+      low: Math.min(open, price) * (1 - rand() * 0.01),
+      close: price,
+      volume: volBase + rand() * volSpan,
+    });
+  }
+  return out;
+}
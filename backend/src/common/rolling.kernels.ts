@@ -0,0 +1,734 @@
+/**
+ * Rolling Statistics Kernels
+ * Streaming O(n) rolling primitives shared by the fractal engine (chart /
+ * terminal series, multi-rep vectors, phase classifier, regime engines)
+ * and the exchange-alt rolling indicator states.
+ *
+ * - Stateful accumulators (RollingMoments, RollingExtreme, RollingSlope)
+ *   for incremental use: push a value, read the statistic of the window
+ * - Whole-series helpers returning Float64Array (NaN where the window is
+ *   not full, unless `partial` allows shorter windows at the start)
+ * - Range helpers (rangeMean / rangeStd / ...) for one-off statistics over
+ *   x[from..to) without slicing; a range that does not fit in x gives NaN,
+ *   like the whole-series helpers before their window is full
+ * - Indicator kernels (RingBuffer, SeededEma, WilderSum, RsiKernel,
+ *   ParabolicSar, ...) seeded like the technicalindicators routines the
+ *   alt providers used before, so a state replayed over a candle array
+ *   gives the library's series. Each can clone() itself: the indicator
+ *   engine evaluates the still-open candle on a clone.
+ *
+ * Running sums are Neumaier-compensated so long series do not drift from
+ * the naive per-window loops they replace.
+ */
+
+// ═══════════════════════════════════════════════════════════════
+// Stateful accumulators
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * Compensated running sum (add and remove)
+ */
+export class RunningSum {
+  private sum = 0;
+  private comp = 0;
+
+  add(x: number): void {
+    const t = this.sum + x;
+    if (Math.abs(this.sum) >= Math.abs(x)) this.comp += (this.sum - t) + x;
+    else this.comp += (x - t) + this.sum;
+    this.sum = t;
+  }
+
+  value(): number {
+    return this.sum + this.comp;
+  }
+
+  reset(): void {
+    this.sum = 0;
+    this.comp = 0;
+  }
+}
+
+/**
+ * Sliding-window mean / variance (Welford with removal)
+ */
+export class RollingMoments {
+  private buf: Float64Array;
+  private head = 0;
+  private n = 0;
+  private mean = 0;
+  private m2 = 0;
+
+  constructor(readonly window: number) {
+    this.buf = new Float64Array(Math.max(1, window));
+  }
+
+  get count(): number {
+    return this.n;
+  }
+
+  push(x: number): void {
+    if (this.n === this.window) this.remove(this.buf[this.head]);
+    this.buf[this.head] = x;
+    this.head = (this.head + 1) % this.buf.length;
+
+    this.n++;
+    const d = x - this.mean;
+    this.mean += d / this.n;
+    this.m2 += d * (x - this.mean);
+  }
+
+  private remove(y: number): void {
+    if (this.n === 1) {
+      this.n = 0;
+      this.mean = 0;
+      this.m2 = 0;
+      return;
+    }
+    const prevMean = this.mean;
+    this.mean -= (y - prevMean) / (this.n - 1);
+    this.m2 -= (y - prevMean) * (y - this.mean);
+    if (this.m2 < 0) this.m2 = 0;
+    this.n--;
+  }
+
+  getMean(): number {
+    return this.n > 0 ? this.mean : NaN;
+  }
+
+  /**
+   * Variance with `ddof` degrees of freedom (0 if fewer than ddof + 1 values)
+   */
+  variance(ddof = 1): number {
+    return this.n > ddof ? this.m2 / (this.n - ddof) : 0;
+  }
+
+  std(ddof = 1): number {
+    return Math.sqrt(this.variance(ddof));
+  }
+}
+
+/**
+ * Sliding-window max (or min) by monotonic deque of indices
+ */
+export class RollingExtreme {
+  private idx: Int32Array;
+  private val: Float64Array;
+  private head = 0;
+  private size = 0;
+  private pushed = 0;
+
+  constructor(readonly window: number, readonly mode: 'max' | 'min' = 'max') {
+    this.idx = new Int32Array(Math.max(1, window));
+    this.val = new Float64Array(Math.max(1, window));
+  }
+
+  push(x: number): void {
+    const cap = this.idx.length;
+    const i = this.pushed++;
+
+    // Expire the front, then drop dominated values from the back
+    if (this.size > 0 && this.idx[this.head] <= i - this.window) {
+      this.head = (this.head + 1) % cap;
+      this.size--;
+    }
+    while (this.size > 0) {
+      const back = (this.head + this.size - 1) % cap;
+      const dominated = this.mode === 'max' ? this.val[back] <= x : this.val[back] >= x;
+      if (!dominated) break;
+      this.size--;
+    }
+    const slot = (this.head + this.size) % cap;
+    this.idx[slot] = i;
+    this.val[slot] = x;
+    this.size++;
+  }
+
+  value(): number {
+    return this.size > 0 ? this.val[this.head] : NaN;
+  }
+}
+
+/**
+ * Sliding-window OLS slope of y against its position in the window
+ */
+export class RollingSlope {
+  private buf: Float64Array;
+  private head = 0;
+  private n = 0;
+  private sumY = new RunningSum();
+  private sumJY = new RunningSum();   // sum of j * y_j, j = 0..n-1 (oldest = 0)
+
+  constructor(readonly window: number) {
+    this.buf = new Float64Array(Math.max(1, window));
+  }
+
+  push(y: number): void {
+    if (this.n === this.window) {
+      const old = this.buf[this.head];
+      // Positions shift down by one: sum(j*y) loses sum(y) of the survivors
+      this.sumJY.add(-(this.sumY.value() - old));
+      this.sumY.add(-old);
+      this.n--;
+    }
+    this.buf[this.head] = y;
+    this.head = (this.head + 1) % this.buf.length;
+    this.sumJY.add(this.n * y);
+    this.sumY.add(y);
+    this.n++;
+  }
+
+  get count(): number {
+    return this.n;
+  }
+
+  meanY(): number {
+    return this.n > 0 ? this.sumY.value() / this.n : NaN;
+  }
+
+  /**
+   * Slope per step (0 with fewer than 2 values)
+   */
+  slope(): number {
+    const n = this.n;
+    if (n < 2) return 0;
+    const xMean = (n - 1) / 2;
+    const den = n * (n * n - 1) / 12;  // sum (j - xMean)^2
+    return (this.sumJY.value() - xMean * this.sumY.value()) / den;
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════
+// Whole-series kernels
+// ═══════════════════════════════════════════════════════════════
+
+export function toFloat64(x: ArrayLike<number>): Float64Array {
+  return x instanceof Float64Array ? x : Float64Array.from(x);
+}
+
+/**
+ * Simple moving average; out[i] = mean(x[i-n+1..i]), NaN before n values
+ */
+export function rollingMean(x: ArrayLike<number>, n: number): Float64Array {
+  const out = new Float64Array(x.length).fill(NaN);
+  if (n <= 0) return out;
+  const sum = new RunningSum();
+  for (let i = 0; i < x.length; i++) {
+    sum.add(x[i]);
+    if (i >= n) sum.add(-x[i - n]);
+    if (i >= n - 1) out[i] = sum.value() / n;
+  }
+  return out;
+}
+
+/**
+ * Exponential moving average seeded with the first value
+ */
+export function ema(x: ArrayLike<number>, n: number, alpha = 2 / (n + 1)): Float64Array {
+  const out = new Float64Array(x.length);
+  if (x.length === 0) return out;
+  let e = x[0];
+  out[0] = e;
+  for (let i = 1; i < x.length; i++) {
+    e += alpha * (x[i] - e);
+    out[i] = e;
+  }
+  return out;
+}
+
+/**
+ * Rolling standard deviation over the last n values.
+ * partial: shorter windows at the start (std 0 below ddof + 1 values),
+ * otherwise NaN until the window is full.
+ */
+export function rollingStd(
+  x: ArrayLike<number>,
+  n: number,
+  options: { ddof?: number; partial?: boolean } = {}
+): Float64Array {
+  const { ddof = 1, partial = false } = options;
+  const out = new Float64Array(x.length);
+  const moments = new RollingMoments(n);
+  for (let i = 0; i < x.length; i++) {
+    moments.push(x[i]);
+    out[i] = partial || moments.count === n ? moments.std(ddof) : NaN;
+  }
+  return out;
+}
+
+/**
+ * Rolling max over the last n values (shorter windows at the start)
+ */
+export function rollingMax(x: ArrayLike<number>, n: number): Float64Array {
+  return rollingExtreme(x, n, 'max');
+}
+
+/**
+ * Rolling min over the last n values (shorter windows at the start)
+ */
+export function rollingMin(x: ArrayLike<number>, n: number): Float64Array {
+  return rollingExtreme(x, n, 'min');
+}
+
+function rollingExtreme(x: ArrayLike<number>, n: number, mode: 'max' | 'min'): Float64Array {
+  const out = new Float64Array(x.length);
+  const ext = new RollingExtreme(n, mode);
+  for (let i = 0; i < x.length; i++) {
+    ext.push(x[i]);
+    out[i] = ext.value();
+  }
+  return out;
+}
+
+/**
+ * Rolling OLS slope per step over the last n values.
+ * partial: shorter windows at the start, otherwise NaN until full.
+ */
+export function rollingSlope(
+  x: ArrayLike<number>,
+  n: number,
+  options: { partial?: boolean } = {}
+): Float64Array {
+  const out = new Float64Array(x.length);
+  const reg = new RollingSlope(n);
+  for (let i = 0; i < x.length; i++) {
+    reg.push(x[i]);
+    out[i] = options.partial || reg.count === n ? reg.slope() : NaN;
+  }
+  return out;
+}
+
+/**
+ * Drawdown from the running peak: x[i] / max(x[0..i]) - 1 (<= 0)
+ */
+export function drawdown(x: ArrayLike<number>): Float64Array {
+  const out = new Float64Array(x.length);
+  let peak = -Infinity;
+  for (let i = 0; i < x.length; i++) {
+    if (x[i] > peak) peak = x[i];
+    out[i] = x[i] / peak - 1;
+  }
+  return out;
+}
+
+/**
+ * Cumulative sum
+ */
+export function cumsum(x: ArrayLike<number>): Float64Array {
+  const out = new Float64Array(x.length);
+  const sum = new RunningSum();
+  for (let i = 0; i < x.length; i++) {
+    sum.add(x[i]);
+    out[i] = sum.value();
+  }
+  return out;
+}
+
+// ═══════════════════════════════════════════════════════════════
+// Range helpers (x[from..to), no copies)
+// ═══════════════════════════════════════════════════════════════
+
+function fits(x: ArrayLike<number>, from: number, to: number): boolean {
+  return from >= 0 && to <= x.length && from <= to;
+}
+
+/**
+ * Mean of x[from..to); NaN when the range is empty or does not fit in x
+ * (no shorter window at the start)
+ */
+export function rangeMean(x: ArrayLike<number>, from: number, to: number): number {
+  if (!fits(x, from, to) || to === from) return NaN;
+  let s = 0;
+  for (let i = from; i < to; i++) s += x[i];
+  return s / (to - from);
+}
+
+/**
+ * Two-pass standard deviation (0 below ddof + 1 values, NaN when the
+ * range does not fit in x)
+ */
+export function rangeStd(x: ArrayLike<number>, from: number, to: number, ddof = 1): number {
+  if (!fits(x, from, to)) return NaN;
+  const n = to - from;
+  if (n <= ddof) return 0;
+  const m = rangeMean(x, from, to);
+  let ss = 0;
+  for (let i = from; i < to; i++) ss += (x[i] - m) * (x[i] - m);
+  return Math.sqrt(ss / (n - ddof));
+}
+
+/**
+ * Largest peak-to-trough decline inside the range, as a positive fraction.
+ * A lookback reaching before the start of x uses all of x.
+ */
+export function rangeMaxDrawdown(x: ArrayLike<number>, from: number, to: number): number {
+  const f = Math.max(0, from);
+  const t = Math.min(x.length, to);
+  if (t <= f) return 0;
+  let peak = x[f];
+  let maxDD = 0;
+  for (let i = f + 1; i < t; i++) {
+    if (x[i] > peak) peak = x[i];
+    const dd = (peak - x[i]) / peak;
+    if (dd > maxDD) maxDD = dd;
+  }
+  return maxDD;
+}
+
+/**
+ * Max of x[from..to) (-Infinity when empty, NaN when it does not fit in x)
+ */
+export function rangeMax(x: ArrayLike<number>, from: number, to: number): number {
+  if (!fits(x, from, to)) return NaN;
+  let m = -Infinity;
+  for (let i = from; i < to; i++) if (x[i] > m) m = x[i];
+  return m;
+}
+
+// ═══════════════════════════════════════════════════════════════
+// Ring buffer
+// ═══════════════════════════════════════════════════════════════
+
+export class RingBuffer {
+  private buf: Float64Array;
+  private head = 0;          // next write slot
+  private size = 0;
+
+  constructor(readonly capacity: number) {
+    this.buf = new Float64Array(Math.max(1, capacity));
+  }
+
+  get length(): number {
+    return this.size;
+  }
+
+  get full(): boolean {
+    return this.size === this.capacity;
+  }
+
+  push(v: number): void {
+    this.buf[this.head] = v;
+    this.head = (this.head + 1) % this.capacity;
+    if (this.size < this.capacity) this.size++;
+  }
+
+  /**
+   * k-th newest value (0 = newest)
+   */
+  back(k = 0): number {
+    return this.buf[(this.head - 1 - k + 2 * this.capacity) % this.capacity];
+  }
+
+  /**
+   * i-th oldest value (0 = oldest)
+   */
+  at(i: number): number {
+    return this.buf[(this.head - this.size + i + this.capacity) % this.capacity];
+  }
+
+  /**
+   * Sum of the newest n values (all by default)
+   */
+  sum(n = this.size): number {
+    let s = 0;
+    for (let k = 0; k < n; k++) s += this.back(k);
+    return s;
+  }
+
+  /**
+   * Mean of the newest n values, divided by `divisor` (default n) to keep
+   * the `slice(-n).reduce(...) / n` form of callers that always divide by n
+   */
+  mean(n = this.size, divisor = n): number {
+    return divisor > 0 ? this.sum(n) / divisor : 0;
+  }
+
+  /**
+   * Population standard deviation of the newest n values (two-pass)
+   */
+  std(n = this.size): number {
+    if (n === 0) return 0;
+    const mean = this.sum(n) / n;
+    let ss = 0;
+    for (let k = 0; k < n; k++) {
+      const d = this.back(k) - mean;
+      ss += d * d;
+    }
+    return Math.sqrt(ss / n);
+  }
+
+  max(n = this.size): number {
+    let m = -Infinity;
+    for (let k = 0; k < n; k++) if (this.back(k) > m) m = this.back(k);
+    return m;
+  }
+
+  min(n = this.size): number {
+    let m = Infinity;
+    for (let k = 0; k < n; k++) if (this.back(k) < m) m = this.back(k);
+    return m;
+  }
+
+  /**
+   * Newest n values, oldest first
+   */
+  toArray(n = this.size): number[] {
+    const out: number[] = new Array(n);
+    for (let k = 0; k < n; k++) out[n - 1 - k] = this.back(k);
+    return out;
+  }
+
+  clone(): RingBuffer {
+    const copy = new RingBuffer(this.capacity);
+    copy.buf.set(this.buf);
+    copy.head = this.head;
+    copy.size = this.size;
+    return copy;
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════
+// Simple moving average (indicator kernel)
+// ═══════════════════════════════════════════════════════════════
+
+export class RollingMean {
+  private ring: RingBuffer;
+  private total = 0;
+  value: number | undefined;
+
+  constructor(readonly period: number) {
+    this.ring = new RingBuffer(period);
+  }
+
+  update(x: number): number | undefined {
+    const evicted = this.ring.full ? this.ring.at(0) : 0;
+    this.ring.push(x);
+    this.total = this.total - evicted + x;
+    this.value = this.ring.full ? this.total / this.period : undefined;
+    return this.value;
+  }
+
+  clone(): RollingMean {
+    const copy = new RollingMean(this.period);
+    copy.ring = this.ring.clone();
+    copy.total = this.total;
+    copy.value = this.value;
+    return copy;
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════
+// EMA / Wilder average (SMA-seeded)
+// ═══════════════════════════════════════════════════════════════
+
+export class SeededEma {
+  private seedSum = 0;
+  private seen = 0;
+  value: number | undefined;
+
+  /**
+   * alpha defaults to 2 / (period + 1); Wilder averages pass 1 / period
+   */
+  constructor(readonly period: number, private alpha = 2 / (period + 1)) {}
+
+  update(x: number): number | undefined {
+    if (this.value === undefined) {
+      this.seedSum += x;
+      this.seen++;
+      if (this.seen === this.period) this.value = this.seedSum / this.period;
+    } else {
+      this.value = (x - this.value) * this.alpha + this.value;
+    }
+    return this.value;
+  }
+
+  clone(): SeededEma {
+    const copy = new SeededEma(this.period, this.alpha);
+    copy.seedSum = this.seedSum;
+    copy.seen = this.seen;
+    copy.value = this.value;
+    return copy;
+  }
+}
+
+export function wilderAverage(period: number): SeededEma {
+  return new SeededEma(period, 1 / period);
+}
+
+/**
+ * Wilder running sum (ADX smoothing): sum of the first `period` inputs,
+ * then prev - prev / period + x
+ */
+export class WilderSum {
+  private seen = 0;
+  private total = 0;
+  value: number | undefined;
+
+  constructor(readonly period: number) {}
+
+  update(x: number): number | undefined {
+    if (this.value === undefined) {
+      this.total += x;
+      this.seen++;
+      if (this.seen === this.period) this.value = this.total;
+    } else {
+      this.value = this.value - this.value / this.period + x;
+    }
+    return this.value;
+  }
+
+  clone(): WilderSum {
+    const copy = new WilderSum(this.period);
+    copy.seen = this.seen;
+    copy.total = this.total;
+    copy.value = this.value;
+    return copy;
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════
+// RSI (Wilder average gain / loss)
+// ═══════════════════════════════════════════════════════════════
+
+export class RsiKernel {
+  private prev: number | undefined;
+  private seen = 0;
+  private gainSum = 0;
+  private lossSum = 0;
+  private avgGain: number | undefined;
+  private avgLoss: number | undefined;
+  value: number | undefined;
+
+  constructor(readonly period: number) {}
+
+  update(close: number): number | undefined {
+    if (this.prev === undefined) {
+      this.prev = close;
+      return undefined;
+    }
+    const change = close - this.prev;
+    this.prev = close;
+    const gain = change > 0 ? change : 0;
+    const loss = change < 0 ? -change : 0;
+
+    if (this.avgGain === undefined || this.avgLoss === undefined) {
+      this.gainSum += gain;
+      this.lossSum += loss;
+      this.seen++;
+      if (this.seen < this.period) return undefined;
+      this.avgGain = this.gainSum / this.period;
+      this.avgLoss = this.lossSum / this.period;
+    } else {
+      this.avgGain = (this.avgGain * (this.period - 1) + gain) / this.period;
+      this.avgLoss = (this.avgLoss * (this.period - 1) + loss) / this.period;
+    }
+
+    if (this.avgLoss === 0) this.value = 100;
+    else if (this.avgGain === 0) this.value = 0;
+    else this.value = round2(100 - 100 / (1 + this.avgGain / this.avgLoss));
+    return this.value;
+  }
+
+  clone(): RsiKernel {
+    const copy = new RsiKernel(this.period);
+    copy.prev = this.prev;
+    copy.seen = this.seen;
+    copy.gainSum = this.gainSum;
+    copy.lossSum = this.lossSum;
+    copy.avgGain = this.avgGain;
+    copy.avgLoss = this.avgLoss;
+    copy.value = this.value;
+    return copy;
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════
+// True range / Parabolic SAR
+// ═══════════════════════════════════════════════════════════════
+
+export interface HLC {
+  high: number;
+  low: number;
+  close: number;
+}
+
+/**
+ * True range of a candle given the previous close (undefined for the
+ * first candle, like the library series)
+ */
+export function trueRange(c: HLC, prevClose: number | undefined): number | undefined {
+  if (prevClose === undefined) return undefined;
+  return Math.max(c.high - c.low, Math.abs(c.high - prevClose), Math.abs(c.low - prevClose));
+}
+
+export class ParabolicSar {
+  private isUp = true;
+  private accel: number;
+  private extreme = 0;
+  private prev: { high: number; low: number } | undefined;
+  private furthest: { high: number; low: number } | undefined;
+  value: number | undefined;
+
+  constructor(private step = 0.02, private max = 0.2) {
+    this.accel = step;
+  }
+
+  update(c: { high: number; low: number }): number {
+    const cur = { high: c.high, low: c.low };
+    if (this.prev && this.furthest && this.value !== undefined) {
+      let sar = this.value + this.accel * (this.extreme - this.value);
+      if (this.isUp) {
+        sar = Math.min(sar, this.furthest.low, this.prev.low);
+        if (cur.high > this.extreme) {
+          this.extreme = cur.high;
+          this.accel = Math.min(this.accel + this.step, this.max);
+        }
+      } else {
+        sar = Math.max(sar, this.furthest.high, this.prev.high);
+        if (cur.low < this.extreme) {
+          this.extreme = cur.low;
+          this.accel = Math.min(this.accel + this.step, this.max);
+        }
+      }
+      if ((this.isUp && cur.low < sar) || (!this.isUp && cur.high > sar)) {
+        this.accel = this.step;
+        sar = this.extreme;
+        this.isUp = !this.isUp;
+        this.extreme = this.isUp ? cur.high : cur.low;
+      }
+      this.value = sar;
+    } else {
+      this.value = cur.low;
+      this.extreme = cur.high;
+    }
+    this.furthest = this.prev ?? cur;
+    this.prev = cur;
+    return this.value;
+  }
+
+  clone(): ParabolicSar {
+    const copy = new ParabolicSar(this.step, this.max);
+    copy.isUp = this.isUp;
+    copy.accel = this.accel;
+    copy.extreme = this.extreme;
+    copy.prev = this.prev;
+    copy.furthest = this.furthest;
+    copy.value = this.value;
+    return copy;
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════
+// Candle helpers
+// ═══════════════════════════════════════════════════════════════
+
+export function round2(v: number): number {
+  return parseFloat(v.toFixed(2));
+}
+
+/**
+ * Typical price (h + l + c) / 3
+ */
+export function typicalPrice(c: HLC): number {
+  return (c.high + c.low + c.close) / 3;
+}
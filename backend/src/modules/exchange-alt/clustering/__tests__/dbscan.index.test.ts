@@ -0,0 +1,144 @@
+/**
+ * DBSCAN Index Tests
+ *
+ * KD-tree range queries, patched neighborhoods and labels must equal the
+ * brute-force scan and the original O(n²) DBSCAN on the same matrix.
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+  FeatureMatrix,
+  KdTree,
+  changedRows,
+  computeNeighborhoods,
+  createFeatureMatrix,
+  dbscanLabels,
+  rowDistance,
+  updateNeighborhoods,
+} from '../dbscan.index.js';
+import { lcg } from '../../../../common/__tests__/seeded.fixtures.js';
+
+// Gaussian blobs plus uniform noise, fixed seed
+function makeMatrix(n: number, dim: number, seed: number): FeatureMatrix {
+  const rand = lcg(seed);
+  const gauss = () => Math.sqrt(-2 * Math.log(rand() + 1e-12)) * Math.cos(2 * Math.PI * rand());
+  const centers = Array.from({ length: 6 }, () => Array.from({ length: dim }, () => (rand() - 0.5) * 4));
+
+  const m = createFeatureMatrix(n, dim);
+  for (let i = 0; i < n; i++) {
+    const noise = rand() < 0.2;
+    const c = centers[i % centers.length];
+    for (let k = 0; k < dim; k++) {
+      m.data[i * dim + k] = noise ? (rand() - 0.5) * 6 : c[k] + gauss() * 0.15;
+    }
+  }
+  return m;
+}
+
+function bruteForce(m: FeatureMatrix, q: number, eps: number): number[] {
+  const out: number[] = [];
+  for (let i = 0; i < m.n; i++) if (rowDistance(m, q, i) <= eps) out.push(i);
+  return out;
+}
+
+// The scan-based DBSCAN PatternClusteringService used before the index
+function legacyDbscan(m: FeatureMatrix, eps: number, minPts: number): number[] {
+  const labels = new Array(m.n).fill(-1);
+  let clusterId = 0;
+
+  for (let i = 0; i < m.n; i++) {
+    if (labels[i] !== -1) continue;
+    const neighbors = bruteForce(m, i, eps);
+    if (neighbors.length < minPts) {
+      labels[i] = 0;
+      continue;
+    }
+
+    clusterId++;
+    labels[i] = clusterId;
+    const queue = [...neighbors];
+    const visited = new Set<number>([i]);
+    while (queue.length > 0) {
+      const current = queue.shift()!;
+      if (visited.has(current)) continue;
+      visited.add(current);
+      if (labels[current] === 0) labels[current] = clusterId;
+      if (labels[current] !== -1) continue;
+      labels[current] = clusterId;
+
+      const next = bruteForce(m, current, eps);
+      if (next.length >= minPts) {
+        for (const j of next) if (!visited.has(j)) queue.push(j);
+      }
+    }
+  }
+  return labels;
+}
+
+describe('dbscan.index', () => {
+  it('should return the brute-force neighbors from KdTree.rangeQuery', () => {
+    for (const [n, dim] of [[1, 3], [17, 2], [400, 4], [600, 12]]) {
+      const m = makeMatrix(n, dim, 7 + n);
+      const tree = new KdTree(m);
+      for (const eps of [0, 0.1, 0.25, 0.6, 2]) {
+        for (let q = 0; q < n; q++) {
+          expect(Array.from(tree.rangeQuery(q, eps))).toEqual(bruteForce(m, q, eps));
+        }
+      }
+    }
+  });
+
+  it('should find points exactly at eps and duplicate rows', () => {
+    const m = createFeatureMatrix(40, 2);
+    for (let i = 0; i < 40; i++) {
+      m.data[i * 2] = (i % 20) * 0.25;   // rows i and i + 20 coincide
+      m.data[i * 2 + 1] = 0;
+    }
+    const tree = new KdTree(m);
+    for (let q = 0; q < 40; q++) {
+      expect(Array.from(tree.rangeQuery(q, 0.25))).toEqual(bruteForce(m, q, 0.25));
+    }
+  });
+
+  it('should patch neighborhoods to the full recomputation', () => {
+    const eps = 0.3;
+    const m = makeMatrix(500, 6, 11);
+    let nb = computeNeighborhoods(m, eps);
+    const rand = lcg(3);
+
+    for (let round = 0; round < 5; round++) {
+      const next = createFeatureMatrix(m.n, m.dim);
+      next.data.set(m.data);
+      // Move a few rows: small nudges, jumps into other blobs, back again
+      for (let c = 0; c < 5 + round * 10; c++) {
+        const i = Math.floor(rand() * m.n);
+        const j = Math.floor(rand() * m.n);
+        for (let k = 0; k < m.dim; k++) {
+          next.data[i * m.dim + k] = rand() < 0.5
+            ? next.data[i * m.dim + k] + (rand() - 0.5) * 0.2
+            : m.data[j * m.dim + k];
+        }
+      }
+
+      const changed = changedRows(m, next);
+      expect(changed.length).toBeGreaterThan(0);
+      nb = updateNeighborhoods(nb, next, changed);
+      const full = computeNeighborhoods(next, eps);
+      expect(nb.lists.map(l => Array.from(l))).toEqual(full.lists.map(l => Array.from(l)));
+      m.data.set(next.data);
+    }
+  });
+
+  it('should label like the original O(n²) DBSCAN', () => {
+    for (const [n, dim, seed] of [[300, 4, 5], [700, 12, 9]]) {
+      const m = makeMatrix(n, dim, seed);
+      for (const eps of [0.2, 0.35, 0.6]) {
+        const nb = computeNeighborhoods(m, eps);
+        for (const minPts of [1, 3, 5, 10]) {
+          const labels = Array.from(dbscanLabels(nb, minPts));
+          expect(labels).toEqual(legacyDbscan(m, eps, minPts));
+        }
+      }
+    }
+  });
+});
@@ -0,0 +1,272 @@
+/**
+ * DBSCAN INDEX
+ * ============
+ *
+ * Packed feature matrix + KD-tree range queries + cached neighborhoods
+ * for PatternClusteringService.
+ *
+ * - Rows live in one Float64Array (row-major), no per-row arrays
+ * - Neighborhoods (distance <= eps, self included) are computed once per
+ *   point through a KD-tree and kept as one sorted Int32Array per point;
+ *   DBSCAN expansion only reads them
+ * - When a few rows change between scans, only the neighborhoods touching
+ *   those rows are patched
+ *
+ * Labels match the original scan-based DBSCAN: 0 = noise, clusters are
+ * numbered 1.. in seed order, border points go to the first cluster that
+ * reaches them.
+ */
+
+// ═══════════════════════════════════════════════════════════════
+// TYPES
+// ═══════════════════════════════════════════════════════════════
+
+export interface FeatureMatrix {
+  n: number;
+  dim: number;
+  data: Float64Array;    // n * dim, row-major
+}
+
+export interface Neighborhoods {
+  eps: number;
+  lists: Int32Array[];   // per point, ascending indices, self included
+}
+
+interface KdNode {
+  lo: number;            // range in perm
+  hi: number;
+  axis: number;          // -1 for leaves
+  split: number;
+  left: KdNode | null;
+  right: KdNode | null;
+}
+
+const KD_LEAF_SIZE = 16;
+
+// ═══════════════════════════════════════════════════════════════
+// MATRIX
+// ═══════════════════════════════════════════════════════════════
+
+export function createFeatureMatrix(n: number, dim: number): FeatureMatrix {
+  return { n, dim, data: new Float64Array(n * dim) };
+}
+
+export function rowDistance(m: FeatureMatrix, a: number, b: number): number {
+  const { data, dim } = m;
+  const oa = a * dim;
+  const ob = b * dim;
+  let sum = 0;
+  for (let k = 0; k < dim; k++) {
+    const d = data[oa + k] - data[ob + k];
+    sum += d * d;
+  }
+  return Math.sqrt(sum);
+}
+
+/**
+ * Rows whose values differ between two matrices of the same shape
+ */
+export function changedRows(prev: FeatureMatrix, next: FeatureMatrix): number[] {
+  const changed: number[] = [];
+  const { dim } = next;
+  for (let i = 0; i < next.n; i++) {
+    const off = i * dim;
+    for (let k = 0; k < dim; k++) {
+      if (prev.data[off + k] !== next.data[off + k]) {
+        changed.push(i);
+        break;
+      }
+    }
+  }
+  return changed;
+}
+
+// ═══════════════════════════════════════════════════════════════
+// KD-TREE
+// ═══════════════════════════════════════════════════════════════
+
+export class KdTree {
+  private perm: Int32Array;
+  private root: KdNode | null;
+
+  constructor(private m: FeatureMatrix) {
+    this.perm = new Int32Array(m.n);
+    for (let i = 0; i < m.n; i++) this.perm[i] = i;
+    this.root = m.n > 0 ? this.build(0, m.n) : null;
+  }
+
+  /**
+   * Indices of rows within eps of row q (ascending, q included)
+   */
+  rangeQuery(q: number, eps: number): Int32Array {
+    const out: number[] = [];
+    if (this.root) this.search(this.root, q, eps, out);
+    out.sort((a, b) => a - b);
+    return Int32Array.from(out);
+  }
+
+  private build(lo: number, hi: number): KdNode {
+    if (hi - lo <= KD_LEAF_SIZE) {
+      return { lo, hi, axis: -1, split: 0, left: null, right: null };
+    }
+
+    // Split on the widest axis at the median
+    const { data, dim } = this.m;
+    let axis = 0;
+    let widest = -1;
+    for (let k = 0; k < dim; k++) {
+      let min = Infinity;
+      let max = -Infinity;
+      for (let i = lo; i < hi; i++) {
+        const v = data[this.perm[i] * dim + k];
+        if (v < min) min = v;
+        if (v > max) max = v;
+      }
+      if (max - min > widest) {
+        widest = max - min;
+        axis = k;
+      }
+    }
+    if (widest <= 0) {
+      return { lo, hi, axis: -1, split: 0, left: null, right: null };
+    }
+
+    const sorted = Array.from(this.perm.subarray(lo, hi))
+      .sort((a, b) => data[a * dim + axis] - data[b * dim + axis]);
+    this.perm.set(sorted, lo);
+    const mid = lo + ((hi - lo) >> 1);
+    const split = data[this.perm[mid] * dim + axis];
+
+    return {
+      lo,
+      hi,
+      axis,
+      split,
+      left: this.build(lo, mid),
+      right: this.build(mid, hi),
+    };
+  }
+
+  private search(node: KdNode, q: number, eps: number, out: number[]): void {
+    if (node.axis < 0) {
+      for (let i = node.lo; i < node.hi; i++) {
+        const p = this.perm[i];
+        if (rowDistance(this.m, q, p) <= eps) out.push(p);
+      }
+      return;
+    }
+
+    // left holds values <= split, right values >= split; prune with a
+    // little slack so rounding never drops a point exactly at eps
+    const v = this.m.data[q * this.m.dim + node.axis];
+    const reach = eps * (1 + 1e-9);
+    if (v - reach <= node.split) this.search(node.left!, q, eps, out);
+    if (v + reach >= node.split) this.search(node.right!, q, eps, out);
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════
+// NEIGHBORHOODS
+// ═══════════════════════════════════════════════════════════════
+
+export function computeNeighborhoods(m: FeatureMatrix, eps: number, tree = new KdTree(m)): Neighborhoods {
+  const lists: Int32Array[] = new Array(m.n);
+  for (let i = 0; i < m.n; i++) lists[i] = tree.rangeQuery(i, eps);
+  return { eps, lists };
+}
+
+/**
+ * Patch neighborhoods after `changed` rows moved (same n, same eps).
+ * Changed rows are re-queried; every other row only drops / gains
+ * changed rows, using symmetry of the distance.
+ */
+export function updateNeighborhoods(
+  prev: Neighborhoods,
+  m: FeatureMatrix,
+  changed: number[],
+  tree = new KdTree(m)
+): Neighborhoods {
+  const isChanged = new Uint8Array(m.n);
+  for (const c of changed) isChanged[c] = 1;
+
+  const lists = prev.lists.slice();
+  const additions = new Map<number, number[]>();
+
+  for (const c of changed) {
+    lists[c] = tree.rangeQuery(c, prev.eps);
+    for (const u of lists[c]) {
+      if (isChanged[u]) continue;
+      let add = additions.get(u);
+      if (!add) additions.set(u, (add = []));
+      add.push(c);
+    }
+  }
+
+  for (let u = 0; u < m.n; u++) {
+    if (isChanged[u]) continue;
+    const old = lists[u];
+    const add = additions.get(u);
+    let touchesChanged = false;
+    for (let k = 0; k < old.length && !touchesChanged; k++) touchesChanged = isChanged[old[k]] === 1;
+    if (!touchesChanged && !add) continue;
+
+    const merged: number[] = [];
+    for (let k = 0; k < old.length; k++) if (!isChanged[old[k]]) merged.push(old[k]);
+    if (add) merged.push(...add);
+    merged.sort((a, b) => a - b);
+    lists[u] = Int32Array.from(merged);
+  }
+
+  return { eps: prev.eps, lists };
+}
+
+// ═══════════════════════════════════════════════════════════════
+// DBSCAN
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * DBSCAN over cached neighborhoods. Returns labels (0 = noise).
+ */
+export function dbscanLabels(nb: Neighborhoods, minPts: number): Int32Array {
+  const n = nb.lists.length;
+  const labels = new Int32Array(n).fill(-1);   // -1 = unvisited
+  const queue = new Int32Array(n);
+  let clusterId = 0;
+
+  for (let i = 0; i < n; i++) {
+    if (labels[i] !== -1) continue;
+
+    if (nb.lists[i].length < minPts) {
+      labels[i] = 0;
+      continue;
+    }
+
+    clusterId++;
+    labels[i] = clusterId;
+    let head = 0;
+    let tail = 0;
+    for (const j of nb.lists[i]) {
+      if (labels[j] <= 0) {
+        const wasUnvisited = labels[j] === -1;
+        labels[j] = clusterId;
+        if (wasUnvisited) queue[tail++] = j;
+      }
+    }
+
+    while (head < tail) {
+      const current = queue[head++];
+      const neighbors = nb.lists[current];
+      if (neighbors.length < minPts) continue;   // border point
+
+      for (const j of neighbors) {
+        if (labels[j] <= 0) {
+          const wasUnvisited = labels[j] === -1;
+          labels[j] = clusterId;
+          if (wasUnvisited) queue[tail++] = j;
+        }
+      }
+    }
+  }
+
+  return labels;
+}
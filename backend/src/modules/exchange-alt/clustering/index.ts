@@ -4,5 +4,6 @@
  */
 
 export * from './pattern-clustering.service.js';
+export * from './dbscan.index.js';
 
 console.log('[ExchangeAlt] Clustering module loaded');
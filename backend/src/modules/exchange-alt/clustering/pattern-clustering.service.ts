@@ -3,6 +3,11 @@
  * ===========================
  * 
  * DBSCAN clustering for grouping altcoins by similar technical patterns.
+ * 
+ * Features are packed into one Float64Array; eps-neighborhoods come from a
+ * KD-tree and are cached per (venue, timeframe), so a scan where only a few
+ * symbols moved patches those neighborhoods instead of recomputing all
+ * (see dbscan.index.ts).
  */
 
 import type {
@@ -19,6 +24,16 @@ import {
   DBSCAN_MIN_PTS,
 } from '../constants.js';
 import { v4 as uuidv4 } from 'uuid';
+import {
+  FeatureMatrix,
+  Neighborhoods,
+  KdTree,
+  changedRows,
+  computeNeighborhoods,
+  createFeatureMatrix,
+  dbscanLabels,
+  updateNeighborhoods,
+} from './dbscan.index.js';
 
 // ═══════════════════════════════════════════════════════════════
 // TYPES
@@ -29,6 +44,25 @@ export interface ClusteringConfig {
   minPts: number;        // DBSCAN min points per cluster
   featureKeys: readonly string[];
   normalizeFeatures: boolean;
+  // Opt-in: keep the previous scan's normalization while every feature's
+  // mean and std drift at most this much (in std units), so unchanged
+  // symbols keep their coordinates and neighborhoods can be patched.
+  // Labels then come from slightly stale stats; 0 renormalizes every scan
+  statsTolerance: number;
+  // Patch neighborhoods when at most this fraction of rows changed
+  incrementalMaxChanged: number;
+}
+
+interface FeatureStats {
+  means: number[];
+  stds: number[];
+}
+
+interface ScanState {
+  symbols: string[];
+  stats: FeatureStats;
+  matrix: FeatureMatrix;
+  neighborhoods: Neighborhoods;
 }
 
 export interface ClusteringResult {
@@ -43,6 +77,8 @@ export interface ClusteringResult {
     avgClusterSize: number;
     avgDispersion: number;
     durationMs: number;
+    neighborhoods?: 'full' | 'incremental';
+    changedCount?: number;
   };
 }
 
@@ -52,6 +88,7 @@ export interface ClusteringResult {
 
 export class PatternClusteringService {
   private config: ClusteringConfig;
+  private lastScan = new Map<string, ScanState>();
 
   constructor(config?: Partial<ClusteringConfig>) {
     this.config = {
@@ -59,6 +96,8 @@ export class PatternClusteringService {
       minPts: DBSCAN_MIN_PTS,
       featureKeys: ALT_FEATURE_KEYS,
       normalizeFeatures: true,
+      statsTolerance: 0,
+      incrementalMaxChanged: 0.25,
       ...config,
     };
   }
@@ -81,13 +120,36 @@ export class PatternClusteringService {
     // Extract feature matrix
     const { matrix, symbols, featureStats } = this.extractFeatureMatrix(vectors);
 
+    // Previous scan of the same universe can be patched
+    const scanKey = `${venue}:${timeframe}`;
+    const prev = this.lastScan.get(scanKey);
+    const comparable = prev !== undefined &&
+      prev.neighborhoods.eps === this.config.eps &&
+      prev.symbols.length === symbols.length &&
+      prev.symbols.every((s, i) => s === symbols[i]);
+
     // Normalize if configured
+    const stats = comparable && this.statsWithinTolerance(prev!.stats, featureStats)
+      ? prev!.stats
+      : featureStats;
     const normalizedMatrix = this.config.normalizeFeatures
-      ? this.normalizeMatrix(matrix, featureStats)
+      ? this.normalizeMatrix(matrix, stats)
       : matrix;
 
+    // Neighborhoods: patch the changed rows or rebuild
+    const changed = comparable ? changedRows(prev!.matrix, normalizedMatrix) : null;
+    const incremental = changed !== null &&
+      changed.length <= symbols.length * this.config.incrementalMaxChanged;
+    const neighborhoods = !incremental
+      ? computeNeighborhoods(normalizedMatrix, this.config.eps, new KdTree(normalizedMatrix))
+      : changed!.length > 0
+        ? updateNeighborhoods(prev!.neighborhoods, normalizedMatrix, changed!, new KdTree(normalizedMatrix))
+        : prev!.neighborhoods;
+
+    this.lastScan.set(scanKey, { symbols, stats, matrix: normalizedMatrix, neighborhoods });
+
     // Run DBSCAN
-    const labels = this.dbscan(normalizedMatrix);
+    const labels = dbscanLabels(neighborhoods, this.config.minPts);
 
     // Build clusters
     const { clusters, memberships, noise } = this.buildClusters(
@@ -120,6 +182,8 @@ export class PatternClusteringService {
         avgClusterSize,
         avgDispersion,
         durationMs: Date.now() - startTime,
+        neighborhoods: incremental ? 'incremental' : 'full',
+        changedCount: changed?.length,
       },
     };
   }
@@ -129,36 +193,35 @@ export class PatternClusteringService {
   // ═══════════════════════════════════════════════════════════════
 
   private extractFeatureMatrix(vectors: IndicatorVector[]): {
-    matrix: number[][];
+    matrix: FeatureMatrix;
     symbols: string[];
-    featureStats: { means: number[]; stds: number[] };
+    featureStats: FeatureStats;
   } {
-    const matrix: number[][] = [];
+    const keys = this.config.featureKeys;
+    const dim = keys.length;
+    const matrix = createFeatureMatrix(vectors.length, dim);
     const symbols: string[] = [];
 
-    for (const vector of vectors) {
-      const features: number[] = [];
-      
-      for (const key of this.config.featureKeys) {
-        const value = this.getFeatureValue(vector, key);
-        features.push(value);
+    for (let i = 0; i < vectors.length; i++) {
+      for (let j = 0; j < dim; j++) {
+        matrix.data[i * dim + j] = this.getFeatureValue(vectors[i], keys[j]);
       }
-      
-      matrix.push(features);
-      symbols.push(vector.symbol);
+      symbols.push(vectors[i].symbol);
     }
 
     // Calculate feature statistics
+    const n = vectors.length;
     const means: number[] = [];
     const stds: number[] = [];
 
-    for (let j = 0; j < this.config.featureKeys.length; j++) {
-      const column = matrix.map(row => row[j]);
-      const mean = column.reduce((a, b) => a + b, 0) / column.length;
-      const std = Math.sqrt(
-        column.reduce((a, b) => a + Math.pow(b - mean, 2), 0) / column.length
-      ) || 1;
-      
+    for (let j = 0; j < dim; j++) {
+      let sum = 0;
+      for (let i = 0; i < n; i++) sum += matrix.data[i * dim + j];
+      const mean = sum / n;
+      let sq = 0;
+      for (let i = 0; i < n; i++) sq += Math.pow(matrix.data[i * dim + j] - mean, 2);
+      const std = Math.sqrt(sq / n) || 1;
+
       means.push(mean);
       stds.push(std);
     }
@@ -184,96 +247,24 @@ export class PatternClusteringService {
     }
   }
 
-  private normalizeMatrix(
-    matrix: number[][],
-    stats: { means: number[]; stds: number[] }
-  ): number[][] {
-    return matrix.map(row =>
-      row.map((value, j) => (value - stats.means[j]) / stats.stds[j])
-    );
-  }
-
-  // ═══════════════════════════════════════════════════════════════
-  // DBSCAN ALGORITHM
-  // ═══════════════════════════════════════════════════════════════
-
-  private dbscan(matrix: number[][]): number[] {
-    const n = matrix.length;
-    const labels = new Array(n).fill(-1); // -1 = unvisited/noise
-    let clusterId = 0;
-
+  private normalizeMatrix(matrix: FeatureMatrix, stats: FeatureStats): FeatureMatrix {
+    const { n, dim } = matrix;
+    const out = createFeatureMatrix(n, dim);
     for (let i = 0; i < n; i++) {
-      if (labels[i] !== -1) continue; // Already processed
-
-      const neighbors = this.regionQuery(matrix, i);
-
-      if (neighbors.length < this.config.minPts) {
-        labels[i] = 0; // Mark as noise (cluster 0)
-      } else {
-        clusterId++;
-        this.expandCluster(matrix, labels, i, neighbors, clusterId);
+      for (let j = 0; j < dim; j++) {
+        out.data[i * dim + j] = (matrix.data[i * dim + j] - stats.means[j]) / stats.stds[j];
       }
     }
-
-    return labels;
+    return out;
   }
 
-  private regionQuery(matrix: number[][], pointIdx: number): number[] {
-    const neighbors: number[] = [];
-    const point = matrix[pointIdx];
-
-    for (let i = 0; i < matrix.length; i++) {
-      if (this.euclideanDistance(point, matrix[i]) <= this.config.eps) {
-        neighbors.push(i);
-      }
-    }
-
-    return neighbors;
-  }
-
-  private expandCluster(
-    matrix: number[][],
-    labels: number[],
-    pointIdx: number,
-    neighbors: number[],
-    clusterId: number
-  ): void {
-    labels[pointIdx] = clusterId;
-    const queue = [...neighbors];
-    const visited = new Set<number>([pointIdx]);
-
-    while (queue.length > 0) {
-      const current = queue.shift()!;
-      
-      if (visited.has(current)) continue;
-      visited.add(current);
-
-      if (labels[current] === 0) {
-        // Was noise, now border point
-        labels[current] = clusterId;
-      }
-
-      if (labels[current] !== -1) continue;
-
-      labels[current] = clusterId;
-
-      const newNeighbors = this.regionQuery(matrix, current);
-      if (newNeighbors.length >= this.config.minPts) {
-        for (const neighbor of newNeighbors) {
-          if (!visited.has(neighbor)) {
-            queue.push(neighbor);
-          }
-        }
-      }
+  private statsWithinTolerance(used: FeatureStats, fresh: FeatureStats): boolean {
+    const tol = this.config.statsTolerance;
+    for (let j = 0; j < used.means.length; j++) {
+      if (Math.abs(fresh.means[j] - used.means[j]) > tol * used.stds[j]) return false;
+      if (Math.abs(fresh.stds[j] - used.stds[j]) > tol * used.stds[j]) return false;
     }
-  }
-
-  private euclideanDistance(a: number[], b: number[]): number {
-    let sum = 0;
-    for (let i = 0; i < a.length; i++) {
-      sum += Math.pow(a[i] - b[i], 2);
-    }
-    return Math.sqrt(sum);
+    return true;
   }
 
   // ═══════════════════════════════════════════════════════════════
@@ -283,8 +274,8 @@ export class PatternClusteringService {
   private buildClusters(
     _vectors: IndicatorVector[],
     symbols: string[],
-    labels: number[],
-    normalizedMatrix: number[][],
+    labels: Int32Array,
+    normalizedMatrix: FeatureMatrix,
     venue: Venue,
     timeframe: Timeframe
   ): {
@@ -316,13 +307,12 @@ export class PatternClusteringService {
     // Build each cluster
     for (const [clusterId, memberIndices] of clusterMap) {
       const clusterSymbols = memberIndices.map(i => symbols[i]);
-      const clusterVectors = memberIndices.map(i => normalizedMatrix[i]);
 
       // Calculate centroid
-      const centroid = this.calculateCentroid(clusterVectors);
+      const centroid = this.calculateCentroid(normalizedMatrix, memberIndices);
 
       // Calculate dispersion (avg distance to centroid)
-      const distances = clusterVectors.map(v => this.euclideanDistance(v, centroid));
+      const distances = memberIndices.map(i => this.distanceToPoint(normalizedMatrix, i, centroid));
       const avgDispersion = distances.reduce((a, b) => a + b, 0) / distances.length;
 
       // Build signature
@@ -373,23 +363,32 @@ export class PatternClusteringService {
     return { clusters, memberships, noise };
   }
 
-  private calculateCentroid(vectors: number[][]): number[] {
-    const dim = vectors[0].length;
+  private calculateCentroid(matrix: FeatureMatrix, rows: number[]): number[] {
+    const dim = matrix.dim;
     const centroid = new Array(dim).fill(0);
 
-    for (const v of vectors) {
+    for (const r of rows) {
       for (let i = 0; i < dim; i++) {
-        centroid[i] += v[i];
+        centroid[i] += matrix.data[r * dim + i];
       }
     }
 
     for (let i = 0; i < dim; i++) {
-      centroid[i] /= vectors.length;
+      centroid[i] /= rows.length;
     }
 
     return centroid;
   }
 
+  private distanceToPoint(matrix: FeatureMatrix, row: number, point: number[]): number {
+    const dim = matrix.dim;
+    let sum = 0;
+    for (let i = 0; i < dim; i++) {
+      sum += Math.pow(matrix.data[row * dim + i] - point[i], 2);
+    }
+    return Math.sqrt(sum);
+  }
+
   private buildSignature(centroid: number[]): PatternSignature {
     const bins: Record<string, string | number> = {};
 
@@ -499,6 +498,7 @@ export class PatternClusteringService {
 
   updateConfig(config: Partial<ClusteringConfig>): void {
     this.config = { ...this.config, ...config };
+    this.lastScan.clear();
   }
 
   getConfig(): ClusteringConfig {
@@ -6,5 +6,6 @@
 export * from './indicator.types.js';
 export * from './indicator-engine.service.js';
 export * from './providers/index.js';
+export * from './rolling/rolling-state.store.js';
 
 console.log('[ExchangeAlt] Indicators module loaded');
@@ -3,27 +3,38 @@
  * =========================
  * 
  * Orchestrates all indicator providers to build IndicatorVector for each asset.
+ *
+ * Incremental providers (momentum, trend, volatility, volume, structure)
+ * keep per-(venue, symbol, timeframe) rolling state in a RollingStateStore:
+ * each scan folds only the candles that closed since the previous one and
+ * evaluates the open candle on a copy. Cold starts, gaps and revised
+ * candles replay the window (see rolling-state.store.ts for how recursive
+ * averages relate to calculate() over the window).
  */
 
 import type {
   IIndicatorProvider,
+  IIncrementalIndicatorProvider,
   IndicatorInput,
   IndicatorOutput,
   IndicatorEngineConfig,
   VectorBuildResult,
   BatchVectorResult,
 } from './indicator.types.js';
-import { DEFAULT_ENGINE_CONFIG } from './indicator.types.js';
+import { DEFAULT_ENGINE_CONFIG, isIncrementalProvider } from './indicator.types.js';
 import type { IndicatorVector, MarketOHLCV, DerivativesSnapshot, Timeframe, Venue } from '../types.js';
 import { ALL_PROVIDERS } from './providers/index.js';
 import { ALT_THRESHOLDS } from '../constants.js';
+import { RollingStateStore, type RollingSyncResult } from './rolling/rolling-state.store.js';
 
 export class IndicatorEngineService {
   private providers: IIndicatorProvider[] = [];
   private config: IndicatorEngineConfig;
+  private rolling: RollingStateStore;
 
   constructor(config?: Partial<IndicatorEngineConfig>) {
     this.config = { ...DEFAULT_ENGINE_CONFIG, ...config };
+    this.rolling = new RollingStateStore(this.config.maxRollingSeries);
     
     // Register all providers
     for (const provider of ALL_PROVIDERS) {
@@ -35,6 +46,7 @@ export class IndicatorEngineService {
 
   registerProvider(provider: IIndicatorProvider): void {
     this.providers.push(provider);
+    this.rolling.clear();
     console.log(`[IndicatorEngine] Registered provider: ${provider.id} (${provider.indicators.length} indicators)`);
   }
 
@@ -64,6 +76,9 @@ export class IndicatorEngineService {
       timeframe,
     };
 
+    // Advance rolling state once for all incremental providers
+    const rolling = this.syncRolling(symbol, venue, candles, timeframe);
+
     // Run providers (can be parallelized)
     const providerPromises = this.providers.map(async (provider) => {
       const providerStart = Date.now();
@@ -78,12 +93,10 @@ export class IndicatorEngineService {
           };
         }
 
-        const outputs = await Promise.race([
-          provider.calculate(input),
-          new Promise<IndicatorOutput[]>((_, reject) =>
-            setTimeout(() => reject(new Error('Timeout')), this.config.timeoutMs)
-          ),
-        ]);
+        const state = rolling?.states.get(provider.id);
+        const outputs = state && isIncrementalProvider(provider)
+          ? provider.calculateFromState(state, input)
+          : await this.calculateWithTimeout(provider, input);
 
         return {
           id: provider.id,
@@ -143,9 +156,55 @@ export class IndicatorEngineService {
       missing,
       coverage,
       providers: providerResults,
+      rolling: rolling
+        ? { mode: rolling.mode, applied: rolling.applied, reason: rolling.reason }
+        : undefined,
     };
   }
 
+  private async calculateWithTimeout(
+    provider: IIndicatorProvider,
+    input: IndicatorInput
+  ): Promise<IndicatorOutput[]> {
+    let timer: ReturnType<typeof setTimeout> | undefined;
+    try {
+      return await Promise.race([
+        provider.calculate(input),
+        new Promise<IndicatorOutput[]>((_, reject) => {
+          timer = setTimeout(() => reject(new Error('Timeout')), this.config.timeoutMs);
+        }),
+      ]);
+    } finally {
+      clearTimeout(timer);
+    }
+  }
+
+  // ═══════════════════════════════════════════════════════════════
+  // ROLLING STATE
+  // ═══════════════════════════════════════════════════════════════
+
+  private syncRolling(
+    symbol: string,
+    venue: Venue,
+    candles: MarketOHLCV[],
+    timeframe: Timeframe
+  ): RollingSyncResult | null {
+    const incremental = this.providers.filter(isIncrementalProvider) as IIncrementalIndicatorProvider[];
+    if (incremental.length === 0 || candles.length === 0) return null;
+
+    if (!this.config.incremental) {
+      return this.rolling.replay(candles, incremental);
+    }
+    return this.rolling.sync(`${venue}:${symbol}:${timeframe}`, candles, timeframe, incremental);
+  }
+
+  /**
+   * Drop all rolling state (next scan replays full history)
+   */
+  resetRollingState(): void {
+    this.rolling.clear();
+  }
+
   // ═══════════════════════════════════════════════════════════════
   // BATCH BUILD FOR MULTIPLE ASSETS
   // ═══════════════════════════════════════════════════════════════
@@ -164,6 +223,8 @@ export class IndicatorEngineService {
     const errors = new Map<string, string>();
     let totalCoverage = 0;
     let successCount = 0;
+    let incrementalCount = 0;
+    let recomputedCount = 0;
 
     // Process in parallel batches
     const batchSize = this.config.parallelProviders;
@@ -186,6 +247,7 @@ export class IndicatorEngineService {
             success: true,
             vector: result.vector as IndicatorVector,
             coverage: result.coverage,
+            rollingMode: result.rolling?.mode,
           };
         } catch (error: any) {
           return {
@@ -203,6 +265,8 @@ export class IndicatorEngineService {
           vectors.set(result.symbol, result.vector);
           totalCoverage += result.coverage ?? 0;
           successCount++;
+          if (result.rollingMode === 'incremental') incrementalCount++;
+          else if (result.rollingMode === 'full') recomputedCount++;
         } else {
           errors.set(result.symbol, result.error ?? 'Unknown error');
         }
@@ -218,6 +282,8 @@ export class IndicatorEngineService {
         failed: errors.size,
         avgCoverage: successCount > 0 ? totalCoverage / successCount : 0,
         durationMs: Date.now() - startTime,
+        incremental: incrementalCount,
+        recomputed: recomputedCount,
       },
     };
   }
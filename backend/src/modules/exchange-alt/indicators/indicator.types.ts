@@ -47,6 +47,39 @@ export interface IIndicatorProvider {
   calculate(input: IndicatorInput): Promise<IndicatorOutput[]>;
 }
 
+// ═══════════════════════════════════════════════════════════════
+// INCREMENTAL (ROLLING STATE) PROVIDERS
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * Per-(asset, timeframe) rolling state of one provider. update() folds one
+ * candle in O(1); clone() is used to evaluate the still-open last candle
+ * without committing it.
+ */
+export interface IRollingIndicatorState {
+  update(candle: MarketOHLCV): void;
+  clone(): IRollingIndicatorState;
+}
+
+/**
+ * Provider whose outputs are a pure function of its rolling state.
+ * calculate(input) is equivalent to replaying input.candles into
+ * createState(input.candles.length) and reading it.
+ */
+export interface IIncrementalIndicatorProvider<S extends IRollingIndicatorState = IRollingIndicatorState>
+  extends IIndicatorProvider {
+  /**
+   * `window` = candles per scan; window-anchored values (VWAP, OBV level,
+   * pivots) cover the newest `window` candles
+   */
+  createState(window: number): S;
+  calculateFromState(state: S, input: IndicatorInput): IndicatorOutput[];
+}
+
+export function isIncrementalProvider(p: IIndicatorProvider): p is IIncrementalIndicatorProvider {
+  return typeof (p as Partial<IIncrementalIndicatorProvider>).createState === 'function';
+}
+
 // ═══════════════════════════════════════════════════════════════
 // INDICATOR REGISTRY
 // ═══════════════════════════════════════════════════════════════
@@ -62,6 +95,8 @@ export interface IndicatorEngineConfig {
   defaultTimeframe: Timeframe;
   parallelProviders: number;
   timeoutMs: number;
+  incremental: boolean;         // reuse rolling state between scans
+  maxRollingSeries: number;     // (asset, timeframe) states kept in memory
 }
 
 export const DEFAULT_ENGINE_CONFIG: IndicatorEngineConfig = {
@@ -69,6 +104,8 @@ export const DEFAULT_ENGINE_CONFIG: IndicatorEngineConfig = {
   defaultTimeframe: '1h',
   parallelProviders: 5,
   timeoutMs: 10000,
+  incremental: true,
+  maxRollingSeries: 5000,
 };
 
 // ═══════════════════════════════════════════════════════════════
@@ -85,6 +122,11 @@ export interface VectorBuildResult {
     error?: string;
     durationMs: number;
   }[];
+  rolling?: {
+    mode: 'incremental' | 'full';
+    applied: number;            // candles folded into the rolling state
+    reason?: string;            // why a full recompute was needed
+  };
 }
 
 export interface BatchVectorResult {
@@ -96,6 +138,8 @@ export interface BatchVectorResult {
     failed: number;
     avgCoverage: number;
     durationMs: number;
+    incremental: number;        // assets updated from rolling state
+    recomputed: number;         // assets replayed from full history
   };
 }
 
@@ -3,27 +3,142 @@
  * ============================
  * 
  * RSI, MACD, Stochastic, ROC, Williams %R, CCI, MFI
+ *
+ * Computed from MomentumRollingState, which the engine keeps per asset and
+ * timeframe and advances by one O(1) update per new candle.
  */
 
-import {
-  RSI,
-  MACD,
-  Stochastic,
-  ROC,
-  WilliamsR,
-  CCI,
-  MFI,
-  StochasticRSI,
-} from 'technicalindicators';
-
 import type {
-  IIndicatorProvider,
+  IIncrementalIndicatorProvider,
+  IRollingIndicatorState,
   IndicatorInput,
   IndicatorOutput,
   IndicatorCategory,
 } from '../indicator.types.js';
+import type { MarketOHLCV } from '../../types.js';
+import {
+  RingBuffer,
+  RollingMean,
+  RsiKernel,
+  SeededEma,
+  round2,
+  typicalPrice,
+} from '../../../../common/rolling.kernels.js';
+
+// ═══════════════════════════════════════════════════════════════
+// ROLLING STATE
+// ═══════════════════════════════════════════════════════════════
+
+export class MomentumRollingState implements IRollingIndicatorState {
+  lastClose = 0;
+
+  // RSI 14 + last 20 values for the z-score
+  rsi = new RsiKernel(14);
+  rsiRecent = new RingBuffer(20);
+
+  // MACD 12/26/9
+  ema12 = new SeededEma(12);
+  ema26 = new SeededEma(26);
+  macdSignal = new SeededEma(9);
+  macd: number | undefined;
+
+  // Stochastic 14/3, Williams %R 14
+  highs = new RingBuffer(14);
+  lows = new RingBuffer(14);
+  stochK: number | undefined;
+  stochD = new RollingMean(3);
+
+  // Stochastic RSI 14/14/3/3
+  rsiWindow = new RingBuffer(14);
+  stochRsiK = new RollingMean(3);
+  stochRsiD = new RollingMean(3);
+
+  // ROC 10
+  closes = new RingBuffer(11);
+
+  // CCI 20
+  typical = new RingBuffer(20);
+
+  // MFI 14
+  prevTypical: number | undefined;
+  positiveFlow = new RingBuffer(14);
+  negativeFlow = new RingBuffer(14);
+
+  update(c: MarketOHLCV): void {
+    this.lastClose = c.close;
+
+    const rsi = this.rsi.update(c.close);
+    if (rsi !== undefined) {
+      this.rsiRecent.push(rsi);
+      this.rsiWindow.push(rsi);
+      if (this.rsiWindow.full) {
+        const lo = this.rsiWindow.min();
+        const hi = this.rsiWindow.max();
+        const stochRsi = ((rsi - lo) / (hi - lo)) * 100;
+        const k = this.stochRsiK.update(Number.isNaN(stochRsi) ? 0 : stochRsi);
+        if (k !== undefined) this.stochRsiD.update(k);
+      }
+    }
+
+    const fast = this.ema12.update(c.close);
+    const slow = this.ema26.update(c.close);
+    if (fast !== undefined && slow !== undefined) {
+      this.macd = fast - slow;
+      this.macdSignal.update(this.macd);
+    }
+
+    this.highs.push(c.high);
+    this.lows.push(c.low);
+    if (this.highs.full) {
+      const hh = this.highs.max();
+      const ll = this.lows.min();
+      const k = ((c.close - ll) / (hh - ll)) * 100;
+      this.stochK = Number.isNaN(k) ? 0 : k;
+      this.stochD.update(this.stochK);
+    }
+
+    this.closes.push(c.close);
+
+    const tp = typicalPrice(c);
+    this.typical.push(tp);
+    if (this.prevTypical !== undefined) {
+      const flow = tp * c.volume;
+      this.positiveFlow.push(tp > this.prevTypical ? flow : 0);
+      this.negativeFlow.push(tp < this.prevTypical ? flow : 0);
+    }
+    this.prevTypical = tp;
+  }
+
+  clone(): MomentumRollingState {
+    const copy = new MomentumRollingState();
+    copy.lastClose = this.lastClose;
+    copy.rsi = this.rsi.clone();
+    copy.rsiRecent = this.rsiRecent.clone();
+    copy.ema12 = this.ema12.clone();
+    copy.ema26 = this.ema26.clone();
+    copy.macdSignal = this.macdSignal.clone();
+    copy.macd = this.macd;
+    copy.highs = this.highs.clone();
+    copy.lows = this.lows.clone();
+    copy.stochK = this.stochK;
+    copy.stochD = this.stochD.clone();
+    copy.rsiWindow = this.rsiWindow.clone();
+    copy.stochRsiK = this.stochRsiK.clone();
+    copy.stochRsiD = this.stochRsiD.clone();
+    copy.closes = this.closes.clone();
+    copy.typical = this.typical.clone();
+    copy.prevTypical = this.prevTypical;
+    copy.positiveFlow = this.positiveFlow.clone();
+    copy.negativeFlow = this.negativeFlow.clone();
+    return copy;
+  }
+}
 
-export class MomentumIndicatorProvider implements IIndicatorProvider {
+// ═══════════════════════════════════════════════════════════════
+// PROVIDER
+// ═══════════════════════════════════════════════════════════════
+
+export class MomentumIndicatorProvider implements IIncrementalIndicatorProvider<MomentumRollingState> {
   readonly id = 'MOMENTUM';
   readonly category: IndicatorCategory = 'MOMENTUM';
   readonly requiredCandles = 50;
@@ -33,29 +148,36 @@ export class MomentumIndicatorProvider implements IIndicatorProvider {
     'williams_r', 'cci_20', 'mfi_14', 'momentum_score'
   ];
 
+  createState(): MomentumRollingState {
+    return new MomentumRollingState();
+  }
+
   async calculate(input: IndicatorInput): Promise<IndicatorOutput[]> {
+    if (input.candles.length < this.requiredCandles) {
+      return [];
+    }
+    const state = this.createState();
+    for (const c of input.candles) state.update(c);
+    return this.calculateFromState(state, input);
+  }
+
+  calculateFromState(state: MomentumRollingState, input: IndicatorInput): IndicatorOutput[] {
     const outputs: IndicatorOutput[] = [];
-    const { candles } = input;
     
-    if (candles.length < this.requiredCandles) {
+    if (input.candles.length < this.requiredCandles) {
       return outputs;
     }
 
-    const closes = candles.map((c: { close: number }) => c.close);
-    const highs = candles.map((c: { high: number }) => c.high);
-    const lows = candles.map((c: { low: number }) => c.low);
-    const volumes = candles.map((c: { volume: number }) => c.volume);
-
     try {
       // RSI 14
-      const rsiValues = RSI.calculate({ values: closes, period: 14 });
-      const rsi14 = rsiValues[rsiValues.length - 1] ?? 50;
+      const rsi14 = state.rsi.value ?? 50;
       
       // RSI Z-Score (relative to recent values)
-      const rsiMean = rsiValues.slice(-20).reduce((a, b) => a + b, 0) / 20;
-      const rsiStd = Math.sqrt(
-        rsiValues.slice(-20).reduce((a, b) => a + Math.pow(b - rsiMean, 2), 0) / 20
-      ) || 1;
+      const recent = state.rsiRecent;
+      const rsiMean = recent.mean(recent.length, 20);
+      let rsiSs = 0;
+      for (let k = 0; k < recent.length; k++) rsiSs += Math.pow(recent.back(k) - rsiMean, 2);
+      const rsiStd = Math.sqrt(rsiSs / 20) || 1;
       const rsiZ = (rsi14 - rsiMean) / rsiStd;
 
       outputs.push({
@@ -73,79 +195,56 @@ export class MomentumIndicatorProvider implements IIndicatorProvider {
       });
 
       // MACD
-      const macdValues = MACD.calculate({
-        values: closes,
-        fastPeriod: 12,
-        slowPeriod: 26,
-        signalPeriod: 9,
-        SimpleMAOscillator: false,
-        SimpleMASignal: false,
-      });
-      
-      const lastMacd = macdValues[macdValues.length - 1];
-      if (lastMacd) {
+      if (state.macd !== undefined) {
+        const signal = state.macdSignal.value;
+        const histogram = signal !== undefined ? state.macd - signal : 0;
         outputs.push({
           key: 'macd_histogram',
-          value: lastMacd.histogram ?? 0,
-          normalized: Math.tanh((lastMacd.histogram ?? 0) / (closes[closes.length - 1] * 0.01)),
+          value: histogram,
+          normalized: Math.tanh(histogram / (state.lastClose * 0.01)),
           confidence: 0.85,
         });
         
         outputs.push({
           key: 'macd_signal',
-          value: lastMacd.signal ?? 0,
+          value: signal ?? 0,
           confidence: 0.85,
         });
       }
 
-      // Stochastic
-      const stochValues = Stochastic.calculate({
-        high: highs,
-        low: lows,
-        close: closes,
-        period: 14,
-        signalPeriod: 3,
-      });
-      
-      const lastStoch = stochValues[stochValues.length - 1];
-      if (lastStoch) {
+      // Stochastic (%D averages the unrounded %K; both reported to 2 decimals)
+      const stochK = state.stochK !== undefined ? round2(state.stochK) : undefined;
+      const stochD = state.stochD.value !== undefined ? round2(state.stochD.value) : undefined;
+      if (stochK !== undefined && stochD !== undefined) {
         outputs.push({
           key: 'stoch_k',
-          value: lastStoch.k,
-          normalized: (lastStoch.k - 50) / 50,
+          value: stochK,
+          normalized: (stochK - 50) / 50,
           confidence: 0.85,
         });
         
         outputs.push({
           key: 'stoch_d',
-          value: lastStoch.d,
-          normalized: (lastStoch.d - 50) / 50,
+          value: stochD,
+          normalized: (stochD - 50) / 50,
           confidence: 0.85,
         });
       }
 
       // Stochastic RSI
-      const stochRsiValues = StochasticRSI.calculate({
-        values: closes,
-        rsiPeriod: 14,
-        stochasticPeriod: 14,
-        kPeriod: 3,
-        dPeriod: 3,
-      });
-      
-      const lastStochRsi = stochRsiValues[stochRsiValues.length - 1];
-      if (lastStochRsi) {
+      const stochRsi = state.stochRsiK.value;
+      if (stochRsi !== undefined && state.stochRsiD.value !== undefined) {
         outputs.push({
           key: 'stoch_rsi',
-          value: lastStochRsi.k,
-          normalized: (lastStochRsi.k - 50) / 50,
+          value: stochRsi,
+          normalized: (stochRsi - 50) / 50,
           confidence: 0.8,
         });
       }
 
       // ROC (Rate of Change) 10
-      const rocValues = ROC.calculate({ values: closes, period: 10 });
-      const roc10 = rocValues[rocValues.length - 1] ?? 0;
+      const past = state.closes.full ? state.closes.at(0) : undefined;
+      const roc10 = past !== undefined ? ((state.lastClose - past) / past) * 100 : 0;
       
       outputs.push({
         key: 'roc_10',
@@ -155,14 +254,10 @@ export class MomentumIndicatorProvider implements IIndicatorProvider {
       });
 
       // Williams %R
-      const willRValues = WilliamsR.calculate({
-        high: highs,
-        low: lows,
-        close: closes,
-        period: 14,
-      });
-      
-      const willR = willRValues[willRValues.length - 1] ?? -50;
+      const hh = state.highs.max();
+      const ll = state.lows.min();
+      const willRaw = ((hh - state.lastClose) / (hh - ll)) * -100;
+      const willR = state.highs.full && Number.isFinite(willRaw) ? willRaw : -50;
       outputs.push({
         key: 'williams_r',
         value: willR,
@@ -171,14 +266,7 @@ export class MomentumIndicatorProvider implements IIndicatorProvider {
       });
 
       // CCI 20
-      const cciValues = CCI.calculate({
-        high: highs,
-        low: lows,
-        close: closes,
-        period: 20,
-      });
-      
-      const cci20 = cciValues[cciValues.length - 1] ?? 0;
+      const cci20 = this.calculateCci(state.typical);
       outputs.push({
         key: 'cci_20',
         value: cci20,
@@ -187,15 +275,7 @@ export class MomentumIndicatorProvider implements IIndicatorProvider {
       });
 
       // MFI 14 (Money Flow Index)
-      const mfiValues = MFI.calculate({
-        high: highs,
-        low: lows,
-        close: closes,
-        volume: volumes,
-        period: 14,
-      });
-      
-      const mfi14 = mfiValues[mfiValues.length - 1] ?? 50;
+      const mfi14 = this.calculateMfi(state.positiveFlow, state.negativeFlow);
       outputs.push({
         key: 'mfi_14',
         value: mfi14,
@@ -205,7 +285,7 @@ export class MomentumIndicatorProvider implements IIndicatorProvider {
 
       // Composite Momentum Score
       const momentumScore = this.calculateMomentumScore(
-        rsi14, lastStoch?.k ?? 50, roc10, willR, mfi14
+        rsi14, stochK ?? 50, roc10, willR, mfi14
       );
       
       outputs.push({
@@ -222,6 +302,24 @@ export class MomentumIndicatorProvider implements IIndicatorProvider {
     return outputs;
   }
 
+  private calculateCci(typical: RingBuffer): number {
+    if (!typical.full) return 0;
+    const tp = typical.back(0);
+    const mean = typical.mean();
+    let dev = 0;
+    for (let k = 0; k < typical.length; k++) dev += Math.abs(typical.back(k) - mean);
+    const meanDev = dev / typical.length;
+    return meanDev > 0 ? (tp - mean) / (0.015 * meanDev) : 0;
+  }
+
+  private calculateMfi(positive: RingBuffer, negative: RingBuffer): number {
+    if (!positive.full) return 50;
+    const pos = positive.sum();
+    const neg = negative.sum();
+    if (pos === 0 && neg === 0) return 50;
+    return round2(100 - 100 / (1 + pos / neg));
+  }
+
   private calculateMomentumScore(
     rsi: number,
     stochK: number,
@@ -3,16 +3,109 @@
  * =============================
  * 
  * Breakout/Breakdown, Support/Resistance, Market Structure
+ *
+ * Computed from StructureRollingState (per asset and timeframe, O(1)
+ * update per new candle).
  */
 
 import type {
-  IIndicatorProvider,
+  IIncrementalIndicatorProvider,
+  IRollingIndicatorState,
   IndicatorInput,
   IndicatorOutput,
   IndicatorCategory,
 } from '../indicator.types.js';
+import type { MarketOHLCV } from '../../types.js';
+import { RingBuffer } from '../../../../common/rolling.kernels.js';
 
-export class StructureIndicatorProvider implements IIndicatorProvider {
+const PIVOT_SPAN = 2;       // S/R pivots: 2 candles each side
+const SWING_LOOKBACK = 5;   // swing points: 5 candles each side
+
+interface LevelPoint {
+  idx: number;              // absolute candle index
+  value: number;
+}
+
+// ═══════════════════════════════════════════════════════════════
+// ROLLING STATE
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * Pivots and swing points are confirmed once the candles to their right
+ * arrive and dropped when they leave the scan window, so they always
+ * match a scan over the window alone.
+ */
+export class StructureRollingState implements IRollingIndicatorState {
+  count = 0;
+  lastPrice = 0;
+  highs: RingBuffer;
+  lows: RingBuffer;
+  closes = new RingBuffer(20);
+
+  pivotHighs: LevelPoint[] = [];
+  pivotLows: LevelPoint[] = [];
+  swingHighs: LevelPoint[] = [];
+  swingLows: LevelPoint[] = [];
+
+  constructor(readonly window: number) {
+    this.highs = new RingBuffer(window);
+    this.lows = new RingBuffer(window);
+  }
+
+  update(c: MarketOHLCV): void {
+    this.highs.push(c.high);
+    this.lows.push(c.low);
+    this.closes.push(c.close);
+    this.lastPrice = c.close;
+    this.count++;
+
+    const start = this.count - this.highs.length;   // window start (absolute)
+    this.confirm(PIVOT_SPAN, this.pivotHighs, this.pivotLows, start);
+    this.confirm(SWING_LOOKBACK, this.swingHighs, this.swingLows, start);
+  }
+
+  clone(): StructureRollingState {
+    const copy = new StructureRollingState(this.window);
+    copy.count = this.count;
+    copy.lastPrice = this.lastPrice;
+    copy.highs = this.highs.clone();
+    copy.lows = this.lows.clone();
+    copy.closes = this.closes.clone();
+    copy.pivotHighs = this.pivotHighs.slice();
+    copy.pivotLows = this.pivotLows.slice();
+    copy.swingHighs = this.swingHighs.slice();
+    copy.swingLows = this.swingLows.slice();
+    return copy;
+  }
+
+  /**
+   * Confirm the candle `span` back as a strict high / low over `span`
+   * candles each side, and expire points too close to the window start
+   */
+  private confirm(span: number, highs: LevelPoint[], lows: LevelPoint[], start: number): void {
+    while (highs.length && highs[0].idx < start + span) highs.shift();
+    while (lows.length && lows[0].idx < start + span) lows.shift();
+    if (this.count - span - 1 < start + span) return;
+
+    const h = this.highs.back(span);
+    const l = this.lows.back(span);
+    let isHigh = true;
+    let isLow = true;
+    for (let j = 1; j <= span; j++) {
+      if (h <= this.highs.back(span - j) || h <= this.highs.back(span + j)) isHigh = false;
+      if (l >= this.lows.back(span - j) || l >= this.lows.back(span + j)) isLow = false;
+    }
+    const idx = this.count - span - 1;
+    if (isHigh) highs.push({ idx, value: h });
+    if (isLow) lows.push({ idx, value: l });
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════
+// PROVIDER
+// ═══════════════════════════════════════════════════════════════
+
+export class StructureIndicatorProvider implements IIncrementalIndicatorProvider<StructureRollingState> {
   readonly id = 'STRUCTURE';
   readonly category: IndicatorCategory = 'STRUCTURE';
   readonly requiredCandles = 50;
@@ -23,25 +116,36 @@ export class StructureIndicatorProvider implements IIndicatorProvider {
     'mean_reversion_score', 'structure_trend'
   ];
 
+  createState(window: number): StructureRollingState {
+    return new StructureRollingState(window);
+  }
+
   async calculate(input: IndicatorInput): Promise<IndicatorOutput[]> {
+    if (input.candles.length < this.requiredCandles) {
+      return [];
+    }
+    const state = this.createState(input.candles.length);
+    for (const c of input.candles) state.update(c);
+    return this.calculateFromState(state, input);
+  }
+
+  calculateFromState(state: StructureRollingState, input: IndicatorInput): IndicatorOutput[] {
     const outputs: IndicatorOutput[] = [];
-    const { candles } = input;
     
-    if (candles.length < this.requiredCandles) {
+    if (input.candles.length < this.requiredCandles) {
       return outputs;
     }
 
-    const closes = candles.map((c: { close: number }) => c.close);
-    const highs = candles.map((c: { high: number }) => c.high);
-    const lows = candles.map((c: { low: number }) => c.low);
-    const lastPrice = closes[closes.length - 1];
+    const lastPrice = state.lastPrice;
+    const recentHigh = state.highs.max(Math.min(20, state.highs.length));
+    const recentLow = state.lows.min(Math.min(20, state.lows.length));
 
     try {
       // ═══════════════════════════════════════════════════════════
       // SUPPORT & RESISTANCE LEVELS
       // ═══════════════════════════════════════════════════════════
       
-      const { support, resistance } = this.findSRLevels(highs, lows, closes);
+      const { support, resistance } = this.findSRLevels(state, recentHigh, recentLow);
       
       // Distance to S/R as percentage
       const resistanceDistance = resistance > 0 
@@ -76,8 +180,6 @@ export class StructureIndicatorProvider implements IIndicatorProvider {
       // BREAKOUT / BREAKDOWN SCORES
       // ═══════════════════════════════════════════════════════════
       
-      const recentHigh = Math.max(...highs.slice(-20));
-      const recentLow = Math.min(...lows.slice(-20));
       const range = recentHigh - recentLow;
       
       // Breakout score: how close to breaking recent high
@@ -108,7 +210,7 @@ export class StructureIndicatorProvider implements IIndicatorProvider {
       // HIGHER HIGHS / LOWER LOWS
       // ═══════════════════════════════════════════════════════════
       
-      const swingPoints = this.findSwingPoints(highs, lows, 5);
+      const swingPoints = this.countSwingPoints(state);
       const hhCount = swingPoints.higherHighs;
       const llCount = swingPoints.lowerLows;
       const hlCount = swingPoints.higherLows;
@@ -143,8 +245,8 @@ export class StructureIndicatorProvider implements IIndicatorProvider {
       // RANGE POSITION
       // ═══════════════════════════════════════════════════════════
       
-      const range50High = Math.max(...highs.slice(-50));
-      const range50Low = Math.min(...lows.slice(-50));
+      const range50High = state.highs.max(Math.min(50, state.highs.length));
+      const range50Low = state.lows.min(Math.min(50, state.lows.length));
       const range50 = range50High - range50Low;
       
       const rangePosition = range50 > 0 
@@ -162,7 +264,7 @@ export class StructureIndicatorProvider implements IIndicatorProvider {
       // MEAN REVERSION SCORE
       // ═══════════════════════════════════════════════════════════
       
-      const meanPrice = closes.slice(-20).reduce((a, b) => a + b, 0) / 20;
+      const meanPrice = state.closes.mean(state.closes.length, 20);
       const deviation = (lastPrice - meanPrice) / meanPrice;
       
       // Mean reversion opportunity: high when far from mean
@@ -191,72 +293,38 @@ export class StructureIndicatorProvider implements IIndicatorProvider {
   }
 
   private findSRLevels(
-    highs: number[],
-    lows: number[],
-    closes: number[]
+    state: StructureRollingState,
+    recentHigh: number,
+    recentLow: number
   ): { support: number; resistance: number } {
-    // Simple pivot-based S/R
-    const pivotHighs: number[] = [];
-    const pivotLows: number[] = [];
+    const lastPrice = state.lastPrice;
     
-    for (let i = 2; i < highs.length - 2; i++) {
-      // Pivot high
-      if (highs[i] > highs[i - 1] && highs[i] > highs[i - 2] &&
-          highs[i] > highs[i + 1] && highs[i] > highs[i + 2]) {
-        pivotHighs.push(highs[i]);
-      }
-      // Pivot low
-      if (lows[i] < lows[i - 1] && lows[i] < lows[i - 2] &&
-          lows[i] < lows[i + 1] && lows[i] < lows[i + 2]) {
-        pivotLows.push(lows[i]);
-      }
+    // Nearest resistance (pivot high above current price)
+    let resistance = Infinity;
+    for (const p of state.pivotHighs) {
+      if (p.value > lastPrice && p.value < resistance) resistance = p.value;
     }
     
-    const lastPrice = closes[closes.length - 1];
-    
-    // Find nearest resistance (pivot high above current price)
-    const resistance = pivotHighs
-      .filter(p => p > lastPrice)
-      .sort((a, b) => a - b)[0] ?? Math.max(...highs.slice(-20));
-    
-    // Find nearest support (pivot low below current price)
-    const support = pivotLows
-      .filter(p => p < lastPrice)
-      .sort((a, b) => b - a)[0] ?? Math.min(...lows.slice(-20));
+    // Nearest support (pivot low below current price)
+    let support = -Infinity;
+    for (const p of state.pivotLows) {
+      if (p.value < lastPrice && p.value > support) support = p.value;
+    }
     
-    return { support, resistance };
+    return {
+      support: support === -Infinity ? recentLow : support,
+      resistance: resistance === Infinity ? recentHigh : resistance,
+    };
   }
 
-  private findSwingPoints(
-    highs: number[],
-    lows: number[],
-    lookback: number
-  ): {
+  private countSwingPoints(state: StructureRollingState): {
     higherHighs: number;
     lowerLows: number;
     higherLows: number;
     lowerHighs: number;
   } {
-    const swingHighs: number[] = [];
-    const swingLows: number[] = [];
-    
-    for (let i = lookback; i < highs.length - lookback; i++) {
-      // Check for swing high
-      let isSwingHigh = true;
-      let isSwingLow = true;
-      
-      for (let j = 1; j <= lookback; j++) {
-        if (highs[i] <= highs[i - j] || highs[i] <= highs[i + j]) {
-          isSwingHigh = false;
-        }
-        if (lows[i] >= lows[i - j] || lows[i] >= lows[i + j]) {
-          isSwingLow = false;
-        }
-      }
-      
-      if (isSwingHigh) swingHighs.push(highs[i]);
-      if (isSwingLow) swingLows.push(lows[i]);
-    }
+    const swingHighs = state.swingHighs;
+    const swingLows = state.swingLows;
     
     // Count patterns
     let higherHighs = 0;
@@ -265,12 +333,12 @@ export class StructureIndicatorProvider implements IIndicatorProvider {
     let lowerLows = 0;
     
     for (let i = 1; i < swingHighs.length; i++) {
-      if (swingHighs[i] > swingHighs[i - 1]) higherHighs++;
+      if (swingHighs[i].value > swingHighs[i - 1].value) higherHighs++;
       else lowerHighs++;
     }
     
     for (let i = 1; i < swingLows.length; i++) {
-      if (swingLows[i] > swingLows[i - 1]) higherLows++;
+      if (swingLows[i].value > swingLows[i - 1].value) higherLows++;
       else lowerLows++;
     }
     
@@ -3,25 +3,120 @@
  * =========================
  * 
  * SMA/EMA Crossovers, ADX, Supertrend, Aroon, PSAR
+ *
+ * Computed from TrendRollingState (per asset and timeframe, O(1) update
+ * per new candle).
  */
 
-import {
-  SMA,
-  EMA,
-  ADX,
-  PSAR,
-  CrossUp,
-  CrossDown,
-} from 'technicalindicators';
-
 import type {
-  IIndicatorProvider,
+  IIncrementalIndicatorProvider,
+  IRollingIndicatorState,
   IndicatorInput,
   IndicatorOutput,
   IndicatorCategory,
 } from '../indicator.types.js';
+import type { MarketOHLCV } from '../../types.js';
+import {
+  ParabolicSar,
+  RingBuffer,
+  RollingMean,
+  SeededEma,
+  WilderSum,
+  trueRange,
+  wilderAverage,
+} from '../../../../common/rolling.kernels.js';
+
+const AROON_PERIOD = 25;
+
+// ═══════════════════════════════════════════════════════════════
+// ROLLING STATE
+// ═══════════════════════════════════════════════════════════════
+
+export class TrendRollingState implements IRollingIndicatorState {
+  lastPrice = 0;
+  prev: MarketOHLCV | undefined;
+
+  sma20 = new RollingMean(20);
+  sma50 = new RollingMean(50);
+  ema12 = new SeededEma(12);
+  ema26 = new SeededEma(26);
+  ema12Recent = new RingBuffer(5);
+  ema26Recent = new RingBuffer(5);
+
+  // ADX 14
+  trSum = new WilderSum(14);
+  plusDmSum = new WilderSum(14);
+  minusDmSum = new WilderSum(14);
+  adx = wilderAverage(14);
+  pdi: number | undefined;
+  mdi: number | undefined;
+
+  psar = new ParabolicSar(0.02, 0.2);
+
+  // Aroon 25
+  highs = new RingBuffer(AROON_PERIOD);
+  lows = new RingBuffer(AROON_PERIOD);
+
+  update(c: MarketOHLCV): void {
+    this.lastPrice = c.close;
+    this.sma20.update(c.close);
+    this.sma50.update(c.close);
+
+    const ema12 = this.ema12.update(c.close);
+    const ema26 = this.ema26.update(c.close);
+    if (ema12 !== undefined) this.ema12Recent.push(ema12);
+    if (ema26 !== undefined) this.ema26Recent.push(ema26);
+
+    const prev = this.prev;
+    const tr = trueRange(c, prev?.close);
+    if (prev && tr !== undefined) {
+      const up = c.high - prev.high;
+      const down = prev.low - c.low;
+      const trS = this.trSum.update(tr);
+      const pS = this.plusDmSum.update(up > down && up > 0 ? up : 0);
+      const mS = this.minusDmSum.update(down > up && down > 0 ? down : 0);
+      if (trS !== undefined && pS !== undefined && mS !== undefined) {
+        this.pdi = (pS * 100) / trS;
+        this.mdi = (mS * 100) / trS;
+        const dx = (Math.abs(this.pdi - this.mdi) / (this.pdi + this.mdi)) * 100;
+        this.adx.update(Number.isNaN(dx) ? 0 : dx);
+      }
+    }
+    this.prev = c;
+
+    this.psar.update(c);
+    this.highs.push(c.high);
+    this.lows.push(c.low);
+  }
+
+  clone(): TrendRollingState {
+    const copy = new TrendRollingState();
+    copy.lastPrice = this.lastPrice;
+    copy.prev = this.prev;
+    copy.sma20 = this.sma20.clone();
+    copy.sma50 = this.sma50.clone();
+    copy.ema12 = this.ema12.clone();
+    copy.ema26 = this.ema26.clone();
+    copy.ema12Recent = this.ema12Recent.clone();
+    copy.ema26Recent = this.ema26Recent.clone();
+    copy.trSum = this.trSum.clone();
+    copy.plusDmSum = this.plusDmSum.clone();
+    copy.minusDmSum = this.minusDmSum.clone();
+    copy.adx = this.adx.clone();
+    copy.pdi = this.pdi;
+    copy.mdi = this.mdi;
+    copy.psar = this.psar.clone();
+    copy.highs = this.highs.clone();
+    copy.lows = this.lows.clone();
+    return copy;
+  }
+}
 
-export class TrendIndicatorProvider implements IIndicatorProvider {
+// ═══════════════════════════════════════════════════════════════
+// PROVIDER
+// ═══════════════════════════════════════════════════════════════
+
+export class TrendIndicatorProvider implements IIncrementalIndicatorProvider<TrendRollingState> {
   readonly id = 'TREND';
   readonly category: IndicatorCategory = 'TREND';
   readonly requiredCandles = 50;
@@ -32,26 +127,32 @@ export class TrendIndicatorProvider implements IIndicatorProvider {
     'aroon_up', 'aroon_down', 'trend_score'
   ];
 
+  createState(): TrendRollingState {
+    return new TrendRollingState();
+  }
+
   async calculate(input: IndicatorInput): Promise<IndicatorOutput[]> {
+    if (input.candles.length < this.requiredCandles) {
+      return [];
+    }
+    const state = this.createState();
+    for (const c of input.candles) state.update(c);
+    return this.calculateFromState(state, input);
+  }
+
+  calculateFromState(state: TrendRollingState, input: IndicatorInput): IndicatorOutput[] {
     const outputs: IndicatorOutput[] = [];
-    const { candles } = input;
     
-    if (candles.length < this.requiredCandles) {
+    if (input.candles.length < this.requiredCandles) {
       return outputs;
     }
 
-    const closes = candles.map(c => c.close);
-    const highs = candles.map(c => c.high);
-    const lows = candles.map(c => c.low);
-    const lastPrice = closes[closes.length - 1];
+    const lastPrice = state.lastPrice;
 
     try {
       // SMA 20 & 50
-      const sma20Values = SMA.calculate({ values: closes, period: 20 });
-      const sma50Values = SMA.calculate({ values: closes, period: 50 });
-      
-      const sma20 = sma20Values[sma20Values.length - 1] ?? lastPrice;
-      const sma50 = sma50Values[sma50Values.length - 1] ?? lastPrice;
+      const sma20 = state.sma20.value ?? lastPrice;
+      const sma50 = state.sma50.value ?? lastPrice;
 
       outputs.push({
         key: 'sma_20',
@@ -84,11 +185,8 @@ export class TrendIndicatorProvider implements IIndicatorProvider {
       });
 
       // EMA 12 & 26
-      const ema12Values = EMA.calculate({ values: closes, period: 12 });
-      const ema26Values = EMA.calculate({ values: closes, period: 26 });
-      
-      const ema12 = ema12Values[ema12Values.length - 1] ?? lastPrice;
-      const ema26 = ema26Values[ema26Values.length - 1] ?? lastPrice;
+      const ema12 = state.ema12.value ?? lastPrice;
+      const ema26 = state.ema26.value ?? lastPrice;
 
       outputs.push({
         key: 'ema_12',
@@ -106,22 +204,12 @@ export class TrendIndicatorProvider implements IIndicatorProvider {
       const emaCross = ((ema12 - ema26) / ema26) * 100;
       
       // Check for recent crossover
-      const recentEma12 = ema12Values.slice(-5);
-      const recentEma26 = ema26Values.slice(-5);
-      
-      const crossUp = CrossUp.calculate({
-        lineA: recentEma12,
-        lineB: recentEma26,
-      });
-      
-      const crossDown = CrossDown.calculate({
-        lineA: recentEma12,
-        lineB: recentEma26,
-      });
+      const recentEma12 = state.ema12Recent.toArray();
+      const recentEma26 = state.ema26Recent.toArray();
       
       let emaCrossSignal = 0;
-      if (crossUp.some(v => v)) emaCrossSignal = 1;
-      else if (crossDown.some(v => v)) emaCrossSignal = -1;
+      if (this.crosses(recentEma12, recentEma26)) emaCrossSignal = 1;
+      else if (this.crosses(recentEma26, recentEma12)) emaCrossSignal = -1;
 
       outputs.push({
         key: 'ema_cross',
@@ -137,14 +225,9 @@ export class TrendIndicatorProvider implements IIndicatorProvider {
       });
 
       // ADX (Average Directional Index)
-      const adxValues = ADX.calculate({
-        high: highs,
-        low: lows,
-        close: closes,
-        period: 14,
-      });
-      
-      const lastAdx = adxValues[adxValues.length - 1];
+      const lastAdx = state.adx.value !== undefined
+        ? { adx: state.adx.value, pdi: state.pdi!, mdi: state.mdi! }
+        : undefined;
       if (lastAdx) {
         outputs.push({
           key: 'adx_14',
@@ -167,14 +250,7 @@ export class TrendIndicatorProvider implements IIndicatorProvider {
       }
 
       // PSAR (Parabolic SAR)
-      const psarValues = PSAR.calculate({
-        high: highs,
-        low: lows,
-        step: 0.02,
-        max: 0.2,
-      });
-      
-      const lastPsar = psarValues[psarValues.length - 1] ?? lastPrice;
+      const lastPsar = state.psar.value ?? lastPrice;
       const psarTrend = lastPrice > lastPsar ? 1 : -1;
 
       outputs.push({
@@ -191,8 +267,11 @@ export class TrendIndicatorProvider implements IIndicatorProvider {
       });
 
       // Aroon (custom calculation)
-      const aroonPeriod = 25;
-      const aroon = this.calculateAroon(highs, lows, aroonPeriod);
+      const aroon = this.calculateAroon(
+        state.highs.toArray(),
+        state.lows.toArray(),
+        AROON_PERIOD
+      );
       
       outputs.push({
         key: 'aroon_up',
@@ -234,6 +313,19 @@ export class TrendIndicatorProvider implements IIndicatorProvider {
     return outputs;
   }
 
+  /**
+   * True when lineA crosses above lineB anywhere in the (end-aligned) series
+   */
+  private crosses(lineA: number[], lineB: number[]): boolean {
+    const n = Math.min(lineA.length, lineB.length);
+    const a = lineA.slice(-n);
+    const b = lineB.slice(-n);
+    for (let i = 1; i < n; i++) {
+      if (a[i] > b[i] && a[i - 1] <= b[i - 1]) return true;
+    }
+    return false;
+  }
+
   private calculateAroon(
     highs: number[],
     lows: number[],
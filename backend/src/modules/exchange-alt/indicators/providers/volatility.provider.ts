@@ -3,21 +3,80 @@
  * ==============================
  * 
  * ATR, Bollinger Bands, Keltner Channels, Historical Volatility
+ *
+ * Computed from VolatilityRollingState (per asset and timeframe, O(1)
+ * update per new candle).
  */
 
-import {
-  ATR,
-  BollingerBands,
-} from 'technicalindicators';
-
 import type {
-  IIndicatorProvider,
+  IIncrementalIndicatorProvider,
+  IRollingIndicatorState,
   IndicatorInput,
   IndicatorOutput,
   IndicatorCategory,
 } from '../indicator.types.js';
+import type { MarketOHLCV } from '../../types.js';
+import { RingBuffer, trueRange, wilderAverage } from '../../../../common/rolling.kernels.js';
+
+const VOL_OF_VOL_WINDOW = 50;
+
+// ═══════════════════════════════════════════════════════════════
+// ROLLING STATE
+// ═══════════════════════════════════════════════════════════════
+
+export class VolatilityRollingState implements IRollingIndicatorState {
+  lastPrice = 0;
+  prevClose: number | undefined;
+
+  atr = wilderAverage(14);
+  closes = new RingBuffer(20);               // Bollinger 20
+
+  // Keltner EMA 20, seeded with the first close
+  ema20: number | undefined;
+
+  // Log returns (last 20) and the 20-return stdev series (last 50)
+  returns = new RingBuffer(20);
+  returnCount = 0;
+  windowVols = new RingBuffer(VOL_OF_VOL_WINDOW);
+
+  update(c: MarketOHLCV): void {
+    const tr = trueRange(c, this.prevClose);
+    if (tr !== undefined) this.atr.update(tr);
+
+    this.closes.push(c.close);
+    this.ema20 = this.ema20 === undefined
+      ? c.close
+      : c.close * (2 / 21) + this.ema20 * (1 - 2 / 21);
 
-export class VolatilityIndicatorProvider implements IIndicatorProvider {
+    if (this.prevClose !== undefined) {
+      this.returns.push(Math.log(c.close / this.prevClose));
+      this.returnCount++;
+      if (this.returnCount >= 20) this.windowVols.push(this.returns.std());
+    }
+
+    this.prevClose = c.close;
+    this.lastPrice = c.close;
+  }
+
+  clone(): VolatilityRollingState {
+    const copy = new VolatilityRollingState();
+    copy.lastPrice = this.lastPrice;
+    copy.prevClose = this.prevClose;
+    copy.atr = this.atr.clone();
+    copy.closes = this.closes.clone();
+    copy.ema20 = this.ema20;
+    copy.returns = this.returns.clone();
+    copy.returnCount = this.returnCount;
+    copy.windowVols = this.windowVols.clone();
+    return copy;
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════
+// PROVIDER
+// ═══════════════════════════════════════════════════════════════
+
+export class VolatilityIndicatorProvider implements IIncrementalIndicatorProvider<VolatilityRollingState> {
   readonly id = 'VOLATILITY';
   readonly category: IndicatorCategory = 'VOLATILITY';
   readonly requiredCandles = 30;
@@ -27,29 +86,31 @@ export class VolatilityIndicatorProvider implements IIndicatorProvider {
     'hist_vol_20', 'volatility_z', 'vol_regime', 'squeeze_score'
   ];
 
+  createState(): VolatilityRollingState {
+    return new VolatilityRollingState();
+  }
+
   async calculate(input: IndicatorInput): Promise<IndicatorOutput[]> {
+    if (input.candles.length < this.requiredCandles) {
+      return [];
+    }
+    const state = this.createState();
+    for (const c of input.candles) state.update(c);
+    return this.calculateFromState(state, input);
+  }
+
+  calculateFromState(state: VolatilityRollingState, input: IndicatorInput): IndicatorOutput[] {
     const outputs: IndicatorOutput[] = [];
-    const { candles } = input;
     
-    if (candles.length < this.requiredCandles) {
+    if (input.candles.length < this.requiredCandles) {
       return outputs;
     }
 
-    const closes = candles.map(c => c.close);
-    const highs = candles.map(c => c.high);
-    const lows = candles.map(c => c.low);
-    const lastPrice = closes[closes.length - 1];
+    const lastPrice = state.lastPrice;
 
     try {
       // ATR 14
-      const atrValues = ATR.calculate({
-        high: highs,
-        low: lows,
-        close: closes,
-        period: 14,
-      });
-      
-      const atr14 = atrValues[atrValues.length - 1] ?? 0;
+      const atr14 = state.atr.value ?? 0;
       const atrPct = (atr14 / lastPrice) * 100;
 
       outputs.push({
@@ -66,13 +127,7 @@ export class VolatilityIndicatorProvider implements IIndicatorProvider {
       });
 
       // Bollinger Bands
-      const bbValues = BollingerBands.calculate({
-        values: closes,
-        period: 20,
-        stdDev: 2,
-      });
-      
-      const lastBB = bbValues[bbValues.length - 1];
+      const lastBB = this.calculateBollinger(state.closes, 2);
       if (lastBB) {
         const bbWidth = ((lastBB.upper - lastBB.lower) / lastBB.middle) * 100;
         const bbPercent = (lastPrice - lastBB.lower) / (lastBB.upper - lastBB.lower);
@@ -111,7 +166,7 @@ export class VolatilityIndicatorProvider implements IIndicatorProvider {
       }
 
       // Keltner Channels (EMA 20 ± 2*ATR)
-      const ema20 = this.calculateEMA(closes, 20);
+      const ema20 = state.ema20 ?? lastPrice;
       const keltnerUpper = ema20 + 2 * atr14;
       const keltnerLower = ema20 - 2 * atr14;
       const keltnerWidth = ((keltnerUpper - keltnerLower) / ema20) * 100;
@@ -135,8 +190,7 @@ export class VolatilityIndicatorProvider implements IIndicatorProvider {
       });
 
       // Historical Volatility (20-period)
-      const returns = this.calculateReturns(closes);
-      const histVol20 = this.calculateStdDev(returns.slice(-20)) * Math.sqrt(252) * 100;
+      const histVol20 = state.returns.std() * Math.sqrt(252) * 100;
       
       outputs.push({
         key: 'hist_vol_20',
@@ -146,9 +200,9 @@ export class VolatilityIndicatorProvider implements IIndicatorProvider {
       });
 
       // Volatility Z-Score (current vol vs 50-period average)
-      const recentVol = this.calculateStdDev(returns.slice(-14)) * Math.sqrt(252) * 100;
+      const recentVol = state.returns.std(Math.min(14, state.returns.length)) * Math.sqrt(252) * 100;
       const avgVol = histVol20;
-      const volStd = this.calculateVolatilityOfVolatility(returns, 50);
+      const volStd = state.windowVols.std();
       const volatilityZ = volStd > 0 ? (recentVol - avgVol) / volStd : 0;
 
       outputs.push({
@@ -203,38 +257,18 @@ export class VolatilityIndicatorProvider implements IIndicatorProvider {
     return outputs;
   }
 
-  private calculateEMA(values: number[], period: number): number {
-    const k = 2 / (period + 1);
-    let ema = values[0];
-    for (let i = 1; i < values.length; i++) {
-      ema = values[i] * k + ema * (1 - k);
-    }
-    return ema;
-  }
-
-  private calculateReturns(prices: number[]): number[] {
-    const returns: number[] = [];
-    for (let i = 1; i < prices.length; i++) {
-      returns.push(Math.log(prices[i] / prices[i - 1]));
-    }
-    return returns;
-  }
-
-  private calculateStdDev(values: number[]): number {
-    if (values.length === 0) return 0;
-    const mean = values.reduce((a, b) => a + b, 0) / values.length;
-    const variance = values.reduce((a, b) => a + Math.pow(b - mean, 2), 0) / values.length;
-    return Math.sqrt(variance);
-  }
-
-  private calculateVolatilityOfVolatility(returns: number[], window: number): number {
-    const vols: number[] = [];
-    for (let i = 20; i <= returns.length; i++) {
-      const windowReturns = returns.slice(i - 20, i);
-      const vol = this.calculateStdDev(windowReturns);
-      vols.push(vol);
-    }
-    return this.calculateStdDev(vols.slice(-window));
+  private calculateBollinger(
+    closes: RingBuffer,
+    stdDev: number
+  ): { upper: number; middle: number; lower: number } | undefined {
+    if (!closes.full) return undefined;
+    const middle = closes.mean();
+    const sd = closes.std();
+    return {
+      upper: middle + stdDev * sd,
+      middle,
+      lower: middle - stdDev * sd,
+    };
   }
 }
 
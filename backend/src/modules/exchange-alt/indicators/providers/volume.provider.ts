@@ -3,23 +3,100 @@
  * ==========================
  * 
  * OBV, Volume Z-Score, VWAP Deviation, Accumulation/Distribution, Volume Profile
+ *
+ * Computed from VolumeRollingState (per asset and timeframe, O(1) update
+ * per new candle).
  */
 
-import {
-  OBV,
-  ADL,
-  VWAP,
-  ForceIndex,
-} from 'technicalindicators';
-
 import type {
-  IIndicatorProvider,
+  IIncrementalIndicatorProvider,
+  IRollingIndicatorState,
   IndicatorInput,
   IndicatorOutput,
   IndicatorCategory,
 } from '../indicator.types.js';
+import type { MarketOHLCV } from '../../types.js';
+import { RingBuffer, SeededEma, typicalPrice } from '../../../../common/rolling.kernels.js';
+
+// ═══════════════════════════════════════════════════════════════
+// ROLLING STATE
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * OBV, ADL and VWAP are anchored at the first candle of the scan window:
+ * the running totals are kept from the first candle ever seen and
+ * re-anchored with the totals stored for the window start.
+ */
+export class VolumeRollingState implements IRollingIndicatorState {
+  lastPrice = 0;
+  prevClose: number | undefined;
+
+  obv = 0;
+  obvHistory: RingBuffer;        // OBV after each window candle
+  adl = 0;
+  adlBefore: RingBuffer;         // ADL before each window candle
+  priceVolume: RingBuffer;       // typical price * volume (VWAP)
+  volumeWindow: RingBuffer;
+
+  volumes = new RingBuffer(20);
+  signedVolumes = new RingBuffer(20);   // +volume up candle, -volume down
+  force = new SeededEma(13);
+  forceRecent = new RingBuffer(20);
+
+  constructor(readonly window: number) {
+    this.obvHistory = new RingBuffer(window);
+    this.adlBefore = new RingBuffer(window);
+    this.priceVolume = new RingBuffer(window);
+    this.volumeWindow = new RingBuffer(window);
+  }
+
+  update(c: MarketOHLCV): void {
+    if (this.prevClose !== undefined) {
+      if (c.close > this.prevClose) this.obv += c.volume;
+      else if (c.close < this.prevClose) this.obv -= c.volume;
+
+      const fi = this.force.update((c.close - this.prevClose) * c.volume);
+      if (fi !== undefined) this.forceRecent.push(fi);
+    }
+    this.obvHistory.push(this.obv);
+
+    this.adlBefore.push(this.adl);
+    const multiplier = ((c.close - c.low) - (c.high - c.close)) / (c.high - c.low);
+    this.adl += (Number.isNaN(multiplier) ? 0 : multiplier) * c.volume;
+
+    this.priceVolume.push(typicalPrice(c) * c.volume);
+    this.volumeWindow.push(c.volume);
+
+    this.volumes.push(c.volume);
+    this.signedVolumes.push(c.close >= c.open ? c.volume : -c.volume);
+
+    this.prevClose = c.close;
+    this.lastPrice = c.close;
+  }
+
+  clone(): VolumeRollingState {
+    const copy = new VolumeRollingState(this.window);
+    copy.lastPrice = this.lastPrice;
+    copy.prevClose = this.prevClose;
+    copy.obv = this.obv;
+    copy.obvHistory = this.obvHistory.clone();
+    copy.adl = this.adl;
+    copy.adlBefore = this.adlBefore.clone();
+    copy.priceVolume = this.priceVolume.clone();
+    copy.volumeWindow = this.volumeWindow.clone();
+    copy.volumes = this.volumes.clone();
+    copy.signedVolumes = this.signedVolumes.clone();
+    copy.force = this.force.clone();
+    copy.forceRecent = this.forceRecent.clone();
+    return copy;
+  }
+}
 
-export class VolumeIndicatorProvider implements IIndicatorProvider {
+// ═══════════════════════════════════════════════════════════════
+// PROVIDER
+// ═══════════════════════════════════════════════════════════════
+
+export class VolumeIndicatorProvider implements IIncrementalIndicatorProvider<VolumeRollingState> {
   readonly id = 'VOLUME';
   readonly category: IndicatorCategory = 'VOLUME';
   readonly requiredCandles = 30;
@@ -29,31 +106,36 @@ export class VolumeIndicatorProvider implements IIndicatorProvider {
     'volume_sma_ratio', 'force_index', 'volume_trend'
   ];
 
+  createState(window: number): VolumeRollingState {
+    return new VolumeRollingState(window);
+  }
+
   async calculate(input: IndicatorInput): Promise<IndicatorOutput[]> {
+    if (input.candles.length < this.requiredCandles) {
+      return [];
+    }
+    const state = this.createState(input.candles.length);
+    for (const c of input.candles) state.update(c);
+    return this.calculateFromState(state, input);
+  }
+
+  calculateFromState(state: VolumeRollingState, input: IndicatorInput): IndicatorOutput[] {
     const outputs: IndicatorOutput[] = [];
-    const { candles } = input;
     
-    if (candles.length < this.requiredCandles) {
+    if (input.candles.length < this.requiredCandles) {
       return outputs;
     }
 
-    const closes = candles.map(c => c.close);
-    const highs = candles.map(c => c.high);
-    const lows = candles.map(c => c.low);
-    const volumes = candles.map(c => c.volume);
-    const lastPrice = closes[closes.length - 1];
-    const lastVolume = volumes[volumes.length - 1];
+    const lastPrice = state.lastPrice;
+    const lastVolume = state.volumes.back(0);
 
     try {
       // OBV (On Balance Volume)
-      const obvValues = OBV.calculate({
-        close: closes,
-        volume: volumes,
-      });
-      
-      const lastObv = obvValues[obvValues.length - 1] ?? 0;
-      const obvChange = obvValues.length > 10 
-        ? (lastObv - obvValues[obvValues.length - 10]) / Math.abs(obvValues[obvValues.length - 10] || 1)
+      const obvAnchor = state.obvHistory.at(0);
+      const lastObv = state.obv - obvAnchor;
+      const obvPast = state.obvHistory.back(9) - obvAnchor;
+      const obvChange = state.obvHistory.length > 10
+        ? (lastObv - obvPast) / Math.abs(obvPast || 1)
         : 0;
 
       outputs.push({
@@ -70,16 +152,11 @@ export class VolumeIndicatorProvider implements IIndicatorProvider {
       });
 
       // ADL (Accumulation/Distribution Line)
-      const adlValues = ADL.calculate({
-        high: highs,
-        low: lows,
-        close: closes,
-        volume: volumes,
-      });
-      
-      const lastAdl = adlValues[adlValues.length - 1] ?? 0;
-      const adlChange = adlValues.length > 10
-        ? (lastAdl - adlValues[adlValues.length - 10]) / Math.abs(adlValues[adlValues.length - 10] || 1)
+      const adlAnchor = state.adlBefore.at(0);
+      const lastAdl = state.adl - adlAnchor;
+      const adlPast = state.adlBefore.back(8) - adlAnchor;
+      const adlChange = state.adlBefore.length > 10
+        ? (lastAdl - adlPast) / Math.abs(adlPast || 1)
         : 0;
 
       outputs.push({
@@ -96,14 +173,8 @@ export class VolumeIndicatorProvider implements IIndicatorProvider {
       });
 
       // VWAP (Volume Weighted Average Price) - for intraday
-      const vwapValues = VWAP.calculate({
-        high: highs,
-        low: lows,
-        close: closes,
-        volume: volumes,
-      });
-      
-      const lastVwap = vwapValues[vwapValues.length - 1] ?? lastPrice;
+      const windowVolume = state.volumeWindow.sum();
+      const lastVwap = windowVolume > 0 ? state.priceVolume.sum() / windowVolume : lastPrice;
       const vwapDeviation = ((lastPrice - lastVwap) / lastVwap) * 100;
 
       outputs.push({
@@ -120,10 +191,8 @@ export class VolumeIndicatorProvider implements IIndicatorProvider {
       });
 
       // Volume Z-Score
-      const avgVolume = volumes.slice(-20).reduce((a, b) => a + b, 0) / 20;
-      const volStd = Math.sqrt(
-        volumes.slice(-20).reduce((a, b) => a + Math.pow(b - avgVolume, 2), 0) / 20
-      ) || 1;
+      const avgVolume = state.volumes.mean(state.volumes.length, 20);
+      const volStd = this.deviation(state.volumes, avgVolume, 20) || 1;
       const volumeZ = (lastVolume - avgVolume) / volStd;
 
       outputs.push({
@@ -144,19 +213,11 @@ export class VolumeIndicatorProvider implements IIndicatorProvider {
       });
 
       // Force Index (price change × volume)
-      const forceIndexValues = ForceIndex.calculate({
-        close: closes,
-        volume: volumes,
-        period: 13,
-      });
-      
-      const lastForceIndex = forceIndexValues[forceIndexValues.length - 1] ?? 0;
+      const lastForceIndex = state.force.value ?? 0;
       
       // Normalize force index
-      const forceIndexMean = forceIndexValues.slice(-20).reduce((a, b) => a + b, 0) / 20;
-      const forceIndexStd = Math.sqrt(
-        forceIndexValues.slice(-20).reduce((a, b) => a + Math.pow(b - forceIndexMean, 2), 0) / 20
-      ) || 1;
+      const forceIndexMean = state.forceRecent.mean(state.forceRecent.length, 20);
+      const forceIndexStd = this.deviation(state.forceRecent, forceIndexMean, 20) || 1;
       const forceIndexNorm = (lastForceIndex - forceIndexMean) / forceIndexStd;
 
       outputs.push({
@@ -167,7 +228,7 @@ export class VolumeIndicatorProvider implements IIndicatorProvider {
       });
 
       // Volume Trend (accumulation vs distribution)
-      const volumeTrend = this.calculateVolumeTrend(candles.slice(-20));
+      const volumeTrend = this.calculateVolumeTrend(state.signedVolumes, state.volumes);
 
       outputs.push({
         key: 'volume_trend',
@@ -192,25 +253,21 @@ export class VolumeIndicatorProvider implements IIndicatorProvider {
     return outputs;
   }
 
-  private calculateVolumeTrend(
-    candles: Array<{ open: number; close: number; volume: number }>
-  ): number {
-    let upVolume = 0;
-    let downVolume = 0;
-    
-    for (const candle of candles) {
-      if (candle.close >= candle.open) {
-        upVolume += candle.volume;
-      } else {
-        downVolume += candle.volume;
-      }
-    }
-    
-    const totalVolume = upVolume + downVolume;
+  private calculateVolumeTrend(signed: RingBuffer, volumes: RingBuffer): number {
+    const totalVolume = volumes.sum();
     if (totalVolume === 0) return 0;
     
-    // -1 to +1 scale
-    return (upVolume - downVolume) / totalVolume;
+    // -1 to +1 scale: (up volume - down volume) / total
+    return signed.sum() / totalVolume;
+  }
+
+  /**
+   * sqrt(sum((x - mean)^2) / divisor) over the ring
+   */
+  private deviation(values: RingBuffer, mean: number, divisor: number): number {
+    let ss = 0;
+    for (let k = 0; k < values.length; k++) ss += Math.pow(values.back(k) - mean, 2);
+    return Math.sqrt(ss / divisor);
   }
 }
 
@@ -0,0 +1,212 @@
+/**
+ * Indicator Parity Tests
+ *
+ * The rolling indicator kernels and the providers built on them replaced technicalindicators
+ * calls; on fixed candle fixtures they must give the library's series and
+ * the values the providers reported from it. Some library series are
+ * rounded to 2 decimals, so values are compared to within half a cent.
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+  ADL,
+  ADX,
+  ATR,
+  BollingerBands,
+  CCI,
+  EMA,
+  ForceIndex,
+  MACD,
+  MFI,
+  OBV,
+  PSAR,
+  ROC,
+  RSI,
+  SMA,
+  Stochastic,
+  StochasticRSI,
+  VWAP,
+  WilliamsR,
+} from 'technicalindicators';
+import {
+  ParabolicSar,
+  RollingMean,
+  RsiKernel,
+  SeededEma,
+  trueRange,
+  wilderAverage,
+} from '../../../../../common/rolling.kernels.js';
+import { randomCandles } from '../../../../../common/__tests__/seeded.fixtures.js';
+import { momentumProvider } from '../../providers/momentum.provider.js';
+import { trendProvider } from '../../providers/trend.provider.js';
+import { volatilityProvider } from '../../providers/volatility.provider.js';
+import { volumeProvider } from '../../providers/volume.provider.js';
+import type { IndicatorOutput } from '../../indicator.types.js';
+import type { MarketOHLCV } from '../../../types.js';
+
+function makeCandles(n: number, seed: number): MarketOHLCV[] {
+  return randomCandles(n, seed, {
+    start: 50,
+    vol: 0.04,
+    drift: i => 0.003 * Math.sin(i / 20),
+    volume: [500, 4000],
+  });
+}
+
+const FIXTURES = [makeCandles(150, 7), makeCandles(100, 1234), makeCandles(240, 99)];
+
+function expectNear(actual: number | undefined, expected: number | undefined, label: string): void {
+  expect(actual, label).toBeTypeOf('number');
+  expect(expected, label).toBeTypeOf('number');
+  expect(Math.abs(actual! - expected!), label).toBeLessThanOrEqual(0.0051 + 1e-8 * Math.abs(expected!));
+}
+
+function expectSeries(kernel: Array<number | undefined>, library: number[], label: string): void {
+  const defined = kernel.filter((v): v is number => v !== undefined);
+  expect(defined.length, label).toBe(library.length);
+  for (let i = 0; i < library.length; i++) expectNear(defined[i], library[i], `${label}[${i}]`);
+}
+
+function valueOf(outputs: IndicatorOutput[], key: string): number | undefined {
+  return outputs.find(o => o.key === key)?.value;
+}
+
+const last = <T>(xs: T[]): T => xs[xs.length - 1];
+
+describe('rolling kernels', () => {
+  it('should match the library EMA, SMA and RSI series', () => {
+    for (const candles of FIXTURES) {
+      const closes = candles.map(c => c.close);
+      for (const period of [9, 12, 26]) {
+        const ema = new SeededEma(period);
+        expectSeries(closes.map(x => ema.update(x)), EMA.calculate({ period, values: closes }), `ema${period}`);
+      }
+      for (const period of [20, 50]) {
+        const sma = new RollingMean(period);
+        expectSeries(closes.map(x => sma.update(x)), SMA.calculate({ period, values: closes }), `sma${period}`);
+      }
+      const rsi = new RsiKernel(14);
+      expectSeries(closes.map(x => rsi.update(x)), RSI.calculate({ period: 14, values: closes }), 'rsi14');
+    }
+  });
+
+  it('should match the library ATR and PSAR series', () => {
+    for (const candles of FIXTURES) {
+      const high = candles.map(c => c.high);
+      const low = candles.map(c => c.low);
+      const close = candles.map(c => c.close);
+
+      const atr = wilderAverage(14);
+      let prevClose: number | undefined;
+      const atrSeries = candles.map(c => {
+        const tr = trueRange(c, prevClose);
+        prevClose = c.close;
+        return tr === undefined ? undefined : atr.update(tr);
+      });
+      expectSeries(atrSeries, ATR.calculate({ high, low, close, period: 14 }), 'atr14');
+
+      const psar = new ParabolicSar(0.02, 0.2);
+      expectSeries(candles.map(c => psar.update(c)), PSAR.calculate({ high, low, step: 0.02, max: 0.2 }), 'psar');
+    }
+  });
+});
+
+describe('providers over rolling kernels', () => {
+  it('should report the library momentum values', async () => {
+    for (const candles of FIXTURES) {
+      const close = candles.map(c => c.close);
+      const high = candles.map(c => c.high);
+      const low = candles.map(c => c.low);
+      const volume = candles.map(c => c.volume);
+      const out = await momentumProvider.calculate({ symbol: 'ALT', candles, timeframe: '1h' });
+
+      const rsi = RSI.calculate({ values: close, period: 14 });
+      const recent = rsi.slice(-20);
+      const rsiMean = recent.reduce((a, b) => a + b, 0) / 20;
+      const rsiStd = Math.sqrt(recent.reduce((a, b) => a + Math.pow(b - rsiMean, 2), 0) / 20) || 1;
+      expectNear(valueOf(out, 'rsi_14'), last(rsi), 'rsi_14');
+      expectNear(valueOf(out, 'rsi_z'), (last(rsi) - rsiMean) / rsiStd, 'rsi_z');
+
+      const macd = last(MACD.calculate({
+        values: close,
+        fastPeriod: 12,
+        slowPeriod: 26,
+        signalPeriod: 9,
+        SimpleMAOscillator: false,
+        SimpleMASignal: false,
+      }));
+      expectNear(valueOf(out, 'macd_histogram'), macd.histogram, 'macd_histogram');
+      expectNear(valueOf(out, 'macd_signal'), macd.signal, 'macd_signal');
+
+      const stoch = last(Stochastic.calculate({ high, low, close, period: 14, signalPeriod: 3 }));
+      expectNear(valueOf(out, 'stoch_k'), stoch.k, 'stoch_k');
+      expectNear(valueOf(out, 'stoch_d'), stoch.d, 'stoch_d');
+      // Reported to 2 decimals
+      expect(valueOf(out, 'stoch_k')).toBe(parseFloat(valueOf(out, 'stoch_k')!.toFixed(2)));
+      expect(valueOf(out, 'stoch_d')).toBe(parseFloat(valueOf(out, 'stoch_d')!.toFixed(2)));
+
+      const stochRsi = last(StochasticRSI.calculate({
+        values: close,
+        rsiPeriod: 14,
+        stochasticPeriod: 14,
+        kPeriod: 3,
+        dPeriod: 3,
+      }));
+      expectNear(valueOf(out, 'stoch_rsi'), stochRsi.k, 'stoch_rsi');
+
+      expectNear(valueOf(out, 'roc_10'), last(ROC.calculate({ values: close, period: 10 })), 'roc_10');
+      expectNear(valueOf(out, 'williams_r'), last(WilliamsR.calculate({ high, low, close, period: 14 })), 'williams_r');
+      expectNear(valueOf(out, 'cci_20'), last(CCI.calculate({ high, low, close, period: 20 })), 'cci_20');
+      expectNear(valueOf(out, 'mfi_14'), last(MFI.calculate({ high, low, close, volume, period: 14 })), 'mfi_14');
+    }
+  });
+
+  it('should report the library trend values', async () => {
+    for (const candles of FIXTURES) {
+      const close = candles.map(c => c.close);
+      const high = candles.map(c => c.high);
+      const low = candles.map(c => c.low);
+      const out = await trendProvider.calculate({ symbol: 'ALT', candles, timeframe: '1h' });
+
+      expectNear(valueOf(out, 'sma_20'), last(SMA.calculate({ values: close, period: 20 })), 'sma_20');
+      expectNear(valueOf(out, 'sma_50'), last(SMA.calculate({ values: close, period: 50 })), 'sma_50');
+      expectNear(valueOf(out, 'ema_12'), last(EMA.calculate({ values: close, period: 12 })), 'ema_12');
+      expectNear(valueOf(out, 'ema_26'), last(EMA.calculate({ values: close, period: 26 })), 'ema_26');
+
+      const adx = last(ADX.calculate({ high, low, close, period: 14 }));
+      expectNear(valueOf(out, 'adx_14'), adx.adx, 'adx_14');
+      expectNear(valueOf(out, 'pdi_14'), adx.pdi, 'pdi_14');
+      expectNear(valueOf(out, 'mdi_14'), adx.mdi, 'mdi_14');
+
+      expectNear(valueOf(out, 'psar_value'), last(PSAR.calculate({ high, low, step: 0.02, max: 0.2 })), 'psar_value');
+    }
+  });
+
+  it('should report the library volatility and volume values', async () => {
+    for (const candles of FIXTURES) {
+      const close = candles.map(c => c.close);
+      const high = candles.map(c => c.high);
+      const low = candles.map(c => c.low);
+      const volume = candles.map(c => c.volume);
+      const input = { symbol: 'ALT', candles, timeframe: '1h' as const };
+
+      const vol = await volatilityProvider.calculate(input);
+      expectNear(valueOf(vol, 'atr_14'), last(ATR.calculate({ high, low, close, period: 14 })), 'atr_14');
+      const bb = last(BollingerBands.calculate({ values: close, period: 20, stdDev: 2 }));
+      expectNear(valueOf(vol, 'bb_upper'), bb.upper, 'bb_upper');
+      expectNear(valueOf(vol, 'bb_lower'), bb.lower, 'bb_lower');
+      expectNear(valueOf(vol, 'bb_middle'), bb.middle, 'bb_middle');
+
+      const out = await volumeProvider.calculate(input);
+      const obv = OBV.calculate({ close, volume });
+      const adl = ADL.calculate({ high, low, close, volume });
+      const trend = (xs: number[]) => (last(xs) - xs[xs.length - 10]) / Math.abs(xs[xs.length - 10] || 1);
+      expectNear(valueOf(out, 'obv'), last(obv), 'obv');
+      expectNear(valueOf(out, 'obv_trend'), trend(obv), 'obv_trend');
+      expectNear(valueOf(out, 'adl'), last(adl), 'adl');
+      expectNear(valueOf(out, 'adl_trend'), trend(adl), 'adl_trend');
+      expectNear(valueOf(out, 'vwap'), last(VWAP.calculate({ high, low, close, volume })), 'vwap');
+      expectNear(valueOf(out, 'force_index'), last(ForceIndex.calculate({ close, volume, period: 13 })), 'force_index');
+    }
+  });
+});
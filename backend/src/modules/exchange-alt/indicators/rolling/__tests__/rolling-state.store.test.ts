@@ -0,0 +1,189 @@
+/**
+ * Rolling State Store Tests
+ *
+ * Synced state must equal a replay of every candle since the cold start,
+ * scan after scan: while the open candle changes, after closed candles are
+ * folded in and after gaps / revisions. Window-anchored outputs must also
+ * equal each provider's calculate() over the same candles.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { RollingStateStore, TIMEFRAME_MS } from '../rolling-state.store.js';
+import { ALL_PROVIDERS } from '../../providers/index.js';
+import {
+  isIncrementalProvider,
+  type IIncrementalIndicatorProvider,
+  type IndicatorOutput,
+} from '../../indicator.types.js';
+import type { MarketOHLCV } from '../../../types.js';
+import { randomCandles } from '../../../../../common/__tests__/seeded.fixtures.js';
+
+const HOUR = TIMEFRAME_MS['1h'];
+const WINDOW = 100;
+const providers = ALL_PROVIDERS.filter(isIncrementalProvider) as IIncrementalIndicatorProvider[];
+
+function makeCandles(n: number, seed: number): MarketOHLCV[] {
+  return randomCandles(n, seed, { drift: i => 0.002 * Math.sin(i / 25), stepMs: HOUR })
+    // A few flat candles hit the zero-range branches
+    .map((c, i) => (i % 97 === 13 ? { ...c, high: c.open, low: c.open, close: c.open } : c));
+}
+
+// Still-open version of a candle: part of the move, part of the volume
+function openCandle(c: MarketOHLCV, f: number): MarketOHLCV {
+  const close = c.open + (c.close - c.open) * f;
+  return {
+    ts: c.ts,
+    open: c.open,
+    high: Math.max(c.open, close),
+    low: Math.min(c.open, close),
+    close,
+    volume: c.volume * f,
+  };
+}
+
+// Outputs that only depend on the candles inside the window
+const WINDOW_ANCHORED: Record<string, string[]> = {
+  MOMENTUM: ['stoch_k', 'stoch_d', 'roc_10', 'williams_r', 'cci_20', 'mfi_14'],
+  TREND: ['sma_20', 'sma_50', 'aroon_up', 'aroon_down'],
+  VOLATILITY: ['bb_upper', 'bb_lower', 'bb_middle', 'hist_vol_20'],
+  VOLUME: ['obv', 'obv_trend', 'adl', 'vwap', 'volume_z'],
+  STRUCTURE: ['resistance_proximity', 'support_proximity', 'range_position', 'structure_trend'],
+};
+
+function valueOf(outputs: IndicatorOutput[], key: string): number {
+  const output = outputs.find(o => o.key === key);
+  expect(output).toBeDefined();
+  return output!.value;
+}
+
+async function expectReplayEqual(
+  states: Map<string, unknown>,
+  candles: MarketOHLCV[]
+): Promise<void> {
+  const input = { symbol: 'ALT', candles, timeframe: '1h' as const };
+  for (const p of providers) {
+    const fromState = p.calculateFromState(states.get(p.id) as any, input);
+    expect(fromState.length).toBeGreaterThan(0);
+    expect(fromState).toEqual(await p.calculate(input));
+  }
+}
+
+describe('RollingStateStore', () => {
+  const series = makeCandles(260, 42);
+
+  it('should equal a replay since the cold start on every scan as the window slides', () => {
+    const store = new RollingStateStore(10);
+    const modes: string[] = [];
+    const applied: number[] = [];
+    // Reference: fresh states fed every closed candle once, in order
+    const reference = new Map(providers.map(p => [p.id, p.createState(WINDOW)]));
+    let committed = 1;
+
+    for (let t = WINDOW; t < series.length; t++) {
+      const closed = series.slice(t - WINDOW + 1, t);
+      for (; committed < t; committed++) {
+        for (const state of reference.values()) state.update(series[committed]);
+      }
+      // Three scans while candle t is open, the last one sees it closed
+      for (const f of [0.3, 0.7, 1]) {
+        const last = f === 1 ? series[t] : openCandle(series[t], f);
+        const candles = [...closed, last];
+        const result = store.sync('ALT', candles, '1h', providers);
+        modes.push(result.reason ?? result.mode);
+        applied.push(result.applied);
+
+        const input = { symbol: 'ALT', candles, timeframe: '1h' as const };
+        for (const p of providers) {
+          const open = reference.get(p.id)!.clone();
+          open.update(last);
+          expect(p.calculateFromState(result.states.get(p.id) as any, input))
+            .toEqual(p.calculateFromState(open as any, input));
+        }
+      }
+    }
+
+    expect(modes[0]).toBe('cold start');
+    expect(modes.filter(m => m === 'incremental').length).toBe(3 * (series.length - WINDOW) - 1);
+    // One candle closes per step: fold it, evaluate the open one
+    expect(applied.slice(1, 7)).toEqual([1, 1, 2, 1, 1, 2]);
+  });
+
+  it('should keep window-anchored outputs equal to calculate() after the window slid', async () => {
+    const store = new RollingStateStore(10);
+    for (let t = WINDOW; t < series.length; t += 7) {
+      const candles = series.slice(t - WINDOW + 1, t + 1);
+      const { states } = store.sync('ALT', candles, '1h', providers);
+      const input = { symbol: 'ALT', candles, timeframe: '1h' as const };
+
+      for (const p of providers) {
+        const fromState = p.calculateFromState(states.get(p.id) as any, input);
+        const full = await p.calculate(input);
+        for (const key of WINDOW_ANCHORED[p.id] ?? []) {
+          const a = valueOf(fromState, key);
+          const b = valueOf(full, key);
+          expect(Math.abs(a - b), `${p.id}.${key}`).toBeLessThanOrEqual(1e-9 * Math.max(1, Math.abs(b)));
+        }
+        // Recursive averages only differ by their seed, which has decayed
+        if (p.id === 'MOMENTUM') {
+          expect(Math.abs(valueOf(fromState, 'rsi_14') - valueOf(full, 'rsi_14'))).toBeLessThan(0.5);
+        }
+        if (p.id === 'TREND') {
+          const ema = valueOf(full, 'ema_26');
+          expect(Math.abs(valueOf(fromState, 'ema_26') - ema)).toBeLessThan(1e-3 * ema);
+        }
+      }
+    }
+  });
+
+  it('should fold only the closed candles when several arrived', () => {
+    const store = new RollingStateStore(10);
+    const window = series.slice(0, WINDOW);
+
+    expect(store.sync('ALT', window, '1h', providers).applied).toBe(WINDOW);
+    const again = store.sync('ALT', [...window.slice(0, -1), openCandle(window[WINDOW - 1], 0.5)], '1h', providers);
+    expect(again.mode).toBe('incremental');
+    expect(again.applied).toBe(1);
+
+    // Three more candles closed: fold them plus evaluate the open one
+    const slid = store.sync('ALT', series.slice(3, WINDOW + 3), '1h', providers);
+    expect(slid.mode).toBe('incremental');
+    expect(slid.reason).toBeUndefined();
+    expect(slid.applied).toBe(4);
+  });
+
+  it('should replay on revised candles, gaps and window changes', async () => {
+    const cases: Array<[string, MarketOHLCV[]]> = [];
+
+    const revised = series.slice(0, WINDOW).map(c => ({ ...c }));
+    revised[WINDOW - 2].close *= 1.01;
+    cases.push(['revised candle', revised]);
+
+    // Candle WINDOW is missing after the last committed one
+    const gap = [...series.slice(2, WINDOW), ...series.slice(WINDOW + 1, WINDOW + 3)];
+    cases.push(['gap', gap]);
+
+    cases.push(['window changed', series.slice(0, WINDOW + 1)]);
+
+    for (const [reason, candles] of cases) {
+      const store = new RollingStateStore(10);
+      store.sync('ALT', series.slice(0, WINDOW), '1h', providers);
+      const result = store.sync('ALT', candles, '1h', providers);
+      expect(result.mode).toBe('full');
+      expect(result.reason).toBe(reason);
+      await expectReplayEqual(result.states, candles);
+    }
+  });
+
+  it('should keep at most maxSeries assets, least recently synced first out', () => {
+    const store = new RollingStateStore(2);
+    const window = series.slice(0, WINDOW);
+    store.sync('A', window, '1h', providers);
+    store.sync('B', window, '1h', providers);
+    store.sync('A', window, '1h', providers);
+    store.sync('C', window, '1h', providers);
+
+    expect(store.size).toBe(2);
+    expect(store.sync('A', window, '1h', providers).mode).toBe('incremental');
+    expect(store.sync('B', window, '1h', providers).reason).toBe('cold start');
+  });
+});
@@ -0,0 +1,193 @@
+/**
+ * ROLLING STATE STORE
+ * ====================
+ *
+ * Per-(venue, symbol, timeframe) rolling indicator state between scans.
+ *
+ * The committed state covers every candle of the previous scan except the
+ * last one (exchanges return the still-open candle last, and it keeps
+ * changing until it closes). Each sync:
+ * - locates the last committed candle in the new array and checks it is
+ *   unchanged, the candles after it are contiguous (one timeframe apart)
+ *   and the window start lines up with the committed history
+ * - folds only the newly closed candles into the committed state, one
+ *   update each, however long the window is
+ * - evaluates the last candle on clones of the committed states
+ *
+ * The state is a replay of every candle since the cold start. Window-
+ * anchored values (VWAP, OBV / ADL level, pivots, SMAs, ranges) slide
+ * with the window and equal calculate() over the same candles (up to the
+ * rounding of running sums). Recursive
+ * averages (EMA / Wilder / RSI / ADX, PSAR) keep their history from before
+ * the window start instead of being re-seeded at it, so they differ from
+ * calculate() over the window alone by a seed effect that decays with
+ * every candle.
+ *
+ * Anything else (cold start, gap, revised candle, different window or
+ * provider set) replays the whole candle array into fresh states.
+ */
+
+import type { MarketOHLCV, Timeframe } from '../../types.js';
+import type { IIncrementalIndicatorProvider, IRollingIndicatorState } from '../indicator.types.js';
+import { RingBuffer } from '../../../../common/rolling.kernels.js';
+
+export const TIMEFRAME_MS: Record<Timeframe, number> = {
+  '1m': 60_000,
+  '5m': 5 * 60_000,
+  '15m': 15 * 60_000,
+  '1h': 60 * 60_000,
+  '4h': 4 * 60 * 60_000,
+  '1d': 24 * 60 * 60_000,
+};
+
+interface RollingSeries {
+  window: number;
+  last: MarketOHLCV;                             // last committed candle
+  ts: RingBuffer;                                // committed timestamps
+  states: Map<string, IRollingIndicatorState>;   // by provider id
+}
+
+export interface RollingSyncResult {
+  states: Map<string, IRollingIndicatorState>;   // committed + last candle
+  mode: 'incremental' | 'full';                  // committed state reused or replayed
+  applied: number;                               // candles folded this sync
+  reason?: string;
+}
+
+export class RollingStateStore {
+  private series = new Map<string, RollingSeries>();
+
+  constructor(private maxSeries: number) {}
+
+  get size(): number {
+    return this.series.size;
+  }
+
+  /**
+   * Bring the state of `key` up to date with `candles` (oldest first)
+   */
+  sync(
+    key: string,
+    candles: MarketOHLCV[],
+    timeframe: Timeframe,
+    providers: IIncrementalIndicatorProvider[]
+  ): RollingSyncResult {
+    const prev = this.series.get(key);
+    const plan = prev
+      ? this.planAppend(prev, candles, TIMEFRAME_MS[timeframe], providers)
+      : { reason: 'cold start' };
+
+    let series: RollingSeries;
+    let applied: number;
+    if ('index' in plan) {
+      series = prev!;
+      for (let i = plan.index + 1; i < candles.length - 1; i++) this.commit(series, candles[i]);
+      applied = candles.length - 2 - plan.index;
+    } else {
+      series = this.seed(candles, providers);
+      applied = candles.length - 1;
+    }
+
+    // LRU: most recently synced last
+    this.series.delete(key);
+    this.series.set(key, series);
+    while (this.series.size > this.maxSeries) {
+      this.series.delete(this.series.keys().next().value!);
+    }
+
+    return {
+      states: withLastCandle(series.states, candles[candles.length - 1]),
+      mode: 'index' in plan ? 'incremental' : 'full',
+      applied: applied + 1,
+      reason: 'reason' in plan ? plan.reason : undefined,
+    };
+  }
+
+  /**
+   * Replay without keeping state (incremental mode disabled)
+   */
+  replay(candles: MarketOHLCV[], providers: IIncrementalIndicatorProvider[]): RollingSyncResult {
+    const series = this.seed(candles, providers);
+    return {
+      states: withLastCandle(series.states, candles[candles.length - 1]),
+      mode: 'full',
+      applied: candles.length,
+    };
+  }
+
+  clear(): void {
+    this.series.clear();
+  }
+
+  // Private Methods
+
+  private seed(candles: MarketOHLCV[], providers: IIncrementalIndicatorProvider[]): RollingSeries {
+    const window = candles.length;
+    const series: RollingSeries = {
+      window,
+      last: candles[0],
+      ts: new RingBuffer(window),
+      states: new Map(providers.map(p => [p.id, p.createState(window)])),
+    };
+    for (let i = 0; i < window - 1; i++) this.commit(series, candles[i]);
+    return series;
+  }
+
+  private commit(series: RollingSeries, candle: MarketOHLCV): void {
+    for (const state of series.states.values()) state.update(candle);
+    series.ts.push(candle.ts);
+    series.last = { ...candle };
+  }
+
+  /**
+   * Index of the last committed candle in `candles` when only new closed
+   * candles were appended, else why the history has to be replayed
+   */
+  private planAppend(
+    series: RollingSeries,
+    candles: MarketOHLCV[],
+    tfMs: number,
+    providers: IIncrementalIndicatorProvider[]
+  ): { index: number } | { reason: string } {
+    const n = candles.length;
+    if (n !== series.window) return { reason: 'window changed' };
+    if (series.ts.length === 0) return { reason: 'cold start' };
+    if (providers.length !== series.states.size || providers.some(p => !series.states.has(p.id))) {
+      return { reason: 'providers changed' };
+    }
+
+    const steps = (candles[n - 1].ts - series.last.ts) / tfMs;
+    const j = n - 1 - steps;
+    if (!Number.isInteger(steps) || steps < 1 || j < 0 || candles[j].ts !== series.last.ts) {
+      return { reason: 'gap' };
+    }
+    for (let i = j + 1; i < n; i++) {
+      if (candles[i].ts - candles[i - 1].ts !== tfMs) return { reason: 'gap' };
+    }
+
+    const c = candles[j];
+    const last = series.last;
+    if (c.open !== last.open || c.high !== last.high || c.low !== last.low ||
+        c.close !== last.close || c.volume !== last.volume) {
+      return { reason: 'revised candle' };
+    }
+    if (j >= series.ts.length || series.ts.back(j) !== candles[0].ts) {
+      return { reason: 'window mismatch' };
+    }
+
+    return { index: j };
+  }
+}
+
+function withLastCandle(
+  committed: Map<string, IRollingIndicatorState>,
+  candle: MarketOHLCV
+): Map<string, IRollingIndicatorState> {
+  const states = new Map<string, IRollingIndicatorState>();
+  for (const [id, state] of committed) {
+    const open = state.clone();
+    open.update(candle);
+    states.set(id, open);
+  }
+  return states;
+}
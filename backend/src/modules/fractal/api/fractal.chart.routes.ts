@@ -8,10 +8,14 @@
  * - Candles: Daily OHLCV
  * - SMA200: 200-day simple moving average
  * - PhaseZones: Market phase regions (MARKUP, MARKDOWN, etc.)
+ *
+ * Candles come from the shared series cache; SMA and phase zones are read
+ * from the materialized chart series (engine/chart.series.ts).
  */
 
 import { FastifyInstance, FastifyRequest } from 'fastify';
-import { CanonicalStore } from '../data/canonical.store.js';
+import { seriesCache } from '../data/series.cache.js';
+import { chartSeriesFor, type PhaseZone } from '../engine/chart.series.js';
 
 // ═══════════════════════════════════════════════════════════════
 // TYPE DEFINITIONS
@@ -31,12 +35,6 @@ interface SMA200Point {
   value: number;
 }
 
-interface PhaseZone {
-  from: number;
-  to: number;
-  phase: string;
-}
-
 interface ChartResponse {
   symbol: string;
   tf: string;
@@ -47,137 +45,6 @@ interface ChartResponse {
   phaseZones: PhaseZone[];
 }
 
-// ═══════════════════════════════════════════════════════════════
-// HELPER FUNCTIONS
-// ═══════════════════════════════════════════════════════════════
-
-const canonicalStore = new CanonicalStore();
-
-/**
- * Calculate SMA for given period
- */
-function calculateSMA(closes: number[], period: number): (number | null)[] {
-  const result: (number | null)[] = [];
-  
-  for (let i = 0; i < closes.length; i++) {
-    if (i < period - 1) {
-      result.push(null);
-      continue;
-    }
-    
-    let sum = 0;
-    for (let j = i - period + 1; j <= i; j++) {
-      sum += closes[j];
-    }
-    result.push(sum / period);
-  }
-  
-  return result;
-}
-
-/**
- * Detect market phase from price action
- * Returns: MARKUP | MARKDOWN | ACCUMULATION | DISTRIBUTION | RECOVERY | CAPITULATION
- */
-function detectPhaseAtIndex(
-  closes: number[],
-  index: number,
-  sma20: (number | null)[],
-  sma50: (number | null)[],
-  sma200: (number | null)[]
-): string {
-  if (index < 200) return 'UNKNOWN';
-  
-  const price = closes[index];
-  const ma20 = sma20[index];
-  const ma50 = sma50[index];
-  const ma200 = sma200[index];
-  
-  if (!ma20 || !ma50 || !ma200) return 'UNKNOWN';
-  
-  // Calculate momentum indicators
-  const priceVsMa20 = (price - ma20) / ma20;
-  const priceVsMa50 = (price - ma50) / ma50;
-  const priceVsMa200 = (price - ma200) / ma200;
-  const ma20VsMa50 = (ma20 - ma50) / ma50;
-  const ma50VsMa200 = (ma50 - ma200) / ma200;
-  
-  // Calculate recent drawdown (last 90 days)
-  const lookback = Math.min(90, index);
-  const recentSlice = closes.slice(index - lookback, index + 1);
-  const recentHigh = Math.max(...recentSlice);
-  const drawdown = (recentHigh - price) / recentHigh;
-  
-  // Phase detection logic
-  if (drawdown > 0.35 && priceVsMa200 < -0.25) {
-    return 'CAPITULATION';
-  }
-  
-  if (priceVsMa200 < -0.10 && ma20VsMa50 < 0 && ma50VsMa200 < 0) {
-    return 'MARKDOWN';
-  }
-  
-  if (priceVsMa200 > 0.15 && ma20VsMa50 > 0.02 && ma50VsMa200 > 0.05) {
-    return 'MARKUP';
-  }
-  
-  if (priceVsMa200 > 0.10 && ma20VsMa50 < -0.01) {
-    return 'DISTRIBUTION';
-  }
-  
-  if (priceVsMa200 < 0 && ma20VsMa50 > 0.01) {
-    return 'RECOVERY';
-  }
-  
-  return 'ACCUMULATION';
-}
-
-/**
- * Generate phase zones from daily phase classifications
- */
-function generatePhaseZones(
-  timestamps: number[],
-  closes: number[],
-  sma20: (number | null)[],
-  sma50: (number | null)[],
-  sma200: (number | null)[]
-): PhaseZone[] {
-  if (timestamps.length < 201) return [];
-  
-  const zones: PhaseZone[] = [];
-  let currentPhase = 'UNKNOWN';
-  let zoneStart = timestamps[200];
-  
-  for (let i = 200; i < timestamps.length; i++) {
-    const phase = detectPhaseAtIndex(closes, i, sma20, sma50, sma200);
-    
-    if (phase !== currentPhase) {
-      // Close previous zone
-      if (currentPhase !== 'UNKNOWN') {
-        zones.push({
-          from: zoneStart,
-          to: timestamps[i - 1],
-          phase: currentPhase
-        });
-      }
-      // Start new zone
-      currentPhase = phase;
-      zoneStart = timestamps[i];
-    }
-  }
-  
-  // Close last zone
-  if (currentPhase !== 'UNKNOWN' && timestamps.length > 0) {
-    zones.push({
-      from: zoneStart,
-      to: timestamps[timestamps.length - 1],
-      phase: currentPhase
-    });
-  }
-  
-  return zones;
-}
-
 // ═══════════════════════════════════════════════════════════════
 // ROUTE REGISTRATION
 // ═══════════════════════════════════════════════════════════════
@@ -202,10 +69,11 @@ export async function fractalChartRoutes(fastify: FastifyInstance): Promise<void
     const symbol = request.query.symbol ?? 'BTC';
     const limit = Math.min(2000, parseInt(request.query.limit ?? '365', 10));
     
-    // 1. Fetch all candles from canonical store
-    const allCandles = await canonicalStore.getAll(symbol, '1d');
+    // 1. Cached series (incremental sync, no full read per request)
+    const series = await seriesCache.get(symbol, '1d');
+    const n = series.closes.length;
     
-    if (allCandles.length === 0) {
+    if (n === 0) {
       return {
         symbol,
         tf: '1D',
@@ -217,50 +85,28 @@ export async function fractalChartRoutes(fastify: FastifyInstance): Promise<void
       };
     }
     
-    // 2. Take last N candles
-    const candles = allCandles.slice(-limit);
+    // 2. Materialized SMA / phase series (new candles are classified once)
+    const chart = chartSeriesFor(series);
     
-    // 3. Extract arrays for calculations
-    const timestamps = candles.map(c => c.ts.getTime());
-    const closes = candles.map(c => c.ohlcv.c);
+    // 3. Last N candles
+    const startIdx = limit > 0 ? Math.max(0, n - limit) : 0;
     
-    // 4. Calculate SMAs (need more history for accurate SMA200)
-    const fullCloses = allCandles.map(c => c.ohlcv.c);
-    const fullTimestamps = allCandles.map(c => c.ts.getTime());
-    
-    const sma20Full = calculateSMA(fullCloses, 20);
-    const sma50Full = calculateSMA(fullCloses, 50);
-    const sma200Full = calculateSMA(fullCloses, 200);
-    
-    // 5. Slice SMAs to match requested limit
-    const startIdx = fullCloses.length - limit;
-    const sma200Slice = sma200Full.slice(startIdx);
-    
-    // 6. Build SMA200 response array
+    // 4. Build SMA200 response array
+    const sma200 = chart.sma200;
     const sma200Data: SMA200Point[] = [];
-    for (let i = 0; i < candles.length; i++) {
-      const val = sma200Slice[i];
-      if (val !== null) {
+    for (let i = startIdx; i < n; i++) {
+      if (!Number.isNaN(sma200[i])) {
         sma200Data.push({
-          t: timestamps[i],
-          value: val
+          t: series.ts[i].getTime(),
+          value: sma200[i]
         });
       }
     }
     
-    // 7. Generate phase zones
-    const phaseZones = generatePhaseZones(
-      fullTimestamps,
-      fullCloses,
-      sma20Full,
-      sma50Full,
-      sma200Full
-    );
-    
-    // Filter phase zones to requested range
-    const rangeStart = timestamps[0];
-    const rangeEnd = timestamps[timestamps.length - 1];
-    const filteredZones = phaseZones
+    // 5. Phase zones, filtered to requested range
+    const rangeStart = series.ts[startIdx].getTime();
+    const rangeEnd = series.ts[n - 1].getTime();
+    const filteredZones = chart.zones
       .filter(z => z.to >= rangeStart && z.from <= rangeEnd)
       .map(z => ({
         from: Math.max(z.from, rangeStart),
@@ -268,15 +114,18 @@ export async function fractalChartRoutes(fastify: FastifyInstance): Promise<void
         phase: z.phase
       }));
     
-    // 8. Build candles response
-    const candleData: CandleData[] = candles.map(c => ({
-      t: c.ts.getTime(),
-      o: c.ohlcv.o,
-      h: c.ohlcv.h,
-      l: c.ohlcv.l,
-      c: c.ohlcv.c,
-      v: c.ohlcv.v ?? 0
-    }));
+    // 6. Build candles response
+    const candleData: CandleData[] = [];
+    for (let i = startIdx; i < n; i++) {
+      candleData.push({
+        t: series.ts[i].getTime(),
+        o: series.opens[i],
+        h: series.highs[i],
+        l: series.lows[i],
+        c: series.closes[i],
+        v: series.volumes[i]
+      });
+    }
     
     return {
       symbol,
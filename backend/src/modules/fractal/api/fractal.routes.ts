@@ -8,6 +8,7 @@ import { FractalEngine } from '../engine/fractal.engine.js';
 import { FractalBootstrapService } from '../bootstrap/fractal.bootstrap.service.js';
 import { StateStore } from '../data/state.store.js';
 import { CanonicalStore } from '../data/canonical.store.js';
+import { seriesCache, countUpTo } from '../data/series.cache.js';
 import { KrakenCsvProvider } from '../data/providers/kraken-csv.provider.js';
 import { LegacyProvider } from '../data/providers/legacy.provider.js';
 import { FractalMatchRequest, FractalHealthResponse } from '../contracts/fractal.contracts.js';
@@ -201,10 +202,9 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
       const query = (request.query || {}) as any;
       
       // Import new engines
-      const { buildMultiRepVectors, multiRepSimilarity, buildSingleRepVector } = 
-        await import('../engine/similarity.engine.v2.js');
-      const { stage1SelectByReturns } = await import('../engine/retrieval.stage1.js');
-      const { twoStageRetrieve, analyzeStageCorrelation } = await import('../engine/retrieval.two_stage.js');
+      const { stage1SelectIndexed } = await import('../engine/retrieval.stage1.js');
+      const { twoStageRetrieveIndexed, analyzeStageCorrelation } = await import('../engine/retrieval.two_stage.js');
+      const { multiRepIndexFor } = await import('../engine/multirep.index.js');
       const { enforcePhaseDiversity, analyzePhaseDistribution } = await import('../engine/match-filters.phase.js');
       const { classifyPhaseDetailed } = await import('../engine/phase.classifier.js');
       const { V2_INSTITUTIONAL_CORE_CONFIG } = await import('../config/fractal.presets.js');
@@ -235,40 +235,33 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
         return baseResult;
       }
       
-      // Get closes data for current window
-      const data = await canonicalStore.getAll(FRACTAL_SYMBOL, FRACTAL_TIMEFRAME);
-      if (data.length < windowLen + 200) {
-        return { ok: false, error: 'Insufficient data', debug: { dataLength: data.length } };
+      // Cached series, bounded at asOf by index (no copies of the history)
+      const series = await seriesCache.get(FRACTAL_SYMBOL, FRACTAL_TIMEFRAME);
+      if (series.closes.length < windowLen + 200) {
+        return { ok: false, error: 'Insufficient data', debug: { dataLength: series.closes.length } };
       }
       
       const asOfTs = asOf?.getTime() ?? Date.now();
-      let filtered = data;
-      if (asOf) {
-        filtered = data.filter(d => d.ts.getTime() <= asOfTs);
-      }
-      
-      const closes = filtered.map(d => d.ohlcv.c);
-      const timestamps = filtered.map(d => d.ts);
-      
-      // Current window closes
-      const curCloses = closes.slice(-windowLen - 1);
+      const visible = asOf ? countUpTo(series.ts, asOfTs) : series.closes.length;
+      const curEndIdx = visible - 1;
+      const phaseCloses = series.closes.slice(Math.max(0, visible - 300), visible);
+      const windowCloses = (endIdx: number) => series.closes.slice(endIdx - windowLen, endIdx + 1);
       
       // Get current phase
-      const curPhaseInfo = classifyPhaseDetailed(closes.slice(-300), V2_INSTITUTIONAL_CORE_CONFIG.phaseClassifier);
+      const curPhaseInfo = classifyPhaseDetailed(phaseCloses, V2_INSTITUTIONAL_CORE_CONFIG.phaseClassifier);
       
-      // Build candidates with closes
+      // Candidates by window end index (binary search on the cached ts)
       const candidates = baseResult.matches.map((m, idx) => {
-        const endIdx = timestamps.findIndex(t => t.getTime() === new Date(m.endTs).getTime());
-        const startIdx = endIdx - windowLen;
+        const endTs = new Date(m.endTs);
+        const endIdx = countUpTo(series.ts, endTs.getTime()) - 1;
         return {
-          endIdx,
-          endTs: new Date(m.endTs),
+          endIdx: endIdx >= 0 && series.ts[endIdx].getTime() === endTs.getTime() ? endIdx : -1,
+          endTs,
           startTs: new Date(m.startTs),
-          closes: closes.slice(startIdx, endIdx + 1),
           originalRank: idx + 1,
           originalScore: m.score,
         };
-      }).filter(c => c.closes.length === windowLen + 1);
+      }).filter(c => c.endIdx >= windowLen && c.endIdx < visible);
       
       let finalMatches = candidates;
       let twoStageStats = null;
@@ -276,9 +269,11 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
       let phaseDiversityStats = null;
       let phaseDistribution = null;
       
-      // Two-stage retrieval
+      // Two-stage retrieval over the packed multi-rep index
       if (useTwoStage && candidates.length > 0) {
-        const stage1 = stage1SelectByReturns(curCloses, candidates, {
+        const multiRepIndex = multiRepIndexFor(series, windowLen, V2_INSTITUTIONAL_CORE_CONFIG.multiRep);
+        
+        const stage1 = stage1SelectIndexed(multiRepIndex, curEndIdx, candidates, {
           enabled: true,
           stage1Mode: 'ret_fast',
           stage1TopK: 600,
@@ -287,8 +282,9 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
           stage2MinSim: 0.35,
         });
         
-        const { ranked, stats } = twoStageRetrieve(
-          curCloses,
+        const { ranked, stats } = twoStageRetrieveIndexed(
+          multiRepIndex,
+          curEndIdx,
           stage1,
           V2_INSTITUTIONAL_CORE_CONFIG.twoStage,
           V2_INSTITUTIONAL_CORE_CONFIG.multiRep
@@ -305,20 +301,21 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
         }));
       }
       
-      // Phase diversity
+      // Phase diversity (historical window closes only for the survivors)
       if (usePhaseDiversity && finalMatches.length > 0) {
         const { filtered: phaseFiltered, stats } = enforcePhaseDiversity(
-          finalMatches.map(m => ({ ...m, sim: (m as any).sim ?? (m as any).originalScore ?? 0.5 })),
-          closes.slice(-300),
+          finalMatches.map(m => ({ ...m, closes: windowCloses(m.endIdx), sim: (m as any).sim ?? (m as any).originalScore ?? 0.5 })),
+          phaseCloses,
           V2_INSTITUTIONAL_CORE_CONFIG.phaseClassifier,
           V2_INSTITUTIONAL_CORE_CONFIG.phaseDiversity
         );
         
         phaseDiversityStats = stats;
-        finalMatches = phaseFiltered.slice(0, topK);
+        const kept = phaseFiltered.slice(0, topK);
+        finalMatches = kept;
         
         phaseDistribution = analyzePhaseDistribution(
-          finalMatches,
+          kept,
           V2_INSTITUTIONAL_CORE_CONFIG.phaseClassifier
         );
       }
@@ -329,7 +326,7 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
       return {
         ok: true,
         version: '2.1',
-        asOf: asOf ?? timestamps[timestamps.length - 1],
+        asOf: asOf ?? series.ts[curEndIdx],
         features: {
           multiRep: useMultiRep,
           twoStage: useTwoStage,
@@ -381,33 +378,29 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
       const { DEFAULT_PHASE_CLASSIFIER_CONFIG } = await import('../contracts/phase.contracts.js');
       
       // Get closes data using FRACTAL constants
-      const data = await canonicalStore.getAll(FRACTAL_SYMBOL, FRACTAL_TIMEFRAME);
+      const series = await seriesCache.get(FRACTAL_SYMBOL, FRACTAL_TIMEFRAME);
       
-      if (data.length < 300) {
+      if (series.closes.length < 300) {
         return { 
           ok: false, 
           error: 'Insufficient data for phase classification',
           debug: { 
             symbol: FRACTAL_SYMBOL, 
             timeframe: FRACTAL_TIMEFRAME,
-            dataLength: data.length 
+            dataLength: series.closes.length 
           }
         };
       }
       
-      let filtered = data;
-      if (asOf) {
-        const asOfTs = asOf.getTime();
-        filtered = data.filter(d => d.ts.getTime() <= asOfTs);
-      }
+      const visible = asOf ? countUpTo(series.ts, asOf.getTime()) : series.closes.length;
       
-      const closes = filtered.map(d => d.ohlcv.c);
-      const result = classifyPhaseDetailed(closes.slice(-300), DEFAULT_PHASE_CLASSIFIER_CONFIG);
+      const closes = series.closes.slice(Math.max(0, visible - 300), visible);
+      const result = classifyPhaseDetailed(closes, DEFAULT_PHASE_CLASSIFIER_CONFIG);
       
       return {
         ok: true,
         symbol,
-        asOf: asOf ?? filtered[filtered.length - 1]?.ts,
+        asOf: asOf ?? series.ts[visible - 1],
         ...result,
         config: DEFAULT_PHASE_CLASSIFIER_CONFIG,
       };
@@ -1096,8 +1089,7 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
       const { DEFAULT_PHASE_CLASSIFIER_CONFIG } = await import('../contracts/phase.contracts.js');
       
       // Get current phase from data
-      const data = await canonicalStore.getAll(FRACTAL_SYMBOL, FRACTAL_TIMEFRAME);
-      const closes = data.map(d => d.ohlcv.c);
+      const { closes } = await seriesCache.get(FRACTAL_SYMBOL, FRACTAL_TIMEFRAME);
       const phase = classifyPhase(closes.slice(-300), DEFAULT_PHASE_CLASSIFIER_CONFIG);
       
       // Mock horizon scores (in production, from multi-horizon engine)
@@ -1803,9 +1795,18 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
    * Admin: Invalidate cache
    * POST /api/fractal/admin/invalidate-cache
    */
-  fastify.post('/api/fractal/admin/invalidate-cache', async () => {
-    engine.adminClearCache();
-    return { ok: true, message: 'Cache invalidated' };
+  fastify.post('/api/fractal/admin/invalidate-cache', async (request) => {
+    const body = (request.body || {}) as { symbol?: string; timeframe?: string };
+    engine.adminClearCache(body.symbol, body.timeframe);
+    return { ok: true, message: 'Cache invalidated', series: seriesCache.stats() };
+  });
+
+  /**
+   * Admin: Series cache stats
+   * GET /api/fractal/admin/series-cache
+   */
+  fastify.get('/api/fractal/admin/series-cache', async () => {
+    return { ok: true, ...seriesCache.stats() };
   });
 
   /**
@@ -1941,6 +1942,8 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
   /**
    * Admin: Run shadow backtest
    * POST /api/fractal/admin/backtest
+   * Body: { symbol?, timeframe?, windowLen?, horizonDays?, minGapDays?, topK?,
+   *         startDate?, endDate?, engine?: 'vectorized' | 'stepwise' }
    */
   fastify.post('/api/fractal/admin/backtest', async (request) => {
     try {
@@ -1957,7 +1960,8 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
         minGapDays: body.minGapDays ?? 60,
         topK: body.topK ?? 25,
         startDate: body.startDate ? new Date(body.startDate) : undefined,
-        endDate: body.endDate ? new Date(body.endDate) : undefined
+        endDate: body.endDate ? new Date(body.endDate) : undefined,
+        engine: body.engine === 'stepwise' ? 'stepwise' as const : 'vectorized' as const
       };
       
       fastify.log.info({ config }, 'Starting backtest');
@@ -3427,23 +3431,31 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
    */
   fastify.post('/api/fractal/admin/sim/batch', async (request) => {
     try {
-      const { FractalSimulationRunner } = await import('../sim/sim.runner.js');
-      const sim = new FractalSimulationRunner();
+      const { simSweepExecutor } = await import('../sim/sim.sweep.executor.js');
       
       const body = (request.body || {}) as any;
       const experiments = body.experiments || ['E0'];
       
-      const results: any[] = [];
-      
-      for (const exp of experiments) {
-        const result = await sim.run({
+      // Experiments run in parallel worker threads
+      const outcomes = await simSweepExecutor.runAll(
+        experiments.map((exp: any) => ({
           symbol: body.symbol || 'BTC',
           from: body.from || '2017-01-01',
           to: body.to || '2026-01-01',
           stepDays: body.stepDays ?? 7,
           mode: body.mode || 'AUTOPILOT',
           experiment: exp
-        });
+        })),
+        { maxConcurrency: body.maxConcurrency }
+      );
+      
+      const results: any[] = [];
+      
+      for (let i = 0; i < experiments.length; i++) {
+        const exp = experiments[i];
+        const outcome = outcomes[i];
+        if (!outcome.ok) throw new Error(outcome.error);
+        const result = outcome.result;
         
         results.push({
           experiment: exp,
@@ -3507,7 +3519,8 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
         taper: body.taper ?? [0.7, 0.85, 1.0],
         maxRuns: body.maxRuns ?? 60,
         mode: body.mode ?? 'AUTOPILOT',
-        stepDays: body.stepDays ?? 7
+        stepDays: body.stepDays ?? 7,
+        maxConcurrency: body.maxConcurrency
       });
       
       return result;
@@ -3689,7 +3702,8 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
         flip: body.flip ?? [0.45, 0.55],
         softGate: body.softGate ?? true,
         maxRuns: body.maxRuns ?? 30,
-        mode: body.mode ?? 'AUTOPILOT'
+        mode: body.mode ?? 'AUTOPILOT',
+        maxConcurrency: body.maxConcurrency
       });
       
       return result;
@@ -3820,7 +3834,8 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
         hard: body.hard ?? [0.18, 0.20, 0.22],
         taper: body.taper ?? [0.85, 0.90, 1.00],
         maxRuns: body.maxRuns ?? 30,
-        mode: body.mode ?? 'AUTOPILOT'
+        mode: body.mode ?? 'AUTOPILOT',
+        maxConcurrency: body.maxConcurrency
       });
       
       return result;
@@ -3981,12 +3996,16 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
   /**
    * Admin: Run Monte Carlo Trade Reshuffle (BLOCK 35.1 + 35.3)
    * POST /api/fractal/admin/sim/montecarlo
-   * Body: { iterations?, seed?, mode?, blockSize?, start?, end?, symbol?, stepDays? }
+   * Body: { iterations?, seed?, mode?, blockSize?, start?, end?, symbol?, stepDays?,
+   *         maxConcurrency?, shardSize?, earlyStop? }
    * 
    * mode: 'permute' (default) - full random shuffle
    *       'block' - block bootstrap (preserves local regime structure)
    * blockSize: 3-5 (default 3, only for block mode)
    * 
+   * Iterations run in seeded shards on worker threads (same seed → same
+   * result for any maxConcurrency); earlyStop ends once both verdicts settle.
+   * 
    * Validates system robustness by reshuffling trade order.
    * Pass criteria:
    * - sharpe.p05 >= 0.30
@@ -3995,7 +4014,7 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
   fastify.post('/api/fractal/admin/sim/montecarlo', async (request) => {
     try {
       const { SimFullService } = await import('../sim/sim.full.service.js');
-      const { runMonteCarlo } = await import('../sim/sim.montecarlo.js');
+      const { runMonteCarloSharded } = await import('../sim/sim.montecarlo.js');
       
       const body = (request.body || {}) as any;
       const iterations = Number(body.iterations ?? 1000);
@@ -4013,13 +4032,16 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
       });
       
       // Run Monte Carlo on trades
-      const mc = runMonteCarlo({
+      const mc = await runMonteCarloSharded({
         trades: sim.trades.map(t => ({ netReturn: t.netReturn })),
         iterations,
         seed,
         initialEquity: 1.0,
         mode,
-        blockSize
+        blockSize,
+        maxConcurrency: body.maxConcurrency != null ? Number(body.maxConcurrency) : undefined,
+        shardSize: body.shardSize != null ? Number(body.shardSize) : undefined,
+        earlyStop: body.earlyStop === true || body.earlyStop === 'true'
       });
       
       return {
@@ -4296,9 +4318,12 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
   /**
    * Admin: Run Monte Carlo block bootstrap on V2 multi-horizon strategy
    * POST /api/fractal/admin/sim/monte-carlo-v2
-   * Body: { start?, end?, symbol?, iterations?: 3000, blockSizes?: [5, 7, 10], seed? }
+   * Body: { start?, end?, symbol?, iterations?: 3000, blockSizes?: [5, 7, 10], seed?,
+   *         maxConcurrency?, shardSize?, earlyStop? }
    * 
    * Tests decision SEQUENCE robustness (not just returns).
+   * Runs in seeded shards on worker threads: the same seed gives the same
+   * result for any maxConcurrency.
    * Uses ONLY block bootstrap (no permutation - preserves regime structure).
    * 
    * Acceptance criteria:
@@ -4321,6 +4346,9 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
         iterations: body.iterations ?? 3000,
         blockSizes: body.blockSizes ?? [5, 7, 10],
         seed: body.seed,
+        maxConcurrency: body.maxConcurrency != null ? Number(body.maxConcurrency) : undefined,
+        shardSize: body.shardSize != null ? Number(body.shardSize) : undefined,
+        earlyStop: body.earlyStop === true || body.earlyStop === 'true',
       });
       
       return result;
@@ -12,8 +12,11 @@
  */
 
 import { FastifyInstance, FastifyRequest } from 'fastify';
-import { CanonicalStore } from '../data/canonical.store.js';
+import { seriesCache } from '../data/series.cache.js';
 import { FractalEngine } from '../engine/fractal.engine.js';
+import { chartSeriesFor, type ChartSeriesStore } from '../engine/chart.series.js';
+import type { FractalMatchResponse } from '../contracts/fractal.contracts.js';
+import { FRACTAL_SYMBOL, FRACTAL_TIMEFRAME } from '../domain/constants.js';
 import {
   HORIZON_CONFIG,
   FRACTAL_HORIZONS,
@@ -152,7 +155,6 @@ interface TerminalPayload {
 // HELPERS
 // ═══════════════════════════════════════════════════════════════
 
-const canonicalStore = new CanonicalStore();
 const engine = new FractalEngine();
 const resolver = new HierarchicalResolverService();
 
@@ -172,29 +174,73 @@ function getWeight(horizon: HorizonKey): number {
   return weights[horizon] || 0.1;
 }
 
-function detectPhase(candles: any[]): string {
-  if (candles.length < 50) return 'UNKNOWN';
-  const recent = candles.slice(-30);
-  const ma20 = recent.slice(-20).reduce((s, c) => s + c.close, 0) / 20;
-  const ma50 = candles.slice(-50).reduce((s, c) => s + c.close, 0) / 50;
-  const currentPrice = recent[recent.length - 1].close;
-  const priceVsMa20 = (currentPrice - ma20) / ma20;
-  const priceVsMa50 = (currentPrice - ma50) / ma50;
-  if (priceVsMa20 > 0.05 && priceVsMa50 > 0.10) return 'MARKUP';
-  if (priceVsMa20 < -0.05 && priceVsMa50 < -0.10) return 'MARKDOWN';
-  if (priceVsMa20 > 0 && priceVsMa50 < 0) return 'RECOVERY';
-  if (priceVsMa20 < 0 && priceVsMa50 > 0) return 'DISTRIBUTION';
-  return 'ACCUMULATION';
+/**
+ * Nearest window size the engine supports (30 / 60 / 90)
+ */
+function supportedWindowLen(configured: number): 30 | 60 | 90 {
+  const supportedWindows: Array<30 | 60 | 90> = [30, 60, 90];
+  return supportedWindows.reduce((prev, curr) =>
+    Math.abs(curr - configured) < Math.abs(prev - configured) ? curr : prev
+  );
+}
+
+/**
+ * Match results per horizon, one similarity scan per window size: horizons
+ * that map to the same window only differ in top-K (see FractalEngine.matchTopKs)
+ */
+async function matchHorizons(horizons: HorizonKey[]): Promise<Map<HorizonKey, FractalMatchResponse | null>> {
+  const byWindow = new Map<30 | 60 | 90, HorizonKey[]>();
+  for (const h of new Set(horizons)) {
+    const windowLen = supportedWindowLen(HORIZON_CONFIG[h].windowLen);
+    const group = byWindow.get(windowLen) ?? [];
+    group.push(h);
+    byWindow.set(windowLen, group);
+  }
+
+  const results = new Map<HorizonKey, FractalMatchResponse | null>();
+  for (const [windowLen, group] of byWindow) {
+    const responses = await engine.matchTopKs(
+      { symbol: 'BTCUSD', windowLen },
+      group.map(h => HORIZON_CONFIG[h].topK)
+    ).catch(() => null);
+    group.forEach((h, i) => results.set(h, responses?.[i] ?? null));
+  }
+  return results;
 }
 
-function computeSMA(candles: any[], period: number): number {
-  if (candles.length < period) return candles[candles.length - 1]?.close || 0;
-  return candles.slice(-period).reduce((s, c) => s + c.close, 0) / period;
+/**
+ * Memo key of a horizon's match and matrix entry: the horizon plus every
+ * config value they are computed from, so a config change misses the memo
+ */
+function horizonMemoKey(h: HorizonKey): string {
+  const { windowLen, topK, minHistory } = HORIZON_CONFIG[h];
+  return `${h}|w${supportedWindowLen(windowLen)}|k${topK}|m${minHistory}`;
+}
+
+/**
+ * Matches of the latest candle, computed once per candle and horizon
+ * config: only horizons without a stored result are matched (failed
+ * matches are retried)
+ */
+async function latestMatches(
+  chart: ChartSeriesStore,
+  horizons: HorizonKey[]
+): Promise<Map<HorizonKey, FractalMatchResponse | null>> {
+  const stored = chart.latest('horizonMatches', () => new Map<string, FractalMatchResponse>());
+  const missing = [...new Set(horizons)].filter(h => !stored.has(horizonMemoKey(h)));
+  if (missing.length) {
+    for (const [h, result] of await matchHorizons(missing)) {
+      if (result) stored.set(horizonMemoKey(h), result);
+    }
+  }
+
+  const results = new Map<HorizonKey, FractalMatchResponse | null>();
+  for (const h of horizons) results.set(h, stored.get(horizonMemoKey(h)) ?? null);
+  return results;
 }
 
-async function computeHorizonSignal(candles: any[], horizon: HorizonKey) {
+function computeHorizonSignal(historyLen: number, horizon: HorizonKey, result: FractalMatchResponse | null) {
   const config = HORIZON_CONFIG[horizon];
-  const phase = detectPhase(candles);
   
   const defaultSignal = {
     direction: 'NEUTRAL' as const,
@@ -207,22 +253,9 @@ async function computeHorizonSignal(candles: any[], horizon: HorizonKey) {
     blockers: ['INSUFFICIENT_DATA'],
   };
 
-  if (candles.length < config.minHistory) return defaultSignal;
+  if (historyLen < config.minHistory) return defaultSignal;
 
   try {
-    // Map to supported window sizes
-    const supportedWindows = [30, 60, 90];
-    const windowLen = supportedWindows.reduce((prev, curr) =>
-      Math.abs(curr - config.windowLen) < Math.abs(prev - config.windowLen) ? curr : prev
-    );
-
-    const result = await engine.match({
-      symbol: 'BTCUSD',
-      candles,
-      windowLen,
-      topK: config.topK,
-    });
-
     if (!result || !result.forwardStats) return defaultSignal;
 
     const stats = result.forwardStats;
@@ -315,32 +348,59 @@ export async function fractalTerminalRoutes(fastify: FastifyInstance): Promise<v
     }
 
     try {
-      // Load candles
-      const candles = await canonicalStore.getCandles({ symbol: 'BTCUSD', limit: 1200 });
+      // Cached series + materialized chart series (no candle read per request)
+      const series = await seriesCache.get(FRACTAL_SYMBOL, FRACTAL_TIMEFRAME);
+      const n = series.closes.length;
       
-      if (!candles || candles.length < 100) {
+      if (n < 100) {
         return reply.code(503).send({ error: 'INSUFFICIENT_DATA' });
       }
 
-      const currentPrice = candles[candles.length - 1].close;
-      const prevPrice = candles.length > 1 ? candles[candles.length - 2].close : currentPrice;
-      const sma200 = computeSMA(candles, 200);
-      const globalPhase = detectPhase(candles);
+      const chart = chartSeriesFor(series);
+      const last = n - 1;
+      const currentPrice = series.closes[last];
+      const prevPrice = n > 1 ? series.closes[last - 1] : currentPrice;
+      const sma200 = n < 200 ? currentPrice : chart.sma200[last];
+      const globalPhase = chart.trendPhase(last);
       const asof = new Date().toISOString();
 
       // Build chart data (last 365 candles for display)
-      const chartCandles = candles.slice(-365).map(c => ({
-        ts: c.ts.toISOString(),
-        o: c.open, h: c.high, l: c.low, c: c.close, v: c.volume
-      }));
+      const chartCandles = chart.latest('terminalCandles', () => {
+        const out: TerminalPayload['chart']['candles'] = [];
+        for (let i = Math.max(0, n - 365); i < n; i++) {
+          out.push({
+            ts: series.ts[i].toISOString(),
+            o: series.opens[i], h: series.highs[i], l: series.lows[i], c: series.closes[i], v: series.volumes[i]
+          });
+        }
+        return out;
+      });
 
       // Compute signals for all horizons in set
       const horizonsToUse = set === 'extended' ? EXTENDED_HORIZONS : SHORT_HORIZONS;
       const horizonMatrix: TerminalPayload['horizonMatrix'] = [];
 
+      // Matches for the matrix and the focus overlay, one scan per window size
+      const matched = await latestMatches(chart, [
+        ...horizonsToUse.filter(h => n >= HORIZON_CONFIG[h].minHistory),
+        focus,
+      ]);
+
+      // Matrix entries are kept for the candle and horizon config once their match resolved
+      const matrixEntries = chart.latest(
+        'horizonMatrix',
+        () => new Map<string, TerminalPayload['horizonMatrix'][number]>()
+      );
       for (const h of horizonsToUse) {
-        const sig = await computeHorizonSignal(candles, h);
-        horizonMatrix.push({
+        const stored = matrixEntries.get(horizonMemoKey(h));
+        if (stored) {
+          horizonMatrix.push(stored);
+          continue;
+        }
+
+        const match = matched.get(h) ?? null;
+        const sig = computeHorizonSignal(n, h, match);
+        const entry: TerminalPayload['horizonMatrix'][number] = {
           horizon: h,
           tier: getTier(h),
           direction: sig.direction,
@@ -352,7 +412,9 @@ export async function fractalTerminalRoutes(fastify: FastifyInstance): Promise<v
           stability: sig.stability,
           blockers: sig.blockers,
           weight: getWeight(h),
-        });
+        };
+        if (match) matrixEntries.set(horizonMemoKey(h), entry);
+        horizonMatrix.push(entry);
       }
 
       // Build resolver input
@@ -401,17 +463,8 @@ export async function fractalTerminalRoutes(fastify: FastifyInstance): Promise<v
 
       // Overlay for focus horizon
       const focusConfig = HORIZON_CONFIG[focus];
-      const supportedWindows = [30, 60, 90];
-      const overlayWindowLen = supportedWindows.reduce((prev, curr) =>
-        Math.abs(curr - focusConfig.windowLen) < Math.abs(prev - focusConfig.windowLen) ? curr : prev
-      );
-
-      const overlayResult = await engine.match({
-        symbol: 'BTCUSD',
-        candles,
-        windowLen: overlayWindowLen,
-        topK: focusConfig.topK,
-      }).catch(() => null);
+      const overlayWindowLen = supportedWindowLen(focusConfig.windowLen);
+      const overlayResult = matched.get(focus) ?? null;
 
       // BLOCK 59.2 — P1.1: Full Consensus Index calculation
       const consensusResult = buildConsensusFromMatrix(horizonMatrix);
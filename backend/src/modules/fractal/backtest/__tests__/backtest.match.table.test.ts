@@ -0,0 +1,55 @@
+/**
+ * Walk-forward Neighbor Table Tests
+ *
+ * Batched table vs a per-step brute-force scan with the same look-ahead
+ * boundary.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { MATCH_MIN_SCORE, buildNeighborTable, stepNeighbors } from '../backtest.match.table.js';
+import { randomWalk } from '../../../../common/__tests__/seeded.fixtures.js';
+
+function zscore(closes: number[], endIdx: number, windowLen: number): number[] {
+  const r: number[] = [];
+  for (let j = endIdx - windowLen + 1; j <= endIdx; j++) r.push(Math.log(closes[j] / closes[j - 1]));
+  const mean = r.reduce((s, x) => s + x, 0) / r.length;
+  const std = Math.sqrt(r.reduce((s, x) => s + (x - mean) ** 2, 0) / (r.length - 1)) || 0.01;
+  return r.map(x => (x - mean) / std);
+}
+
+function bruteForce(closes: number[], endIdx: number, windowLen: number, minGapDays: number, topK: number) {
+  const cur = zscore(closes, endIdx, windowLen);
+  const curNorm = Math.sqrt(cur.reduce((s, x) => s + x * x, 0));
+  const candidates: { idx: number; score: number }[] = [];
+  for (let histEnd = windowLen; histEnd < endIdx - windowLen - minGapDays; histEnd++) {
+    const h = zscore(closes, histEnd, windowLen);
+    const dot = h.reduce((s, x, k) => s + x * cur[k], 0);
+    const score = dot / (curNorm * Math.sqrt(h.reduce((s, x) => s + x * x, 0)));
+    if (score > MATCH_MIN_SCORE) candidates.push({ idx: histEnd, score });
+  }
+  candidates.sort((a, b) => b.score - a.score);
+  return { count: candidates.length, top: candidates.slice(0, topK).map(c => c.idx) };
+}
+
+describe('buildNeighborTable', () => {
+  it('should match a per-step scan for every step', () => {
+    const closes = [100, ...randomWalk(599, 5, { vol: 0.05 })];
+    const params = { windowLen: 20, minGapDays: 15, topK: 8 };
+    const steps = [35, 60, 200, 333, 599];
+    const table = buildNeighborTable(closes, steps, params);
+
+    steps.forEach((endIdx, s) => {
+      const ref = bruteForce(closes, endIdx, params.windowLen, params.minGapDays, params.topK);
+      expect(table.candidates[s]).toBe(ref.count);
+      expect(Array.from(stepNeighbors(table, s))).toEqual(ref.top);
+      // Look-ahead boundary
+      for (const idx of stepNeighbors(table, s)) expect(idx).toBeLessThan(endIdx - params.windowLen - params.minGapDays);
+    });
+  });
+
+  it('should leave steps without history empty', () => {
+    const table = buildNeighborTable([1, 2, 3, 4, 5], [2, 4], { windowLen: 3, minGapDays: 1, topK: 4 });
+    expect(Array.from(table.counts)).toEqual([0, 0]);
+    expect(Array.from(table.neighbors)).toEqual(new Array(8).fill(-1));
+  });
+});
@@ -0,0 +1,88 @@
+/**
+ * BLOCK 24.x — Walk-forward Neighbor Table
+ *
+ * Batched matching for the shadow backtest: window vectors are built once
+ * (packed window index, z-score mode) and every walk-forward step is scored
+ * against that single index instead of re-deriving each historical window.
+ *
+ * Row s of the table holds the top-K neighbors of step s, best first,
+ * restricted to windows ending before endIdx - windowLen - minGapDays
+ * (the same look-ahead boundary as the step-wise matcher).
+ */
+
+import { buildPackedWindowIndex, scoreWindowRange } from '../engine/window.index.js';
+import { TopKSelector } from '../engine/topk.selector.js';
+
+// Candidate threshold and minimum candidate count of the step-wise matcher
+export const MATCH_MIN_SCORE = 0.3;
+export const MATCH_MIN_CANDIDATES = 5;
+
+export interface NeighborTable {
+  steps: number;
+  topK: number;
+  endIdx: Int32Array;      // closes index of each step
+  neighbors: Int32Array;   // steps * topK, best first, -1 padded
+  counts: Int32Array;      // neighbors kept per step
+  candidates: Int32Array;  // windows above MATCH_MIN_SCORE per step
+}
+
+/**
+ * Fill the N x topK neighbor table for the given step indices in one pass
+ * over a shared window index
+ */
+export function buildNeighborTable(
+  closes: ArrayLike<number>,
+  stepEndIdx: ArrayLike<number>,
+  params: { windowLen: number; minGapDays: number; topK: number }
+): NeighborTable {
+  const { windowLen, minGapDays } = params;
+  const topK = Math.max(0, Math.floor(params.topK));
+  const steps = stepEndIdx.length;
+
+  const table: NeighborTable = {
+    steps,
+    topK,
+    endIdx: Int32Array.from(stepEndIdx),
+    neighbors: new Int32Array(steps * topK).fill(-1),
+    counts: new Int32Array(steps),
+    candidates: new Int32Array(steps),
+  };
+  if (steps === 0) return table;
+
+  const index = buildPackedWindowIndex('backtest', closes, windowLen, 'zscore');
+  const scores = new Float64Array(Math.max(0, closes.length));
+  const sel = new TopKSelector(topK);
+
+  for (let s = 0; s < steps; s++) {
+    const endIdx = table.endIdx[s];
+    if (endIdx - windowLen < 0) continue;
+
+    // Windows ending in [windowLen, endIdx - windowLen - minGapDays)
+    const lastEnd = endIdx - windowLen - minGapDays - 1;
+    const n = scoreWindowRange(index, endIdx, windowLen, lastEnd, scores);
+
+    let candidates = 0;
+    sel.reset();
+    for (let i = 0; i < n; i++) {
+      if (scores[i] > MATCH_MIN_SCORE) {
+        candidates++;
+        sel.push(windowLen + i, scores[i]);
+      }
+    }
+
+    const { indices } = sel.drain();
+    table.neighbors.set(indices, s * topK);
+    table.counts[s] = indices.length;
+    table.candidates[s] = candidates;
+  }
+
+  return table;
+}
+
+/**
+ * Neighbors of one step (best first)
+ */
+export function stepNeighbors(table: NeighborTable, step: number): Int32Array {
+  const off = step * table.topK;
+  return table.neighbors.subarray(off, off + table.counts[step]);
+}
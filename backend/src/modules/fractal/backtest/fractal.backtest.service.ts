@@ -5,12 +5,23 @@
  * - Volatility targeting (29.17)
  * - DD taper / kill switch (29.18)
  * - Regime exposure map (29.19)
+ *
+ * Matching runs vectorized by default: all walk-forward steps are scored
+ * against one window index (backtest.match.table.ts) and ML predictions
+ * are evaluated in one batch before the position loop. engine 'stepwise'
+ * keeps the original per-step rescan.
  */
 
 import { CanonicalStore } from '../data/canonical.store.js';
 import { RegimeEngine } from '../engine/regime.engine.js';
 import { FractalSettingsModel } from '../data/schemas/fractal-settings.schema.js';
-import { FractalMLService } from '../bootstrap/fractal.ml.service.js';
+import { FractalMLService, MLPrediction } from '../bootstrap/fractal.ml.service.js';
+import {
+  MATCH_MIN_CANDIDATES,
+  buildNeighborTable,
+  stepNeighbors,
+} from './backtest.match.table.js';
+import { ForwardOutcomeTable } from '../engine/forward.outcomes.js';
 
 // ═══════════════════════════════════════════════════════════════
 // TYPES
@@ -31,6 +42,8 @@ export interface BacktestConfig {
   applyVolTarget?: boolean;
   applyDDTaper?: boolean;
   applyRegimeExposure?: boolean;
+  // Matching engine (default 'vectorized')
+  engine?: 'vectorized' | 'stepwise';
 }
 
 export interface BacktestResult {
@@ -83,6 +96,21 @@ interface Trade {
   cost: number;
 }
 
+interface MatchStats {
+  p10: number;
+  p50: number;
+  p90: number;
+  meanLogRet: number;
+  volLogRet: number;
+  regime: { trend: string; volatility: string } | null;
+}
+
+interface StepMatch {
+  implied: 'UP' | 'DOWN' | 'MIXED';
+  regime: { trend: string; volatility: string } | null;
+  p50Return: number;
+}
+
 interface Settings {
   costModel?: {
     feeBps?: number;
@@ -117,6 +145,9 @@ export class FractalBacktestService {
   private regime = new RegimeEngine();
   private ml = new FractalMLService();
 
+  // Forward-outcome table per loaded closes array (one per run)
+  private outcomeTables = new WeakMap<number[], ForwardOutcomeTable>();
+
   async run(config: BacktestConfig): Promise<BacktestResult> {
     const timeframe = config.timeframe ?? '1d';
     const series = await this.canonical.getSeriesWithQuality(config.symbol, timeframe);
@@ -190,30 +221,28 @@ export class FractalBacktestService {
       return 'FLAT';
     }
 
-    // Walk-forward loop (step every day for position lifecycle)
-    const stepDays = 7; // sample every 7 days for efficiency
+    // Walk-forward steps (sampled every 7 days for efficiency)
+    const stepDays = 7;
+    const steps: number[] = [];
     for (
       let i = config.windowLen + config.minGapDays;
       i < closes.length - config.horizonDays;
       i += stepDays
     ) {
-      const currentTs = ts[i];
+      if (config.startDate && ts[i] < config.startDate) continue;
+      if (config.endDate && ts[i] > config.endDate) continue;
+      steps.push(i);
+    }
 
-      if (config.startDate && currentTs < config.startDate) continue;
-      if (config.endDate && currentTs > config.endDate) continue;
+    // Matches depend only on history, so they are resolved up front
+    const matches = config.engine === 'stepwise'
+      ? await this.matchStepwise(closes, ts, quality, steps, config)
+      : await this.matchVectorized(closes, steps, config);
 
-      // Get match at this historical point
-      const match = await this.matchAtIndex({
-        closes,
-        ts,
-        quality,
-        endIdx: i,
-        windowLen: config.windowLen,
-        horizonDays: config.horizonDays,
-        topK: config.topK,
-        minGapDays: config.minGapDays,
-        mlVersion: config.mlVersion
-      });
+    for (let s = 0; s < steps.length; s++) {
+      const i = steps[s];
+      const currentTs = ts[i];
+      const match = matches[s];
 
       if (!match) {
         skipped++;
@@ -514,12 +543,8 @@ export class FractalBacktestService {
     topK: number;
     minGapDays: number;
     mlVersion?: string;
-  }): Promise<{
-    implied: 'UP' | 'DOWN' | 'MIXED';
-    regime: { trend: string; volatility: string } | null;
-    p50Return: number;
-  } | null> {
-    const { closes, endIdx, windowLen, topK, minGapDays, horizonDays, mlVersion } = params;
+  }): Promise<StepMatch | null> {
+    const { closes, endIdx, windowLen, topK, minGapDays, mlVersion } = params;
 
     const windowStart = endIdx - windowLen;
     if (windowStart < 0) return null;
@@ -570,17 +595,110 @@ export class FractalBacktestService {
       }
     }
 
-    if (candidates.length < 5) return null;
+    if (candidates.length < MATCH_MIN_CANDIDATES) return null;
 
     candidates.sort((a, b) => b.score - a.score);
     const top = candidates.slice(0, topK);
 
-    // Calculate forward returns
+    const stats = this.matchStats(closes, endIdx, top.map(m => m.idx), params);
+    if (!stats) return null;
+
+    const mlPred = mlVersion
+      ? await this.ml.predict('BTC', this.mlFeatures(stats), mlVersion)
+      : null;
+    return this.resolveMatch(stats, mlPred);
+  }
+
+  /**
+   * Per-step matching (original engine)
+   */
+  private async matchStepwise(
+    closes: number[],
+    ts: Date[],
+    quality: number[],
+    steps: number[],
+    config: BacktestConfig
+  ): Promise<(StepMatch | null)[]> {
+    const matches: (StepMatch | null)[] = [];
+    for (const endIdx of steps) {
+      matches.push(await this.matchAtIndex({
+        closes,
+        ts,
+        quality,
+        endIdx,
+        windowLen: config.windowLen,
+        horizonDays: config.horizonDays,
+        topK: config.topK,
+        minGapDays: config.minGapDays,
+        mlVersion: config.mlVersion
+      }));
+    }
+    return matches;
+  }
+
+  /**
+   * All steps against one window index, ML evaluated in one batch
+   */
+  private async matchVectorized(
+    closes: number[],
+    steps: number[],
+    config: BacktestConfig
+  ): Promise<(StepMatch | null)[]> {
+    const table = buildNeighborTable(closes, steps, config);
+
+    const stats = steps.map((endIdx, s) =>
+      table.candidates[s] < MATCH_MIN_CANDIDATES
+        ? null
+        : this.matchStats(closes, endIdx, stepNeighbors(table, s), config)
+    );
+
+    const preds = new Array<MLPrediction | null>(steps.length).fill(null);
+    if (config.mlVersion) {
+      const rows: number[] = [];
+      stats.forEach((st, s) => { if (st) rows.push(s); });
+      const batch = await this.ml.predictBatch(
+        'BTC',
+        rows.map(s => this.mlFeatures(stats[s]!)),
+        config.mlVersion
+      );
+      rows.forEach((s, k) => { preds[s] = batch[k]; });
+    }
+
+    return stats.map((st, s) => (st ? this.resolveMatch(st, preds[s]) : null));
+  }
+
+  /**
+   * Forward-outcome table for this run's closes (built on first use)
+   */
+  private outcomeTable(closes: number[], horizonDays: number): ForwardOutcomeTable {
+    let table = this.outcomeTables.get(closes);
+    if (!table || !table.has(horizonDays)) {
+      table = new ForwardOutcomeTable([horizonDays]).extend(closes);
+      this.outcomeTables.set(closes, table);
+    }
+    return table;
+  }
+
+  /**
+   * Forward-return quantiles of the neighbors plus current window and
+   * regime context; null if too few neighbors resolve before the gap
+   */
+  private matchStats(
+    closes: number[],
+    endIdx: number,
+    neighbors: ArrayLike<number>,
+    params: { windowLen: number; horizonDays: number; minGapDays: number }
+  ): MatchStats | null {
+    const { windowLen, horizonDays, minGapDays } = params;
+
+    // Forward returns from the precomputed table
+    const table = this.outcomeTable(closes, horizonDays);
     const forwardReturns: number[] = [];
-    for (const m of top) {
-      const fwdIdx = m.idx + horizonDays;
+    for (let k = 0; k < neighbors.length; k++) {
+      const idx = neighbors[k];
+      const fwdIdx = idx + horizonDays;
       if (fwdIdx < endIdx - minGapDays) {
-        forwardReturns.push(closes[fwdIdx] / closes[m.idx] - 1);
+        forwardReturns.push(table.outcome(idx, horizonDays)!.ret);
       }
     }
 
@@ -591,42 +709,53 @@ export class FractalBacktestService {
     const p50 = forwardReturns[Math.floor(forwardReturns.length * 0.5)];
     const p90 = forwardReturns[Math.floor(forwardReturns.length * 0.9)];
 
+    // Current window log-return mean / std
+    let sum = 0;
+    for (let j = endIdx - windowLen + 1; j <= endIdx; j++) sum += Math.log(closes[j] / closes[j - 1]);
+    const mean = sum / windowLen;
+    let sq = 0;
+    for (let j = endIdx - windowLen + 1; j <= endIdx; j++) sq += (Math.log(closes[j] / closes[j - 1]) - mean) ** 2;
+    const std = Math.sqrt(sq / (windowLen - 1)) || 0.01;
+
     const regime = this.regime.buildHistoricalRegime(closes, endIdx);
-    const vol = std;
 
-    // Determine implied direction
-    let implied: 'UP' | 'DOWN' | 'MIXED' = 'MIXED';
+    return { p10, p50, p90, meanLogRet: mean, volLogRet: std, regime };
+  }
 
-    if (mlVersion) {
-      const features: Record<string, number> = {
-        rule_p50: p50,
-        rule_p10: p10,
-        rule_p90: p90,
-        meanLogRet: mean,
-        volLogRet: vol,
-        regimeVol: regime?.volatility === 'HIGH_VOL' ? 1 : regime?.volatility === 'LOW_VOL' ? -1 : 0,
-        regimeTrend: regime?.trend === 'UP_TREND' ? 1 : regime?.trend === 'DOWN_TREND' ? -1 : 0
-      };
+  private mlFeatures(stats: MatchStats): Record<string, number> {
+    const { regime } = stats;
+    return {
+      rule_p50: stats.p50,
+      rule_p10: stats.p10,
+      rule_p90: stats.p90,
+      meanLogRet: stats.meanLogRet,
+      volLogRet: stats.volLogRet,
+      regimeVol: regime?.volatility === 'HIGH_VOL' ? 1 : regime?.volatility === 'LOW_VOL' ? -1 : 0,
+      regimeTrend: regime?.trend === 'UP_TREND' ? 1 : regime?.trend === 'DOWN_TREND' ? -1 : 0
+    };
+  }
 
-      const mlPred = await this.ml.predict('BTC', features, mlVersion);
+  /**
+   * Implied direction: rule + ML ensemble when a prediction exists,
+   * otherwise rule quantiles only
+   */
+  private resolveMatch(stats: MatchStats, mlPred: MLPrediction | null): StepMatch {
+    const { p10, p50, p90 } = stats;
+    let implied: 'UP' | 'DOWN' | 'MIXED' = 'MIXED';
 
-      if (mlPred) {
-        const ruleSignal = Math.max(-0.5, Math.min(0.5, p50)) * 2;
-        const mlSignal = (mlPred.probUp - 0.5) * 2;
-        const ensembleScore = 0.5 * ruleSignal + 0.5 * mlSignal;
+    if (mlPred) {
+      const ruleSignal = Math.max(-0.5, Math.min(0.5, p50)) * 2;
+      const mlSignal = (mlPred.probUp - 0.5) * 2;
+      const ensembleScore = 0.5 * ruleSignal + 0.5 * mlSignal;
 
-        if (ensembleScore > 0.1) implied = 'UP';
-        else if (ensembleScore < -0.1) implied = 'DOWN';
-      } else {
-        if (p10 > 0 && p90 > 0) implied = 'UP';
-        else if (p10 < 0 && p90 < 0) implied = 'DOWN';
-      }
+      if (ensembleScore > 0.1) implied = 'UP';
+      else if (ensembleScore < -0.1) implied = 'DOWN';
     } else {
       if (p10 > 0 && p90 > 0) implied = 'UP';
       else if (p10 < 0 && p90 < 0) implied = 'DOWN';
     }
 
-    return { implied, regime, p50Return: p50 };
+    return { implied, regime: stats.regime, p50Return: p50 };
   }
 
   private computeStats(
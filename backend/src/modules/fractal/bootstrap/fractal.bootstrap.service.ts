@@ -11,6 +11,7 @@
 
 import { RawStore } from '../data/raw.store.js';
 import { CanonicalStore } from '../data/canonical.store.js';
+import { seriesCache } from '../data/series.cache.js';
 import { StateStore } from '../data/state.store.js';
 import { KrakenCsvProvider } from '../data/providers/kraken-csv.provider.js';
 import { LegacyProvider } from '../data/providers/legacy.provider.js';
@@ -236,6 +237,10 @@ export class FractalBootstrapService {
         }
       });
     }
+
+    // Cached series pick up the new/rewritten candles on next use
+    // (append-only sync; full reload only if history was restated)
+    if (candles.length) seriesCache.markStale(FRACTAL_SYMBOL, FRACTAL_TIMEFRAME);
   }
 
   /**
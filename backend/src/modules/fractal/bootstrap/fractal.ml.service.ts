@@ -39,35 +39,21 @@ export class FractalMLService {
   ): Promise<MLPrediction | null> {
     const model = await this.getModel(symbol, version);
     if (!model) return null;
+    return this.score(model, features);
+  }
 
-    // Build feature vector in correct order
-    const xRaw = model.featureOrder.map(k => features[k] ?? 0);
-
-    // Apply scaler if present (BLOCK 29.13)
-    let x: number[];
-    if (model.scaler && model.scaler.mean && model.scaler.scale) {
-      x = xRaw.map((v, i) => {
-        const mean = model.scaler!.mean[i] ?? 0;
-        const scale = model.scaler!.scale[i] ?? 1;
-        return (v - mean) / (scale || 1);
-      });
-    } else {
-      x = xRaw;
-    }
-
-    // Logistic regression: z = bias + sum(w_i * x_i)
-    let z = model.bias;
-    for (let i = 0; i < x.length; i++) {
-      z += x[i] * (model.weights[i] ?? 0);
-    }
-
-    // Sigmoid
-    const prob = 1 / (1 + Math.exp(-z));
-
-    return {
-      probUp: prob,
-      probDown: 1 - prob
-    };
+  /**
+   * Predict many feature rows with one model lookup
+   * (null entries when the model is missing)
+   */
+  async predictBatch(
+    symbol: string,
+    rows: Record<string, number>[],
+    version = 'ACTIVE'
+  ): Promise<(MLPrediction | null)[]> {
+    const model = await this.getModel(symbol, version);
+    if (!model) return rows.map(() => null);
+    return rows.map(features => this.score(model, features));
   }
 
   /**
@@ -160,6 +146,37 @@ export class FractalMLService {
     return true;
   }
 
+  private score(model: CachedModel, features: Record<string, number>): MLPrediction {
+    // Build feature vector in correct order
+    const xRaw = model.featureOrder.map(k => features[k] ?? 0);
+
+    // Apply scaler if present (BLOCK 29.13)
+    let x: number[];
+    if (model.scaler && model.scaler.mean && model.scaler.scale) {
+      x = xRaw.map((v, i) => {
+        const mean = model.scaler!.mean[i] ?? 0;
+        const scale = model.scaler!.scale[i] ?? 1;
+        return (v - mean) / (scale || 1);
+      });
+    } else {
+      x = xRaw;
+    }
+
+    // Logistic regression: z = bias + sum(w_i * x_i)
+    let z = model.bias;
+    for (let i = 0; i < x.length; i++) {
+      z += x[i] * (model.weights[i] ?? 0);
+    }
+
+    // Sigmoid
+    const prob = 1 / (1 + Math.exp(-z));
+
+    return {
+      probUp: prob,
+      probDown: 1 - prob
+    };
+  }
+
   private async getModel(symbol: string, version = 'ACTIVE'): Promise<CachedModel | null> {
     const now = Date.now();
     const cacheKey = `${symbol}:${version}`;
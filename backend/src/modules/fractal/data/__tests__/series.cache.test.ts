@@ -0,0 +1,127 @@
+/**
+ * Series Cache Tests
+ *
+ * LRU / TTL / single-flight / incremental sync behaviour with a stubbed
+ * canonical store.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { SeriesCache, countUpTo } from '../series.cache.js';
+
+interface Row { ts: Date; ohlcv: { c: number }; updatedAt: Date }
+
+function row(day: number, c: number, updatedMs = Date.UTC(2020, 0, 10)): Row {
+  return { ts: new Date(Date.UTC(2020, 0, day)), ohlcv: { c }, updatedAt: new Date(updatedMs) };
+}
+
+function makeCache(config: ConstructorParameters<typeof SeriesCache>[0] = {}) {
+  const cache = new SeriesCache(config);
+  const calls: string[] = [];
+  const rows: Row[] = [row(1, 100), row(2, 101), row(3, 102)];
+  (cache as any).canonicalStore = {
+    getAll: async (symbol: string, timeframe: string) => {
+      calls.push(`${symbol}:${timeframe}`);
+      await new Promise(r => setTimeout(r, 5));
+      return rows.slice();
+    },
+    getChangedSince: async (symbol: string, timeframe: string, afterTs: Date, updatedSince: Date) => {
+      calls.push(`delta:${symbol}:${timeframe}`);
+      return rows.filter(r => r.ts > afterTs || r.updatedAt >= updatedSince);
+    },
+  };
+  return { cache, calls, rows };
+}
+
+describe('SeriesCache', () => {
+  it('should share one load between concurrent misses', async () => {
+    const { cache, calls } = makeCache();
+    const [a, b] = await Promise.all([cache.get('BTC', '1d'), cache.get('BTC', '1d')]);
+
+    expect(a).toBe(b);
+    expect(a.closes).toEqual([100, 101, 102]);
+    expect(calls).toEqual(['BTC:1d']);
+
+    await cache.get('BTC', '1d');
+    expect(calls.length).toBe(1);
+    expect(cache.stats().hits).toBe(1);
+  });
+
+  it('should sync incrementally after TTL expiry and invalidate', async () => {
+    const { cache, calls } = makeCache();
+    cache.setTtl('BTC', '1d', 0);
+    await cache.get('BTC', '1d');
+    await cache.get('BTC', '1d');
+    expect(calls).toEqual(['BTC:1d', 'delta:BTC:1d']);
+
+    cache.setTtl('BTC', '1d', 60_000);
+    await cache.get('ETH', '1d');
+    expect(cache.invalidate('ETH')).toBe(1);
+    expect(cache.peek('ETH', '1d')).toBeUndefined();
+    expect(cache.peek('BTC', '1d')).toBeDefined();
+  });
+
+  it('should evict least recently used beyond maxEntries', async () => {
+    const { cache } = makeCache({ maxEntries: 2 });
+    await cache.get('A', '1d');
+    await cache.get('B', '1d');
+    await cache.get('A', '1d'); // touch A
+    await cache.get('C', '1d');
+
+    expect(cache.peek('A', '1d')).toBeDefined();
+    expect(cache.peek('B', '1d')).toBeUndefined();
+    expect(cache.stats().evictions).toBe(1);
+  });
+
+  it('should append new candles in place and keep derived artefacts', async () => {
+    const { cache, calls, rows } = makeCache();
+    const entry = await cache.get('BTC', '1d');
+    const artefact = cache.derived(entry, 'x', () => ({}));
+
+    rows.push(row(4, 103, Date.now()), row(5, 104, Date.now()));
+    rows[2] = row(3, 102, Date.now()); // rewritten with identical values
+    cache.markStale('BTC');
+
+    const synced = await cache.get('BTC', '1d');
+    expect(synced).toBe(entry);
+    expect(synced.closes).toEqual([100, 101, 102, 103, 104]);
+    expect(cache.derived(synced, 'x', () => ({}))).toBe(artefact);
+    expect(calls.filter(c => c === 'BTC:1d').length).toBe(1);
+    expect(cache.stats().appended).toBe(2);
+  });
+
+  it('should fully reload when an older candle is restated', async () => {
+    const { cache, calls, rows } = makeCache();
+    const entry = await cache.get('BTC', '1d');
+
+    rows[1] = row(2, 99, Date.now());
+    cache.markStale();
+
+    const reloaded = await cache.get('BTC', '1d');
+    expect(reloaded).not.toBe(entry);
+    expect(reloaded.closes).toEqual([100, 99, 102]);
+    expect(calls.filter(c => c === 'BTC:1d').length).toBe(2);
+    expect(cache.stats().restatements).toBe(1);
+  });
+
+  it('should build derived artefacts once per entry', async () => {
+    const { cache } = makeCache();
+    const entry = await cache.get('BTC', '1d');
+    let builds = 0;
+    const x = cache.derived(entry, 'x', () => ++builds);
+    const y = cache.derived(entry, 'x', () => ++builds);
+
+    expect(x).toBe(1);
+    expect(y).toBe(1);
+    expect(builds).toBe(1);
+  });
+});
+
+describe('countUpTo', () => {
+  it('should count candles at or before asOf', () => {
+    const ts = [1, 2, 3, 5].map(d => new Date(Date.UTC(2020, 0, d)));
+    expect(countUpTo(ts, Date.UTC(2020, 0, 3))).toBe(3);
+    expect(countUpTo(ts, Date.UTC(2020, 0, 4))).toBe(3);
+    expect(countUpTo(ts, Date.UTC(2019, 0, 1))).toBe(0);
+    expect(countUpTo(ts, Date.UTC(2021, 0, 1))).toBe(4);
+  });
+});
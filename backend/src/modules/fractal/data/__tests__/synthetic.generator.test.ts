@@ -0,0 +1,113 @@
+/**
+ * Synthetic OHLCV Generator Tests
+ *
+ * Determinism, candle sanity, gaps / restatements and the NDJSON fixture
+ * round trip.
+ */
+
+import { describe, it, expect } from 'vitest';
+import * as os from 'os';
+import * as path from 'path';
+import * as fs from 'fs';
+import { generateSyntheticSeries, SYNTHETIC_TIMEFRAME_MS } from '../synthetic.generator.js';
+import { readSyntheticFixture, writeSyntheticFixture } from '../synthetic.loader.js';
+import { SyntheticDataProvider } from '../providers/synthetic.provider.js';
+
+const from = new Date('2000-01-01T00:00:00Z');
+const to = new Date('2019-12-31T00:00:00Z');
+
+describe('generateSyntheticSeries', () => {
+  it('should be reproducible for a seed and differ across seeds / symbols', () => {
+    const a = generateSyntheticSeries({ symbol: 'SYN1', timeframe: '1d', from, to }, { seed: 7 });
+    const b = generateSyntheticSeries({ symbol: 'SYN1', timeframe: '1d', from, to }, { seed: 7 });
+    const c = generateSyntheticSeries({ symbol: 'SYN1', timeframe: '1d', from, to }, { seed: 8 });
+    const d = generateSyntheticSeries({ symbol: 'SYN2', timeframe: '1d', from, to }, { seed: 7 });
+
+    expect(b).toEqual(a);
+    expect(c.candles[100].close).not.toBe(a.candles[100].close);
+    expect(d.candles[100].close).not.toBe(a.candles[100].close);
+  });
+
+  it('should produce consistent candles on the timeframe grid', () => {
+    const s = generateSyntheticSeries({ symbol: 'SYN1', timeframe: '1h', from, to: new Date('2001-01-01T00:00:00Z') });
+    const step = SYNTHETIC_TIMEFRAME_MS['1h'];
+
+    expect(s.candles.length).toBeGreaterThan(8000);
+    for (let i = 0; i < s.candles.length; i++) {
+      const c = s.candles[i];
+      expect(c.ts.getTime() % step).toBe(0);
+      expect(c.high).toBeGreaterThanOrEqual(Math.max(c.open, c.close));
+      expect(c.low).toBeLessThanOrEqual(Math.min(c.open, c.close));
+      expect(c.low).toBeGreaterThan(0);
+      expect(c.volume).toBeGreaterThan(0);
+      if (i > 0) expect(c.ts.getTime()).toBeGreaterThan(s.candles[i - 1].ts.getTime());
+    }
+  });
+
+  it('should drop the bars of every recorded gap', () => {
+    const s = generateSyntheticSeries({ symbol: 'SYN1', timeframe: '1d', from, to }, { gapRate: 0.01 });
+    const present = new Set(s.candles.map(c => c.ts.getTime()));
+    const expected = Math.floor((to.getTime() - from.getTime()) / SYNTHETIC_TIMEFRAME_MS['1d']) + 1;
+    const missing = s.gaps.reduce((n, g) => n + g.bars, 0);
+
+    expect(s.gaps.length).toBeGreaterThan(0);
+    expect(present.has(s.gaps[0].from.getTime())).toBe(false);
+    // The last gap may run past the end of the range
+    expect(s.candles.length).toBeLessThanOrEqual(expected - missing + s.gaps[s.gaps.length - 1].bars);
+    expect(s.candles.length).toBeGreaterThanOrEqual(expected - missing);
+  });
+
+  it('should restate existing bars only, keeping them consistent', () => {
+    const s = generateSyntheticSeries({ symbol: 'SYN1', timeframe: '1d', from, to }, { restatementRate: 0.05 });
+    const byTs = new Map(s.candles.map(c => [c.ts.getTime(), c]));
+
+    expect(s.restatements.length).toBeGreaterThan(0);
+    for (const r of s.restatements) {
+      const original = byTs.get(r.ts.getTime());
+      expect(original).toBeDefined();
+      expect(r.open).toBe(original!.open);
+      expect(r.high).toBeGreaterThanOrEqual(Math.max(r.open, r.close));
+      expect(r.low).toBeLessThanOrEqual(Math.min(r.open, r.close));
+    }
+  });
+
+  it('should visit more than one regime over a long history', () => {
+    const s = generateSyntheticSeries({ symbol: 'SYN1', timeframe: '1d', from, to });
+    expect(new Set(s.regimes.map(r => r.regime)).size).toBeGreaterThan(1);
+  });
+});
+
+describe('SyntheticDataProvider', () => {
+  it('should return slices of one path for overlapping ranges', async () => {
+    const provider = new SyntheticDataProvider({ seed: 3 });
+    const wide = await provider.fetchRange('SYN1', '1d', new Date('2015-01-01'), new Date('2016-01-01'));
+    const narrow = await provider.fetchRange('SYN1', '1d', new Date('2015-06-01'), new Date('2015-07-01'));
+
+    const offset = wide.findIndex(c => c.ts.getTime() === narrow[0].ts.getTime());
+    expect(offset).toBeGreaterThan(0);
+    expect(wide.slice(offset, offset + narrow.length)).toEqual(narrow);
+  });
+});
+
+describe('synthetic fixture', () => {
+  it('should round-trip candles and restatements through NDJSON', async () => {
+    const series = [
+      generateSyntheticSeries({ symbol: 'SYN1', timeframe: '1d', from, to }, { restatementRate: 0.01 }),
+      generateSyntheticSeries({ symbol: 'SYN2', timeframe: '4h', from, to: new Date('2001-01-01') }),
+    ];
+    const file = path.join(os.tmpdir(), `synthetic-${process.pid}-${Date.now()}.ndjson`);
+
+    try {
+      const lines = await writeSyntheticFixture(file, series);
+      const back = await readSyntheticFixture(file);
+
+      expect(lines).toBe(series.reduce((n, s) => n + s.candles.length + s.restatements.length, 0));
+      expect(back.map(s => `${s.symbol}:${s.timeframe}`)).toEqual(['SYN1:1d', 'SYN2:4h']);
+      expect(back[0].candles).toEqual(series[0].candles);
+      expect(back[0].restatements).toEqual(series[0].restatements);
+      expect(back[1].candles).toEqual(series[1].candles);
+    } finally {
+      fs.rmSync(file, { force: true });
+    }
+  });
+});
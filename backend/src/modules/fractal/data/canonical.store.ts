@@ -77,6 +77,26 @@ export class CanonicalStore {
     }).sort({ ts: 1 }).lean();
   }
 
+  /**
+   * Candles appended after afterTs or rewritten since updatedSince
+   * (incremental cache sync; never a full-collection read)
+   */
+  async getChangedSince(
+    symbol: string,
+    timeframe: string,
+    afterTs: Date,
+    updatedSince: Date
+  ): Promise<CanonicalOhlcvDocument[]> {
+    return CanonicalOhlcvModel.find({
+      'meta.symbol': symbol,
+      'meta.timeframe': timeframe,
+      $or: [
+        { ts: { $gt: afterTs } },
+        { updatedAt: { $gte: updatedSince } }
+      ]
+    }).sort({ ts: 1 }).lean();
+  }
+
   /**
    * Count canonical candles
    */
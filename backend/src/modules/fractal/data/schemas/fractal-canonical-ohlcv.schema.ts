@@ -43,6 +43,11 @@ CanonicalOhlcvSchema.index(
   { 'meta.symbol': 1, 'meta.timeframe': 1 }
 );
 
+// Incremental sync: candles rewritten since the cache watermark
+CanonicalOhlcvSchema.index(
+  { 'meta.symbol': 1, 'meta.timeframe': 1, updatedAt: 1 }
+);
+
 export const CanonicalOhlcvModel: Model<CanonicalOhlcvDocument> = model<CanonicalOhlcvDocument>(
   'fractal_canonical_ohlcv',
   CanonicalOhlcvSchema
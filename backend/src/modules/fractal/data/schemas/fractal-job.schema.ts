@@ -0,0 +1,35 @@
+/**
+ * BLOCK 56.7: Async Job Schema
+ * Persisted state + result of long-running admin jobs (sim / sweep / optimize)
+ */
+
+import { Schema, model } from 'mongoose';
+
+const FractalJobSchema = new Schema(
+  {
+    jobId: { type: String, required: true, unique: true },
+    route: { type: String, required: true },
+    params: { type: Schema.Types.Mixed },
+
+    status: { type: String, required: true }, // QUEUED | RUNNING | DONE | FAILED | CANCELLED | INTERRUPTED
+    progress: {
+      done: { type: Number, default: 0 },
+      total: { type: Number, default: 0 },
+      message: { type: String }
+    },
+    partial: { type: [Schema.Types.Mixed], default: [] },
+    result: { type: Schema.Types.Mixed },
+    resultTruncated: { type: Boolean },   // result above is a summary
+    error: { type: String },
+
+    createdAt: { type: Date, required: true },
+    startedAt: { type: Date },
+    finishedAt: { type: Date }
+  },
+  { versionKey: false }
+);
+
+FractalJobSchema.index({ createdAt: -1 });
+FractalJobSchema.index({ status: 1, createdAt: -1 });
+
+export const FractalJobModel = model('fractal_job', FractalJobSchema);
@@ -0,0 +1,381 @@
+/**
+ * Series Cache
+ * Keyed (symbol, timeframe) in-memory cache of canonical OHLCV series,
+ * shared by the fractal engines, MultiHorizonEngine and the v2.1 routes.
+ *
+ * - LRU eviction bounded by entry count and approximate bytes
+ * - Per-key TTL; an expired entry is synced incrementally (only candles
+ *   after the last cached ts, or rewritten since the updatedAt watermark),
+ *   a full-collection read happens only on first load or restatement
+ * - Single-flight loads/syncs: concurrent misses for one key share one read
+ * - Derived artefacts (window indices, regime labels, chart series) hang off the entry,
+ *   so they are shared by every engine instance and dropped with it.
+ *   Entries only ever grow by appended candles, so artefacts may extend
+ *   themselves when closes.length grew; a restatement replaces the entry.
+ * - markStale() for canonical writers, invalidate()/reload() for admin
+ */
+
+import { CanonicalStore } from './canonical.store.js';
+
+export interface SeriesCacheConfig {
+  maxEntries: number;
+  maxBytes: number;
+  defaultTtlMs: number;
+}
+
+export const DEFAULT_SERIES_CACHE_CONFIG: SeriesCacheConfig = {
+  maxEntries: 16,
+  maxBytes: 256 * 1024 * 1024,
+  defaultTtlMs: 5 * 60 * 1000,
+};
+
+// Rough per-candle cost: Date object + 6 numbers in JS arrays
+const BYTES_PER_CANDLE = 104;
+
+/**
+ * Derived artefacts report their own size for memory accounting
+ */
+export interface SizedArtefact {
+  byteSize(): number;
+}
+
+export interface CachedSeries {
+  key: string;
+  symbol: string;
+  timeframe: string;
+  loadedAt: number;       // last full load or incremental sync
+  ttlMs: number;
+  watermark: Date;        // updatedAt already reflected in the entry
+  ts: Date[];
+  closes: number[];
+  quality: number[];
+  opens: number[];
+  highs: number[];
+  lows: number[];
+  volumes: number[];
+  derived: Map<string, unknown>;
+}
+
+export interface SeriesCacheStats {
+  entries: number;
+  maxEntries: number;
+  bytes: number;
+  maxBytes: number;
+  hits: number;
+  misses: number;
+  loads: number;
+  syncs: number;
+  appended: number;
+  restatements: number;
+  evictions: number;
+  keys: Array<{ key: string; candles: number; bytes: number; ageMs: number; ttlMs: number }>;
+}
+
+export function seriesKey(symbol: string, timeframe: string): string {
+  return `${symbol}:${timeframe}`;
+}
+
+/**
+ * Number of leading candles with ts <= asOfMs (ts sorted ascending).
+ * Replaces data.filter(d => d.ts <= asOf) on cached series.
+ */
+export function countUpTo(ts: Date[], asOfMs: number): number {
+  let lo = 0, hi = ts.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (ts[mid].getTime() <= asOfMs) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+/**
+ * Highest updatedAt seen, capped at the query start so writes racing
+ * with the read are picked up again by the next sync
+ */
+function nextWatermark(prev: Date, docs: Array<{ updatedAt?: Date }>, queryStartMs: number): Date {
+  let max = prev.getTime();
+  for (const d of docs) {
+    const u = d.updatedAt ? new Date(d.updatedAt).getTime() : 0;
+    if (u > max) max = u;
+  }
+  return new Date(Math.min(max, queryStartMs));
+}
+
+/**
+ * OHLCV columns of one canonical candle (o/h/l default to the close)
+ */
+function barOf(d: { ohlcv?: { o?: number; h?: number; l?: number; c?: number; v?: number } }) {
+  const close = d.ohlcv?.c ?? 0;
+  return {
+    close,
+    open: d.ohlcv?.o ?? close,
+    high: d.ohlcv?.h ?? close,
+    low: d.ohlcv?.l ?? close,
+    volume: d.ohlcv?.v ?? 0,
+  };
+}
+
+function entryBytes(entry: CachedSeries): number {
+  let bytes = entry.closes.length * BYTES_PER_CANDLE;
+  for (const value of entry.derived.values()) {
+    const sized = value as Partial<SizedArtefact> | null;
+    if (sized && typeof sized.byteSize === 'function') bytes += sized.byteSize();
+  }
+  return bytes;
+}
+
+export class SeriesCache {
+  private canonicalStore = new CanonicalStore();
+  private config: SeriesCacheConfig;
+
+  // Map iteration order doubles as LRU order (oldest first)
+  private entries = new Map<string, CachedSeries>();
+  private inflight = new Map<string, Promise<CachedSeries>>();
+  private ttlOverrides = new Map<string, number>();
+
+  private hits = 0;
+  private misses = 0;
+  private loads = 0;
+  private syncs = 0;
+  private appended = 0;
+  private restatements = 0;
+  private evictions = 0;
+
+  constructor(config: Partial<SeriesCacheConfig> = {}) {
+    this.config = { ...DEFAULT_SERIES_CACHE_CONFIG, ...config };
+  }
+
+  /**
+   * Get series for (symbol, timeframe): full load on miss, incremental
+   * sync on expiry
+   */
+  async get(symbol: string, timeframe: string): Promise<CachedSeries> {
+    const key = seriesKey(symbol, timeframe);
+    const now = Date.now();
+
+    const existing = this.entries.get(key);
+    if (existing && now - existing.loadedAt < existing.ttlMs) {
+      this.touch(key, existing);
+      this.hits++;
+      return existing;
+    }
+
+    this.misses++;
+    const pending = this.inflight.get(key);
+    if (pending) return pending;
+
+    const load = (existing ? this.sync(existing) : this.load(symbol, timeframe))
+      .finally(() => this.inflight.delete(key));
+    this.inflight.set(key, load);
+    return load;
+  }
+
+  /**
+   * Cached entry without loading (may be expired)
+   */
+  peek(symbol: string, timeframe: string): CachedSeries | undefined {
+    return this.entries.get(seriesKey(symbol, timeframe));
+  }
+
+  /**
+   * Derived artefact attached to an entry, built once per entry
+   */
+  derived<T>(entry: CachedSeries, name: string, build: () => T): T {
+    let value = entry.derived.get(name) as T | undefined;
+    if (value === undefined) {
+      value = build();
+      entry.derived.set(name, value);
+    }
+    return value;
+  }
+
+  /**
+   * Override TTL for one key (e.g. intraday timeframes)
+   */
+  setTtl(symbol: string, timeframe: string, ttlMs: number): void {
+    const key = seriesKey(symbol, timeframe);
+    this.ttlOverrides.set(key, ttlMs);
+    const entry = this.entries.get(key);
+    if (entry) entry.ttlMs = ttlMs;
+  }
+
+  /**
+   * Force an incremental sync on next get (call after canonical writes)
+   */
+  markStale(symbol?: string, timeframe?: string): void {
+    for (const entry of this.entries.values()) {
+      if (symbol && entry.symbol !== symbol) continue;
+      if (timeframe && entry.timeframe !== timeframe) continue;
+      entry.loadedAt = 0;
+    }
+  }
+
+  /**
+   * Admin: drop and fully reload one series (rebuilds derived artefacts)
+   */
+  async reload(symbol: string, timeframe: string): Promise<CachedSeries> {
+    this.invalidate(symbol, timeframe);
+    return this.get(symbol, timeframe);
+  }
+
+  /**
+   * Drop cached series: one key, all timeframes of a symbol, or everything
+   */
+  invalidate(symbol?: string, timeframe?: string): number {
+    let dropped = 0;
+    for (const entry of [...this.entries.values()]) {
+      if (symbol && entry.symbol !== symbol) continue;
+      if (timeframe && entry.timeframe !== timeframe) continue;
+      this.entries.delete(entry.key);
+      dropped++;
+    }
+
+    console.log(`[SeriesCache] Invalidated ${symbol ?? '*'}:${timeframe ?? '*'} (${dropped} entries)`);
+    return dropped;
+  }
+
+  stats(): SeriesCacheStats {
+    const now = Date.now();
+    const keys = [...this.entries.values()].map(e => ({
+      key: e.key,
+      candles: e.closes.length,
+      bytes: entryBytes(e),
+      ageMs: now - e.loadedAt,
+      ttlMs: e.ttlMs,
+    }));
+
+    return {
+      entries: this.entries.size,
+      maxEntries: this.config.maxEntries,
+      bytes: keys.reduce((s, k) => s + k.bytes, 0),
+      maxBytes: this.config.maxBytes,
+      hits: this.hits,
+      misses: this.misses,
+      loads: this.loads,
+      syncs: this.syncs,
+      appended: this.appended,
+      restatements: this.restatements,
+      evictions: this.evictions,
+      keys,
+    };
+  }
+
+  // Private Methods
+
+  private async load(symbol: string, timeframe: string): Promise<CachedSeries> {
+    const key = seriesKey(symbol, timeframe);
+    const t0 = Date.now();
+
+    const data = await this.canonicalStore.getAll(symbol, timeframe);
+    const bars = data.map(barOf);
+
+    const entry: CachedSeries = {
+      key,
+      symbol,
+      timeframe,
+      loadedAt: Date.now(),
+      ttlMs: this.ttlOverrides.get(key) ?? this.config.defaultTtlMs,
+      watermark: nextWatermark(new Date(0), data, t0),
+      ts: data.map(d => d.ts),
+      closes: bars.map(b => b.close),
+      quality: data.map(d => (d as any).quality?.qualityScore ?? 1),
+      opens: bars.map(b => b.open),
+      highs: bars.map(b => b.high),
+      lows: bars.map(b => b.low),
+      volumes: bars.map(b => b.volume),
+      derived: new Map(),
+    };
+
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    this.loads++;
+    this.evict(key);
+
+    console.log(`[SeriesCache] Loaded ${key}: ${entry.closes.length} candles in ${Date.now() - t0}ms`);
+    return entry;
+  }
+
+  /**
+   * Bring an expired entry up to date with one delta query. New candles are
+   * appended in place; a changed or inserted older candle is a restatement
+   * and triggers a full reload (fresh entry, derived artefacts rebuilt).
+   */
+  private async sync(entry: CachedSeries): Promise<CachedSeries> {
+    const n = entry.ts.length;
+    if (n === 0) return this.load(entry.symbol, entry.timeframe);
+
+    const t0 = Date.now();
+    const lastTs = entry.ts[n - 1];
+    const delta = await this.canonicalStore.getChangedSince(entry.symbol, entry.timeframe, lastTs, entry.watermark);
+    this.syncs++;
+
+    const lastMs = lastTs.getTime();
+    let added = 0;
+    for (const d of delta) {
+      const bar = barOf(d);
+      const quality = (d as any).quality?.qualityScore ?? 1;
+      const tMs = d.ts.getTime();
+
+      if (tMs > lastMs) {
+        entry.ts.push(d.ts);
+        entry.closes.push(bar.close);
+        entry.quality.push(quality);
+        entry.opens.push(bar.open);
+        entry.highs.push(bar.high);
+        entry.lows.push(bar.low);
+        entry.volumes.push(bar.volume);
+        added++;
+        continue;
+      }
+
+      // Rewritten older candle: harmless if values are unchanged
+      const idx = countUpTo(entry.ts, tMs) - 1;
+      const same = idx >= 0 && entry.ts[idx].getTime() === tMs &&
+        entry.closes[idx] === bar.close && entry.quality[idx] === quality &&
+        entry.opens[idx] === bar.open && entry.highs[idx] === bar.high &&
+        entry.lows[idx] === bar.low && entry.volumes[idx] === bar.volume;
+      if (!same) {
+        this.restatements++;
+        console.log(`[SeriesCache] Restatement in ${entry.key} at ${d.ts.toISOString()}, full reload`);
+        this.entries.delete(entry.key);
+        return this.load(entry.symbol, entry.timeframe);
+      }
+    }
+
+    entry.watermark = nextWatermark(entry.watermark, delta, t0);
+    entry.loadedAt = Date.now();
+    this.appended += added;
+    if (this.entries.get(entry.key) === entry) this.touch(entry.key, entry);
+
+    if (added) console.log(`[SeriesCache] Synced ${entry.key}: +${added} candles in ${Date.now() - t0}ms`);
+    return entry;
+  }
+
+  private touch(key: string, entry: CachedSeries): void {
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    // Derived artefacts grow after load, so re-check the byte budget on use
+    this.evict(key);
+  }
+
+  /**
+   * Evict least-recently-used entries until within budget (never `keep`)
+   */
+  private evict(keep: string): void {
+    let total = 0;
+    for (const e of this.entries.values()) total += entryBytes(e);
+
+    for (const [key, entry] of this.entries) {
+      if (this.entries.size <= this.config.maxEntries && total <= this.config.maxBytes) break;
+      if (key === keep) continue;
+      total -= entryBytes(entry);
+      this.entries.delete(key);
+      this.evictions++;
+      console.log(`[SeriesCache] Evicted ${key}`);
+    }
+  }
+}
+
+// Export singleton
+export const seriesCache = new SeriesCache();
@@ -0,0 +1,300 @@
+/**
+ * Synthetic OHLCV Generator
+ *
+ * Seeded, reproducible OHLCV series for offline benchmarks (match, sims,
+ * index builds) at many times the real history length.
+ *
+ * Model per bar (log price):
+ * - Regime-switching GBM: a Markov chain over regimes (bull / bear / chop /
+ *   crisis by default), each with its own annual drift and volatility;
+ *   regimes last `meanDays` on average
+ * - Jumps: Poisson arrivals (`jumpsPerYear`), normal log jump size
+ * - High / low: open/close envelope plus a half-normal wick scaled by the
+ *   bar volatility; volume lognormal, rising with |return|
+ *
+ * Data defects, recorded next to the series:
+ * - Gaps: runs of dropped bars (`gapRate` starts per bar, geometric length)
+ * - Restatements: revised versions of a `restatementRate` fraction of the
+ *   bars, to be applied after the initial load (exercises incremental sync)
+ *
+ * Every series draws from its own PRNG stream derived from
+ * (seed, symbol, timeframe), so adding a symbol never changes the others.
+ */
+
+import { OhlcvCandle } from '../contracts/fractal.contracts.js';
+import { ONE_DAY_MS } from '../domain/constants.js';
+
+// ═══════════════════════════════════════════════════════════════
+// TYPES
+// ═══════════════════════════════════════════════════════════════
+
+export type SyntheticTimeframe = '1d' | '4h' | '1h' | '15m' | '5m' | '1m';
+
+export const SYNTHETIC_TIMEFRAME_MS: Record<SyntheticTimeframe, number> = {
+  '1d': ONE_DAY_MS,
+  '4h': 4 * 60 * 60 * 1000,
+  '1h': 60 * 60 * 1000,
+  '15m': 15 * 60 * 1000,
+  '5m': 5 * 60 * 1000,
+  '1m': 60 * 1000,
+};
+
+export interface SyntheticRegime {
+  name: string;
+  driftAnnual: number;      // expected log return per year
+  volAnnual: number;        // annualized volatility
+  meanDays: number;         // mean regime duration
+  weight: number;           // relative odds of being entered
+}
+
+export interface SyntheticConfig {
+  seed: number;
+  regimes: SyntheticRegime[];
+  jumpsPerYear: number;
+  jumpMean: number;         // mean log jump
+  jumpStd: number;
+  gapRate: number;          // probability per bar that a gap starts
+  gapMeanBars: number;
+  restatementRate: number;  // fraction of bars revised later
+  restatementStd: number;   // relative size of a close revision
+  baseVolume: number;
+}
+
+export interface SyntheticSeriesSpec {
+  symbol: string;
+  timeframe: SyntheticTimeframe;
+  from: Date;
+  to: Date;
+  startPrice?: number;
+}
+
+export interface SyntheticGap {
+  from: Date;               // first missing bar
+  bars: number;
+}
+
+export interface SyntheticSeries {
+  symbol: string;
+  timeframe: SyntheticTimeframe;
+  candles: OhlcvCandle[];
+  restatements: OhlcvCandle[];                         // revised candles, ts ascending
+  gaps: SyntheticGap[];
+  regimes: Array<{ ts: Date; regime: string }>;        // regime changes
+}
+
+export const DEFAULT_SYNTHETIC_REGIMES: SyntheticRegime[] = [
+  { name: 'bull', driftAnnual: 0.8, volAnnual: 0.55, meanDays: 240, weight: 3 },
+  { name: 'bear', driftAnnual: -0.7, volAnnual: 0.7, meanDays: 180, weight: 2 },
+  { name: 'chop', driftAnnual: 0.0, volAnnual: 0.4, meanDays: 150, weight: 3 },
+  { name: 'crisis', driftAnnual: -2.5, volAnnual: 1.4, meanDays: 25, weight: 0.5 },
+];
+
+export const DEFAULT_SYNTHETIC_CONFIG: SyntheticConfig = {
+  seed: 42,
+  regimes: DEFAULT_SYNTHETIC_REGIMES,
+  jumpsPerYear: 6,
+  jumpMean: 0,
+  jumpStd: 0.08,
+  gapRate: 0.0005,
+  gapMeanBars: 3,
+  restatementRate: 0.002,
+  restatementStd: 0.003,
+  baseVolume: 25000,
+};
+
+const YEAR_MS = 365 * ONE_DAY_MS;
+
+// ═══════════════════════════════════════════════════════════════
+// PRNG
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * mulberry32 stream with normal / exponential helpers
+ */
+export class SeededRandom {
+  private state: number;
+  private spare: number | null = null;
+
+  constructor(seed: number) {
+    this.state = seed >>> 0;
+  }
+
+  next(): number {
+    this.state = (this.state + 0x6d2b79f5) >>> 0;
+    let t = this.state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  }
+
+  normal(): number {
+    if (this.spare !== null) {
+      const s = this.spare;
+      this.spare = null;
+      return s;
+    }
+    // Box-Muller, u1 in (0, 1]
+    const u1 = 1 - this.next();
+    const u2 = this.next();
+    const r = Math.sqrt(-2 * Math.log(u1));
+    this.spare = r * Math.sin(2 * Math.PI * u2);
+    return r * Math.cos(2 * Math.PI * u2);
+  }
+
+  /**
+   * Poisson draw (Knuth; fine for the small means used per bar)
+   */
+  poisson(lambda: number): number {
+    if (lambda <= 0) return 0;
+    const limit = Math.exp(-lambda);
+    let k = 0;
+    let p = this.next();
+    while (p > limit) {
+      k++;
+      p *= this.next();
+    }
+    return k;
+  }
+}
+
+/**
+ * Stable 32-bit stream seed for (seed, symbol, timeframe) — FNV-1a
+ */
+export function seriesSeed(seed: number, symbol: string, timeframe: string): number {
+  let h = 0x811c9dc5 ^ (seed >>> 0);
+  const key = `${symbol}:${timeframe}`;
+  for (let i = 0; i < key.length; i++) {
+    h ^= key.charCodeAt(i);
+    h = Math.imul(h, 0x01000193);
+  }
+  return h >>> 0;
+}
+
+// ═══════════════════════════════════════════════════════════════
+// GENERATOR
+// ═══════════════════════════════════════════════════════════════
+
+export function generateSyntheticSeries(
+  spec: SyntheticSeriesSpec,
+  config: Partial<SyntheticConfig> = {}
+): SyntheticSeries {
+  const cfg: SyntheticConfig = { ...DEFAULT_SYNTHETIC_CONFIG, ...config };
+  if (cfg.regimes.length === 0) throw new Error('At least one regime is required');
+
+  const rng = new SeededRandom(seriesSeed(cfg.seed, spec.symbol, spec.timeframe));
+  const stepMs = SYNTHETIC_TIMEFRAME_MS[spec.timeframe];
+  const dt = stepMs / YEAR_MS;                       // bar length in years
+  const barsPerDay = ONE_DAY_MS / stepMs;
+  const totalWeight = cfg.regimes.reduce((s, r) => s + r.weight, 0);
+
+  const start = Math.ceil(spec.from.getTime() / stepMs) * stepMs;
+  const end = spec.to.getTime();
+
+  const candles: OhlcvCandle[] = [];
+  const gaps: SyntheticGap[] = [];
+  const regimes: SyntheticSeries['regimes'] = [];
+
+  let regime = pickRegime(cfg.regimes, totalWeight, rng, -1);
+  let close = spec.startPrice ?? 100;
+  let gapLeft = 0;
+
+  for (let ts = start; ts <= end; ts += stepMs) {
+    // Regime switch: exit probability per bar = 1 / (mean duration in bars)
+    if (regimes.length === 0 || rng.next() < 1 / (cfg.regimes[regime].meanDays * barsPerDay)) {
+      if (regimes.length > 0) regime = pickRegime(cfg.regimes, totalWeight, rng, regime);
+      regimes.push({ ts: new Date(ts), regime: cfg.regimes[regime].name });
+    }
+    const { driftAnnual, volAnnual } = cfg.regimes[regime];
+    const barVol = volAnnual * Math.sqrt(dt);
+
+    let logReturn = (driftAnnual - 0.5 * volAnnual * volAnnual) * dt + barVol * rng.normal();
+    const jumps = rng.poisson(cfg.jumpsPerYear * dt);
+    for (let j = 0; j < jumps; j++) logReturn += cfg.jumpMean + cfg.jumpStd * rng.normal();
+
+    const open = close;
+    close = open * Math.exp(logReturn);
+    const high = Math.max(open, close) * Math.exp(Math.abs(rng.normal()) * barVol * 0.5);
+    const low = Math.min(open, close) * Math.exp(-Math.abs(rng.normal()) * barVol * 0.5);
+    const volume = (cfg.baseVolume / barsPerDay)
+      * Math.exp(0.4 * rng.normal())
+      * (1 + 2 * Math.abs(logReturn) / Math.max(barVol, 1e-12));
+
+    // Gaps: the price path continues, the bars are just missing
+    if (gapLeft > 0) {
+      gapLeft--;
+      continue;
+    }
+    if (rng.next() < cfg.gapRate) {
+      const bars = 1 + Math.floor(-Math.log(1 - rng.next()) * cfg.gapMeanBars);
+      gaps.push({ from: new Date(ts), bars });
+      gapLeft = bars - 1;
+      continue;
+    }
+
+    candles.push({ ts: new Date(ts), open, high, low, close, volume });
+  }
+
+  return {
+    symbol: spec.symbol,
+    timeframe: spec.timeframe,
+    candles,
+    restatements: restate(candles, cfg, rng),
+    gaps,
+    regimes,
+  };
+}
+
+/**
+ * Several series; each keeps its own stream, so the result per spec does
+ * not depend on the others
+ */
+export function generateSyntheticDataset(
+  specs: SyntheticSeriesSpec[],
+  config: Partial<SyntheticConfig> = {}
+): SyntheticSeries[] {
+  return specs.map(spec => generateSyntheticSeries(spec, config));
+}
+
+// ═══════════════════════════════════════════════════════════════
+// HELPERS
+// ═══════════════════════════════════════════════════════════════
+
+function pickRegime(
+  regimes: SyntheticRegime[],
+  totalWeight: number,
+  rng: SeededRandom,
+  current: number
+): number {
+  if (regimes.length === 1) return 0;
+  const weight = current >= 0 ? totalWeight - regimes[current].weight : totalWeight;
+  let r = rng.next() * weight;
+  for (let i = 0; i < regimes.length; i++) {
+    if (i === current) continue;
+    r -= regimes[i].weight;
+    if (r < 0) return i;
+  }
+  return current === regimes.length - 1 ? regimes.length - 2 : regimes.length - 1;
+}
+
+/**
+ * Revised versions of a random subset of bars (close nudged, range kept
+ * consistent, volume re-counted)
+ */
+function restate(candles: OhlcvCandle[], cfg: SyntheticConfig, rng: SeededRandom): OhlcvCandle[] {
+  const out: OhlcvCandle[] = [];
+  if (cfg.restatementRate <= 0) return out;
+
+  for (const c of candles) {
+    if (rng.next() >= cfg.restatementRate) continue;
+    const close = c.close * (1 + cfg.restatementStd * rng.normal());
+    out.push({
+      ts: c.ts,
+      open: c.open,
+      high: Math.max(c.high, c.open, close),
+      low: Math.min(c.low, c.open, close),
+      close,
+      volume: c.volume * (0.9 + 0.2 * rng.next()),
+    });
+  }
+  return out;
+}
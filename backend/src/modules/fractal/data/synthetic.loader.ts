@@ -0,0 +1,157 @@
+/**
+ * Synthetic OHLCV Loader
+ *
+ * Puts generated series where the engine and the benchmarks read them:
+ * - loadSyntheticToCanonical: bulk upsert into fractal_canonical_ohlcv
+ *   (chosenSource 'synthetic'), then the restatements as a second pass so
+ *   they land with a later updatedAt, like a provider revision
+ * - writeSyntheticFixture / readSyntheticFixture: NDJSON file fixture, one
+ *   candle per line, for machines without MongoDB
+ */
+
+import * as fs from 'fs';
+import * as readline from 'readline';
+import { once } from 'events';
+import { CanonicalOhlcvModel } from './schemas/fractal-canonical-ohlcv.schema.js';
+import { OhlcvCandle } from '../contracts/fractal.contracts.js';
+import type { SyntheticSeries, SyntheticTimeframe } from './synthetic.generator.js';
+
+export interface SyntheticLoadOptions {
+  chunkSize?: number;            // candles per bulkWrite
+  replace?: boolean;             // delete the symbol/timeframe first
+  applyRestatements?: boolean;
+}
+
+export interface SyntheticLoadResult {
+  symbol: string;
+  timeframe: string;
+  candles: number;
+  restated: number;
+  durationMs: number;
+}
+
+// ═══════════════════════════════════════════════════════════════
+// MONGODB
+// ═══════════════════════════════════════════════════════════════
+
+export async function loadSyntheticToCanonical(
+  series: SyntheticSeries,
+  options: SyntheticLoadOptions = {}
+): Promise<SyntheticLoadResult> {
+  const { chunkSize = 5000, replace = false, applyRestatements = true } = options;
+  const t0 = Date.now();
+  const meta = { symbol: series.symbol, timeframe: series.timeframe };
+
+  if (replace) {
+    await CanonicalOhlcvModel.deleteMany({ 'meta.symbol': meta.symbol, 'meta.timeframe': meta.timeframe });
+  }
+
+  await bulkUpsert(meta, series.candles, chunkSize, []);
+  if (applyRestatements && series.restatements.length > 0) {
+    await bulkUpsert(meta, series.restatements, chunkSize, ['RESTATED']);
+  }
+
+  return {
+    symbol: series.symbol,
+    timeframe: series.timeframe,
+    candles: series.candles.length,
+    restated: applyRestatements ? series.restatements.length : 0,
+    durationMs: Date.now() - t0,
+  };
+}
+
+async function bulkUpsert(
+  meta: { symbol: string; timeframe: string },
+  candles: OhlcvCandle[],
+  chunkSize: number,
+  flags: string[]
+): Promise<void> {
+  for (let i = 0; i < candles.length; i += chunkSize) {
+    const updatedAt = new Date();
+    const ops = candles.slice(i, i + chunkSize).map(c => ({
+      updateOne: {
+        filter: { 'meta.symbol': meta.symbol, 'meta.timeframe': meta.timeframe, ts: c.ts },
+        update: {
+          $set: {
+            meta,
+            ts: c.ts,
+            ohlcv: { o: c.open, h: c.high, l: c.low, c: c.close, v: c.volume },
+            provenance: { chosenSource: 'synthetic', candidates: [{ source: 'synthetic' }] },
+            quality: { qualityScore: 1, flags, sanity_ok: true },
+            updatedAt,
+          },
+        },
+        upsert: true,
+      },
+    }));
+    await CanonicalOhlcvModel.bulkWrite(ops, { ordered: false });
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════
+// FILE FIXTURE
+// ═══════════════════════════════════════════════════════════════
+
+interface FixtureLine {
+  s: string;                     // symbol
+  tf: SyntheticTimeframe;
+  t: number;                     // ts (ms)
+  o: number;
+  h: number;
+  l: number;
+  c: number;
+  v: number;
+  r?: 1;                         // restatement
+}
+
+/**
+ * Write series as NDJSON (candles first, then restatements, per series)
+ */
+export async function writeSyntheticFixture(path: string, series: SyntheticSeries[]): Promise<number> {
+  const out = fs.createWriteStream(path);
+  let lines = 0;
+
+  const write = async (s: SyntheticSeries, c: OhlcvCandle, restated: boolean) => {
+    const line: FixtureLine = {
+      s: s.symbol, tf: s.timeframe, t: c.ts.getTime(),
+      o: c.open, h: c.high, l: c.low, c: c.close, v: c.volume,
+    };
+    if (restated) line.r = 1;
+    lines++;
+    if (!out.write(JSON.stringify(line) + '\n')) await once(out, 'drain');
+  };
+
+  for (const s of series) {
+    for (const c of s.candles) await write(s, c, false);
+    for (const c of s.restatements) await write(s, c, true);
+  }
+
+  out.end();
+  await once(out, 'finish');
+  return lines;
+}
+
+/**
+ * Read a fixture back (gaps / regime changes are not stored)
+ */
+export async function readSyntheticFixture(path: string): Promise<SyntheticSeries[]> {
+  const bySeries = new Map<string, SyntheticSeries>();
+  const rl = readline.createInterface({ input: fs.createReadStream(path), crlfDelay: Infinity });
+
+  for await (const raw of rl) {
+    if (!raw) continue;
+    const line = JSON.parse(raw) as FixtureLine;
+    const key = `${line.s}:${line.tf}`;
+    let series = bySeries.get(key);
+    if (!series) {
+      series = { symbol: line.s, timeframe: line.tf, candles: [], restatements: [], gaps: [], regimes: [] };
+      bySeries.set(key, series);
+    }
+    const candle: OhlcvCandle = {
+      ts: new Date(line.t), open: line.o, high: line.h, low: line.l, close: line.c, volume: line.v,
+    };
+    (line.r ? series.restatements : series.candles).push(candle);
+  }
+
+  return [...bySeries.values()];
+}
@@ -0,0 +1,83 @@
+/**
+ * Chart Series Store Tests
+ *
+ * Materialized SMA / phase rows and zones must not depend on how the
+ * series grew, and zones must equal the runs of the per-candle phases.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { ChartSeriesStore, classifyChartPhase } from '../chart.series.js';
+import { randomWalk } from '../../../../common/__tests__/seeded.fixtures.js';
+
+function makeSeries(n: number, seed: number): { ts: Date[]; closes: number[] } {
+  // Slow regime swings so every phase shows up
+  const closes = randomWalk(n, seed, { vol: 0.08, drift: i => 0.01 * Math.sin(i / 60) });
+  const ts = closes.map((_, i) => new Date(Date.UTC(2015, 0, 1) + i * 86400000));
+  return { ts, closes };
+}
+
+function naiveMean(x: number[], end: number, n: number): number {
+  if (end < n - 1) return NaN;
+  let s = 0;
+  for (let j = end - n + 1; j <= end; j++) s += x[j];
+  return s / n;
+}
+
+describe('ChartSeriesStore', () => {
+  const { ts, closes } = makeSeries(1600, 21);
+
+  it('should give the same rows and zones when extended candle by candle', () => {
+    const full = new ChartSeriesStore().extend(ts, closes);
+    const inc = new ChartSeriesStore();
+    for (let n = 1; n <= closes.length; n += 1 + (n % 5)) inc.extend(ts.slice(0, n), closes.slice(0, n));
+    inc.extend(ts, closes);
+
+    expect(inc.length).toBe(closes.length);
+    for (let i = 0; i < closes.length; i++) {
+      if (i < 199) expect(inc.sma200[i]).toBeNaN();
+      else expect(inc.sma200[i]).toBeCloseTo(full.sma200[i], 9);
+      expect(inc.chartPhase(i)).toBe(full.chartPhase(i));
+      expect(inc.trendPhase(i)).toBe(full.trendPhase(i));
+    }
+    expect(inc.zones).toEqual(full.zones);
+  });
+
+  it('should match per-candle recomputation', () => {
+    const store = new ChartSeriesStore().extend(ts, closes);
+    const phases = new Set<string>();
+
+    for (let i = 0; i < closes.length; i++) {
+      const ma20 = naiveMean(closes, i, 20);
+      const ma50 = naiveMean(closes, i, 50);
+      const ma200 = naiveMean(closes, i, 200);
+      const high = Math.max(...closes.slice(Math.max(0, i - 90), i + 1));
+      if (i >= 49) expect(store.sma50[i]).toBeCloseTo(ma50, 9);
+      expect(store.chartPhase(i)).toBe(classifyChartPhase(closes[i], i, ma20, ma50, ma200, high));
+      phases.add(store.chartPhase(i));
+    }
+    expect(phases.size).toBeGreaterThan(3);
+
+    // Zones are the runs of non-UNKNOWN phases, covering every classified candle
+    let covered = 0;
+    for (const z of store.zones) {
+      const from = ts.findIndex(t => t.getTime() === z.from);
+      const to = ts.findIndex(t => t.getTime() === z.to);
+      for (let i = from; i <= to; i++) expect(store.chartPhase(i)).toBe(z.phase);
+      if (to + 1 < closes.length) expect(store.chartPhase(to + 1)).not.toBe(z.phase);
+      covered += to - from + 1;
+    }
+    expect(covered).toBe(closes.length - 200);
+  });
+
+  it('should drop latest-candle values when candles are appended', () => {
+    const store = new ChartSeriesStore().extend(ts.slice(0, 300), closes.slice(0, 300));
+    let builds = 0;
+    store.latest('x', () => ++builds);
+    store.latest('x', () => ++builds);
+    store.extend(ts.slice(0, 300), closes.slice(0, 300));
+    expect(store.latest('x', () => ++builds)).toBe(1);
+
+    store.extend(ts.slice(0, 301), closes.slice(0, 301));
+    expect(store.latest('x', () => ++builds)).toBe(2);
+  });
+});
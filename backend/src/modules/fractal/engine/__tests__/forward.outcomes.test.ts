@@ -0,0 +1,55 @@
+/**
+ * Forward Outcome Table Tests
+ *
+ * Lookups must be bit-identical to ForwardStatsCalculator.computeOutcomes,
+ * whether the table was built in one go or extended candle by candle.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { ForwardOutcomeTable } from '../forward.outcomes.js';
+import { ForwardStatsCalculator } from '../forward.stats.js';
+import { randomWalk } from '../../../../common/__tests__/seeded.fixtures.js';
+
+describe('ForwardOutcomeTable', () => {
+  const calc = new ForwardStatsCalculator();
+  const horizons = [7, 14, 30, 60];
+
+  it('should match computeOutcomes for every endIdx and horizon', () => {
+    const closes = randomWalk(400, 11);
+    const table = new ForwardOutcomeTable(horizons).extend(closes);
+
+    for (const h of horizons) {
+      expect(table.resolved(h)).toBe(closes.length - h);
+      for (let endIdx = 0; endIdx < closes.length; endIdx++) {
+        expect(table.outcome(endIdx, h)).toEqual(calc.computeOutcomes(closes, endIdx, h));
+      }
+    }
+  });
+
+  it('should give the same table when extended incrementally', () => {
+    const closes = randomWalk(300, 5);
+    const full = new ForwardOutcomeTable(horizons).extend(closes);
+    const inc = new ForwardOutcomeTable(horizons);
+    for (let n = 1; n <= closes.length; n += 1 + (n % 7)) inc.extend(closes.slice(0, n));
+    inc.extend(closes);
+
+    for (const h of horizons) {
+      expect(inc.resolved(h)).toBe(full.resolved(h));
+      for (let endIdx = 0; endIdx < closes.length - h; endIdx++) {
+        expect(inc.outcome(endIdx, h)).toEqual(full.outcome(endIdx, h));
+        expect(inc.runUp(endIdx, h)).toBe(full.runUp(endIdx, h));
+      }
+    }
+  });
+
+  it('should report run-up and log return over the forward span', () => {
+    const closes = [100, 90, 120, 80, 110, 130];
+    const table = new ForwardOutcomeTable([4]).extend(closes);
+
+    expect(table.runUp(0, 4)).toBeCloseTo(0.2);
+    expect(table.outcome(0, 4)!.maxDD).toBeCloseTo(80 / 120 - 1);
+    expect(table.logReturn(1, 4)).toBeCloseTo(Math.log(130 / 90));
+    expect(table.outcome(2, 4)).toBeNull();
+    expect(table.outcome(0, 5)).toBeNull();
+  });
+});
@@ -0,0 +1,59 @@
+/**
+ * Multi-Horizon Engine Tests
+ *
+ * A failing shared scan must not blank every horizon: each horizon is
+ * matched on its own and only the ones that fail come out empty.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { MultiHorizonEngine } from '../multi-horizon.engine.js';
+import type { FractalMatchRequestV2, FractalMatchResponseV2 } from '../fractal.engine.v2.js';
+
+function response(mu: number): FractalMatchResponseV2 {
+  return {
+    ok: true,
+    matches: Array.from({ length: 10 }, () => ({})),
+    forwardStats: { return: { mean: mu, p10: mu / 2, p90: mu * 2 }, maxDrawdown: { p50: 0.02 } },
+    confidence: { stabilityScore: 0.8 },
+    v2: { regime: { currentRegime: 'BEAR' } },
+  } as unknown as FractalMatchResponseV2;
+}
+
+function engineWith(stub: object): MultiHorizonEngine {
+  const engine = new MultiHorizonEngine();
+  (engine as any).engineV2 = stub;
+  return engine;
+}
+
+describe('MultiHorizonEngine', () => {
+  it('should take every horizon from the shared scan', async () => {
+    const engine = engineWith({
+      matchV2Horizons: async (_req: FractalMatchRequestV2, horizons: number[]) => horizons.map(() => response(0.05)),
+      matchV2: async () => { throw new Error('not expected'); },
+    });
+
+    const result = await engine.runMultiHorizonMatch('2025-06-01', { adaptiveFilterEnabled: false });
+    expect(result.regime).toBe('BEAR');
+    expect(result.signals.map(s => s.direction)).toEqual(['LONG', 'LONG', 'LONG', 'LONG']);
+  });
+
+  it('should fall back to per-horizon matches when the shared scan throws', async () => {
+    const asked: number[] = [];
+    const engine = engineWith({
+      matchV2Horizons: async () => { throw new Error('scan failed'); },
+      matchV2: async (req: FractalMatchRequestV2) => {
+        asked.push(req.forwardHorizon!);
+        if (req.forwardHorizon === 60) throw new Error('not enough history');
+        return response(-0.05);
+      },
+    });
+
+    const result = await engine.runMultiHorizonMatch('2025-06-01', { adaptiveFilterEnabled: false });
+    expect([...asked].sort((a, b) => a - b)).toEqual([7, 14, 30, 60]);
+    expect(result.signals.map(s => [s.horizon, s.direction])).toEqual([
+      [7, 'SHORT'], [14, 'SHORT'], [30, 'SHORT'], [60, 'NEUTRAL'],
+    ]);
+    expect(result.signals[3].matchCount).toBe(0);
+    expect(result.regime).toBe('BEAR');
+  });
+});
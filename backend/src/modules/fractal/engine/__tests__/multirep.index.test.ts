@@ -0,0 +1,65 @@
+/**
+ * Multi-Rep Window Index Tests
+ *
+ * Indexed two-stage retrieval must reproduce the per-candidate path
+ * (vectors rebuilt from closes), also after rows were appended.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { MultiRepIndexStore } from '../multirep.index.js';
+import { stage1SelectByReturns, stage1SelectIndexed } from '../retrieval.stage1.js';
+import { twoStageRetrieve, twoStageRetrieveIndexed } from '../retrieval.two_stage.js';
+import { TwoStageRetrievalConfig } from '../../contracts/retrieval.contracts.js';
+import { MultiRepConfig } from '../../contracts/similarity.contracts.js';
+import { randomWalk } from '../../../../common/__tests__/seeded.fixtures.js';
+
+function makeCloses(n: number): number[] {
+  return [100, ...randomWalk(n - 1, 7, { vol: 0.08 })];
+}
+
+const retrieval: TwoStageRetrievalConfig = {
+  enabled: true,
+  stage1Mode: 'ret_fast',
+  stage1TopK: 200,
+  stage1MinSim: 0.05,
+  stage2TopN: 60,
+  stage2MinSim: 0.1,
+};
+
+describe('MultiRepIndex', () => {
+  const closes = makeCloses(900);
+  const windowLen = 30;
+  const curEndIdx = closes.length - 1;
+  const candidates: Array<{ endIdx: number; closes: number[]; endTs: Date; startTs: Date }> = [];
+  for (let endIdx = windowLen; endIdx <= curEndIdx - 60; endIdx++) {
+    candidates.push({
+      endIdx,
+      closes: closes.slice(endIdx - windowLen, endIdx + 1),
+      endTs: new Date(endIdx),
+      startTs: new Date(endIdx - windowLen),
+    });
+  }
+  const curCloses = closes.slice(curEndIdx - windowLen, curEndIdx + 1);
+
+  for (const multi of [
+    { enabled: true, reps: ['ret', 'vol', 'dd'], repWeights: { ret: 0.5, vol: 0.3, dd: 0.2 } },
+    { enabled: true, reps: ['ret', 'vol', 'dd', 'momo'], repWeights: {}, zscoreWithinWindow: true },
+  ] as MultiRepConfig[]) {
+    it(`should match per-candidate scoring (${multi.reps.join('+')})`, () => {
+      const store = new MultiRepIndexStore();
+      store.getOrBuild(closes.slice(0, 500), windowLen, multi);
+      const index = store.getOrBuild(closes, windowLen, multi);  // appended rows
+
+      const direct = twoStageRetrieve(
+        curCloses, stage1SelectByReturns(curCloses, candidates, retrieval), retrieval, multi
+      );
+      const indexed = twoStageRetrieveIndexed(
+        index, curEndIdx, stage1SelectIndexed(index, curEndIdx, candidates, retrieval), retrieval, multi
+      );
+
+      expect(indexed.ranked.length).toBeGreaterThan(0);
+      expect(indexed.ranked.map(r => [r.cand.endIdx, r.sim, r.s1, r.byRep]))
+        .toEqual(direct.ranked.map(r => [r.cand.endIdx, r.sim, r.s1, r.byRep]));
+    });
+  }
+});
@@ -0,0 +1,73 @@
+/**
+ * Series Returns Precompute Tests
+ *
+ * O(1) prefix-sum moments and vectors written from them must agree with
+ * buildWindowVector for both similarity modes.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { buildWindowVector, type SimilarityMode } from '../similarity.engine.js';
+import { buildSeriesReturns, windowMoments, writeWindowVector } from '../series.returns.js';
+import { randomWalk } from '../../../../common/__tests__/seeded.fixtures.js';
+
+function makeCloses(n: number): number[] {
+  return [100, ...randomWalk(n - 1, 11)];
+}
+
+function cosine(a: number[], b: number[]): number {
+  let dot = 0, na = 0, nb = 0;
+  for (let i = 0; i < a.length; i++) {
+    dot += a[i] * b[i];
+    na += a[i] * a[i];
+    nb += b[i] * b[i];
+  }
+  return dot / ((Math.sqrt(na) || 1) * (Math.sqrt(nb) || 1) + 1e-12);
+}
+
+describe('Series Returns Precompute', () => {
+  const closes = makeCloses(300);
+  const sr = buildSeriesReturns(closes);
+
+  it('should compute window moments from prefix sums', () => {
+    const endIdx = 120;
+    const len = 60;
+    const r = Array.from(sr.r.subarray(endIdx - len, endIdx));
+    const mean = r.reduce((s, x) => s + x, 0) / len;
+    const varSum = r.reduce((s, x) => s + (x - mean) * (x - mean), 0);
+
+    const m = windowMoments(sr, endIdx, len);
+    expect(m.mean).toBeCloseTo(mean, 12);
+    expect(m.varSum).toBeCloseTo(varSum, 12);
+    expect(m.std).toBeCloseTo(Math.sqrt(varSum / (len - 1)), 12);
+  });
+
+  function written(series: ReturnType<typeof buildSeriesReturns>, endIdx: number, len: number, mode: SimilarityMode) {
+    const out = new Float64Array(len + 2);
+    const norm = writeWindowVector(series, endIdx, len, mode, out, 1);
+    return { vec: Array.from(out.subarray(1, len + 1)), norm, out };
+  }
+
+  for (const mode of ['raw_returns', 'zscore'] as SimilarityMode[]) {
+    it(`should write vectors with the cosine of buildWindowVector (${mode})`, () => {
+      for (const len of [30, 60, 90]) {
+        const cur = buildWindowVector(closes.slice(280 - len, 281), mode);
+        const hist = buildWindowVector(closes.slice(150 - len, 151), mode);
+        const a = written(sr, 280, len, mode);
+        const b = written(sr, 150, len, mode);
+        expect(a.norm).toBe(1);
+        expect(cosine(a.vec, b.vec)).toBeCloseTo(cosine(cur, hist), 10);
+      }
+    });
+  }
+
+  it('should treat flat windows as zero vectors', () => {
+    const flat = buildSeriesReturns(new Array(100).fill(50));
+    for (const mode of ['raw_returns', 'zscore'] as SimilarityMode[]) {
+      const { vec, norm, out } = written(flat, 99, 30, mode);
+      expect(norm).toBe(1);
+      expect(vec.every(v => v === 0)).toBe(true);
+      expect(out[0]).toBe(0);
+      expect(out[31]).toBe(0);
+    }
+  });
+});
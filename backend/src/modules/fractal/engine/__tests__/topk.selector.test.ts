@@ -0,0 +1,54 @@
+/**
+ * Bounded Top-K Selector Tests
+ *
+ * Heap selection must reproduce "stable sort descending, slice(0, K)".
+ */
+
+import { describe, it, expect } from 'vitest';
+import { TopKSelector, selectTopK } from '../topk.selector.js';
+import { lcg } from '../../../../common/__tests__/seeded.fixtures.js';
+
+function reference(scores: number[], k: number): number[] {
+  return scores
+    .map((score, index) => ({ index, score }))
+    .sort((a, b) => b.score - a.score)
+    .slice(0, k)
+    .map(x => x.index);
+}
+
+describe('TopKSelector', () => {
+  it('should match stable sort + slice on random scores', () => {
+    const rand = lcg(3);
+    const scores: number[] = [];
+    for (let i = 0; i < 2000; i++) {
+      scores.push(Math.round(rand() * 200) / 100 - 1); // many ties
+    }
+
+    for (const k of [1, 25, 600, 5000]) {
+      const { indices, scores: top } = selectTopK(scores, scores.length, k);
+      expect(Array.from(indices)).toEqual(reference(scores, k));
+      for (let i = 1; i < top.length; i++) expect(top[i]).toBeLessThanOrEqual(top[i - 1]);
+    }
+  });
+
+  it('should apply offset and minScore', () => {
+    const { indices } = selectTopK([0.2, 0.9, 0.05, 0.5], 4, 10, 100, 0.1);
+    expect(Array.from(indices)).toEqual([101, 103, 100]);
+  });
+
+  it('should return a smaller K as a prefix of a larger K', () => {
+    // FractalEngine.matchTopKs serves several K from one selection
+    const scores = [0.3, 0.7, 0.7, 0.1, 0.9, 0.3, 0.7, 0.5];
+    const wide = Array.from(selectTopK(scores, scores.length, 6).indices);
+    for (const k of [1, 3, 4]) {
+      expect(Array.from(selectTopK(scores, scores.length, k).indices)).toEqual(wide.slice(0, k));
+    }
+  });
+
+  it('should handle k = 0 and empty input', () => {
+    const sel = new TopKSelector(0);
+    sel.push(1, 1);
+    expect(sel.size).toBe(0);
+    expect(selectTopK([], 0, 5).indices.length).toBe(0);
+  });
+});
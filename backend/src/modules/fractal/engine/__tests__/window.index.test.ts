@@ -0,0 +1,74 @@
+/**
+ * Packed Window Index Tests
+ *
+ * Packed scores must match the per-window buildWindowVector + cosine path
+ * that FractalEngine.match used before the index existed.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { buildWindowVector, type SimilarityMode } from '../similarity.engine.js';
+import { buildPackedWindowIndex, scoreWindowRange, WindowIndex } from '../window.index.js';
+import { randomWalk } from '../../../../common/__tests__/seeded.fixtures.js';
+
+function makeCloses(n: number): number[] {
+  return [100, ...randomWalk(n - 1, 7, { vol: 0.08 })];
+}
+
+function naiveScore(closes: number[], windowLen: number, curEnd: number, histEnd: number, mode: SimilarityMode): number {
+  const cur = buildWindowVector(closes.slice(curEnd - windowLen, curEnd + 1), mode);
+  const hist = buildWindowVector(closes.slice(histEnd - windowLen, histEnd + 1), mode);
+  let dot = 0, nc = 0, nh = 0;
+  for (let i = 0; i < cur.length; i++) {
+    dot += cur[i] * hist[i];
+    nc += cur[i] * cur[i];
+    nh += hist[i] * hist[i];
+  }
+  return dot / ((Math.sqrt(nc) || 1) * (Math.sqrt(nh) || 1) + 1e-12);
+}
+
+describe('Packed Window Index', () => {
+  const closes = makeCloses(400);
+
+  for (const mode of ['raw_returns', 'zscore'] as SimilarityMode[]) {
+    it(`should match naive cosine scores (${mode})`, () => {
+      const windowLen = 30;
+      const index = buildPackedWindowIndex('BTC', closes, windowLen, mode);
+      expect(index.count).toBe(closes.length - windowLen);
+
+      const curEnd = 350;
+      const out = new Float64Array(300);
+      const n = scoreWindowRange(index, curEnd, windowLen, 250, out);
+      expect(n).toBe(250 - windowLen + 1);
+
+      for (const histEnd of [windowLen, 100, 180, 250]) {
+        expect(out[histEnd - windowLen]).toBeCloseTo(naiveScore(closes, windowLen, curEnd, histEnd, mode), 10);
+      }
+    });
+  }
+
+  it('should clamp the scan range to indexed windows', () => {
+    const index = buildPackedWindowIndex('BTC', closes, 60, 'raw_returns');
+    const out = new Float64Array(400);
+    expect(scoreWindowRange(index, 399, 0, 1000, out)).toBe(index.count);
+    expect(scoreWindowRange(index, 399, 200, 100, out)).toBe(0);
+  });
+
+  it('should append rows when the series grows instead of rebuilding', () => {
+    const index = new WindowIndex();
+    const head = closes.slice(0, 300);
+    const grown = index.getOrBuild('BTC', head, 30, 'zscore');
+
+    for (const len of [301, 340, 400]) {
+      const appended = index.getOrBuild('BTC', closes.slice(0, len), 30, 'zscore');
+      expect(appended).toBe(grown);
+      const rebuilt = buildPackedWindowIndex('BTC', closes.slice(0, len), 30, 'zscore');
+      expect(appended.count).toBe(rebuilt.count);
+
+      const a = new Float64Array(len);
+      const b = new Float64Array(len);
+      const n = scoreWindowRange(appended, len - 1, 30, len - 1, a);
+      expect(scoreWindowRange(rebuilt, len - 1, 30, len - 1, b)).toBe(n);
+      for (let i = 0; i < n; i++) expect(a[i]).toBeCloseTo(b[i], 10);
+    }
+  });
+});
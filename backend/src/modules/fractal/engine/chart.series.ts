@@ -0,0 +1,239 @@
+/**
+ * Chart Series Store
+ * Materialized per-candle series behind /api/fractal/v2.1/chart and
+ * /api/fractal/v2.1/terminal, attached to the cached series:
+ * - SMA20 / SMA50 / SMA200 (NaN until the window is full)
+ * - chart phase per candle (MA stack + 90d drawdown) and its phase zones
+ * - trend phase per candle (price vs MA20 / MA50, terminal global phase)
+ * - per-candle memo for values of the latest candle (horizon matrix)
+ *
+ * Every candle is classified once: when the SeriesCache syncs appended
+ * candles (canonical writers call markStale), extend() only fills the new
+ * rows; a restatement replaces the cache entry and with it the store.
+ * Routes read slices of the arrays, so both endpoints see the same values.
+ */
+
+import { seriesCache, CachedSeries, SizedArtefact } from '../data/series.cache.js';
+import { rollingMean, rollingMax } from '../../../common/rolling.kernels.js';
+import { growTo } from './column.growth.js';
+
+// ═══════════════════════════════════════════════════════════════
+// Types
+// ═══════════════════════════════════════════════════════════════
+
+export const CHART_PHASES = [
+  'UNKNOWN',
+  'MARKUP',
+  'MARKDOWN',
+  'ACCUMULATION',
+  'DISTRIBUTION',
+  'RECOVERY',
+  'CAPITULATION',
+] as const;
+
+export type ChartPhase = typeof CHART_PHASES[number];
+
+export interface PhaseZone {
+  from: number;
+  to: number;
+  phase: string;
+}
+
+const PHASE_CODE = new Map<ChartPhase, number>(CHART_PHASES.map((p, i) => [p, i]));
+
+// Longest lookback of any row: SMA200 / 90d high (window of 91 closes)
+const MAX_LOOKBACK = 200;
+
+// ═══════════════════════════════════════════════════════════════
+// Phase Rules
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * Chart phase from price action at one candle (zones on the price chart)
+ * Returns: MARKUP | MARKDOWN | ACCUMULATION | DISTRIBUTION | RECOVERY | CAPITULATION
+ */
+export function classifyChartPhase(
+  price: number,
+  index: number,
+  ma20: number,
+  ma50: number,
+  ma200: number,
+  recentHigh: number
+): ChartPhase {
+  if (index < 200) return 'UNKNOWN';
+  if (!ma20 || !ma50 || !ma200) return 'UNKNOWN';
+
+  // Momentum indicators
+  const priceVsMa200 = (price - ma200) / ma200;
+  const ma20VsMa50 = (ma20 - ma50) / ma50;
+  const ma50VsMa200 = (ma50 - ma200) / ma200;
+
+  // Recent drawdown (last 90 days)
+  const drawdown = (recentHigh - price) / recentHigh;
+
+  if (drawdown > 0.35 && priceVsMa200 < -0.25) {
+    return 'CAPITULATION';
+  }
+
+  if (priceVsMa200 < -0.10 && ma20VsMa50 < 0 && ma50VsMa200 < 0) {
+    return 'MARKDOWN';
+  }
+
+  if (priceVsMa200 > 0.15 && ma20VsMa50 > 0.02 && ma50VsMa200 > 0.05) {
+    return 'MARKUP';
+  }
+
+  if (priceVsMa200 > 0.10 && ma20VsMa50 < -0.01) {
+    return 'DISTRIBUTION';
+  }
+
+  if (priceVsMa200 < 0 && ma20VsMa50 > 0.01) {
+    return 'RECOVERY';
+  }
+
+  return 'ACCUMULATION';
+}
+
+/**
+ * Trend phase at one candle: price vs MA20 / MA50 (terminal global phase)
+ */
+export function classifyTrendPhase(price: number, index: number, ma20: number, ma50: number): ChartPhase {
+  if (index + 1 < 50) return 'UNKNOWN';
+  const priceVsMa20 = (price - ma20) / ma20;
+  const priceVsMa50 = (price - ma50) / ma50;
+  if (priceVsMa20 > 0.05 && priceVsMa50 > 0.10) return 'MARKUP';
+  if (priceVsMa20 < -0.05 && priceVsMa50 < -0.10) return 'MARKDOWN';
+  if (priceVsMa20 > 0 && priceVsMa50 < 0) return 'RECOVERY';
+  if (priceVsMa20 < 0 && priceVsMa50 > 0) return 'DISTRIBUTION';
+  return 'ACCUMULATION';
+}
+
+// ═══════════════════════════════════════════════════════════════
+// Store
+// ═══════════════════════════════════════════════════════════════
+
+export class ChartSeriesStore implements SizedArtefact {
+  private rows = 0;
+  private sma20Col = new Float64Array(0);
+  private sma50Col = new Float64Array(0);
+  private sma200Col = new Float64Array(0);
+  private chartPhaseCol = new Uint8Array(0);
+  private trendPhaseCol = new Uint8Array(0);
+  private zoneList: PhaseZone[] = [];
+  private latestMemo = new Map<string, unknown>();
+
+  get length(): number {
+    return this.rows;
+  }
+
+  get sma20(): Float64Array {
+    return this.sma20Col.subarray(0, this.rows);
+  }
+
+  get sma50(): Float64Array {
+    return this.sma50Col.subarray(0, this.rows);
+  }
+
+  get sma200(): Float64Array {
+    return this.sma200Col.subarray(0, this.rows);
+  }
+
+  /**
+   * Phase zones (runs of one non-UNKNOWN chart phase), oldest first
+   */
+  get zones(): readonly PhaseZone[] {
+    return this.zoneList;
+  }
+
+  chartPhase(index: number): ChartPhase {
+    return CHART_PHASES[this.chartPhaseCol[index]] ?? 'UNKNOWN';
+  }
+
+  trendPhase(index: number): ChartPhase {
+    return CHART_PHASES[this.trendPhaseCol[index]] ?? 'UNKNOWN';
+  }
+
+  /**
+   * Fill rows for candles appended since the last call
+   */
+  extend(ts: Date[], closes: number[]): this {
+    const n = closes.length;
+    const from = this.rows;
+    if (n <= from) return this;
+
+    this.reserve(n);
+
+    // Kernels over the new rows plus the lookback they need
+    const lo = Math.max(0, from - MAX_LOOKBACK);
+    const tail = closes.slice(lo, n);
+    const sma20 = rollingMean(tail, 20);
+    const sma50 = rollingMean(tail, 50);
+    const sma200 = rollingMean(tail, 200);
+    const high90 = rollingMax(tail, 91);
+
+    let lastZone = this.zoneList[this.zoneList.length - 1];
+    let prevPhase = from > 0 ? this.chartPhase(from - 1) : 'UNKNOWN';
+
+    for (let i = from; i < n; i++) {
+      const k = i - lo;
+      this.sma20Col[i] = sma20[k];
+      this.sma50Col[i] = sma50[k];
+      this.sma200Col[i] = sma200[k];
+
+      const phase = classifyChartPhase(closes[i], i, sma20[k], sma50[k], sma200[k], high90[k]);
+      this.chartPhaseCol[i] = PHASE_CODE.get(phase)!;
+      this.trendPhaseCol[i] = PHASE_CODE.get(classifyTrendPhase(closes[i], i, sma20[k], sma50[k]))!;
+
+      const t = ts[i].getTime();
+      if (phase !== 'UNKNOWN') {
+        if (phase === prevPhase && lastZone) {
+          lastZone.to = t;
+        } else {
+          lastZone = { from: t, to: t, phase };
+          this.zoneList.push(lastZone);
+        }
+      }
+      prevPhase = phase;
+    }
+
+    this.rows = n;
+    this.latestMemo.clear();
+    return this;
+  }
+
+  /**
+   * Value computed once for the latest candle (dropped when candles are
+   * appended)
+   */
+  latest<T>(key: string, build: () => T): T {
+    let value = this.latestMemo.get(key) as T | undefined;
+    if (value === undefined) {
+      value = build();
+      this.latestMemo.set(key, value);
+    }
+    return value;
+  }
+
+  byteSize(): number {
+    return this.sma20Col.byteLength + this.sma50Col.byteLength + this.sma200Col.byteLength +
+      this.chartPhaseCol.byteLength + this.trendPhaseCol.byteLength +
+      this.zoneList.length * 64;
+  }
+
+  private reserve(size: number): void {
+    this.sma20Col = growTo(this.sma20Col, this.rows, size);
+    this.sma50Col = growTo(this.sma50Col, this.rows, size);
+    this.sma200Col = growTo(this.sma200Col, this.rows, size);
+    this.chartPhaseCol = growTo(this.chartPhaseCol, this.rows, size);
+    this.trendPhaseCol = growTo(this.trendPhaseCol, this.rows, size);
+  }
+}
+
+/**
+ * Chart series of a cached series, extended to its current length
+ */
+export function chartSeriesFor(series: CachedSeries): ChartSeriesStore {
+  return seriesCache
+    .derived(series, 'chartSeries', () => new ChartSeriesStore())
+    .extend(series.ts, series.closes);
+}
@@ -0,0 +1,26 @@
+/**
+ * Growable Columns
+ * Typed-array storage for the per-candle artefacts attached to a cached
+ * series: window index, multi-rep index, forward outcomes, chart series.
+ *
+ * Series only grow by appended candles while an artefact is alive
+ * (restatements replace the cached series, see SeriesCache), so artefacts
+ * append rows in place instead of rebuilding. Capacity grows
+ * geometrically so daily appends rarely reallocate.
+ */
+
+const GROWTH = 1.25;
+
+type Column = Float64Array | Uint8Array;
+
+/**
+ * `arr` with room for `size` values, keeping the first `used` ones
+ * (the same array when it is already large enough)
+ */
+export function growTo<T extends Column>(arr: T, used: number, size: number): T {
+  if (size <= arr.length) return arr;
+  const Ctor = arr.constructor as new (length: number) => T;
+  const grown = new Ctor(Math.max(size, Math.ceil(arr.length * GROWTH)));
+  grown.set(arr.subarray(0, used));
+  return grown;
+}
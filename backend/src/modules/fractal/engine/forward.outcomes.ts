@@ -0,0 +1,157 @@
+/**
+ * Forward Outcome Table
+ * Precomputed forward outcomes of every endIdx for the supported horizons
+ *
+ * For each horizon h and each endIdx with endIdx + h inside the series:
+ * - ret:    closes[endIdx + h] / closes[endIdx] - 1
+ * - maxDD:  peak-to-trough drawdown inside [endIdx .. endIdx + h] (<= 0)
+ * - runUp:  highest close inside the same span over the entry, - 1 (>= 0)
+ *
+ * Values are produced by exactly the arithmetic of
+ * ForwardStatsCalculator.computeOutcomes, so a lookup is bit-identical to
+ * rescanning. The drawdown is path dependent (running peak, not window
+ * min/max), so rows are filled by one forward walk per endIdx that emits
+ * every horizon at its checkpoint: O(n * maxHorizon) once per series.
+ * extend() only fills rows that became resolvable (see column.growth.ts).
+ */
+
+import { seriesCache, CachedSeries, SizedArtefact } from '../data/series.cache.js';
+import type { Outcome } from './forward.stats.js';
+import { growTo } from './column.growth.js';
+
+export const OUTCOME_HORIZONS = [7, 14, 30, 60, 90, 180, 365];
+
+interface HorizonColumns {
+  horizon: number;
+  rows: number;          // filled rows, row r = endIdx r
+  ret: Float64Array;
+  maxDD: Float64Array;
+  runUp: Float64Array;
+}
+
+export class ForwardOutcomeTable implements SizedArtefact {
+  private columns: HorizonColumns[];
+  private byHorizon = new Map<number, HorizonColumns>();
+  private seriesLen = 0;
+
+  constructor(horizons: number[] = OUTCOME_HORIZONS) {
+    const sorted = [...new Set(horizons)].filter(h => h > 0).sort((a, b) => a - b);
+    this.columns = sorted.map(horizon => ({
+      horizon,
+      rows: 0,
+      ret: new Float64Array(0),
+      maxDD: new Float64Array(0),
+      runUp: new Float64Array(0),
+    }));
+    for (const col of this.columns) this.byHorizon.set(col.horizon, col);
+  }
+
+  get horizons(): number[] {
+    return this.columns.map(c => c.horizon);
+  }
+
+  has(horizon: number): boolean {
+    return this.byHorizon.has(horizon);
+  }
+
+  /**
+   * Fill rows resolvable with the given closes (no-op if nothing was
+   * appended since the last call)
+   */
+  extend(closes: ArrayLike<number>): this {
+    const n = closes.length;
+    if (n <= this.seriesLen) return this;
+
+    for (const col of this.columns) {
+      const rows = n - col.horizon;
+      col.ret = growTo(col.ret, col.rows, rows);
+      col.maxDD = growTo(col.maxDD, col.rows, rows);
+      col.runUp = growTo(col.runUp, col.rows, rows);
+    }
+
+    const first = this.columns.reduce((m, c) => Math.min(m, c.rows), Infinity);
+    const minHorizon = this.columns[0]?.horizon ?? 0;
+
+    for (let start = first; start + minHorizon < n; start++) {
+      // Farthest checkpoint still missing for this start
+      let walkTo = start;
+      for (const col of this.columns) {
+        if (col.rows <= start && start + col.horizon < n) walkTo = start + col.horizon;
+      }
+
+      const entry = closes[start];
+      let peak = entry;
+      let maxDD = 0;
+      let c = 0;
+      for (let i = start; i <= walkTo; i++) {
+        const price = closes[i];
+        if (price > peak) peak = price;
+        const dd = (price / peak) - 1;
+        if (dd < maxDD) maxDD = dd;
+
+        // Columns are sorted by horizon: checkpoints come in order
+        while (c < this.columns.length && start + this.columns[c].horizon === i) {
+          const col = this.columns[c++];
+          if (col.rows !== start) continue;
+          col.ret[start] = (price / entry) - 1;
+          col.maxDD[start] = maxDD;
+          col.runUp[start] = (peak / entry) - 1;
+          col.rows = start + 1;
+        }
+      }
+    }
+
+    this.seriesLen = n;
+    return this;
+  }
+
+  /**
+   * Outcome of the match ending at endIdx; null if unresolved or the
+   * horizon is not tabulated
+   */
+  outcome(endIdx: number, horizon: number): Outcome | null {
+    const col = this.byHorizon.get(horizon);
+    if (!col || endIdx < 0 || endIdx >= col.rows) return null;
+    return { ret: col.ret[endIdx], maxDD: col.maxDD[endIdx] };
+  }
+
+  /**
+   * Forward log return (NaN if unresolved / not tabulated)
+   */
+  logReturn(endIdx: number, horizon: number): number {
+    const col = this.byHorizon.get(horizon);
+    if (!col || endIdx < 0 || endIdx >= col.rows) return NaN;
+    return Math.log1p(col.ret[endIdx]);
+  }
+
+  /**
+   * Max run-up over the entry close (NaN if unresolved / not tabulated)
+   */
+  runUp(endIdx: number, horizon: number): number {
+    const col = this.byHorizon.get(horizon);
+    if (!col || endIdx < 0 || endIdx >= col.rows) return NaN;
+    return col.runUp[endIdx];
+  }
+
+  /**
+   * Number of resolved rows for a horizon (endIdx < resolved(h))
+   */
+  resolved(horizon: number): number {
+    return this.byHorizon.get(horizon)?.rows ?? 0;
+  }
+
+  byteSize(): number {
+    let bytes = 0;
+    for (const col of this.columns) bytes += col.ret.byteLength + col.maxDD.byteLength + col.runUp.byteLength;
+    return bytes;
+  }
+}
+
+/**
+ * Table attached to a cached series, extended to its current length
+ */
+export function forwardOutcomesFor(series: CachedSeries): ForwardOutcomeTable {
+  return seriesCache
+    .derived(series, 'forwardOutcomes', () => new ForwardOutcomeTable())
+    .extend(series.closes);
+}
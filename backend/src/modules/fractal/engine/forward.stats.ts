@@ -4,6 +4,7 @@
  */
 
 import { ForwardOutcome, ForwardStats, FractalConfidence } from '../contracts/fractal.contracts.js';
+import type { ForwardOutcomeTable } from './forward.outcomes.js';
 
 export interface Outcome {
   ret: number;        // forward return
@@ -40,16 +41,22 @@ export class ForwardStatsCalculator {
 
   /**
    * Compute outcomes from closes array
+   * (O(1) lookup when a precomputed table covers the horizon)
    */
   computeOutcomes(
     closes: number[],
     matchEndIdx: number,
-    horizonDays: number
+    horizonDays: number,
+    table?: ForwardOutcomeTable
   ): Outcome | null {
     const start = matchEndIdx;
     const end = matchEndIdx + horizonDays;
 
     if (end >= closes.length) return null;
+    if (table?.has(horizonDays)) {
+      const o = table.outcome(matchEndIdx, horizonDays);
+      if (o) return o;
+    }
 
     const entry = closes[start];
     const exit = closes[end];
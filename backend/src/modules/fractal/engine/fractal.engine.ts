@@ -4,10 +4,12 @@
  * BLOCK 18: ML Feature persistence on match
  */
 
-import { CanonicalStore } from '../data/canonical.store.js';
-import { SimilarityEngine, buildWindowVector, SimilarityMode } from './similarity.engine.js';
+import { seriesCache, CachedSeries } from '../data/series.cache.js';
+import { SimilarityEngine, SimilarityMode } from './similarity.engine.js';
 import { ForwardStatsCalculator, Outcome } from './forward.stats.js';
-import { WindowIndex, WindowLen, WindowVec } from './window.index.js';
+import { WindowIndex, scoreWindowRange } from './window.index.js';
+import { forwardOutcomesFor } from './forward.outcomes.js';
+import { selectTopK } from './topk.selector.js';
 import { ExplainabilityEngine, ExplainabilityResult } from './explainability.engine.js';
 import { WindowStore } from '../data/window.store.js';
 import { FeatureExtractor, VolReg, TrendReg } from './feature.extractor.js';
@@ -24,39 +26,38 @@ import {
   MIN_GAP_DAYS
 } from '../domain/constants.js';
 
-const EPS = 1e-12;
-
 export class FractalEngine {
-  private canonicalStore = new CanonicalStore();
   private sim = new SimilarityEngine();
   private statsCalculator = new ForwardStatsCalculator();
-  private index = new WindowIndex();
   private explainability = new ExplainabilityEngine();
   
   // ML Feature Layer
   private windowStore = new WindowStore();
   private featureExtractor = new FeatureExtractor();
 
-  // Cache
-  private cache: {
-    loadedAt: number;
-    ts: Date[];
-    closes: number[];
-    quality: number[];
-  } | null = null;
-
-  private CACHE_TTL_MS = 60 * 60 * 1000; // 1 hour
-  private INDEX_TTL_MS = 60 * 60 * 1000; // 1 hour
+  // Last series used (shared, keyed cache lives in seriesCache)
+  private cache: CachedSeries | null = null;
 
   /**
    * Main match endpoint
    * BLOCK 34.10: Added similarityMode for asOf-safe simulations
    */
   async match(request: FractalMatchRequest): Promise<FractalMatchResponse> {
+    const [response] = await this.matchTopKs(request, [request.topK || TOP_K_MATCHES]);
+    return response;
+  }
+
+  /**
+   * Several top-K sizes from one similarity scan.
+   *
+   * Responses are aligned with `topKs` and each equals
+   * match({ ...request, topK: k }): the selection order is deterministic
+   * (score desc, index asc), so a smaller top-K is a prefix of the largest.
+   */
+  async matchTopKs(request: FractalMatchRequest, topKs: number[]): Promise<FractalMatchResponse[]> {
     const symbol = request.symbol || FRACTAL_SYMBOL;
     const timeframe = request.timeframe || FRACTAL_TIMEFRAME;
     const windowLen = request.windowLen || 30;
-    const topK = request.topK || TOP_K_MATCHES;
     const horizonDays = request.forwardHorizon || FORWARD_HORIZON_DAYS;
     const minGapDays = MIN_GAP_DAYS;
     const asOf = request.asOf ? new Date(request.asOf) : undefined;
@@ -73,12 +74,13 @@ export class FractalEngine {
     }
 
     // Ensure cache and index are up to date
-    await this.ensureCache(symbol, timeframe, horizonDays);
+    const series = await this.ensureCache(symbol, timeframe);
 
-    let { ts, closes } = this.cache!;
+    const { ts, closes } = series;
 
     // BLOCK 34.8.1: asOf filter for look-ahead protection
-    // In simulation mode, we only see data <= asOf
+    // In simulation mode, we only see data <= asOf.
+    // The scan is bounded by asOfEndIdx instead of slicing the series.
     let asOfEndIdx = closes.length - 1;
     if (asOf) {
       const asOfTs = asOf.getTime();
@@ -90,142 +92,118 @@ export class FractalEngine {
       }
       
       if (asOfEndIdx < windowLen + horizonDays + 5) {
-        return this.emptyResponse(windowLen, timeframe, asOf);
+        return topKs.map(() => this.emptyResponse(windowLen, timeframe, asOf));
       }
-      
-      // Slice data up to asOf
-      ts = ts.slice(0, asOfEndIdx + 1);
-      closes = closes.slice(0, asOfEndIdx + 1);
     }
 
-    if (closes.length < windowLen + horizonDays + 5) {
-      return this.emptyResponse(windowLen, timeframe, asOf);
+    if (asOfEndIdx + 1 < windowLen + horizonDays + 5) {
+      return topKs.map(() => this.emptyResponse(windowLen, timeframe, asOf));
     }
 
-    // BLOCK 34.10: Build current window vector using selected mode
-    // Extract closes for current window (latest windowLen+1 closes to get windowLen returns)
-    const currentCloses = closes.slice(-windowLen - 1);
-    const currentVec = buildWindowVector(currentCloses, similarityMode);
-
-    // Calculate current window norm for cosine
-    let curNorm = 0;
-    for (let i = 0; i < currentVec.length; i++) curNorm += currentVec[i] * currentVec[i];
-    curNorm = Math.sqrt(curNorm) || 1;
+    // BLOCK 34.10: Current and historical vectors come from the same packed
+    // index, so both sides always use identical vector construction
+    const packed = this.indexFor(series).getOrBuild(symbol, closes, windowLen, similarityMode);
 
-    // Get current window timestamps
-    const currentEndIdx = closes.length - 1;
-    const currentStartIdx = Math.max(0, currentEndIdx - windowLen);
+    // Current window ends at asOfEndIdx (latest windowLen+1 closes visible)
+    const currentEndIdx = asOfEndIdx;
 
-    // BLOCK 34.10: Build historical vectors using same mode (NOT from pre-built index)
-    // This ensures hist and cur use identical vector construction
-    const candidates: Array<{ endIdx: number; score: number; startTs: Date; endTs: Date }> = [];
-    
-    // Iterate over all possible historical windows
     const minHistIdx = windowLen; // Need at least windowLen+1 prices
-    const maxHistIdx = closes.length - 1 - minGapDays; // Respect min gap from current
+    const maxHistIdx = currentEndIdx - minGapDays; // Respect min gap from current
     
     // For asOf mode, also respect forward horizon
     const effectiveMaxIdx = asOf 
       ? Math.min(maxHistIdx, asOfEndIdx - horizonDays)
       : maxHistIdx;
 
-    for (let endIdx = minHistIdx; endIdx <= effectiveMaxIdx; endIdx++) {
-      // Skip if too close to current window
-      const distanceDays = Math.abs(currentEndIdx - endIdx);
-      if (distanceDays < minGapDays) continue;
-
-      // BLOCK 34.10: Build historical vector with SAME mode as current
-      const histCloses = closes.slice(endIdx - windowLen, endIdx + 1);
-      const histVec = buildWindowVector(histCloses, similarityMode);
+    const scores = new Float64Array(Math.max(0, effectiveMaxIdx - minHistIdx + 1));
+    const scored = scoreWindowRange(packed, currentEndIdx, minHistIdx, effectiveMaxIdx, scores);
 
-      // Calculate hist norm
-      let histNorm = 0;
-      for (let i = 0; i < histVec.length; i++) histNorm += histVec[i] * histVec[i];
-      histNorm = Math.sqrt(histNorm) || 1;
-
-      // Cosine similarity
-      let dot = 0;
-      for (let i = 0; i < currentVec.length && i < histVec.length; i++) {
-        dot += currentVec[i] * histVec[i];
-      }
-      const score = dot / (curNorm * histNorm + EPS);
-
-      candidates.push({
+    // Bounded top-K: only winners become match objects (largest K once)
+    const best = selectTopK(scores, scored, Math.max(...topKs), minHistIdx);
+    const ranked: Array<{ endIdx: number; score: number; startTs: Date; endTs: Date }> = [];
+    for (let i = 0; i < best.indices.length; i++) {
+      const endIdx = best.indices[i];
+      ranked.push({
         endIdx,
-        score,
+        score: best.scores[i],
         startTs: ts[endIdx - windowLen],
         endTs: ts[endIdx]
       });
     }
 
-    // Sort by score descending and take top-K
-    candidates.sort((a, b) => b.score - a.score);
-    const top = candidates.slice(0, topK);
-
-    // Calculate forward outcomes using original cache (for forward stats)
-    // Note: We use the full cache closes for forward stats calculation
-    // because we want to know what actually happened after each historical match
-    const outcomes: Outcome[] = [];
-    for (const m of top) {
-      const o = this.statsCalculator.computeOutcomes(this.cache!.closes, m.endIdx, horizonDays);
-      if (o) outcomes.push(o);
-    }
+    // Forward outcomes from the series' precomputed table
+    // (scan bound above already keeps asOf matches' horizons <= asOf)
+    const table = forwardOutcomesFor(series);
+    const rankedOutcomes = ranked.map(m =>
+      this.statsCalculator.computeOutcomes(closes, m.endIdx, horizonDays, table)
+    );
 
-    // Aggregate statistics
-    const agg = this.statsCalculator.aggregate(outcomes);
-    const stability = Math.min(1, agg.sampleSize / Math.max(10, topK));
+    // BLOCK 34.11: Include truncated series for relative signal calculation
+    const seriesUsed = includeSeriesUsed
+      ? ts.slice(0, asOfEndIdx + 1).map((t, i) => ({ ts: t, close: closes[i] }))
+      : undefined;
+
+    return topKs.map(topK => {
+      const top = ranked.slice(0, topK);
+      const outcomes: Outcome[] = [];
+      for (let i = 0; i < top.length; i++) {
+        const o = rankedOutcomes[i];
+        if (o) outcomes.push(o);
+      }
 
-    const response: FractalMatchResponse = {
-      ok: true,
-      asOf: asOf ?? ts[ts.length - 1],
-      pattern: {
+      // Aggregate statistics
+      const agg = this.statsCalculator.aggregate(outcomes);
+      const stability = Math.min(1, agg.sampleSize / Math.max(10, topK));
+
+      const response: FractalMatchResponse = {
+        ok: true,
+        asOf: asOf ?? ts[asOfEndIdx],
+        pattern: {
+          windowLen,
+          timeframe,
+          representation: 'log_returns_zscore'
+        },
+        matches: top.map((x, idx) => ({
+          startTs: x.startTs,
+          endTs: x.endTs,
+          score: x.score,
+          rank: idx + 1
+        })),
+        forwardStats: {
+          horizonDays,
+          return: agg.return,
+          maxDrawdown: agg.maxDrawdown
+        },
+        confidence: {
+          sampleSize: agg.sampleSize,
+          stabilityScore: stability
+        },
+        safety: {
+          excludedFromTraining: true,
+          contextOnly: true,
+          notes: [
+            'Historical analogy - not a trading signal',
+            'Past performance does not guarantee future results'
+          ]
+        },
+        seriesUsed
+      };
+
+      // BLOCK 18: Persist ML features (fire-and-forget)
+      this.persistCurrentWindowFeature({
         windowLen,
-        timeframe,
-        representation: 'log_returns_zscore'
-      },
-      matches: top.map((x, idx) => ({
-        startTs: x.startTs,
-        endTs: x.endTs,
-        score: x.score,
-        rank: idx + 1
-      })),
-      forwardStats: {
         horizonDays,
-        return: agg.return,
-        maxDrawdown: agg.maxDrawdown
-      },
-      confidence: {
-        sampleSize: agg.sampleSize,
-        stabilityScore: stability
-      },
-      safety: {
-        excludedFromTraining: true,
-        contextOnly: true,
-        notes: [
-          'Historical analogy - not a trading signal',
-          'Past performance does not guarantee future results'
-        ]
-      },
-      // BLOCK 34.11: Include truncated series for relative signal calculation
-      seriesUsed: includeSeriesUsed 
-        ? ts.map((t, i) => ({ ts: t, close: closes[i] }))
-        : undefined
-    };
+        response,
+        topMatchScore: top[0]?.score ?? 0,
+        avgTopKScore: top.length > 0 
+          ? top.reduce((s, m) => s + m.score, 0) / top.length 
+          : 0
+      }).catch(err => {
+        console.error('[FractalEngine] Failed to persist ML features:', err);
+      });
 
-    // BLOCK 18: Persist ML features (fire-and-forget)
-    this.persistCurrentWindowFeature({
-      windowLen,
-      horizonDays,
-      response,
-      topMatchScore: top[0]?.score ?? 0,
-      avgTopKScore: top.length > 0 
-        ? top.reduce((s, m) => s + m.score, 0) / top.length 
-        : 0
-    }).catch(err => {
-      console.error('[FractalEngine] Failed to persist ML features:', err);
+      return response;
     });
-
-    return response;
   }
 
   /**
@@ -295,25 +273,29 @@ export class FractalEngine {
 
   /**
    * Invalidate cache (call after data update)
+   * Drops the shared series (and its indices) for every engine instance
    */
-  invalidateCache(): void {
+  invalidateCache(symbol?: string, timeframe?: string): void {
     this.cache = null;
-    this.index.clear();
+    seriesCache.invalidate(symbol, timeframe);
     console.log('[FractalEngine] Cache invalidated');
   }
 
   /**
    * Admin: clear cache
    */
-  adminClearCache(): void {
-    this.invalidateCache();
+  adminClearCache(symbol?: string, timeframe?: string): void {
+    this.invalidateCache(symbol, timeframe);
   }
 
   /**
    * Admin: rebuild index
+   * Full reload of the series; normal refreshes only append new candles
    */
   async adminRebuildIndex(): Promise<void> {
-    await this.ensureCache(FRACTAL_SYMBOL, FRACTAL_TIMEFRAME, FORWARD_HORIZON_DAYS);
+    const series = await seriesCache.reload(FRACTAL_SYMBOL, FRACTAL_TIMEFRAME);
+    this.cache = series;
+    this.indexFor(series);
   }
 
   /**
@@ -329,9 +311,7 @@ export class FractalEngine {
     match: { startTs: Date; endTs: Date; points: Array<{ t: string; v: number }>; score: number };
     forward: { startTs: Date; endTs: Date; points: Array<{ t: string; v: number }> };
   }> {
-    await this.ensureCache(FRACTAL_SYMBOL, FRACTAL_TIMEFRAME, params.horizonDays);
-
-    const { ts, closes } = this.cache!;
+    const { ts, closes } = await this.ensureCache(FRACTAL_SYMBOL, FRACTAL_TIMEFRAME);
 
     // Current window indices
     const currentEndIdx = closes.length - 1;
@@ -530,31 +510,23 @@ export class FractalEngine {
   }
 
   // Private Methods
-  private async ensureCache(symbol: string, timeframe: string, horizonDays: number): Promise<void> {
-    const now = Date.now();
-
-    const cacheFresh = this.cache && (now - this.cache.loadedAt < this.CACHE_TTL_MS);
-    const indexFresh = this.index.getBuiltAt() && (now - (this.index.getBuiltAt() as number) < this.INDEX_TTL_MS);
-
-    if (cacheFresh && indexFresh) return;
-
-    console.log('[FractalEngine] Refreshing cache and index...');
-
-    // Load price data with quality scores
-    const series = await this.canonicalStore.getSeriesWithQuality(symbol, timeframe);
-
-    this.cache = {
-      loadedAt: now,
-      ts: series.map(x => x.ts),
-      closes: series.map(x => x.close),
-      quality: series.map(x => x.quality)
-    };
-
-    // Build index for all supported window sizes
-    this.index.clear();
-    this.index.buildAll(this.cache.ts, this.cache.closes, [30, 60, 90], horizonDays);
+  private async ensureCache(symbol: string, timeframe: string): Promise<CachedSeries> {
+    const series = await seriesCache.get(symbol, timeframe);
+    this.cache = series;
+    return series;
+  }
 
-    console.log(`[FractalEngine] Cache refreshed: ${this.cache.closes.length} candles`);
+  /**
+   * Packed window index attached to the shared series entry.
+   * Built for all supported window sizes (default mode) on first use;
+   * zscore indices are built lazily.
+   */
+  private indexFor(series: CachedSeries): WindowIndex {
+    return seriesCache.derived(series, 'windowIndex', () => {
+      const index = new WindowIndex();
+      index.buildAll(series.symbol, series.closes, [30, 60, 90], ['raw_returns']);
+      return index;
+    });
   }
 
   private emptyResponse(windowLen: number, timeframe: string, asOf?: Date): FractalMatchResponse {
@@ -11,10 +11,12 @@
  * V2 endpoints enable new features.
  */
 
-import { CanonicalStore } from '../data/canonical.store.js';
-import { SimilarityEngine, buildWindowVector, SimilarityMode } from './similarity.engine.js';
+import { seriesCache, CachedSeries } from '../data/series.cache.js';
+import { SimilarityEngine, SimilarityMode } from './similarity.engine.js';
 import { ForwardStatsCalculator, Outcome } from './forward.stats.js';
-import { WindowIndex, WindowLen, WindowVec } from './window.index.js';
+import { WindowIndex, scoreWindowRange } from './window.index.js';
+import { ForwardOutcomeTable, forwardOutcomesFor } from './forward.outcomes.js';
+import { selectTopK } from './topk.selector.js';
 import { ExplainabilityEngine } from './explainability.engine.js';
 import { WindowStore } from '../data/window.store.js';
 import { FeatureExtractor } from './feature.extractor.js';
@@ -34,16 +36,16 @@ import {
 // V2 Imports
 import { applyAgeDecay, AgeDecayConfig, DEFAULT_AGE_DECAY } from './age-decay.js';
 import { 
-  classifyRegime, 
-  filterByRegime, 
-  computeRegimeFeatures,
+  classifyWindowRegimes,
+  resolveRegimeFilter,
+  logRegimeFallback,
   RegimeKey,
   RegimeConditionedConfig,
   DEFAULT_REGIME_CONFIG
 } from './regime-conditioned.js';
 // BLOCK 36.3: Match filters
 import {
-  applyDynamicFloor,
+  computeDynamicFloor,
   enforceTemporalDispersion,
   analyzeMatchDistribution,
   DynamicFloorConfig,
@@ -53,8 +55,6 @@ import {
 } from './match-filters.js';
 import { V1_FINAL_CONFIG, V2_EXPERIMENTAL_CONFIG } from '../config/fractal.presets.js';
 
-const EPS = 1e-12;
-
 /**
  * Extended match request for V2 features
  */
@@ -124,36 +124,70 @@ interface HistoricalWindow {
   regimeKey?: RegimeKey;
 }
 
+interface HistoricalWindowWithDecay extends HistoricalWindow {
+  rawScore: number;
+  ageWeight: number;
+  finalScore: number;
+  ageYears: number;
+}
+
+/**
+ * State shared by the per-horizon selections of one scan
+ */
+interface HorizonSelectionContext {
+  request: FractalMatchRequestV2;
+  version: number;
+  config: typeof V1_FINAL_CONFIG | typeof V2_EXPERIMENTAL_CONFIG;
+  ageDecayConfig: AgeDecayConfig;
+  regimeConfig: RegimeConditionedConfig;
+  windowLen: number;
+  timeframe: string;
+  topK: number;
+  asOf: Date | undefined;
+  asOfTs: number;
+  asOfEndIdx: number;
+  ts: Date[];
+  closes: number[];
+  regimeLabels: RegimeKey[];
+  currentRegime: RegimeKey;
+  minHistIdx: number;
+  scores: Float64Array;
+  outcomeTable: ForwardOutcomeTable;
+}
+
 export class FractalEngineV2 {
-  private canonicalStore = new CanonicalStore();
   private sim = new SimilarityEngine();
   private statsCalculator = new ForwardStatsCalculator();
-  private index = new WindowIndex();
   private explainability = new ExplainabilityEngine();
   
   private windowStore = new WindowStore();
   private featureExtractor = new FeatureExtractor();
 
-  private cache: {
-    loadedAt: number;
-    ts: Date[];
-    closes: number[];
-    quality: number[];
-    // V2: Regime labels per window
-    regimeLabels?: Map<number, RegimeKey>;
-  } | null = null;
-
-  private CACHE_TTL_MS = 60 * 60 * 1000;
-
   /**
    * V2 Match endpoint with age decay and regime conditioning
    */
   async matchV2(request: FractalMatchRequestV2): Promise<FractalMatchResponseV2> {
+    const horizonDays = request.forwardHorizon || FORWARD_HORIZON_DAYS;
+    const [response] = await this.matchV2Horizons(request, [horizonDays]);
+    return response;
+  }
+
+  /**
+   * One similarity scan shared by several forward horizons.
+   *
+   * Responses are aligned with `horizons` and each equals
+   * matchV2({ ...request, forwardHorizon: h }): only the candidate cutoff
+   * (asOf - h) and the forward outcomes depend on the horizon, and the
+   * candidates of a shorter cutoff are a prefix of the widest scan.
+   */
+  async matchV2Horizons(
+    request: FractalMatchRequestV2,
+    horizons: number[]
+  ): Promise<FractalMatchResponseV2[]> {
     const symbol = request.symbol || FRACTAL_SYMBOL;
     const timeframe = request.timeframe || FRACTAL_TIMEFRAME;
     const windowLen = request.windowLen || 60;
     const topK = request.topK || TOP_K_MATCHES;
-    const horizonDays = request.forwardHorizon || FORWARD_HORIZON_DAYS;
     const minGapDays = MIN_GAP_DAYS;
     const asOf = request.asOf ? new Date(request.asOf) : undefined;
     const similarityMode: SimilarityMode = request.similarityMode ?? "raw_returns";
@@ -179,88 +213,100 @@ export class FractalEngineV2 {
     }
 
     // Ensure cache is loaded
-    await this.ensureCache(symbol, timeframe, horizonDays, windowLen);
+    const series = await this.ensureCache(symbol, timeframe);
 
-    let { ts, closes } = this.cache!;
+    const { ts, closes } = series;
     const asOfTs = asOf?.getTime() ?? Date.now();
 
     // asOf filter for look-ahead protection
+    // (scan is bounded by asOfEndIdx instead of slicing the series)
     let asOfEndIdx = closes.length - 1;
     if (asOf) {
       asOfEndIdx = this.findIndexByTs(ts, asOf);
       if (asOfEndIdx >= 0 && ts[asOfEndIdx].getTime() > asOfTs) {
         asOfEndIdx--;
       }
-      if (asOfEndIdx < windowLen + horizonDays + 5) {
-        return this.emptyResponseV2(windowLen, timeframe, asOf, ageDecayConfig, regimeConfig);
-      }
-      ts = ts.slice(0, asOfEndIdx + 1);
-      closes = closes.slice(0, asOfEndIdx + 1);
-    }
-
-    if (closes.length < windowLen + horizonDays + 5) {
-      return this.emptyResponseV2(windowLen, timeframe, asOf, ageDecayConfig, regimeConfig);
     }
 
-    // Build current window vector
-    const currentCloses = closes.slice(-windowLen - 1);
-    const currentVec = buildWindowVector(currentCloses, similarityMode);
-
-    let curNorm = 0;
-    for (let i = 0; i < currentVec.length; i++) curNorm += currentVec[i] * currentVec[i];
-    curNorm = Math.sqrt(curNorm) || 1;
+    // Horizons with enough history before asOf
+    const hasHistory = (horizonDays: number) =>
+      (!asOf || asOfEndIdx >= windowLen + horizonDays + 5) &&
+      asOfEndIdx + 1 >= windowLen + horizonDays + 5;
+    const valid = horizons.filter(hasHistory);
+    const empty = () => this.emptyResponseV2(windowLen, timeframe, asOf, ageDecayConfig, regimeConfig);
+    if (valid.length === 0) return horizons.map(empty);
 
-    const currentEndIdx = closes.length - 1;
+    const currentEndIdx = asOfEndIdx;
 
-    // V2: Compute current regime
-    const currentRegimeFeatures = computeRegimeFeatures(currentCloses);
-    const currentRegime = classifyRegime(currentRegimeFeatures);
+    // V2: Regime labels per window are asOf-independent, computed once per cache load
+    const regimeLabels = this.getRegimeLabels(series, windowLen);
+    const currentRegime = regimeLabels[currentEndIdx];
 
-    // Build historical candidates
-    const candidates: HistoricalWindow[] = [];
+    // Score all historical windows against the packed index (no per-window objects),
+    // once, up to the widest cutoff among the horizons
+    const packed = this.indexFor(series).getOrBuild(symbol, closes, windowLen, similarityMode);
     
     const minHistIdx = windowLen;
-    const maxHistIdx = closes.length - 1 - minGapDays;
-    const effectiveMaxIdx = asOf 
+    const maxHistIdx = currentEndIdx - minGapDays;
+    const cutoff = (horizonDays: number) => asOf 
       ? Math.min(maxHistIdx, asOfEndIdx - horizonDays)
       : maxHistIdx;
+    const widestMaxIdx = cutoff(Math.min(...valid));
 
-    for (let endIdx = minHistIdx; endIdx <= effectiveMaxIdx; endIdx++) {
-      const distanceDays = Math.abs(currentEndIdx - endIdx);
-      if (distanceDays < minGapDays) continue;
+    const scores = new Float64Array(Math.max(0, widestMaxIdx - minHistIdx + 1));
+    scoreWindowRange(packed, currentEndIdx, minHistIdx, widestMaxIdx, scores);
 
-      const histCloses = closes.slice(endIdx - windowLen, endIdx + 1);
-      const histVec = buildWindowVector(histCloses, similarityMode);
+    const firstScored = Math.max(minHistIdx, packed.firstEndIdx);
+    const lastIndexed = packed.firstEndIdx + packed.count - 1;
 
-      let histNorm = 0;
-      for (let i = 0; i < histVec.length; i++) histNorm += histVec[i] * histVec[i];
-      histNorm = Math.sqrt(histNorm) || 1;
+    const ctx: HorizonSelectionContext = {
+      request, version, config, ageDecayConfig, regimeConfig,
+      windowLen, timeframe, topK, asOf, asOfTs, asOfEndIdx,
+      ts, closes, regimeLabels, currentRegime, minHistIdx, scores,
+      outcomeTable: forwardOutcomesFor(series),
+    };
 
-      let dot = 0;
-      for (let i = 0; i < currentVec.length && i < histVec.length; i++) {
-        dot += currentVec[i] * histVec[i];
-      }
-      const score = dot / (curNorm * histNorm + EPS);
+    return horizons.map(horizonDays => {
+      if (!hasHistory(horizonDays)) return empty();
+      const scored = Math.max(0, Math.min(cutoff(horizonDays), lastIndexed) - firstScored + 1);
+      return this.selectForHorizon(ctx, horizonDays, scored);
+    });
+  }
 
-      // V2: Compute regime for historical window
-      const histRegimeFeatures = computeRegimeFeatures(histCloses);
-      const histRegime = classifyRegime(histRegimeFeatures);
+  /**
+   * Filters, top-K and forward stats for one horizon over the first
+   * `scored` entries of the shared score array
+   */
+  private selectForHorizon(
+    ctx: HorizonSelectionContext,
+    horizonDays: number,
+    scored: number
+  ): FractalMatchResponseV2 {
+    const {
+      request, version, config, ageDecayConfig, regimeConfig,
+      windowLen, timeframe, topK, asOf, asOfTs, asOfEndIdx,
+      ts, closes, regimeLabels, currentRegime, minHistIdx, scores, outcomeTable,
+    } = ctx;
+    const similarityMode: SimilarityMode = request.similarityMode ?? "raw_returns";
 
-      candidates.push({
-        endIdx,
-        score,
-        similarity: score,  // alias for filter functions
-        startTs: ts[endIdx - windowLen],
-        endTs: ts[endIdx],
-        regimeKey: histRegime,
-      });
+    // V2: Filter by regime (BLOCK 36.2) - in index space
+    const keep = new Uint8Array(scored).fill(1);
+    let keptCount = scored;
+    if (regimeConfig.enabled) {
+      let strictCount = 0;
+      for (let i = 0; i < scored; i++) {
+        if (regimeLabels[minHistIdx + i] === currentRegime) strictCount++;
+      }
+      const { regimes, fallback } = resolveRegimeFilter(strictCount, currentRegime, regimeConfig);
+      keptCount = 0;
+      for (let i = 0; i < scored; i++) {
+        const ok = regimes.includes(regimeLabels[minHistIdx + i]);
+        keep[i] = ok ? 1 : 0;
+        if (ok) keptCount++;
+      }
+      if (fallback) logRegimeFallback(currentRegime, regimes, strictCount, keptCount);
     }
 
-    // V2: Filter by regime (BLOCK 36.2)
-    let filteredCandidates = regimeConfig.enabled
-      ? filterByRegime(candidates, currentRegime, regimeConfig)
-      : candidates;
-
     // BLOCK 36.3: Dynamic Similarity Floor
     const dynamicFloorConfig: DynamicFloorConfig = {
       enabled: request.useDynamicFloor ?? config.useDynamicFloor,
@@ -269,27 +315,51 @@ export class FractalEngineV2 {
     };
     
     let dynamicFloorStats: DynamicFloorStats | undefined;
+    let floor = -Infinity;
     if (dynamicFloorConfig.enabled) {
-      const floorResult = applyDynamicFloor(filteredCandidates, dynamicFloorConfig);
-      filteredCandidates = floorResult.filtered;
-      dynamicFloorStats = floorResult.stats;
+      const kept = new Float64Array(keptCount);
+      for (let i = 0, j = 0; i < scored; i++) {
+        if (keep[i]) kept[j++] = scores[i];
+      }
+      const floorStats = computeDynamicFloor(kept, dynamicFloorConfig);
+      floor = floorStats.effectiveFloor;
+
+      let passedCount = 0;
+      for (let i = 0; i < scored; i++) {
+        if (keep[i] && scores[i] >= floor) passedCount++;
+      }
+      dynamicFloorStats = {
+        totalCandidates: keptCount,
+        staticFloor: dynamicFloorConfig.staticFloor,
+        quantileFloor: floorStats.quantileFloor,
+        effectiveFloor: floorStats.effectiveFloor,
+        passedCount,
+        usedDynamic: floorStats.usedDynamic,
+      };
     }
 
-    // V2: Apply age decay (BLOCK 36.1)
-    const candidatesWithDecay = filteredCandidates.map(c => {
-      const decay = applyAgeDecay(c.score, c.endTs, asOfTs, ageDecayConfig);
-      return {
-        ...c,
-        rawScore: c.score,
+    // V2: Apply age decay (BLOCK 36.1) - only to candidates that passed the filters
+    const candidatesWithDecay: HistoricalWindowWithDecay[] = [];
+    const finalScores = new Float64Array(scored);
+    for (let i = 0; i < scored; i++) {
+      if (!keep[i] || scores[i] < floor) continue;
+      const endIdx = minHistIdx + i;
+      const decay = applyAgeDecay(scores[i], ts[endIdx], asOfTs, ageDecayConfig);
+      finalScores[candidatesWithDecay.length] = decay.finalScore;
+      candidatesWithDecay.push({
+        endIdx,
+        score: scores[i],
+        similarity: scores[i],
+        startTs: ts[endIdx - windowLen],
+        endTs: ts[endIdx],
+        regimeKey: regimeLabels[endIdx],
+        rawScore: scores[i],
         ageWeight: decay.ageWeight,
         finalScore: decay.finalScore,
         ageYears: decay.ageYears,
-      };
-    });
+      });
+    }
 
-    // Sort by finalScore (age-adjusted) instead of raw score
-    candidatesWithDecay.sort((a, b) => b.finalScore - a.finalScore);
-    
     // BLOCK 36.3: Temporal Dispersion (Anti-Clustering)
     const dispersionConfig: DispersionConfig = {
       enabled: request.useTemporalDispersion ?? config.useTemporalDispersion,
@@ -297,24 +367,29 @@ export class FractalEngineV2 {
     };
     
     let dispersionStats: DispersionStats | undefined;
-    let topCandidates = candidatesWithDecay;
+    let top: HistoricalWindowWithDecay[];
     
     if (dispersionConfig.enabled) {
+      // Dispersion walks the full ranking, so it needs the sorted list
+      // Sort by finalScore (age-adjusted) instead of raw score
+      candidatesWithDecay.sort((a, b) => b.finalScore - a.finalScore);
       const dispersionResult = enforceTemporalDispersion(candidatesWithDecay, dispersionConfig);
-      topCandidates = dispersionResult.dispersed;
       dispersionStats = dispersionResult.stats;
+      // Take top K after all filters
+      top = dispersionResult.dispersed.slice(0, topK);
+    } else {
+      // Bounded top-K by finalScore (age-adjusted) instead of raw score
+      const best = selectTopK(finalScores, candidatesWithDecay.length, topK);
+      top = Array.from(best.indices, i => candidatesWithDecay[i]);
     }
     
-    // Take top K after all filters
-    const top = topCandidates.slice(0, topK);
-    
     // Analyze final match distribution
     const matchDistribution = analyzeMatchDistribution(top);
 
     // Calculate forward outcomes
     const outcomes: Outcome[] = [];
     for (const m of top) {
-      const o = this.statsCalculator.computeOutcomes(this.cache!.closes, m.endIdx, horizonDays);
+      const o = this.statsCalculator.computeOutcomes(closes, m.endIdx, horizonDays, outcomeTable);
       if (o) outcomes.push(o);
     }
 
@@ -331,7 +406,7 @@ export class FractalEngineV2 {
 
     const response: FractalMatchResponseV2 = {
       ok: true,
-      asOf: asOf ?? ts[ts.length - 1],
+      asOf: asOf ?? ts[asOfEndIdx],
       pattern: {
         windowLen,
         timeframe,
@@ -402,28 +477,34 @@ export class FractalEngineV2 {
 
   // === Helper methods ===
 
-  private async ensureCache(
-    symbol: string, 
-    timeframe: string, 
-    horizonDays: number,
-    windowLen: number = 60
-  ): Promise<void> {
-    const now = Date.now();
-    if (this.cache && now - this.cache.loadedAt < this.CACHE_TTL_MS) {
-      return;
-    }
-
-    const data = await this.canonicalStore.getAll(symbol, timeframe);
-    if (!data.length) {
+  private async ensureCache(symbol: string, timeframe: string): Promise<CachedSeries> {
+    const series = await seriesCache.get(symbol, timeframe);
+    if (!series.closes.length) {
       throw new Error(`No data found for ${symbol}/${timeframe}`);
     }
+    return series;
+  }
 
-    this.cache = {
-      loadedAt: now,
-      ts: data.map(d => d.ts),
-      closes: data.map(d => d.ohlcv?.c ?? 0),
-      quality: data.map(d => (d as any).quality?.qualityScore ?? 1),
-    };
+  /**
+   * Packed window index shared with every engine using this series
+   */
+  private indexFor(series: CachedSeries): WindowIndex {
+    return seriesCache.derived(series, 'windowIndex', () => new WindowIndex());
+  }
+
+  /**
+   * Regime label of every window of the given length (entry endIdx is the
+   * window closes[endIdx - windowLen .. endIdx]). Depends only on past
+   * closes, so it is safe to share across asOf requests and is only
+   * extended when the cached series gets appended candles.
+   */
+  private getRegimeLabels(series: CachedSeries, windowLen: number): RegimeKey[] {
+    const labels = seriesCache.derived(series, `regimeLabels:${windowLen}`, () => [] as RegimeKey[]);
+    const { closes } = series;
+    if (labels.length < closes.length) {
+      for (const label of classifyWindowRegimes(closes, windowLen, labels.length)) labels.push(label);
+    }
+    return labels;
   }
 
   private findIndexByTs(ts: Date[], target: Date): number {
@@ -71,18 +71,9 @@ export function applyDynamicFloor<T extends { similarity: number }>(
     return { filtered, stats };
   }
 
-  // Sort similarities descending
-  const sorted = candidates
-    .map(c => c.similarity)
-    .sort((a, b) => b - a);
-
-  // Calculate quantile floor (top X%)
-  const quantileIdx = Math.floor(sorted.length * config.dynamicQuantile);
-  stats.quantileFloor = sorted[quantileIdx] ?? sorted[sorted.length - 1] ?? 0;
-
-  // Effective floor = max(static, quantile)
-  stats.effectiveFloor = Math.max(config.staticFloor, stats.quantileFloor);
-  stats.usedDynamic = stats.quantileFloor > config.staticFloor;
+  const similarities = new Float64Array(candidates.length);
+  for (let i = 0; i < candidates.length; i++) similarities[i] = candidates[i].similarity;
+  Object.assign(stats, computeDynamicFloor(similarities, config));
 
   // Filter by effective floor
   const filtered = candidates.filter(c => c.similarity >= stats.effectiveFloor);
@@ -91,6 +82,33 @@ export function applyDynamicFloor<T extends { similarity: number }>(
   return { filtered, stats };
 }
 
+/**
+ * Quantile/effective floor over raw similarities (no candidate objects).
+ * Sorts the passed array in place.
+ */
+export function computeDynamicFloor(
+  similarities: Float64Array,
+  config: DynamicFloorConfig = DEFAULT_DYNAMIC_FLOOR
+): Pick<DynamicFloorStats, 'quantileFloor' | 'effectiveFloor' | 'usedDynamic'> {
+  if (similarities.length === 0) {
+    return { quantileFloor: 0, effectiveFloor: config.staticFloor, usedDynamic: false };
+  }
+
+  // Sort similarities descending
+  similarities.sort().reverse();
+
+  // Calculate quantile floor (top X%)
+  const quantileIdx = Math.floor(similarities.length * config.dynamicQuantile);
+  const quantileFloor = similarities[quantileIdx] ?? similarities[similarities.length - 1] ?? 0;
+
+  // Effective floor = max(static, quantile)
+  return {
+    quantileFloor,
+    effectiveFloor: Math.max(config.staticFloor, quantileFloor),
+    usedDynamic: quantileFloor > config.staticFloor,
+  };
+}
+
 export interface DynamicFloorStats {
   totalCandidates: number;
   staticFloor: number;
@@ -2,7 +2,8 @@
  * BLOCK 36.5-36.7 — Multi-Horizon Engine
  * 
  * V2.0 Core Architecture:
- * - 36.5: Parallel horizon matching (7/14/30/60 days)
+ * - 36.5: Parallel horizon matching (7/14/30/60 days), one shared
+ *   similarity scan for all horizons (FractalEngineV2.matchV2Horizons)
  * - 36.6: Weighted horizon assembly
  * - 36.7: Adaptive horizon filtering by regime
  * 
@@ -103,91 +104,49 @@ export class MultiHorizonEngine {
     
     console.log(`[MULTI-HORIZON 36.5] Running for ${cfg.horizons.length} horizons at ${asOfDate.toISOString().slice(0, 10)}`);
 
-    // Run parallel matching for all horizons
-    const signals: HorizonSignal[] = [];
-    
-    for (const horizon of cfg.horizons) {
-      try {
-        const result = await this.engineV2.matchV2({
-          asOf: asOfDate,
-          forwardHorizon: horizon,
-          windowLen: 60,
-          topK: 25,
-          version: 2,
-          ageDecayEnabled: true,
-          regimeConditioned: true,
-          useDynamicFloor: true,
-          useTemporalDispersion: true,
-        });
-
-        if (!result.ok || result.matches.length < cfg.minMatchesPerHorizon) {
-          signals.push({
-            horizon,
-            direction: 'NEUTRAL',
-            confidence: 0,
-            mu: 0,
-            p10: 0,
-            p90: 0,
-            matchCount: result.matches?.length ?? 0,
-            maxDD: 0,
-          });
-          continue;
-        }
+    // One shared similarity scan for every horizon. The regime comes from the
+    // 14-day response (it only depends on the current window), so 14 is
+    // always evaluated even when it is not a configured horizon.
+    const REGIME_HORIZON = 14;
+    const evaluated = cfg.horizons.includes(REGIME_HORIZON)
+      ? cfg.horizons
+      : [...cfg.horizons, REGIME_HORIZON];
 
-        const mu = result.forwardStats?.return?.mean ?? 0;
-        const p10 = result.forwardStats?.return?.p10 ?? 0;
-        const p90 = result.forwardStats?.return?.p90 ?? 0;
-        const maxDD = result.forwardStats?.maxDrawdown?.p50 ?? 0;
-        const confidence = result.confidence?.stabilityScore ?? 0;
-
-        // Determine direction
-        let direction: 'LONG' | 'SHORT' | 'NEUTRAL' = 'NEUTRAL';
-        if (mu > 0.01 && p10 > -0.05) direction = 'LONG';
-        else if (mu < -0.01 && p90 < 0.05) direction = 'SHORT';
-
-        signals.push({
-          horizon,
-          direction,
-          confidence,
-          mu: Math.round(mu * 10000) / 10000,
-          p10: Math.round(p10 * 10000) / 10000,
-          p90: Math.round(p90 * 10000) / 10000,
-          matchCount: result.matches.length,
-          maxDD: Math.round(maxDD * 10000) / 10000,
-        });
-
-      } catch (err) {
-        console.error(`[MULTI-HORIZON] Horizon ${horizon} failed:`, err);
-        signals.push({
-          horizon,
-          direction: 'NEUTRAL',
-          confidence: 0,
-          mu: 0,
-          p10: 0,
-          p90: 0,
-          matchCount: 0,
-          maxDD: 0,
-        });
-      }
-    }
+    const request: FractalMatchRequestV2 = {
+      asOf: asOfDate,
+      windowLen: 60,
+      topK: 25,
+      version: 2,
+      ageDecayEnabled: true,
+      regimeConditioned: true,
+      useDynamicFloor: true,
+      useTemporalDispersion: true,
+    };
 
-    // Determine current regime from the 14-day match
-    const baseSignal = signals.find(s => s.horizon === 14) ?? signals[0];
-    let regime: RegimeKey = 'SIDE';
-    
-    // Get regime from V2 engine (uses 60-day window)
+    let results: Array<FractalMatchResponseV2 | null>;
     try {
-      const regimeResult = await this.engineV2.matchV2({
-        asOf: asOfDate,
-        forwardHorizon: 14,
-        windowLen: 60,
-        version: 2,
-      });
-      regime = regimeResult.v2?.regime?.currentRegime ?? 'SIDE';
-    } catch {
-      // Default to SIDE if regime detection fails
+      results = await this.engineV2.matchV2Horizons(request, evaluated);
+    } catch (err) {
+      // Fall back to one match per horizon so a failure only nulls its own horizon
+      console.error('[MULTI-HORIZON] Shared match failed, matching per horizon:', err);
+      results = await Promise.all(evaluated.map(async (horizon) => {
+        try {
+          return await this.engineV2.matchV2({ ...request, forwardHorizon: horizon });
+        } catch (horizonErr) {
+          console.error(`[MULTI-HORIZON] Horizon ${horizon}d failed:`, horizonErr);
+          return null;
+        }
+      }));
     }
 
+    const signals: HorizonSignal[] = cfg.horizons.map((horizon, i) =>
+      this.toHorizonSignal(horizon, results[i], cfg)
+    );
+
+    // Determine current regime (uses 60-day window), SIDE if unavailable
+    const regimeResult = results[evaluated.indexOf(REGIME_HORIZON)];
+    const regime: RegimeKey = regimeResult?.v2?.regime?.currentRegime ?? 'SIDE';
+
     // BLOCK 36.7: Apply adaptive filter
     let filteredSignals = signals;
     let filteredCount = signals.length;
@@ -220,6 +179,50 @@ export class MultiHorizonEngine {
     };
   }
 
+  /**
+   * Per-horizon signal from one match response (NEUTRAL when missing or thin)
+   */
+  private toHorizonSignal(
+    horizon: number,
+    result: FractalMatchResponseV2 | null,
+    cfg: MultiHorizonConfig
+  ): HorizonSignal {
+    if (!result || !result.ok || result.matches.length < cfg.minMatchesPerHorizon) {
+      return {
+        horizon,
+        direction: 'NEUTRAL',
+        confidence: 0,
+        mu: 0,
+        p10: 0,
+        p90: 0,
+        matchCount: result?.matches?.length ?? 0,
+        maxDD: 0,
+      };
+    }
+
+    const mu = result.forwardStats?.return?.mean ?? 0;
+    const p10 = result.forwardStats?.return?.p10 ?? 0;
+    const p90 = result.forwardStats?.return?.p90 ?? 0;
+    const maxDD = result.forwardStats?.maxDrawdown?.p50 ?? 0;
+    const confidence = result.confidence?.stabilityScore ?? 0;
+
+    // Determine direction
+    let direction: 'LONG' | 'SHORT' | 'NEUTRAL' = 'NEUTRAL';
+    if (mu > 0.01 && p10 > -0.05) direction = 'LONG';
+    else if (mu < -0.01 && p90 < 0.05) direction = 'SHORT';
+
+    return {
+      horizon,
+      direction,
+      confidence,
+      mu: Math.round(mu * 10000) / 10000,
+      p10: Math.round(p10 * 10000) / 10000,
+      p90: Math.round(p90 * 10000) / 10000,
+      matchCount: result.matches.length,
+      maxDD: Math.round(maxDD * 10000) / 10000,
+    };
+  }
+
   // ═══════════════════════════════════════════════════════════════
   // BLOCK 36.6: HORIZON ASSEMBLER
   // ═══════════════════════════════════════════════════════════════
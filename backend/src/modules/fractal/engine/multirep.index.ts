@@ -0,0 +1,254 @@
+/**
+ * BLOCK 37.1 — Multi-Representation Window Index
+ *
+ * Packed multi-rep vectors (ret / vol / dd / momo, see
+ * similarity.engine.v2.ts) of every historical window, per
+ * (windowLen, multi-rep config), attached to the cached series next to
+ * the window index. Two-stage retrieval then scores candidates by row
+ * instead of rebuilding vectors from closes per request:
+ * - stage 1: cosine of the l2-normalized raw returns
+ * - stage 2: weighted sum of per-rep cosines
+ *
+ * Rows are produced by buildMultiRepVectors / buildSingleRepVector and
+ * scored with the arithmetic of multiRepSimilarity / the stage-1 cosine,
+ * so indexed scores are identical to the per-candidate path. New candles
+ * append rows (see column.growth.ts).
+ */
+
+import { seriesCache, CachedSeries, SizedArtefact } from '../data/series.cache.js';
+import {
+  RepKey,
+  MultiRepConfig,
+  MultiRepScore,
+  DEFAULT_MULTI_REP_CONFIG,
+} from '../contracts/similarity.contracts.js';
+import { buildMultiRepVectors, buildSingleRepVector, defaultRepWeight } from './similarity.engine.v2.js';
+import { growTo } from './column.growth.js';
+
+// ═══════════════════════════════════════════════════════════════
+// Types
+// ═══════════════════════════════════════════════════════════════
+
+export interface PackedMultiRepIndex {
+  windowLen: number;
+  reps: RepKey[];
+  dim: number;            // vector length (= windowLen returns)
+  firstEndIdx: number;    // closes index of the window in row 0
+  count: number;
+  seriesLen: number;
+  s1Vecs: Float64Array;   // stage-1 vectors, row-major
+  s1Norms: Float64Array;
+  repVecs: Float64Array[]; // aligned with reps, row-major
+  repNorms: Float64Array[];
+}
+
+// ═══════════════════════════════════════════════════════════════
+// Build / Append
+// ═══════════════════════════════════════════════════════════════
+
+const DEFAULT_REPS: RepKey[] = ['ret', 'vol', 'dd'];
+
+function configKey(windowLen: number, cfg: MultiRepConfig): string {
+  const reps = cfg.reps?.length ? cfg.reps : DEFAULT_REPS;
+  return [
+    windowLen,
+    reps.join('+'),
+    cfg.volLookback ?? 14,
+    cfg.slopeLookback ?? 10,
+    cfg.zscoreWithinWindow ? 'z' : '-',
+    (cfg.l2Normalize ?? true) ? 'l2' : '-',
+  ].join(':');
+}
+
+function norm(vecs: Float64Array, off: number, dim: number): number {
+  let s = 0;
+  for (let i = 0; i < dim; i++) s += vecs[off + i] * vecs[off + i];
+  return Math.sqrt(s) || 1;
+}
+
+/**
+ * Fill rows [index.count, rows) from closes
+ */
+function fillRows(
+  index: PackedMultiRepIndex,
+  closes: ArrayLike<number>,
+  rows: number,
+  cfg: MultiRepConfig
+): void {
+  const { dim, windowLen, firstEndIdx } = index;
+
+  index.s1Vecs = growTo(index.s1Vecs, index.count * dim, rows * dim);
+  index.s1Norms = growTo(index.s1Norms, index.count, rows);
+  for (let k = 0; k < index.reps.length; k++) {
+    index.repVecs[k] = growTo(index.repVecs[k], index.count * dim, rows * dim);
+    index.repNorms[k] = growTo(index.repNorms[k], index.count, rows);
+  }
+
+  for (let row = index.count; row < rows; row++) {
+    const endIdx = firstEndIdx + row;
+    const windowCloses = Array.prototype.slice.call(closes, endIdx - windowLen, endIdx + 1) as number[];
+    const off = row * dim;
+
+    index.s1Vecs.set(buildSingleRepVector(windowCloses), off);
+    index.s1Norms[row] = norm(index.s1Vecs, off, dim);
+
+    const reps = buildMultiRepVectors(windowCloses, cfg);
+    for (let k = 0; k < reps.length; k++) {
+      index.repVecs[k].set(reps[k].vec, off);
+      index.repNorms[k][row] = norm(index.repVecs[k], off, dim);
+    }
+  }
+
+  index.count = rows;
+  index.seriesLen = closes.length;
+}
+
+export function buildMultiRepIndex(
+  closes: ArrayLike<number>,
+  windowLen: number,
+  cfg: MultiRepConfig = DEFAULT_MULTI_REP_CONFIG
+): PackedMultiRepIndex {
+  const reps = cfg.reps?.length ? [...cfg.reps] : [...DEFAULT_REPS];
+  const index: PackedMultiRepIndex = {
+    windowLen,
+    reps,
+    dim: windowLen,
+    firstEndIdx: windowLen,
+    count: 0,
+    seriesLen: 0,
+    s1Vecs: new Float64Array(0),
+    s1Norms: new Float64Array(0),
+    repVecs: reps.map(() => new Float64Array(0)),
+    repNorms: reps.map(() => new Float64Array(0)),
+  };
+  fillRows(index, closes, Math.max(0, closes.length - windowLen), cfg);
+  return index;
+}
+
+// ═══════════════════════════════════════════════════════════════
+// Scoring
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * Row of the window ending at endIdx, -1 if not indexed
+ */
+export function multiRepRow(index: PackedMultiRepIndex, endIdx: number): number {
+  const row = endIdx - index.firstEndIdx;
+  return row >= 0 && row < index.count ? row : -1;
+}
+
+function rowDot(vecs: Float64Array, a: number, b: number, dim: number): number {
+  const aOff = a * dim;
+  const bOff = b * dim;
+  let s = 0;
+  for (let i = 0; i < dim; i++) s += vecs[aOff + i] * vecs[bOff + i];
+  return s;
+}
+
+/**
+ * Stage-1 cosine (raw returns) between two rows
+ */
+export function stage1RowSimilarity(index: PackedMultiRepIndex, curRow: number, row: number): number {
+  const denom = index.s1Norms[curRow] * index.s1Norms[row];
+  return denom > 0 ? rowDot(index.s1Vecs, curRow, row, index.dim) / denom : 0;
+}
+
+/**
+ * Normalized rep weights for the index's reps (multiRepSimilarity rules)
+ */
+export function multiRepWeights(
+  index: PackedMultiRepIndex,
+  cfg: MultiRepConfig = DEFAULT_MULTI_REP_CONFIG
+): Float64Array {
+  const weightsIn = cfg.repWeights ?? {};
+  const w = new Float64Array(index.reps.length);
+  let sumW = 0;
+  index.reps.forEach((r, k) => {
+    w[k] = weightsIn[r] ?? defaultRepWeight(r);
+    sumW += w[k];
+  });
+  sumW = sumW || 1;
+  for (let k = 0; k < w.length; k++) w[k] /= sumW;
+  return w;
+}
+
+/**
+ * Multi-rep similarity between two rows: weighted sum of per-rep cosines
+ */
+export function multiRepRowSimilarity(
+  index: PackedMultiRepIndex,
+  curRow: number,
+  row: number,
+  weights: Float64Array
+): MultiRepScore {
+  let total = 0;
+  const byRep: MultiRepScore['byRep'] = {};
+  const wNorm: MultiRepScore['weights'] = {};
+
+  for (let k = 0; k < index.reps.length; k++) {
+    const norms = index.repNorms[k];
+    const denom = (norms[curRow] * norms[row]) || 1;
+    const sim = rowDot(index.repVecs[k], curRow, row, index.dim) / denom;
+
+    byRep[index.reps[k]] = sim;
+    wNorm[index.reps[k]] = weights[k];
+    total += weights[k] * sim;
+  }
+
+  return { total, byRep, weights: wNorm };
+}
+
+// ═══════════════════════════════════════════════════════════════
+// Shared per-series cache
+// ═══════════════════════════════════════════════════════════════
+
+export class MultiRepIndexStore implements SizedArtefact {
+  private indexByKey = new Map<string, PackedMultiRepIndex>();
+
+  /**
+   * Packed index for (windowLen, cfg), built on first use, appended when
+   * the series grew
+   */
+  getOrBuild(
+    closes: ArrayLike<number>,
+    windowLen: number,
+    cfg: MultiRepConfig = DEFAULT_MULTI_REP_CONFIG
+  ): PackedMultiRepIndex {
+    const key = configKey(windowLen, cfg);
+    const existing = this.indexByKey.get(key);
+    if (existing && existing.seriesLen === closes.length) return existing;
+    if (existing && existing.seriesLen < closes.length) {
+      fillRows(existing, closes, Math.max(0, closes.length - windowLen), cfg);
+      return existing;
+    }
+
+    const t0 = Date.now();
+    const built = buildMultiRepIndex(closes, windowLen, cfg);
+    this.indexByKey.set(key, built);
+    console.log(`[MultiRepIndex] Built ${key}: ${built.count} windows in ${Date.now() - t0}ms`);
+    return built;
+  }
+
+  byteSize(): number {
+    let bytes = 0;
+    for (const idx of this.indexByKey.values()) {
+      bytes += idx.s1Vecs.byteLength + idx.s1Norms.byteLength;
+      for (const v of idx.repVecs) bytes += v.byteLength;
+      for (const n of idx.repNorms) bytes += n.byteLength;
+    }
+    return bytes;
+  }
+}
+
+/**
+ * Multi-rep index of a cached series for (windowLen, cfg)
+ */
+export function multiRepIndexFor(
+  series: CachedSeries,
+  windowLen: number,
+  cfg: MultiRepConfig = DEFAULT_MULTI_REP_CONFIG
+): PackedMultiRepIndex {
+  return seriesCache
+    .derived(series, 'multiRepIndex', () => new MultiRepIndexStore())
+    .getOrBuild(series.closes, windowLen, cfg);
+}
@@ -13,6 +13,7 @@ import {
   PhaseClassifierConfig,
   DEFAULT_PHASE_CLASSIFIER_CONFIG,
 } from '../contracts/phase.contracts.js';
+import { rangeMean, rangeStd, rangeMaxDrawdown } from '../../../common/rolling.kernels.js';
 
 // ═══════════════════════════════════════════════════════════════
 // Math Utilities
@@ -20,49 +21,32 @@ import {
 
 function sma(x: number[], n: number): number {
   if (x.length < n) return x[x.length - 1] || 0;
-  let s = 0;
-  for (let i = x.length - n; i < x.length; i++) {
-    s += x[i];
-  }
-  return s / n;
-}
-
-function smaSeries(x: number[], n: number, lastK: number): number[] {
-  const out: number[] = [];
-  for (let k = lastK; k >= 1; k--) {
-    const slice = x.slice(0, x.length - (k - 1));
-    if (slice.length < n) continue;
-    out.push(sma(slice, n));
-  }
-  return out;
+  return rangeMean(x, x.length - n, x.length);
 }
 
-function slope(y: number[]): number {
-  if (y.length < 2) return 0;
-  return (y[y.length - 1] - y[0]) / (y.length - 1);
+/**
+ * Slope of the SMA(n) over its last `lastK` points: (last - first) / (len - 1),
+ * from the two end points only (no per-point prefix copies)
+ */
+function smaSlope(x: number[], n: number, lastK: number): number {
+  const lastEnd = x.length;
+  const firstEnd = Math.max(lastEnd - (lastK - 1), n);
+  if (lastEnd - firstEnd < 1) return 0;
+  const first = rangeMean(x, firstEnd - n, firstEnd);
+  const last = rangeMean(x, lastEnd - n, lastEnd);
+  return (last - first) / (lastEnd - firstEnd);
 }
 
-function returns(closes: number[]): number[] {
-  const r: number[] = [];
+function returns(closes: number[]): Float64Array {
+  const r = new Float64Array(Math.max(0, closes.length - 1));
   for (let i = 1; i < closes.length; i++) {
     const prev = closes[i - 1];
     const cur = closes[i];
-    if (prev > 0 && cur > 0) {
-      r.push((cur / prev) - 1);
-    } else {
-      r.push(0);
-    }
+    r[i - 1] = prev > 0 && cur > 0 ? (cur / prev) - 1 : 0;
   }
   return r;
 }
 
-function std(a: number[]): number {
-  if (a.length < 2) return 0;
-  const m = a.reduce((s, x) => s + x, 0) / a.length;
-  const variance = a.reduce((s, x) => s + (x - m) * (x - m), 0) / (a.length - 1);
-  return Math.sqrt(variance);
-}
-
 /**
  * Realized volatility z-score vs long baseline
  * @param closes - price series
@@ -73,30 +57,45 @@ function realizedVolZ(closes: number[], lb: number, annual: number): number {
   const r = returns(closes);
   if (r.length < lb) return 0;
   
-  const recent = r.slice(-lb);
-  const baseline = r.slice(-Math.min(r.length, 5 * annual)); // ~5y baseline if exists
+  const baselineLen = Math.min(r.length, 5 * annual); // ~5y baseline if exists
   
-  const v1 = std(recent) * Math.sqrt(annual);
-  const v0 = std(baseline) * Math.sqrt(annual);
+  const v1 = rangeStd(r, r.length - lb, r.length) * Math.sqrt(annual);
+  const v0 = rangeStd(r, r.length - baselineLen, r.length) * Math.sqrt(annual);
   
   if (v0 === 0) return 0;
   return (v1 - v0) / v0; // relative z-ish
 }
 
-/**
- * Rolling peak drawdown over lookback period
- */
-function rollingPeakDrawdown(closes: number[], lb: number): number {
-  const start = Math.max(0, closes.length - lb);
-  let peak = closes[start];
-  let maxDD = 0;
-  
-  for (let i = start + 1; i < closes.length; i++) {
-    peak = Math.max(peak, closes[i]);
-    const dd = (peak - closes[i]) / peak;
-    maxDD = Math.max(maxDD, dd);
-  }
-  return maxDD;
+interface PhaseMetrics {
+  p: number;
+  ma20: number;
+  ma200: number;
+  ma200Slope: number;
+  vol: number;
+  dd90: number;
+  overExt: number;
+}
+
+function computePhaseMetrics(closes: number[], cfg: PhaseClassifierConfig): PhaseMetrics {
+  const p = closes[closes.length - 1];
+
+  // Moving averages
+  const ma20 = sma(closes, cfg.maFast);
+  const ma200 = sma(closes, cfg.maSlow);
+
+  // MA200 slope over last 20 days
+  const ma200Slope = smaSlope(closes, cfg.maSlow, 20);
+
+  // Volatility z-score vs baseline
+  const vol = realizedVolZ(closes, cfg.volLookback, 252);
+
+  // Rolling drawdown
+  const dd90 = rangeMaxDrawdown(closes, closes.length - cfg.ddLookback, closes.length);
+
+  // Price extension vs MA200
+  const overExt = ma200 > 0 ? (p / ma200) : 1;
+
+  return { p, ma20, ma200, ma200Slope, vol, dd90, overExt };
 }
 
 // ═══════════════════════════════════════════════════════════════
@@ -121,24 +120,11 @@ export function classifyPhase(
   const minLen = Math.max(cfg.maSlow, cfg.ddLookback) + 5;
   if (closes.length < minLen) return "UNKNOWN";
 
-  const p = closes[closes.length - 1];
-
-  // Moving averages
-  const ma20 = sma(closes, cfg.maFast);
-  const ma200 = sma(closes, cfg.maSlow);
-
-  // MA200 slope over last 20 days
-  const ma200Series = smaSeries(closes, cfg.maSlow, 20);
-  const ma200Slope = slope(ma200Series);
-
-  // Volatility z-score vs baseline
-  const vol = realizedVolZ(closes, cfg.volLookback, 252);
-
-  // Rolling drawdown
-  const dd90 = rollingPeakDrawdown(closes, cfg.ddLookback);
+  return classifyFromMetrics(computePhaseMetrics(closes, cfg), cfg);
+}
 
-  // Price extension vs MA200
-  const overExt = ma200 > 0 ? (p / ma200) : 1;
+function classifyFromMetrics(m: PhaseMetrics, cfg: PhaseClassifierConfig): PhaseBucket {
+  const { p, ma20, ma200, ma200Slope, vol, dd90, overExt } = m;
 
   // ═══════════════════════════════════════════════════════════════
   // Classification Logic (priority order)
@@ -211,17 +197,11 @@ export function classifyPhaseDetailed(
     };
   }
 
-  const p = closes[closes.length - 1];
-  const ma20 = sma(closes, cfg.maFast);
-  const ma200 = sma(closes, cfg.maSlow);
-  const ma200Series = smaSeries(closes, cfg.maSlow, 20);
-  const ma200Slope = slope(ma200Series);
-  const vol = realizedVolZ(closes, cfg.volLookback, 252);
-  const dd90 = rollingPeakDrawdown(closes, cfg.ddLookback);
-  const overExt = ma200 > 0 ? (p / ma200) : 1;
+  const m = computePhaseMetrics(closes, cfg);
+  const { p, ma20, ma200, ma200Slope, vol, dd90, overExt } = m;
 
   return {
-    phase: classifyPhase(closes, cfg),
+    phase: classifyFromMetrics(m, cfg),
     metrics: {
       price: Math.round(p * 100) / 100,
       ma20: Math.round(ma20 * 100) / 100,
@@ -11,6 +11,8 @@
  * - Bubble indicators
  */
 
+import { RollingMoments, RunningSum } from '../../../common/rolling.kernels.js';
+
 export type RegimeKey = 'BULL' | 'BEAR' | 'SIDE' | 'CRASH' | 'BUBBLE';
 
 export interface RegimeFeatures {
@@ -94,6 +96,21 @@ export function areRegimesCompatible(
   return false;
 }
 
+/**
+ * Decide which regimes pass the filter given how many candidates
+ * match the current regime strictly (shared by object and index paths)
+ */
+export function resolveRegimeFilter(
+  strictCount: number,
+  currentRegime: RegimeKey,
+  config: RegimeConditionedConfig = DEFAULT_REGIME_CONFIG
+): { regimes: RegimeKey[]; fallback: boolean } {
+  if (strictCount >= config.minMatchesBeforeFallback || !config.fallbackEnabled) {
+    return { regimes: [currentRegime], fallback: false };
+  }
+  return { regimes: getCompatibleRegimes(currentRegime), fallback: true };
+}
+
 /**
  * Filter matches by regime compatibility
  */
@@ -112,25 +129,37 @@ export function filterByRegime<T extends { regimeKey?: RegimeKey }>(
   );
   
   // If enough matches, return strict
-  if (strictMatches.length >= config.minMatchesBeforeFallback || !config.fallbackEnabled) {
+  const { regimes: compatibleRegimes, fallback } = resolveRegimeFilter(strictMatches.length, currentRegime, config);
+  if (!fallback) {
     return strictMatches;
   }
   
   // Fallback: expand to compatible regimes
-  const compatibleRegimes = getCompatibleRegimes(currentRegime);
   const expandedMatches = matches.filter(m =>
     !m.regimeKey || compatibleRegimes.includes(m.regimeKey)
   );
   
   // Log fallback usage
-  if (expandedMatches.length > strictMatches.length) {
+  logRegimeFallback(currentRegime, compatibleRegimes, strictMatches.length, expandedMatches.length);
+  
+  return expandedMatches;
+}
+
+/**
+ * Log when fallback actually widened the candidate set
+ */
+export function logRegimeFallback(
+  currentRegime: RegimeKey,
+  compatibleRegimes: RegimeKey[],
+  strictCount: number,
+  expandedCount: number
+): void {
+  if (expandedCount > strictCount) {
     console.log(
       `[REGIME] Fallback: ${currentRegime} expanded to ${compatibleRegimes.join(',')} ` +
-      `(${strictMatches.length} → ${expandedMatches.length} matches)`
+      `(${strictCount} → ${expandedCount} matches)`
     );
   }
-  
-  return expandedMatches;
 }
 
 /**
@@ -226,6 +255,75 @@ export function computeRegimeFeatures(
   };
 }
 
+/**
+ * Regime of every window closes[endIdx - windowLen .. endIdx] for endIdx in
+ * [from, closes.length), same rules as
+ * classifyRegime(computeRegimeFeatures(window)) with default options.
+ * Trend sum and volatility slide along the series (O(n) instead of one
+ * window scan per endIdx); windows containing a non-positive close take
+ * the per-window path.
+ */
+export function classifyWindowRegimes(
+  closes: ArrayLike<number>,
+  windowLen: number,
+  from = windowLen
+): RegimeKey[] {
+  const trendWindow = 30;
+  const out: RegimeKey[] = [];
+  const start = Math.max(from, windowLen);
+  for (let endIdx = from; endIdx < Math.min(start, closes.length); endIdx++) out.push('SIDE');
+  if (start >= closes.length) return out;
+
+  // Short windows never reach the trend window: all SIDE
+  if (windowLen + 1 < trendWindow + 5) {
+    for (let endIdx = start; endIdx < closes.length; endIdx++) out.push('SIDE');
+    return out;
+  }
+
+  const moments = new RollingMoments(windowLen);
+  const trendSum = new RunningSum();
+  const ret = (j: number) =>
+    closes[j] > 0 && closes[j - 1] > 0 ? Math.log(closes[j] / closes[j - 1]) : 0;
+
+  // Last non-positive close seen so far (windows containing it go per-window)
+  let lastBad = -1;
+  for (let j = start - windowLen; j < start; j++) if (!(closes[j] > 0)) lastBad = j;
+
+  // Prime with the returns of the first window except its last one
+  for (let j = start - windowLen + 1; j < start; j++) {
+    moments.push(ret(j));
+    if (j > start - trendWindow) trendSum.add(ret(j));
+  }
+
+  for (let endIdx = start; endIdx < closes.length; endIdx++) {
+    if (!(closes[endIdx] > 0)) lastBad = endIdx;
+    const r = ret(endIdx);
+    moments.push(r);
+    trendSum.add(r);
+    if (endIdx > start) trendSum.add(-ret(endIdx - trendWindow));
+
+    if (lastBad >= endIdx - windowLen) {
+      const window = Array.prototype.slice.call(closes, endIdx - windowLen, endIdx + 1) as number[];
+      out.push(classifyRegime(computeRegimeFeatures(window)));
+      continue;
+    }
+
+    const trend = Math.tanh(trendSum.value() * 5);
+    const volatility = moments.std(1) * Math.sqrt(252);
+    const last30Return = closes[endIdx] / closes[endIdx - 30] - 1;
+    const last60Return = windowLen + 1 > 60 ? closes[endIdx] / closes[endIdx - 60] - 1 : 0;
+
+    out.push(classifyRegime({
+      trend,
+      volatility,
+      crash: last30Return <= -0.30,
+      bubble: last60Return >= 2.0,
+      structuralBull: trend > 0.3 && volatility < 0.8,
+    }));
+  }
+  return out;
+}
+
 /**
  * Regime statistics for diagnostics
  */
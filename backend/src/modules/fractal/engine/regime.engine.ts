@@ -4,8 +4,14 @@
  * Classifies market regime on two dimensions:
  * - Volatility: LOW_VOL | NORMAL_VOL | HIGH_VOL
  * - Trend: UP_TREND | DOWN_TREND | SIDEWAYS
+ *
+ * Historical regimes come from a per-series table (rolling vol + rolling
+ * regression slope for every endIdx), built once in O(n) and reused while
+ * the closes array keeps its length.
  */
 
+import { RollingMoments, RollingSlope } from '../../../common/rolling.kernels.js';
+
 export type VolatilityRegime = 'LOW_VOL' | 'NORMAL_VOL' | 'HIGH_VOL';
 export type TrendRegime = 'UP_TREND' | 'DOWN_TREND' | 'SIDEWAYS';
 
@@ -16,7 +22,18 @@ export interface RegimeState {
   trendSlope: number;
 }
 
+interface RegimeSeries {
+  length: number;
+  vol: Float64Array;      // vol[endIdx]: std of the 30 log returns before endIdx
+  slope: Float64Array;    // slope[endIdx]: normalized slope of closes[endIdx-89..endIdx]
+}
+
+const VOL_LOOKBACK = 30;
+const TREND_LOOKBACK = 90;
+
 export class RegimeEngine {
+  private seriesByCloses = new WeakMap<number[], RegimeSeries | null>();
+
   /**
    * Compute volatility from log returns (std dev)
    */
@@ -87,24 +104,24 @@ export class RegimeEngine {
     const vol = this.computeVolatility(returns);
 
     // Trend from last 90 days
-    const last90 = closes.slice(-90);
+    const last90 = closes.slice(-TREND_LOOKBACK);
     const slope = this.computeTrendSlope(last90);
 
-    return {
-      volatility: this.classifyVol(vol),
-      trend: this.classifyTrend(slope),
-      volValue: Math.round(vol * 10000) / 10000,
-      trendSlope: Math.round(slope * 100000) / 100000
-    };
+    return this.toState(vol, slope);
   }
 
   /**
    * Build regime state for historical period ending at endIdx
    */
   buildHistoricalRegime(closes: number[], endIdx: number): RegimeState {
+    const series = this.historicalSeries(closes);
+    if (series && endIdx >= 0 && endIdx < series.length) {
+      return this.toState(series.vol[endIdx], series.slope[endIdx]);
+    }
+
     // Volatility from 30 days before endIdx
     const returns: number[] = [];
-    for (let i = endIdx - 30; i < endIdx; i++) {
+    for (let i = endIdx - VOL_LOOKBACK; i < endIdx; i++) {
       if (i <= 0) continue;
       returns.push(Math.log(closes[i] / closes[i - 1]));
     }
@@ -112,10 +129,49 @@ export class RegimeEngine {
     const vol = this.computeVolatility(returns);
 
     // Trend from 90 days before endIdx
-    const startIdx = Math.max(0, endIdx - 89);
+    const startIdx = Math.max(0, endIdx - (TREND_LOOKBACK - 1));
     const slice = closes.slice(startIdx, endIdx + 1);
     const slope = this.computeTrendSlope(slice);
 
+    return this.toState(vol, slope);
+  }
+
+  /**
+   * Rolling vol / slope of every endIdx, cached per closes array; null when
+   * log returns are not finite (per-window path keeps those local)
+   */
+  private historicalSeries(closes: number[]): RegimeSeries | null {
+    const cached = this.seriesByCloses.get(closes);
+    if (cached !== undefined && (cached === null || cached.length === closes.length)) return cached;
+
+    const n = closes.length;
+    const vol = new Float64Array(n);
+    const slope = new Float64Array(n);
+    const moments = new RollingMoments(VOL_LOOKBACK);
+    const reg = new RollingSlope(TREND_LOOKBACK);
+    let series: RegimeSeries | null = { length: n, vol, slope };
+
+    for (let i = 0; i < n; i++) {
+      // Returns strictly before i: log(closes[i-1] / closes[i-2])
+      if (i >= 2) {
+        const r = Math.log(closes[i - 1] / closes[i - 2]);
+        if (!Number.isFinite(r)) {
+          series = null;
+          break;
+        }
+        moments.push(r);
+      }
+      vol[i] = moments.std(1);
+
+      reg.push(closes[i]);
+      slope[i] = reg.count < 2 ? 0 : reg.slope() / reg.meanY();
+    }
+
+    this.seriesByCloses.set(closes, series);
+    return series;
+  }
+
+  private toState(vol: number, slope: number): RegimeState {
     return {
       volatility: this.classifyVol(vol),
       trend: this.classifyTrend(slope),
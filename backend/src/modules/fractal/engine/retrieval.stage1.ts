@@ -7,6 +7,8 @@
 
 import { TwoStageRetrievalConfig } from '../contracts/retrieval.contracts.js';
 import { buildRawReturns } from './similarity.engine.v2.js';
+import { TopKSelector } from './topk.selector.js';
+import { PackedMultiRepIndex, multiRepRow, stage1RowSimilarity } from './multirep.index.js';
 
 // ═══════════════════════════════════════════════════════════════
 // Types
@@ -20,11 +22,19 @@ export interface Stage1Candidate {
   meta?: Record<string, any>;
 }
 
-export interface Stage1Result {
-  cand: Stage1Candidate;
+export interface Stage1Result<C = Stage1Candidate> {
+  cand: C;
   s1: number;  // stage-1 similarity score
 }
 
+/**
+ * Candidate scored from the multi-rep index (window rows, no closes)
+ */
+export interface IndexedCandidate {
+  endIdx: number;
+  [key: string]: any;
+}
+
 // ═══════════════════════════════════════════════════════════════
 // Math Utilities
 // ═══════════════════════════════════════════════════════════════
@@ -73,24 +83,20 @@ export function stage1SelectByReturns(
 
   const minSim = cfg.stage1MinSim ?? 0.10;
 
-  // Score all candidates
-  const scored: Stage1Result[] = [];
+  // Score all candidates, keeping only the bounded top-K (index, score)
+  const sel = new TopKSelector(cfg.stage1TopK);
   
-  for (const cand of candidates) {
-    const r = buildRawReturns(cand.closes);
+  for (let i = 0; i < candidates.length; i++) {
+    const r = buildRawReturns(candidates[i].closes);
     const v = l2normalize(r);
     const s1 = cosineSim(curVec, v);
     
     if (s1 >= minSim) {
-      scored.push({ cand, s1 });
+      sel.push(i, s1);
     }
   }
 
-  // Sort descending by similarity
-  scored.sort((a, b) => b.s1 - a.s1);
-
-  // Take top-K
-  const result = scored.slice(0, cfg.stage1TopK);
+  const result = toStage1Results(candidates, sel);
   
   const elapsed = Date.now() - t0;
   if (elapsed > 100) {
@@ -114,24 +120,63 @@ export function stage1SelectBatch(
   const curVec = l2normalize(curRet);
   const minSim = cfg.stage1MinSim ?? 0.10;
 
-  const allScored: Stage1Result[] = [];
+  const sel = new TopKSelector(cfg.stage1TopK);
 
   // Process in batches to avoid blocking
-  for (let i = 0; i < candidates.length; i += batchSize) {
-    const batch = candidates.slice(i, i + batchSize);
+  for (let start = 0; start < candidates.length; start += batchSize) {
+    const end = Math.min(candidates.length, start + batchSize);
     
-    for (const cand of batch) {
-      const r = buildRawReturns(cand.closes);
+    for (let i = start; i < end; i++) {
+      const r = buildRawReturns(candidates[i].closes);
       const v = l2normalize(r);
       const s1 = cosineSim(curVec, v);
       
       if (s1 >= minSim) {
-        allScored.push({ cand, s1 });
+        sel.push(i, s1);
       }
     }
   }
 
-  // Sort and take top-K
-  allScored.sort((a, b) => b.s1 - a.s1);
-  return allScored.slice(0, cfg.stage1TopK);
+  return toStage1Results(candidates, sel);
+}
+
+/**
+ * Stage 1 over the multi-rep index: candidates are window rows, the
+ * current window is the row ending at curEndIdx. Same scores as
+ * stage1SelectByReturns on the corresponding closes.
+ */
+export function stage1SelectIndexed<C extends IndexedCandidate>(
+  index: PackedMultiRepIndex,
+  curEndIdx: number,
+  candidates: C[],
+  cfg: TwoStageRetrievalConfig
+): Stage1Result<C>[] {
+  const curRow = multiRepRow(index, curEndIdx);
+  if (curRow < 0) return [];
+
+  const minSim = cfg.stage1MinSim ?? 0.10;
+  const sel = new TopKSelector(cfg.stage1TopK);
+
+  for (let i = 0; i < candidates.length; i++) {
+    const row = multiRepRow(index, candidates[i].endIdx);
+    if (row < 0) continue;
+    const s1 = stage1RowSimilarity(index, curRow, row);
+    if (s1 >= minSim) {
+      sel.push(i, s1);
+    }
+  }
+
+  return toStage1Results(candidates, sel);
+}
+
+/**
+ * Materialize results for the selected winners only (best first)
+ */
+function toStage1Results<C>(candidates: C[], sel: TopKSelector): Stage1Result<C>[] {
+  const { indices, scores } = sel.drain();
+  const out: Stage1Result<C>[] = new Array(indices.length);
+  for (let i = 0; i < indices.length; i++) {
+    out[i] = { cand: candidates[indices[i]], s1: scores[i] };
+  }
+  return out;
 }
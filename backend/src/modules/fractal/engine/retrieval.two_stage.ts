@@ -12,21 +12,27 @@ import {
 } from '../contracts/retrieval.contracts.js';
 import { MultiRepConfig, DEFAULT_MULTI_REP_CONFIG } from '../contracts/similarity.contracts.js';
 import { buildMultiRepVectors, multiRepSimilarity } from './similarity.engine.v2.js';
-import { Stage1Result } from './retrieval.stage1.js';
+import { Stage1Result, Stage1Candidate, IndexedCandidate } from './retrieval.stage1.js';
+import {
+  PackedMultiRepIndex,
+  multiRepRow,
+  multiRepRowSimilarity,
+  multiRepWeights,
+} from './multirep.index.js';
 
 // ═══════════════════════════════════════════════════════════════
 // Types
 // ═══════════════════════════════════════════════════════════════
 
-export interface Stage2Result {
-  cand: Stage1Result['cand'];
+export interface Stage2Result<C = Stage1Candidate> {
+  cand: C;
   sim: number;           // final multi-rep similarity
   byRep: Record<string, number>;
   s1: number;            // stage-1 similarity (for diagnostics)
 }
 
-export interface TwoStageOutput {
-  ranked: Stage2Result[];
+export interface TwoStageOutput<C = Stage1Candidate> {
+  ranked: Stage2Result<C>[];
   stats: TwoStageStats;
 }
 
@@ -94,6 +100,66 @@ export function twoStageRetrieve(
   return { ranked: kept, stats };
 }
 
+/**
+ * Two-Stage Retrieval over the multi-rep index: stage 2 is a weighted sum
+ * of row dot products, no vectors are built per request. Same output as
+ * twoStageRetrieve on the corresponding closes.
+ *
+ * @param index - multi-rep index built with multiCfg
+ * @param curEndIdx - endIdx of the current window
+ * @param stage1 - stage-1 results (from stage1SelectIndexed)
+ */
+export function twoStageRetrieveIndexed<C extends IndexedCandidate>(
+  index: PackedMultiRepIndex,
+  curEndIdx: number,
+  stage1: Stage1Result<C>[],
+  cfg: TwoStageRetrievalConfig = DEFAULT_TWO_STAGE_CONFIG,
+  multiCfg: MultiRepConfig = DEFAULT_MULTI_REP_CONFIG
+): TwoStageOutput<C> {
+  const t0 = Date.now();
+
+  const stage2Input = stage1.slice(0, cfg.stage2TopN);
+  const curRow = multiRepRow(index, curEndIdx);
+  const weights = multiRepWeights(index, multiCfg);
+
+  const t1 = Date.now();
+  const stage1Ms = t1 - t0;
+
+  const rescored: Stage2Result<C>[] = [];
+  if (curRow >= 0) {
+    for (const { cand, s1 } of stage2Input) {
+      const row = multiRepRow(index, cand.endIdx);
+      if (row < 0) continue;
+      const score = multiRepRowSimilarity(index, curRow, row, weights);
+
+      rescored.push({
+        cand,
+        sim: score.total,
+        byRep: score.byRep as Record<string, number>,
+        s1,
+      });
+    }
+  }
+
+  const stage2Min = cfg.stage2MinSim ?? 0.35;
+  const kept = rescored
+    .filter(x => x.sim >= stage2Min)
+    .sort((a, b) => b.sim - a.sim);
+
+  const t2 = Date.now();
+
+  return {
+    ranked: kept,
+    stats: {
+      stage1Candidates: stage1.length,
+      stage2Scored: stage2Input.length,
+      stage2Kept: kept.length,
+      stage1Ms,
+      stage2Ms: t2 - t1,
+    },
+  };
+}
+
 /**
  * Full two-stage pipeline with stage-1 included
  * (convenience function for single-call usage)
@@ -126,7 +192,7 @@ export function twoStageRetrieveFull(
  * Useful for tuning stage-1 threshold
  */
 export function analyzeStageCorrelation(
-  results: Stage2Result[]
+  results: Array<Pick<Stage2Result, 'sim' | 's1'>>
 ): {
   correlation: number;
   avgS1: number;
@@ -0,0 +1,140 @@
+/**
+ * Series-level Return Precompute
+ *
+ * One log-return array plus prefix sums of r and r^2 per series.
+ * Any window's sum / mean / std / L2 norm is then O(1), so normalized
+ * window vectors are written with one affine map per element instead of
+ * per-window slicing. Shared by all window lengths.
+ */
+
+import { SimilarityMode } from './similarity.engine.js';
+
+// Relative variance below this is treated as a constant window
+// (prefix-sum cancellation would otherwise turn 0 into noise)
+const DEGENERATE_VAR_REL = 1e-12;
+
+export interface SeriesReturns {
+  r: Float64Array;       // r[i] = log(closes[i+1] / closes[i]), 0 on bad data
+  prefR: Float64Array;   // prefR[i] = sum r[0..i-1]
+  prefR2: Float64Array;  // prefR2[i] = sum r[0..i-1]^2
+}
+
+export interface WindowMoments {
+  n: number;
+  sum: number;
+  sumSq: number;
+  mean: number;
+  varSum: number;   // sum (r - mean)^2
+  std: number;      // sample std, 1 when degenerate (matches buildWindowVector)
+}
+
+/**
+ * Build log returns and prefix sums in one pass
+ */
+export function buildSeriesReturns(closes: ArrayLike<number>): SeriesReturns {
+  const n = Math.max(0, closes.length - 1);
+  const r = new Float64Array(n);
+  const prefR = new Float64Array(n + 1);
+  const prefR2 = new Float64Array(n + 1);
+
+  for (let i = 0; i < n; i++) {
+    const a = closes[i];
+    const b = closes[i + 1];
+    const x = (!Number.isFinite(a) || !Number.isFinite(b) || a <= 0 || b <= 0) ? 0 : Math.log(b / a);
+    r[i] = x;
+    prefR[i + 1] = prefR[i] + x;
+    prefR2[i + 1] = prefR2[i] + x * x;
+  }
+
+  return { r, prefR, prefR2 };
+}
+
+/**
+ * Extend a SeriesReturns for closes that grew by appending candles.
+ * Existing returns and prefix sums are copied, only the tail is computed.
+ */
+export function extendSeriesReturns(sr: SeriesReturns, closes: ArrayLike<number>): SeriesReturns {
+  const prevN = sr.r.length;
+  const n = Math.max(0, closes.length - 1);
+  if (n <= prevN) return sr;
+
+  const r = new Float64Array(n);
+  const prefR = new Float64Array(n + 1);
+  const prefR2 = new Float64Array(n + 1);
+  r.set(sr.r);
+  prefR.set(sr.prefR);
+  prefR2.set(sr.prefR2);
+
+  for (let i = prevN; i < n; i++) {
+    const a = closes[i];
+    const b = closes[i + 1];
+    const x = (!Number.isFinite(a) || !Number.isFinite(b) || a <= 0 || b <= 0) ? 0 : Math.log(b / a);
+    r[i] = x;
+    prefR[i + 1] = prefR[i] + x;
+    prefR2[i + 1] = prefR2[i] + x * x;
+  }
+
+  return { r, prefR, prefR2 };
+}
+
+/**
+ * Moments of the window ending at closes index endIdx
+ * (returns r[endIdx - windowLen .. endIdx - 1])
+ */
+export function windowMoments(sr: SeriesReturns, endIdx: number, windowLen: number): WindowMoments {
+  const from = endIdx - windowLen;
+  const sum = sr.prefR[endIdx] - sr.prefR[from];
+  const sumSq = Math.max(0, sr.prefR2[endIdx] - sr.prefR2[from]);
+  const n = windowLen;
+  const mean = n > 0 ? sum / n : 0;
+
+  let varSum = sumSq - n * mean * mean;
+  if (varSum <= sumSq * DEGENERATE_VAR_REL) varSum = 0;
+  const std = Math.sqrt(varSum / Math.max(1, n - 1)) || 1;
+
+  return { n, sum, sumSq, mean, varSum, std };
+}
+
+/**
+ * Offset and scale that map a window's raw returns to its unit-length
+ * vector for the given mode: vec[i] = (r[i] - shift) * scale.
+ * scale is 0 for degenerate (all-zero) windows.
+ */
+export function windowAffine(
+  sr: SeriesReturns,
+  endIdx: number,
+  windowLen: number,
+  mode: SimilarityMode
+): { shift: number; scale: number } {
+  const m = windowMoments(sr, endIdx, windowLen);
+
+  if (mode === 'raw_returns') {
+    return { shift: 0, scale: m.sumSq > 0 ? 1 / Math.sqrt(m.sumSq) : 0 };
+  }
+  return { shift: m.mean, scale: m.varSum > 0 ? 1 / Math.sqrt(m.varSum) : 0 };
+}
+
+/**
+ * Write the normalized vector of one window into out[off .. off + windowLen)
+ * Returns the norm to store for the row: 1 by construction, and also 1 for
+ * all-zero windows (the `|| 1` convention used by the cosine code).
+ */
+export function writeWindowVector(
+  sr: SeriesReturns,
+  endIdx: number,
+  windowLen: number,
+  mode: SimilarityMode,
+  out: Float64Array,
+  off: number
+): number {
+  const { shift, scale } = windowAffine(sr, endIdx, windowLen, mode);
+  const from = endIdx - windowLen;
+  const { r } = sr;
+
+  if (scale === 0) {
+    out.fill(0, off, off + windowLen);
+    return 1;
+  }
+  for (let i = 0; i < windowLen; i++) out[off + i] = (r[from + i] - shift) * scale;
+  return 1;
+}
@@ -17,6 +17,7 @@ import {
   MultiRepScore,
   DEFAULT_MULTI_REP_CONFIG,
 } from '../contracts/similarity.contracts.js';
+import { rollingStd, cumsum } from '../../../common/rolling.kernels.js';
 
 // ═══════════════════════════════════════════════════════════════
 // Math Utilities
@@ -56,12 +57,6 @@ function l2normalize(x: number[]): number[] {
   return x.map(v => v / n);
 }
 
-function safeSlice<T>(arr: T[], from: number, to: number): T[] {
-  const f = Math.max(0, from);
-  const t = Math.min(arr.length, to);
-  return arr.slice(f, t);
-}
-
 // ═══════════════════════════════════════════════════════════════
 // Vector Builders
 // ═══════════════════════════════════════════════════════════════
@@ -90,13 +85,7 @@ export function buildRawReturns(closes: number[]): number[] {
  * Captures volatility profile within the window
  */
 export function buildVolShape(returns: number[], lookback = 14): number[] {
-  const out: number[] = [];
-  for (let i = 0; i < returns.length; i++) {
-    const window = safeSlice(returns, i - lookback + 1, i + 1);
-    const sd = stdev(window);
-    out.push(sd);
-  }
-  return out;
+  return Array.from(rollingStd(returns, lookback, { partial: true }));
 }
 
 /**
@@ -122,22 +111,13 @@ export function buildDrawdownShape(returns: number[]): number[] {
  * Captures trend acceleration within the window
  */
 export function buildMomentumSlope(returns: number[], lookback = 10): number[] {
+  const cumSeries = cumsum(returns);
   const out: number[] = [];
-  let cum = 0;
-  const cumSeries: number[] = [];
-  
-  for (const r of returns) {
-    cum += r;
-    cumSeries.push(cum);
-  }
 
   for (let i = 0; i < cumSeries.length; i++) {
-    const window = safeSlice(cumSeries, i - lookback + 1, i + 1);
-    // simple slope: (last-first)/len
-    const slope = window.length >= 2 
-      ? (window[window.length - 1] - window[0]) / (window.length - 1) 
-      : 0;
-    out.push(slope);
+    // simple slope: (last-first)/len over the (partial) last N
+    const first = Math.max(0, i - lookback + 1);
+    out.push(i > first ? (cumSeries[i] - cumSeries[first]) / (i - first) : 0);
   }
   return out;
 }
@@ -206,7 +186,7 @@ export function cosineSim(a: number[], b: number[]): number {
 /**
  * Default weight for each representation
  */
-function defaultRepWeight(r: RepKey): number {
+export function defaultRepWeight(r: RepKey): number {
   switch (r) {
     case "ret": return 0.45;
     case "vol": return 0.30;
@@ -0,0 +1,133 @@
+/**
+ * Bounded Top-K Selector
+ *
+ * Typed-array min-heap that keeps only the K best (index, score) pairs.
+ * Replaces "push every candidate object, sort all, slice(0, K)" in the
+ * match paths: O(N log K) time, O(K) memory, no per-candidate objects.
+ *
+ * Ordering matches a stable descending sort over candidates pushed in
+ * index order: higher score first, ties broken by lower index.
+ */
+
+export interface TopKResult {
+  indices: Int32Array;   // best first
+  scores: Float64Array;  // aligned with indices
+}
+
+export class TopKSelector {
+  private idx: Int32Array;
+  private score: Float64Array;
+  private n = 0;
+
+  constructor(k: number) {
+    const cap = Math.max(0, Math.floor(k));
+    this.idx = new Int32Array(cap);
+    this.score = new Float64Array(cap);
+  }
+
+  get size(): number {
+    return this.n;
+  }
+
+  /**
+   * Offer a candidate; kept only if it beats the current K-th best
+   */
+  push(index: number, score: number): void {
+    const cap = this.idx.length;
+    if (cap === 0 || Number.isNaN(score)) return;
+
+    if (this.n < cap) {
+      this.idx[this.n] = index;
+      this.score[this.n] = score;
+      this.siftUp(this.n++);
+      return;
+    }
+
+    // Root is the worst kept candidate
+    if (!this.better(index, score, this.idx[0], this.score[0])) return;
+    this.idx[0] = index;
+    this.score[0] = score;
+    this.siftDown(0);
+  }
+
+  /**
+   * Winners sorted best-first (selector is left empty)
+   */
+  drain(): TopKResult {
+    const count = this.n;
+    const indices = new Int32Array(count);
+    const scores = new Float64Array(count);
+
+    // Pop worst-first into the tail
+    for (let out = count - 1; out >= 0; out--) {
+      indices[out] = this.idx[0];
+      scores[out] = this.score[0];
+      this.n--;
+      if (this.n > 0) {
+        this.idx[0] = this.idx[this.n];
+        this.score[0] = this.score[this.n];
+        this.siftDown(0);
+      }
+    }
+    return { indices, scores };
+  }
+
+  reset(): void {
+    this.n = 0;
+  }
+
+  private better(ia: number, sa: number, ib: number, sb: number): boolean {
+    return sa > sb || (sa === sb && ia < ib);
+  }
+
+  // Heap invariant: parent is worse than (or equal to) its children
+  private worseAt(a: number, b: number): boolean {
+    return this.better(this.idx[b], this.score[b], this.idx[a], this.score[a]);
+  }
+
+  private swap(a: number, b: number): void {
+    const ti = this.idx[a]; this.idx[a] = this.idx[b]; this.idx[b] = ti;
+    const ts = this.score[a]; this.score[a] = this.score[b]; this.score[b] = ts;
+  }
+
+  private siftUp(i: number): void {
+    while (i > 0) {
+      const p = (i - 1) >> 1;
+      if (!this.worseAt(i, p)) break;
+      this.swap(i, p);
+      i = p;
+    }
+  }
+
+  private siftDown(i: number): void {
+    const n = this.n;
+    for (;;) {
+      const l = 2 * i + 1;
+      if (l >= n) break;
+      const r = l + 1;
+      const c = r < n && this.worseAt(r, l) ? r : l;
+      if (!this.worseAt(c, i)) break;
+      this.swap(i, c);
+      i = c;
+    }
+  }
+}
+
+/**
+ * Top-K over a score array: candidate i has index offset + i.
+ * Scores below minScore are skipped.
+ */
+export function selectTopK(
+  scores: ArrayLike<number>,
+  count: number,
+  k: number,
+  offset = 0,
+  minScore = -Infinity
+): TopKResult {
+  const sel = new TopKSelector(k);
+  for (let i = 0; i < count; i++) {
+    const s = scores[i];
+    if (s >= minScore) sel.push(offset + i, s);
+  }
+  return sel.drain();
+}
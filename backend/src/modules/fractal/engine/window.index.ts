@@ -1,74 +1,197 @@
 /**
  * Window Index Service
  * Pre-computes window vectors for fast pattern matching
+ *
+ * One packed index per (symbol, windowLen, similarityMode): the normalized
+ * return vectors of every historical window live row-major in a single
+ * contiguous Float64Array with their L2 norms alongside. Scoring a query is
+ * one pass of dot products over that array - no per-window slicing.
+ *
+ * Rows are filled from a shared SeriesReturns precompute (one log-return
+ * pass + prefix sums per series), so every window length reuses the same
+ * returns and each window's normalization is O(1). New candles append
+ * rows instead of rebuilding (see column.growth.ts).
  */
 
-import { SimilarityEngine } from './similarity.engine.js';
+import { SimilarityMode } from './similarity.engine.js';
+import { SeriesReturns, buildSeriesReturns, extendSeriesReturns, writeWindowVector } from './series.returns.js';
+import { growTo } from './column.growth.js';
 
 export type WindowLen = 30 | 60 | 90;
 
-export interface WindowVec {
-  endIdx: number;      // index in closes (end of window)
-  startIdx: number;    // index in closes (start of window)
-  startTs: Date;
-  endTs: Date;
-  vec: number[];       // z-scored returns vector
-  norm: number;        // L2 norm of vec
+const EPS = 1e-12;
+
+export interface PackedWindowIndex {
+  symbol: string;
+  windowLen: number;
+  mode: SimilarityMode;
+  dim: number;           // vector length (= windowLen returns)
+  firstEndIdx: number;   // closes index of the window in row 0
+  count: number;         // number of rows (windows)
+  seriesLen: number;     // closes.length the index was built from
+  vecs: Float64Array;    // >= count * dim, row r = window ending at firstEndIdx + r
+  norms: Float64Array;   // L2 norm per row (1 for degenerate windows)
+}
+
+function indexKey(symbol: string, windowLen: number, mode: SimilarityMode): string {
+  return `${symbol}:${windowLen}:${mode}`;
+}
+
+/**
+ * Build packed index for one (windowLen, mode) over the whole series.
+ * Row for endIdx holds the vector of closes[endIdx - windowLen .. endIdx].
+ */
+export function buildPackedWindowIndex(
+  symbol: string,
+  closes: ArrayLike<number>,
+  windowLen: number,
+  mode: SimilarityMode,
+  returns: SeriesReturns = buildSeriesReturns(closes)
+): PackedWindowIndex {
+  const dim = windowLen;
+  const firstEndIdx = windowLen;
+  const count = Math.max(0, closes.length - firstEndIdx);
+  const vecs = new Float64Array(count * dim);
+  const norms = new Float64Array(count);
+
+  for (let row = 0; row < count; row++) {
+    norms[row] = writeWindowVector(returns, firstEndIdx + row, windowLen, mode, vecs, row * dim);
+  }
+
+  return { symbol, windowLen, mode, dim, firstEndIdx, count, seriesLen: closes.length, vecs, norms };
+}
+
+/**
+ * Append rows for candles added after the index was built
+ */
+export function appendPackedWindowIndex(
+  index: PackedWindowIndex,
+  closes: ArrayLike<number>,
+  returns: SeriesReturns
+): PackedWindowIndex {
+  const { dim, firstEndIdx, windowLen, mode } = index;
+  const count = Math.max(0, closes.length - firstEndIdx);
+  if (count <= index.count) return index;
+
+  const vecs = growTo(index.vecs, index.count * dim, count * dim);
+  const norms = growTo(index.norms, index.count, count);
+
+  for (let row = index.count; row < count; row++) {
+    norms[row] = writeWindowVector(returns, firstEndIdx + row, windowLen, mode, vecs, row * dim);
+  }
+
+  index.vecs = vecs;
+  index.norms = norms;
+  index.count = count;
+  index.seriesLen = closes.length;
+  return index;
+}
+
+/**
+ * Cosine scores of the window ending at curEndIdx against every window
+ * with endIdx in [fromEndIdx, toEndIdx]. out[i] is the score for
+ * endIdx = fromEndIdx + i. Returns the number of scores written.
+ */
+export function scoreWindowRange(
+  index: PackedWindowIndex,
+  curEndIdx: number,
+  fromEndIdx: number,
+  toEndIdx: number,
+  out: Float64Array
+): number {
+  const { vecs, norms, dim, firstEndIdx } = index;
+  const from = Math.max(fromEndIdx, firstEndIdx);
+  const to = Math.min(toEndIdx, firstEndIdx + index.count - 1);
+  if (to < from) return 0;
+
+  const curRow = curEndIdx - firstEndIdx;
+  const curOff = curRow * dim;
+  const curNorm = norms[curRow];
+
+  let n = 0;
+  for (let endIdx = from; endIdx <= to; endIdx++) {
+    const row = endIdx - firstEndIdx;
+    const off = row * dim;
+    let dot = 0;
+    for (let i = 0; i < dim; i++) {
+      dot += vecs[curOff + i] * vecs[off + i];
+    }
+    out[n++] = dot / (curNorm * norms[row] + EPS);
+  }
+  return n;
 }
 
 export class WindowIndex {
-  private sim = new SimilarityEngine();
-  private indexByLen: Map<WindowLen, WindowVec[]> = new Map();
+  private indexByKey: Map<string, PackedWindowIndex> = new Map();
+  private returnsBySymbol: Map<string, SeriesReturns> = new Map();
   private builtAt: number | null = null;
 
   getBuiltAt(): number | null {
     return this.builtAt;
   }
 
-  buildAll(ts: Date[], closes: number[], lens: WindowLen[], horizonDays: number): void {
-    // Returns length = closes.length - 1
-    const returns = this.sim.buildLogReturns(closes);
+  /**
+   * Shared returns/prefix sums for a series (one pass, reused by all lens)
+   */
+  getReturns(symbol: string, closes: ArrayLike<number>): SeriesReturns {
+    const existing = this.returnsBySymbol.get(symbol);
+    const n = Math.max(0, closes.length - 1);
+    if (existing && existing.r.length === n) return existing;
 
+    const built = existing && existing.r.length < n
+      ? extendSeriesReturns(existing, closes)
+      : buildSeriesReturns(closes);
+    this.returnsBySymbol.set(symbol, built);
+    return built;
+  }
+
+  buildAll(symbol: string, closes: number[], lens: WindowLen[], modes: SimilarityMode[]): void {
+    const returns = this.getReturns(symbol, closes);
     for (const len of lens) {
-      const windows: WindowVec[] = [];
-
-      // For each window ending at returns index `end`,
-      // closes end index = end, closes start index = end - len
-      for (let end = len; end < returns.length - horizonDays; end++) {
-        const slice = returns.slice(end - len, end);
-        const z = this.sim.zScoreNormalize(slice);
-
-        // Calculate L2 norm
-        let norm = 0;
-        for (let i = 0; i < z.length; i++) norm += z[i] * z[i];
-        norm = Math.sqrt(norm) || 1;
-
-        const endIdx = end;            // closes index
-        const startIdx = end - len;    // closes index
-
-        windows.push({
-          endIdx,
-          startIdx,
-          startTs: ts[startIdx],
-          endTs: ts[endIdx],
-          vec: z,
-          norm
-        });
+      for (const mode of modes) {
+        this.indexByKey.set(indexKey(symbol, len, mode), buildPackedWindowIndex(symbol, closes, len, mode, returns));
       }
-
-      this.indexByLen.set(len, windows);
     }
 
     this.builtAt = Date.now();
-    console.log(`[WindowIndex] Built indices for lens: ${lens.join(', ')}`);
+    console.log(`[WindowIndex] Built ${symbol} indices for lens: ${lens.join(', ')} (${modes.join(', ')})`);
+  }
+
+  /**
+   * Get packed index, building it lazily if missing, appending rows if the
+   * series grew since it was built
+   */
+  getOrBuild(symbol: string, closes: number[], windowLen: number, mode: SimilarityMode): PackedWindowIndex {
+    const key = indexKey(symbol, windowLen, mode);
+    const existing = this.indexByKey.get(key);
+    if (existing && existing.seriesLen === closes.length) return existing;
+    if (existing && existing.seriesLen < closes.length) {
+      return appendPackedWindowIndex(existing, closes, this.getReturns(symbol, closes));
+    }
+
+    const built = buildPackedWindowIndex(symbol, closes, windowLen, mode, this.getReturns(symbol, closes));
+    this.indexByKey.set(key, built);
+    if (!this.builtAt) this.builtAt = Date.now();
+    return built;
+  }
+
+  get(symbol: string, len: WindowLen, mode: SimilarityMode): PackedWindowIndex | undefined {
+    return this.indexByKey.get(indexKey(symbol, len, mode));
   }
 
-  get(len: WindowLen): WindowVec[] {
-    return this.indexByLen.get(len) || [];
+  /**
+   * Approximate memory held by packed vectors and shared returns
+   */
+  byteSize(): number {
+    let bytes = 0;
+    for (const idx of this.indexByKey.values()) bytes += idx.vecs.byteLength + idx.norms.byteLength;
+    for (const sr of this.returnsBySymbol.values()) bytes += sr.r.byteLength + sr.prefR.byteLength + sr.prefR2.byteLength;
+    return bytes;
   }
 
   clear(): void {
-    this.indexByLen.clear();
+    this.indexByKey.clear();
+    this.returnsBySymbol.clear();
     this.builtAt = null;
   }
 }
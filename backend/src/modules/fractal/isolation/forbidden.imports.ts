@@ -92,7 +92,6 @@ export const FORBIDDEN_IMPORTS: ForbiddenImportRule[] = [
 export const ALLOWED_EXTERNAL_IMPORTS = [
   'fastify',           // App framework (injected via HostDeps.app)
   'zod',              // Schema validation (pure, no side effects)
-  'technicalindicators', // Math library (pure functions)
   'uuid',             // ID generation (pure)
 ];
 
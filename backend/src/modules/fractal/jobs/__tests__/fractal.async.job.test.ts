@@ -0,0 +1,161 @@
+/**
+ * Async Job Service Tests
+ *
+ * Queue / concurrency / cancel semantics with a stubbed fastify.inject,
+ * restart recovery, oversized results and pruning with a stubbed model.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { FractalAsyncJobService, AsyncJobConfig, AsyncJobError, currentAsyncJob } from '../fractal.async.job.js';
+import { FractalJobModel } from '../../data/schemas/fractal-job.schema.js';
+
+// Model calls recorded instead of hitting Mongo
+const writes: Array<{ op: string; filter: any; update: any }> = [];
+const model = FractalJobModel as any;
+model.updateOne = async (filter: any, update: any) => {
+  writes.push({ op: 'updateOne', filter, update });
+  return { modifiedCount: 1 };
+};
+model.updateMany = async (filter: any, update: any) => {
+  writes.push({ op: 'updateMany', filter, update });
+  return { modifiedCount: 0 };
+};
+
+function makeService(concurrency: number, config: Partial<AsyncJobConfig> = {}) {
+  const pending: Array<(body: unknown) => void> = [];
+  const seenJobs: Array<string | undefined> = [];
+  const app = {
+    inject: () => {
+      const job = currentAsyncJob();
+      seenJobs.push(job?.jobId);
+      job?.progress(1, 2);
+      return new Promise(resolve => {
+        pending.push(body => resolve({ statusCode: 200, json: () => body }));
+      });
+    },
+  };
+  const service = new FractalAsyncJobService({ concurrency, maxQueued: 2, ...config });
+  service.attach(app as any);
+  return { service, pending, seenJobs };
+}
+
+const tick = () => new Promise(resolve => setTimeout(resolve, 0));
+
+describe('FractalAsyncJobService', () => {
+  it('should run jobs up to the concurrency limit and expose the job context', async () => {
+    const { service, pending, seenJobs } = makeService(1);
+    const a = service.submit('/api/fractal/admin/sim/run', {});
+    const b = service.submit('/api/fractal/admin/sim/run', {});
+
+    expect(a.status).toBe('RUNNING');
+    expect(b.status).toBe('QUEUED');
+    expect(seenJobs).toEqual([a.jobId]);
+    expect(a.progress).toEqual({ done: 1, total: 2, message: undefined });
+
+    pending[0]({ ok: true, value: 1 });
+    await tick();
+
+    expect(a.status).toBe('DONE');
+    expect(a.result).toEqual({ ok: true, value: 1 });
+    expect(b.status).toBe('RUNNING');
+  });
+
+  it('should mark { ok: false } responses as failed', async () => {
+    const { service, pending } = makeService(1);
+    const job = service.submit('/api/fractal/admin/sim/oos', {});
+
+    pending[0]({ ok: false, error: 'Insufficient data' });
+    await tick();
+
+    expect(job.status).toBe('FAILED');
+    expect(job.error).toBe('Insufficient data');
+  });
+
+  it('should cancel queued and running jobs', async () => {
+    const { service, pending } = makeService(1);
+    const a = service.submit('/api/fractal/admin/sim/run', {});
+    const b = service.submit('/api/fractal/admin/sim/run', {});
+
+    expect(service.cancel(b.jobId)).toBe(true);
+    expect(service.cancel(a.jobId)).toBe(true);
+    expect(service.cancel(a.jobId)).toBe(false);
+
+    pending[0]({ ok: true });
+    await tick();
+
+    expect(a.status).toBe('CANCELLED');
+    expect(b.status).toBe('CANCELLED');
+    expect(pending.length).toBe(1);
+  });
+
+  it('should reject routes outside the allow-list and a full queue', () => {
+    const { service } = makeService(1);
+    expect(() => service.submit('/api/fractal/v2.1/signal', {})).toThrow();
+
+    service.submit('/api/fractal/admin/sim/run', {});
+    service.submit('/api/fractal/admin/sim/run', {});
+    service.submit('/api/fractal/admin/sim/run', {});
+    expect(() => service.submit('/api/fractal/admin/sim/run', {})).toThrow();
+  });
+
+  it('should reject with 429 only when the queue is full', () => {
+    const { service } = makeService(1);
+    const statusOf = (route: string) => {
+      try {
+        service.submit(route, {});
+        return 202;
+      } catch (err) {
+        return err instanceof AsyncJobError ? err.statusCode : 500;
+      }
+    };
+
+    expect(statusOf('/api/fractal/v2.1/signal')).toBe(400);
+    expect(statusOf('/api/fractal/admin/sim/run')).toBe(202);
+    expect(statusOf('/api/fractal/admin/sim/run')).toBe(202);
+    expect(statusOf('/api/fractal/admin/sim/run')).toBe(202);
+    expect(statusOf('/api/fractal/admin/sim/run')).toBe(429);
+
+    const detached = new FractalAsyncJobService();
+    expect(() => detached.submit('/api/fractal/admin/sim/run', {})).toThrow('Async jobs not attached to app');
+  });
+
+  it('should mark jobs left QUEUED / RUNNING by a previous process as interrupted', () => {
+    writes.length = 0;
+    const { service } = makeService(1);
+    service.attach({} as any);
+
+    const recovery = writes.filter(w => w.op === 'updateMany');
+    expect(recovery.length).toBe(1);
+    expect(recovery[0].filter.status).toEqual({ $in: ['QUEUED', 'RUNNING'] });
+    expect(recovery[0].update.$set.status).toBe('INTERRUPTED');
+  });
+
+  it('should persist a summary of results too large for one document', async () => {
+    const { service, pending } = makeService(1, { maxResultBytes: 1000 });
+    const job = service.submit('/api/fractal/admin/sim/sweep', {});
+    writes.length = 0;
+
+    const body = { ok: true, best: 0.7, runs: Array.from({ length: 500 }, (_, i) => ({ i })), meta: { a: 1, b: 2 } };
+    pending[0](body);
+    await tick();
+
+    expect(job.status).toBe('DONE');
+    expect(job.result).toBe(body);
+
+    const saved = writes[writes.length - 1].update.$set;
+    expect(saved.status).toBe('DONE');
+    expect(saved.resultTruncated).toBe(true);
+    expect(saved.result).toEqual({ ok: true, best: 0.7, runs: { items: 500 }, meta: { keys: 2 } });
+  });
+
+  it('should drop finished jobs from memory on the prune timer', async () => {
+    const { service, pending } = makeService(1, { retainMs: 0, pruneEveryMs: 5 });
+    const job = service.submit('/api/fractal/admin/sim/run', {});
+    pending[0]({ ok: true });
+    await tick();
+    expect((service as any).states.has(job.jobId)).toBe(true);
+
+    await new Promise(resolve => setTimeout(resolve, 30));
+    expect((service as any).states.has(job.jobId)).toBe(false);
+  });
+});
@@ -0,0 +1,432 @@
+/**
+ * BLOCK 56.7 — Async Job Service
+ *
+ * Long-running admin endpoints (sim / sweep / montecarlo / oos / optimize)
+ * run as background jobs instead of holding the HTTP request open:
+ * - submit() returns a job id at once; jobs run on a bounded FIFO queue
+ *   with a concurrency limit
+ * - a job replays the original route in-process (fastify.inject), so every
+ *   existing endpoint can run async without changes
+ * - code running inside a job reads its handle via currentAsyncJob() to
+ *   report progress / partial results and observe cancellation
+ * - state and results persist in Mongo (fractal_job) and survive restarts;
+ *   jobs a restart cut short are marked INTERRUPTED on attach, and results
+ *   too large for one document are persisted as a summary
+ */
+
+import { AsyncLocalStorage } from 'node:async_hooks';
+import { EventEmitter } from 'node:events';
+import { FastifyInstance, FastifyReply, FastifyRequest } from 'fastify';
+import { FractalJobModel } from '../data/schemas/fractal-job.schema.js';
+
+// ═══════════════════════════════════════════════════════════════
+// TYPES
+// ═══════════════════════════════════════════════════════════════
+
+export type AsyncJobStatus = 'QUEUED' | 'RUNNING' | 'DONE' | 'FAILED' | 'CANCELLED' | 'INTERRUPTED';
+
+export interface AsyncJobProgress {
+  done: number;
+  total: number;
+  message?: string;
+}
+
+export interface AsyncJob {
+  jobId: string;
+  route: string;
+  params: unknown;
+  status: AsyncJobStatus;
+  progress: AsyncJobProgress;
+  partial: unknown[];
+  result?: unknown;
+  resultTruncated?: boolean; // persisted result is a summary (full one too large)
+  error?: string;
+  createdAt: Date;
+  startedAt?: Date;
+  finishedAt?: Date;
+}
+
+export type AsyncJobEvent = 'status' | 'progress' | 'partial';
+
+/**
+ * Handle visible to code running inside a job
+ */
+export interface AsyncJobHandle {
+  jobId: string;
+  signal: AbortSignal;
+  progress: (done: number, total: number, message?: string) => void;
+  partial: (item: unknown) => void;
+}
+
+export interface AsyncJobConfig {
+  concurrency: number;
+  maxQueued: number;
+  maxPartial: number;        // partial results kept per job
+  retainMs: number;          // finished jobs kept in memory
+  pruneEveryMs: number;      // sweep of finished jobs past retainMs
+  persistEveryMs: number;    // progress write throttle
+  maxResultBytes: number;    // larger results persist as a summary
+}
+
+export const DEFAULT_ASYNC_JOB_CONFIG: AsyncJobConfig = {
+  concurrency: 2,
+  maxQueued: 20,
+  maxPartial: 500,
+  retainMs: 6 * 60 * 60 * 1000,
+  pruneEveryMs: 10 * 60 * 1000,
+  persistEveryMs: 2000,
+  maxResultBytes: 8 * 1024 * 1024,   // Mongo documents cap at 16 MB
+};
+
+/**
+ * Submit rejected; statusCode is the HTTP status for the caller
+ */
+export class AsyncJobError extends Error {
+  statusCode: number;
+
+  constructor(message: string, statusCode: number) {
+    super(message);
+    this.name = 'AsyncJobError';
+    this.statusCode = statusCode;
+  }
+}
+
+// Routes allowed to run as jobs (long-running admin compute)
+const ASYNC_ROUTE_PREFIXES = [
+  '/api/fractal/admin/sim/',
+  '/api/fractal/admin/optimize',
+  '/api/fractal/admin/autolearn/',
+];
+
+export function isAsyncJobRoute(path: string): boolean {
+  return ASYNC_ROUTE_PREFIXES.some(p => path.startsWith(p));
+}
+
+const TERMINAL: AsyncJobStatus[] = ['DONE', 'FAILED', 'CANCELLED', 'INTERRUPTED'];
+
+export function isTerminal(status: AsyncJobStatus): boolean {
+  return TERMINAL.includes(status);
+}
+
+const jobContext = new AsyncLocalStorage<AsyncJobHandle>();
+
+/**
+ * Handle of the job the caller is running in (undefined outside jobs)
+ */
+export function currentAsyncJob(): AsyncJobHandle | undefined {
+  return jobContext.getStore();
+}
+
+// ═══════════════════════════════════════════════════════════════
+// SERVICE
+// ═══════════════════════════════════════════════════════════════
+
+interface JobState {
+  job: AsyncJob;
+  controller: AbortController;
+  events: EventEmitter;
+  lastPersistAt: number;
+}
+
+export class FractalAsyncJobService {
+  private config: AsyncJobConfig;
+  private app: FastifyInstance | null = null;
+  private states = new Map<string, JobState>();
+  private queue: string[] = [];
+  private running = 0;
+  private pruneTimer: NodeJS.Timeout | null = null;
+
+  constructor(config: Partial<AsyncJobConfig> = {}) {
+    this.config = { ...DEFAULT_ASYNC_JOB_CONFIG, ...config };
+  }
+
+  /**
+   * Bind to the app whose routes jobs replay. Persisted jobs still QUEUED /
+   * RUNNING belong to a previous process and can no longer finish.
+   */
+  attach(app: FastifyInstance): void {
+    const first = this.app === null;
+    this.app = app;
+    if (!first) return;
+
+    void this.markInterrupted();
+    this.pruneTimer = setInterval(() => this.prune(), this.config.pruneEveryMs);
+    this.pruneTimer.unref();
+  }
+
+  /**
+   * Queue a job for an allowed POST route
+   */
+  submit(route: string, params: unknown): AsyncJob {
+    if (!this.app) throw new AsyncJobError('Async jobs not attached to app', 503);
+    if (!isAsyncJobRoute(route.split('?')[0])) throw new AsyncJobError(`Route not allowed as job: ${route}`, 400);
+    if (this.queue.length >= this.config.maxQueued) throw new AsyncJobError('Job queue is full', 429);
+
+    this.prune();
+
+    const job: AsyncJob = {
+      jobId: `job-${Date.now()}-${Math.random().toString(36).slice(2, 8)}`,
+      route,
+      params,
+      status: 'QUEUED',
+      progress: { done: 0, total: 0 },
+      partial: [],
+      createdAt: new Date(),
+    };
+
+    const events = new EventEmitter();
+    events.setMaxListeners(0);
+    this.states.set(job.jobId, { job, controller: new AbortController(), events, lastPersistAt: 0 });
+    this.queue.push(job.jobId);
+
+    void this.persist(job);
+    this.pump();
+    return job;
+  }
+
+  /**
+   * Live job (in memory) or persisted one
+   */
+  async get(jobId: string): Promise<AsyncJob | null> {
+    const live = this.states.get(jobId);
+    if (live) return live.job;
+
+    const doc = await FractalJobModel.findOne({ jobId }).lean() as any;
+    if (!doc) return null;
+    const { _id, ...job } = doc;
+    return job as AsyncJob;
+  }
+
+  async list(limit = 20): Promise<AsyncJob[]> {
+    const docs = await FractalJobModel.find({}, { result: 0, partial: 0 })
+      .sort({ createdAt: -1 })
+      .limit(limit)
+      .lean() as any[];
+
+    // Live state wins over the (throttled) persisted copy
+    return docs.map(({ _id, ...doc }) => this.states.get(doc.jobId)?.job ?? doc as AsyncJob);
+  }
+
+  /**
+   * Cancel a queued or running job. Running work sees the abort signal;
+   * code that ignores it finishes in the background and is discarded.
+   */
+  cancel(jobId: string): boolean {
+    const state = this.states.get(jobId);
+    if (!state || isTerminal(state.job.status)) return false;
+
+    this.queue = this.queue.filter(id => id !== jobId);
+    state.controller.abort();
+    this.finish(state, 'CANCELLED', undefined, 'Cancelled');
+    return true;
+  }
+
+  /**
+   * Listen to job events until it reaches a terminal state
+   */
+  subscribe(jobId: string, listener: (event: AsyncJobEvent, job: AsyncJob) => void): () => void {
+    const state = this.states.get(jobId);
+    if (!state) return () => {};
+
+    const handlers = (['status', 'progress', 'partial'] as AsyncJobEvent[]).map(event => {
+      const h = () => listener(event, state.job);
+      state.events.on(event, h);
+      return [event, h] as const;
+    });
+    return () => handlers.forEach(([event, h]) => state.events.off(event, h));
+  }
+
+  stats(): { queued: number; running: number; concurrency: number; maxQueued: number } {
+    return {
+      queued: this.queue.length,
+      running: this.running,
+      concurrency: this.config.concurrency,
+      maxQueued: this.config.maxQueued,
+    };
+  }
+
+  // Private Methods
+
+  private pump(): void {
+    while (this.running < this.config.concurrency && this.queue.length) {
+      const state = this.states.get(this.queue.shift()!);
+      if (!state || state.job.status !== 'QUEUED') continue;
+      this.running++;
+      this.execute(state).finally(() => {
+        this.running--;
+        this.pump();
+      });
+    }
+  }
+
+  private async execute(state: JobState): Promise<void> {
+    const { job, controller } = state;
+    job.status = 'RUNNING';
+    job.startedAt = new Date();
+    state.events.emit('status');
+    void this.persist(job);
+
+    const handle: AsyncJobHandle = {
+      jobId: job.jobId,
+      signal: controller.signal,
+      progress: (done, total, message) => {
+        job.progress = { done, total, message };
+        state.events.emit('progress');
+        this.persistThrottled(state);
+      },
+      partial: (item) => {
+        if (job.partial.length < this.config.maxPartial) job.partial.push(item);
+        state.events.emit('partial');
+      },
+    };
+
+    try {
+      const res = await jobContext.run(handle, () => this.app!.inject({
+        method: 'POST',
+        url: job.route,
+        payload: (job.params ?? {}) as any,
+      }));
+      if (controller.signal.aborted) return;
+
+      const body = res.json();
+      if (res.statusCode >= 400 || body?.ok === false) {
+        this.finish(state, 'FAILED', body, body?.error ?? body?.message ?? `HTTP ${res.statusCode}`);
+      } else {
+        this.finish(state, 'DONE', body);
+      }
+    } catch (err) {
+      if (controller.signal.aborted) return;
+      this.finish(state, 'FAILED', undefined, err instanceof Error ? err.message : String(err));
+    }
+  }
+
+  private finish(state: JobState, status: AsyncJobStatus, result?: unknown, error?: string): void {
+    const { job } = state;
+    job.status = status;
+    job.result = result;
+    job.error = error;
+    job.finishedAt = new Date();
+    state.events.emit('status');
+    void this.persist(job);
+    console.log(`[AsyncJob] ${job.jobId} ${job.route} → ${status}${error ? ` (${error})` : ''}`);
+  }
+
+  private persistThrottled(state: JobState): void {
+    const now = Date.now();
+    if (now - state.lastPersistAt < this.config.persistEveryMs) return;
+    state.lastPersistAt = now;
+    void this.persist(state.job);
+  }
+
+  private async persist(job: AsyncJob): Promise<void> {
+    const doc: AsyncJob = { ...job };
+    if (job.result !== undefined && !fitsDocument(job.result, this.config.maxResultBytes)) {
+      doc.result = summarizeResult(job.result);
+      doc.resultTruncated = true;
+    }
+    try {
+      await FractalJobModel.updateOne({ jobId: job.jobId }, { $set: doc }, { upsert: true });
+    } catch (err) {
+      console.error(`[AsyncJob] Persist failed for ${job.jobId}:`, err);
+    }
+  }
+
+  /**
+   * QUEUED / RUNNING jobs persisted by an earlier process → INTERRUPTED
+   */
+  private async markInterrupted(): Promise<void> {
+    try {
+      const res = await FractalJobModel.updateMany(
+        { status: { $in: ['QUEUED', 'RUNNING'] }, jobId: { $nin: [...this.states.keys()] } },
+        { $set: { status: 'INTERRUPTED', error: 'Interrupted by server restart', finishedAt: new Date() } }
+      );
+      if (res.modifiedCount) console.log(`[AsyncJob] Marked ${res.modifiedCount} unfinished job(s) INTERRUPTED`);
+    } catch (err) {
+      console.error('[AsyncJob] Interrupted-job recovery failed:', err);
+    }
+  }
+
+  /**
+   * Drop finished jobs from memory after retainMs (still in Mongo)
+   */
+  private prune(): void {
+    const cutoff = Date.now() - this.config.retainMs;
+    for (const [id, { job }] of this.states) {
+      if (isTerminal(job.status) && (job.finishedAt?.getTime() ?? 0) < cutoff) this.states.delete(id);
+    }
+  }
+}
+
+/**
+ * Serialized size check against the per-document budget
+ */
+function fitsDocument(value: unknown, maxBytes: number): boolean {
+  try {
+    return Buffer.byteLength(JSON.stringify(value) ?? '') <= maxBytes;
+  } catch {
+    return false;
+  }
+}
+
+/**
+ * Persistable stand-in for an oversized result: top-level scalars kept,
+ * arrays / objects replaced by their size
+ */
+export function summarizeResult(result: unknown): unknown {
+  if (result === null || typeof result !== 'object') return result;
+  if (Array.isArray(result)) return { items: result.length };
+
+  const summary: Record<string, unknown> = {};
+  for (const [key, value] of Object.entries(result)) {
+    if (Array.isArray(value)) summary[key] = { items: value.length };
+    else if (value !== null && typeof value === 'object') summary[key] = { keys: Object.keys(value).length };
+    else summary[key] = value;
+  }
+  return summary;
+}
+
+// Export singleton
+export const fractalAsyncJobService = new FractalAsyncJobService();
+
+// ═══════════════════════════════════════════════════════════════
+// ?async=1 HOOK
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * POST <long route>?async=1 → { ok, jobId } instead of running inline.
+ * Must be added on the instance that owns the fractal routes (hooks are
+ * encapsulated per plugin).
+ */
+export function registerAsyncJobHook(app: FastifyInstance): void {
+  fractalAsyncJobService.attach(app);
+
+  app.addHook('preHandler', async (request: FastifyRequest, reply: FastifyReply) => {
+    if (request.method !== 'POST') return;
+    const query = (request.query || {}) as Record<string, string>;
+    if (query.async !== '1' && query.async !== 'true') return;
+
+    const [path, qs = ''] = request.url.split('?');
+    if (!isAsyncJobRoute(path)) return;
+
+    const rest = new URLSearchParams(qs);
+    rest.delete('async');
+    const route = rest.toString() ? `${path}?${rest}` : path;
+
+    try {
+      const job = fractalAsyncJobService.submit(route, request.body ?? {});
+      return reply.code(202).send({
+        ok: true,
+        jobId: job.jobId,
+        status: job.status,
+        links: {
+          self: `/api/fractal/v2.1/admin/jobs/${job.jobId}`,
+          events: `/api/fractal/v2.1/admin/jobs/${job.jobId}/events`,
+          cancel: `/api/fractal/v2.1/admin/jobs/${job.jobId}/cancel`,
+        },
+      });
+    } catch (err) {
+      const status = err instanceof AsyncJobError ? err.statusCode : 500;
+      return reply.code(status).send({ ok: false, error: err instanceof Error ? err.message : String(err) });
+    }
+  });
+}
@@ -18,6 +18,7 @@
 import { snapshotWriterService } from '../lifecycle/snapshot.writer.service.js';
 import { outcomeResolverService } from '../lifecycle/outcome.resolver.service.js';
 import { forwardEquityService } from '../strategy/forward/forward.equity.service.js';
+import { seriesCache } from '../data/series.cache.js';
 
 // ═══════════════════════════════════════════════════════════════
 // TYPES
@@ -139,6 +140,9 @@ export class FractalDailyJobService {
     
     jobHistory.push(context);
     
+    // Snapshots must see today's canonical candle, not a cached series
+    seriesCache.markStale(symbol);
+    
     // Keep only last 30 runs
     if (jobHistory.length > 30) {
       jobHistory.shift();
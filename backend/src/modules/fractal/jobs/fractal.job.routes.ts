@@ -5,10 +5,18 @@
  * - POST /api/fractal/v2.1/admin/jobs/daily-run - Run daily job manually
  * - GET /api/fractal/v2.1/admin/jobs/status - Get last run status
  * - GET /api/fractal/v2.1/admin/jobs/history - Get job history
+ *
+ * BLOCK 56.7 — Async jobs (long sim / optimize runs):
+ * - POST /api/fractal/v2.1/admin/jobs - Submit { route, body } as a job
+ * - GET /api/fractal/v2.1/admin/jobs/list - Recent jobs
+ * - GET /api/fractal/v2.1/admin/jobs/:jobId - Job state (+ result when done)
+ * - GET /api/fractal/v2.1/admin/jobs/:jobId/events - SSE progress stream
+ * - POST /api/fractal/v2.1/admin/jobs/:jobId/cancel - Cancel job
  */
 
 import { FastifyInstance, FastifyRequest } from 'fastify';
 import { fractalDailyJobService } from './fractal.daily.job.js';
+import { fractalAsyncJobService, isTerminal, AsyncJob, AsyncJobError } from './fractal.async.job.js';
 
 export async function fractalJobRoutes(fastify: FastifyInstance): Promise<void> {
   
@@ -122,4 +130,173 @@ export async function fractalJobRoutes(fastify: FastifyInstance): Promise<void>
       }))
     };
   });
+
+  /**
+   * POST /api/fractal/v2.1/admin/jobs
+   *
+   * Run a long admin endpoint as a background job
+   * (same as POST <route>?async=1)
+   *
+   * Body:
+   *   route: string (e.g. /api/fractal/admin/sim/risk-sweep)
+   *   body?: object (request body for that route)
+   */
+  fastify.post('/api/fractal/v2.1/admin/jobs', async (
+    request: FastifyRequest<{
+      Body: { route?: string; body?: unknown }
+    }>,
+    reply
+  ) => {
+    const route = request.body?.route;
+    if (!route) {
+      return reply.code(400).send({ ok: false, error: 'route is required' });
+    }
+
+    try {
+      const job = fractalAsyncJobService.submit(route, request.body?.body ?? {});
+      return reply.code(202).send({ ok: true, jobId: job.jobId, status: job.status });
+    } catch (err: any) {
+      return reply.code(err instanceof AsyncJobError ? err.statusCode : 500).send({ ok: false, error: err.message });
+    }
+  });
+
+  /**
+   * GET /api/fractal/v2.1/admin/jobs/list
+   *
+   * Query:
+   *   limit?: number (default: 20, max: 100)
+   */
+  fastify.get('/api/fractal/v2.1/admin/jobs/list', async (
+    request: FastifyRequest<{
+      Querystring: { limit?: string }
+    }>
+  ) => {
+    const limit = Math.min(100, parseInt(request.query.limit ?? '20', 10));
+    const jobs = await fractalAsyncJobService.list(limit);
+
+    return {
+      ok: true,
+      queue: fractalAsyncJobService.stats(),
+      count: jobs.length,
+      jobs: jobs.map(jobSummary)
+    };
+  });
+
+  /**
+   * GET /api/fractal/v2.1/admin/jobs/:jobId
+   *
+   * Query:
+   *   partial?: '1' to include partial results
+   */
+  fastify.get('/api/fractal/v2.1/admin/jobs/:jobId', async (
+    request: FastifyRequest<{
+      Params: { jobId: string };
+      Querystring: { partial?: string }
+    }>,
+    reply
+  ) => {
+    const job = await fractalAsyncJobService.get(request.params.jobId);
+    if (!job) {
+      return reply.code(404).send({ ok: false, error: 'Job not found' });
+    }
+
+    return {
+      ok: true,
+      ...jobSummary(job),
+      partial: request.query.partial === '1' ? job.partial : undefined,
+      result: job.result ?? null,
+      resultTruncated: job.resultTruncated ?? false
+    };
+  });
+
+  /**
+   * GET /api/fractal/v2.1/admin/jobs/:jobId/events
+   *
+   * Server-Sent Events: snapshot, then progress / partial / status events
+   * until the job finishes
+   */
+  fastify.get('/api/fractal/v2.1/admin/jobs/:jobId/events', async (
+    request: FastifyRequest<{
+      Params: { jobId: string }
+    }>,
+    reply
+  ) => {
+    const job = await fractalAsyncJobService.get(request.params.jobId);
+    if (!job) {
+      return reply.code(404).send({ ok: false, error: 'Job not found' });
+    }
+
+    reply.hijack();
+    const res = reply.raw;
+    res.writeHead(200, {
+      'Content-Type': 'text/event-stream',
+      'Cache-Control': 'no-cache',
+      'Connection': 'keep-alive',
+      'X-Accel-Buffering': 'no'
+    });
+
+    const send = (event: string, data: unknown) => {
+      res.write(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`);
+    };
+
+    send('snapshot', jobSummary(job));
+    if (isTerminal(job.status)) {
+      send('done', jobSummary(job));
+      res.end();
+      return;
+    }
+
+    let sentPartial = job.partial.length;
+    const heartbeat = setInterval(() => res.write(': ping\n\n'), 15000);
+    const close = () => {
+      clearInterval(heartbeat);
+      unsubscribe();
+    };
+
+    const unsubscribe = fractalAsyncJobService.subscribe(job.jobId, (event, current) => {
+      if (event === 'progress') {
+        send('progress', current.progress);
+      } else if (event === 'partial') {
+        // Partial list is capped; stream only what was kept
+        while (sentPartial < current.partial.length) send('partial', current.partial[sentPartial++]);
+      } else if (isTerminal(current.status)) {
+        send('done', jobSummary(current));
+        close();
+        res.end();
+      } else {
+        send('status', { status: current.status });
+      }
+    });
+
+    request.raw.on('close', close);
+  });
+
+  /**
+   * POST /api/fractal/v2.1/admin/jobs/:jobId/cancel
+   */
+  fastify.post('/api/fractal/v2.1/admin/jobs/:jobId/cancel', async (
+    request: FastifyRequest<{
+      Params: { jobId: string }
+    }>
+  ) => {
+    const cancelled = fractalAsyncJobService.cancel(request.params.jobId);
+    if (!cancelled) {
+      return { ok: false, error: 'Job not found or already finished' };
+    }
+    return { ok: true, jobId: request.params.jobId, status: 'CANCELLED' };
+  });
+}
+
+function jobSummary(job: AsyncJob) {
+  return {
+    jobId: job.jobId,
+    route: job.route,
+    status: job.status,
+    progress: job.progress,
+    partialCount: job.partial?.length ?? 0,
+    error: job.error ?? null,
+    createdAt: job.createdAt,
+    startedAt: job.startedAt ?? null,
+    finishedAt: job.finishedAt ?? null
+  };
 }
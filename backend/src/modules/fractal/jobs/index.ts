@@ -10,4 +10,15 @@ export {
   type DailyJobResult
 } from './fractal.daily.job.js';
 
+export {
+  fractalAsyncJobService,
+  FractalAsyncJobService,
+  registerAsyncJobHook,
+  currentAsyncJob,
+  AsyncJobError,
+  type AsyncJob,
+  type AsyncJobStatus,
+  type AsyncJobHandle
+} from './fractal.async.job.js';
+
 export { fractalJobRoutes } from './fractal.job.routes.js';
@@ -0,0 +1,44 @@
+/**
+ * Outcome Resolver Tests
+ *
+ * ClosePriceIndex must pick the same close as the per-date
+ * getClosePrice() queries it replaces in batched resolution.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { ClosePriceIndex, OutcomeResolverService } from '../outcome.resolver.service.js';
+
+const DAY = 24 * 60 * 60 * 1000;
+
+function candlesWithGaps() {
+  const candles: { ts: Date; ohlcv: { c: number } }[] = [];
+  const start = Date.UTC(2025, 0, 1);
+  for (let d = 0; d < 60; d++) {
+    if (d % 7 === 3 || d === 20 || d === 21 || d === 22 || d === 23 || d === 24) continue;  // missing days
+    // Mostly midnight candles, some intraday timestamps
+    const offset = d % 5 === 0 ? 13 * 60 * 60 * 1000 : 0;
+    candles.push({ ts: new Date(start + d * DAY + offset), ohlcv: { c: 100 + d } });
+  }
+  return candles;
+}
+
+describe('ClosePriceIndex', () => {
+  it('should match getClosePrice for exact, nearby and missing dates', async () => {
+    const candles = candlesWithGaps();
+    const service = new OutcomeResolverService();
+    (service as any).canonicalStore = {
+      getRange: async (_s: string, _tf: string, from: Date, to: Date) =>
+        candles.filter(c => c.ts >= from && c.ts <= to),
+    };
+
+    const index = new ClosePriceIndex(candles.map(c => ({ ts: c.ts, close: c.ohlcv.c })));
+    for (let h = -72; h < 64 * 24; h += 5) {
+      const date = new Date(Date.UTC(2025, 0, 1) + h * 60 * 60 * 1000);
+      expect(index.closeAt(date)).toBe(await service.getClosePrice('BTC', date));
+    }
+  });
+
+  it('should return null without candles', () => {
+    expect(new ClosePriceIndex([]).closeAt(new Date())).toBeNull();
+  });
+});
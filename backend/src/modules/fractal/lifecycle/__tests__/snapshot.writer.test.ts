@@ -0,0 +1,95 @@
+/**
+ * Snapshot Writer Tests
+ *
+ * Write once per day: a second run for the same asofDate skips the presets
+ * already written and never inserts a snapshot twice.
+ */
+
+import { describe, it, expect, beforeEach } from 'vitest';
+import { SnapshotWriterService } from '../snapshot.writer.service.js';
+import { SignalSnapshotModel } from '../../storage/signal-snapshot.schema.js';
+
+// In-memory collection behind the model calls the writer makes
+let stored: any[] = [];
+let insertCalls = 0;
+const model = SignalSnapshotModel as any;
+model.distinct = async (field: string, filter: any) => {
+  const rows = stored.filter(d => d.symbol === filter.symbol && d.asOf.getTime() === filter.asOf.getTime());
+  return [...new Set(rows.map(d => field.split('.').reduce((v: any, k) => v?.[k], d)))];
+};
+model.insertMany = async (docs: any[]) => {
+  insertCalls++;
+  stored.push(...docs);
+  return docs;
+};
+
+function makeWriter() {
+  const writer = new SnapshotWriterService();
+  let signalCalls = 0;
+  writer.fetchSignal = async () => {
+    signalCalls++;
+    return {
+      version: 'v2.1-test',
+      action: 'LONG',
+      confidence: 0.4,
+      reliability: 0.8,
+      entropy: 0.3,
+      expectedReturn: 0.05,
+      tailRiskP95dd: 0.2,
+      regime: 'MARKUP',
+      sizeMultiplier: 0.5,
+      dominantHorizon: '14d',
+    };
+  };
+  return { writer, signalCalls: () => signalCalls };
+}
+
+const keyOf = (d: any) => `${d.asOf.toISOString()}|${d.strategy.preset}|${d.modelType}`;
+
+describe('SnapshotWriterService', () => {
+  beforeEach(() => {
+    stored = [];
+    insertCalls = 0;
+  });
+
+  it('should skip every preset on a second run for the same day', async () => {
+    const { writer, signalCalls } = makeWriter();
+
+    const first = await writer.writeBtcSnapshots('2026-03-01');
+    expect(first.written).toBe(3);
+    expect(first.skipped).toBe(0);
+    expect(stored.length).toBe(6);   // ACTIVE + SHADOW per preset
+
+    const second = await writer.writeBtcSnapshots('2026-03-01');
+    expect(second.written).toBe(0);
+    expect(second.skipped).toBe(3);
+    expect(second.items.every(i => i.status === 'skipped' && i.reason === 'already_exists')).toBe(true);
+
+    expect(stored.length).toBe(6);
+    expect(new Set(stored.map(keyOf)).size).toBe(6);
+    expect(insertCalls).toBe(1);
+    expect(signalCalls()).toBe(1);   // nothing pending → no signal assembly
+  });
+
+  it('should write only the presets missing for the day', async () => {
+    const { writer } = makeWriter();
+    await writer.writeBtcSnapshots('2026-03-01');
+    stored = stored.filter(d => d.strategy.preset !== 'BALANCED');
+
+    const rerun = await writer.writeBtcSnapshots('2026-03-01');
+    expect(rerun.items.map(i => `${i.preset}:${i.status}`))
+      .toEqual(['Conservative:skipped', 'Balanced:written', 'Aggressive:skipped']);
+    expect(stored.length).toBe(6);
+    expect(new Set(stored.map(keyOf)).size).toBe(6);
+  });
+
+  it('should write again for the next day', async () => {
+    const { writer } = makeWriter();
+    await writer.writeBtcSnapshots('2026-03-01');
+    const next = await writer.writeBtcSnapshots('2026-03-02');
+
+    expect(next.written).toBe(3);
+    expect(stored.length).toBe(12);
+    expect(new Set(stored.map(keyOf)).size).toBe(12);
+  });
+});
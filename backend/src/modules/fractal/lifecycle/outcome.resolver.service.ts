@@ -9,6 +9,10 @@
  * - Determine hit/miss
  * - Update calibration bins
  * 
+ * resolveSnapshots() is batched: closes for the whole date range are
+ * loaded once into a ClosePriceIndex, every snapshot is resolved in
+ * memory and all outcomes go out in one bulkWrite.
+ * 
  * Principles:
  * - Idempotent (skip already resolved)
  * - Forward only (no backfill)
@@ -18,6 +22,11 @@
 import { SignalSnapshotModel, type SignalSnapshotDocument } from '../storage/signal-snapshot.schema.js';
 import { CanonicalStore } from '../data/canonical.store.js';
 
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// Fallback window of getClosePrice() when the day has no candle
+const NEARBY_MS = 2 * DAY_MS;
+
 // ═══════════════════════════════════════════════════════════════
 // TYPES
 // ═══════════════════════════════════════════════════════════════
@@ -44,6 +53,15 @@ interface ResolveItem {
   reason?: string;
 }
 
+export interface ResolveTiming {
+  findMs: number;
+  loadPricesMs: number;
+  resolveMs: number;
+  writeMs: number;
+  totalMs: number;
+  candles: number;
+}
+
 export interface ResolveResult {
   symbol: string;
   horizon: HorizonDays;
@@ -51,6 +69,7 @@ export interface ResolveResult {
   skipped: number;
   noData: number;
   details: ResolveItem[];
+  timing?: ResolveTiming;
 }
 
 interface CalibrationBin {
@@ -60,6 +79,63 @@ interface CalibrationBin {
   winRate: number;
 }
 
+// ═══════════════════════════════════════════════════════════════
+// CLOSE PRICE INDEX
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * In-memory daily closes with the same lookup rule as getClosePrice():
+ * first candle of the UTC day, else the candle closest to the date
+ * within ±2 days (earliest on ties), else null.
+ */
+export class ClosePriceIndex {
+  private ts: Float64Array;
+  private close: Float64Array;
+
+  constructor(candles: { ts: Date; close: number }[]) {
+    this.ts = Float64Array.from(candles, c => c.ts.getTime());
+    this.close = Float64Array.from(candles, c => c.close);
+  }
+
+  get size(): number {
+    return this.ts.length;
+  }
+
+  closeAt(date: Date): number | null {
+    const t = date.getTime();
+    const startOfDay = new Date(date);
+    startOfDay.setUTCHours(0, 0, 0, 0);
+
+    const first = this.lowerBound(startOfDay.getTime());
+    if (first < this.ts.length && this.ts[first] <= startOfDay.getTime() + DAY_MS - 1) {
+      return this.close[first];
+    }
+
+    let best = -1;
+    let minDiff = Infinity;
+    for (let i = this.lowerBound(t - NEARBY_MS); i < this.ts.length && this.ts[i] <= t + NEARBY_MS; i++) {
+      const diff = Math.abs(this.ts[i] - t);
+      if (diff < minDiff) {
+        minDiff = diff;
+        best = i;
+      }
+    }
+    return best >= 0 ? this.close[best] : null;
+  }
+
+  // First position with ts >= t
+  private lowerBound(t: number): number {
+    let lo = 0;
+    let hi = this.ts.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (this.ts[mid] < t) lo = mid + 1;
+      else hi = mid;
+    }
+    return lo;
+  }
+}
+
 // ═══════════════════════════════════════════════════════════════
 // SERVICE
 // ═══════════════════════════════════════════════════════════════
@@ -115,6 +191,18 @@ export class OutcomeResolverService {
     }
   }
   
+  /**
+   * Load closes covering [from - 2d, to + 2d] in one query
+   */
+  async loadClosePrices(symbol: string, from: Date, to: Date): Promise<ClosePriceIndex> {
+    const candles = await this.canonicalStore.getRange(
+      symbol, '1d',
+      new Date(from.getTime() - NEARBY_MS),
+      new Date(to.getTime() + NEARBY_MS)
+    );
+    return new ClosePriceIndex(candles.map(c => ({ ts: c.ts, close: c.ohlcv.c })));
+  }
+  
   /**
    * Calculate forward date
    */
@@ -189,17 +277,46 @@ export class OutcomeResolverService {
     const closeAsof = await this.getClosePrice(snapshot.symbol, asofDate);
     const closeForward = await this.getClosePrice(snapshot.symbol, forwardDate);
     
+    const { item, outcome } = this.buildOutcome(snapshot, closeAsof, closeForward, new Date());
+    if (!outcome) return item;
+    
+    // Update snapshot
+    await SignalSnapshotModel.updateOne(
+      { _id: (snapshot as any)._id },
+      { $set: this.outcomeUpdate(horizon, outcome) }
+    );
+    
+    return item;
+  }
+  
+  /**
+   * Result item (and outcome to store, if prices exist) for one snapshot
+   */
+  buildOutcome(
+    snapshot: SignalSnapshotDocument,
+    closeAsof: number | null,
+    closeForward: number | null,
+    resolvedAt: Date
+  ): { item: ResolveItem; outcome: OutcomeData | null } {
+    const asofDate = new Date(snapshot.asOf);
+    const base = {
+      snapshotId: (snapshot as any)._id.toString(),
+      preset: snapshot.strategy.preset,
+      asofDate: asofDate.toISOString().slice(0, 10),
+      action: snapshot.action,
+      expectedReturn: snapshot.expectedReturn,
+    };
+    
     if (closeAsof === null || closeForward === null) {
       return {
-        snapshotId: (snapshot as any)._id.toString(),
-        preset: snapshot.strategy.preset,
-        asofDate: asofDate.toISOString().slice(0, 10),
-        action: snapshot.action,
-        expectedReturn: snapshot.expectedReturn,
-        realizedReturn: 0,
-        hit: false,
-        status: 'no_data',
-        reason: `Missing price data: asof=${closeAsof}, forward=${closeForward}`
+        item: {
+          ...base,
+          realizedReturn: 0,
+          hit: false,
+          status: 'no_data',
+          reason: `Missing price data: asof=${closeAsof}, forward=${closeForward}`
+        },
+        outcome: null
       };
     }
     
@@ -209,48 +326,32 @@ export class OutcomeResolverService {
     // Determine hit/miss
     const hit = this.determineHit(snapshot.action, realizedReturn);
     
-    // Build outcome data
-    const outcomeData: OutcomeData = {
-      realizedReturn,
-      hit,
-      resolvedAt: new Date(),
-      closeAsof,
-      closeForward
+    return {
+      item: { ...base, realizedReturn, hit, status: 'resolved' },
+      outcome: { realizedReturn, hit, resolvedAt, closeAsof, closeForward }
     };
-    
-    // Update snapshot
-    const horizonKey = `${horizon}d`;
-    await SignalSnapshotModel.updateOne(
-      { _id: (snapshot as any)._id },
-      {
-        $set: {
-          [`outcomes.${horizonKey}`]: outcomeData,
-          resolved: true
-        }
-      }
-    );
-    
+  }
+  
+  private outcomeUpdate(horizon: HorizonDays, outcome: OutcomeData): Record<string, unknown> {
     return {
-      snapshotId: (snapshot as any)._id.toString(),
-      preset: snapshot.strategy.preset,
-      asofDate: asofDate.toISOString().slice(0, 10),
-      action: snapshot.action,
-      expectedReturn: snapshot.expectedReturn,
-      realizedReturn,
-      hit,
-      status: 'resolved'
+      [`outcomes.${horizon}d`]: outcome,
+      resolved: true
     };
   }
   
   /**
    * Resolve all eligible snapshots for a symbol and horizon
    * Resolves both ACTIVE and SHADOW models
+   * 
+   * One price query for the whole date range, one bulkWrite for all
+   * outcomes (only for horizons still unresolved, so reruns stay no-ops).
    */
   async resolveSnapshots(
     symbol: string,
     horizon: HorizonDays
   ): Promise<ResolveResult> {
     console.log(`[OutcomeResolver] Resolving ${symbol} snapshots for ${horizon}d horizon`);
+    const t0 = Date.now();
     
     // Find ACTIVE snapshots
     const activeEligible = await this.findEligibleSnapshots(symbol, horizon, 'ACTIVE');
@@ -259,22 +360,70 @@ export class OutcomeResolverService {
     
     const allEligible = [...activeEligible, ...shadowEligible];
     console.log(`[OutcomeResolver] Found ${allEligible.length} eligible snapshots (${activeEligible.length} ACTIVE, ${shadowEligible.length} SHADOW)`);
+    const t1 = Date.now();
+    
+    // Load closes once for every asOf / forward date
+    let prices = new ClosePriceIndex([]);
+    if (allEligible.length > 0) {
+      let minTs = Infinity;
+      let maxTs = -Infinity;
+      for (const snapshot of allEligible) {
+        const asofTs = new Date(snapshot.asOf).getTime();
+        const forwardTs = this.getForwardDate(new Date(asofTs), horizon).getTime();
+        minTs = Math.min(minTs, asofTs);
+        maxTs = Math.max(maxTs, forwardTs);
+      }
+      prices = await this.loadClosePrices(symbol, new Date(minTs), new Date(maxTs));
+    }
+    const t2 = Date.now();
     
     const details: ResolveItem[] = [];
+    const ops: any[] = [];
+    const resolvedAt = new Date();
     let resolved = 0;
     let skipped = 0;
     let noData = 0;
     
     for (const snapshot of allEligible) {
-      const item = await this.resolveSnapshot(snapshot, horizon);
+      const asofDate = new Date(snapshot.asOf);
+      const { item, outcome } = this.buildOutcome(
+        snapshot,
+        prices.closeAt(asofDate),
+        prices.closeAt(this.getForwardDate(asofDate, horizon)),
+        resolvedAt
+      );
       details.push(item);
       
+      if (outcome) {
+        ops.push({
+          updateOne: {
+            filter: { _id: (snapshot as any)._id, [`outcomes.${horizon}d.resolvedAt`]: null },
+            update: { $set: this.outcomeUpdate(horizon, outcome) }
+          }
+        });
+      }
+      
       if (item.status === 'resolved') resolved++;
       else if (item.status === 'skipped') skipped++;
       else if (item.status === 'no_data') noData++;
     }
+    const t3 = Date.now();
+    
+    if (ops.length > 0) {
+      await SignalSnapshotModel.bulkWrite(ops, { ordered: false });
+    }
+    const t4 = Date.now();
+    
+    const timing: ResolveTiming = {
+      findMs: t1 - t0,
+      loadPricesMs: t2 - t1,
+      resolveMs: t3 - t2,
+      writeMs: t4 - t3,
+      totalMs: t4 - t0,
+      candles: prices.size
+    };
     
-    console.log(`[OutcomeResolver] Done: resolved=${resolved}, skipped=${skipped}, noData=${noData}`);
+    console.log(`[OutcomeResolver] Done: resolved=${resolved}, skipped=${skipped}, noData=${noData} (${timing.totalMs}ms: find ${timing.findMs}, prices ${timing.loadPricesMs}, resolve ${timing.resolveMs}, write ${timing.writeMs})`);
     
     return {
       symbol,
@@ -282,7 +431,8 @@ export class OutcomeResolverService {
       resolved,
       skipped,
       noData,
-      details
+      details,
+      timing
     };
   }
   
@@ -7,10 +7,18 @@
  * - Idempotent (skip if exists)
  * - Forward only (no backfill)
  * - Per-preset snapshots (Conservative, Balanced, Aggressive)
+ * 
+ * The signal is assembled in-process (FractalSignalService) once per run;
+ * every preset's ACTIVE / SHADOW snapshot derives from it and all new
+ * snapshots are written with one insertMany.
  */
 
 import { SignalSnapshotModel, type SignalSnapshotDocument } from '../storage/signal-snapshot.schema.js';
 import { CanonicalStore } from '../data/canonical.store.js';
+import {
+  fractalSignalService,
+  type FractalSignalResponse,
+} from '../engine/fractal.signal.service.js';
 
 // ═══════════════════════════════════════════════════════════════
 // TYPES
@@ -92,62 +100,55 @@ export class SnapshotWriterService {
   }
   
   /**
-   * Fetch signal from Fractal API
+   * Assemble the signal in-process (default signal on failure)
    */
-  async fetchSignal(symbol: string, preset: PresetKey): Promise<SignalData> {
+  async fetchSignal(symbol: string): Promise<SignalData> {
     try {
-      const signalUrl = `http://localhost:8002/api/fractal/v2.1/signal?symbol=${symbol}`;
-      const response = await fetch(signalUrl);
-      
-      if (!response.ok) {
-        console.warn(`[SnapshotWriter] Signal fetch failed: ${response.status}`);
-        return this.getDefaultSignal();
-      }
-      
-      const data = await response.json();
-      
-      // Extract signal data
-      const assembled = data.assembled || {};
-      const risk = data.risk || {};
-      const meta = data.meta || {};
-      
-      // Determine action from dominant horizon
-      let action: 'LONG' | 'SHORT' | 'HOLD' = 'HOLD';
-      const expectedReturn = assembled.expectedReturn ?? 0;
-      if (expectedReturn > 0.02) action = 'LONG';
-      else if (expectedReturn < -0.02) action = 'SHORT';
-      
-      // Determine dominant horizon
-      let dominantHorizon: '7d' | '14d' | '30d' = '30d';
-      const horizons = data.signalsByHorizon || {};
-      let maxConf = 0;
-      for (const [h, sig] of Object.entries(horizons) as [string, any][]) {
-        if (sig?.confidence > maxConf) {
-          maxConf = sig.confidence;
-          dominantHorizon = h as '7d' | '14d' | '30d';
-        }
-      }
-      
-      return {
-        version: ACTIVE_VERSION,
-        action,
-        confidence: assembled.confidence ?? 0.01,
-        reliability: data.reliability?.score ?? 0.70,
-        entropy: assembled.entropy ?? 0.90,
-        expectedReturn: assembled.expectedReturn ?? 0,
-        tailRiskP95dd: risk.mcP95_DD ?? 0.50,
-        regime: meta.phase ?? 'UNKNOWN',
-        sizeMultiplier: assembled.sizeMultiplier ?? 0.25,
-        dominantHorizon
-      };
+      return this.toSignalData(await fractalSignalService.getSignal(symbol));
     } catch (err) {
-      console.error(`[SnapshotWriter] Signal fetch error:`, err);
+      console.error(`[SnapshotWriter] Signal assembly error:`, err);
       return this.getDefaultSignal();
     }
   }
   
   /**
-   * Get default signal when API fails
+   * Snapshot fields from the v2.1 signal contract
+   */
+  toSignalData(data: FractalSignalResponse): SignalData {
+    const assembled = data.assembled;
+    
+    // Determine action from dominant horizon
+    let action: 'LONG' | 'SHORT' | 'HOLD' = 'HOLD';
+    const expectedReturn = assembled.expectedReturn ?? 0;
+    if (expectedReturn > 0.02) action = 'LONG';
+    else if (expectedReturn < -0.02) action = 'SHORT';
+    
+    // Determine dominant horizon
+    let dominantHorizon: '7d' | '14d' | '30d' = '30d';
+    let maxConf = 0;
+    for (const [h, sig] of Object.entries(data.signalsByHorizon)) {
+      if (sig?.confidence > maxConf) {
+        maxConf = sig.confidence;
+        dominantHorizon = h as '7d' | '14d' | '30d';
+      }
+    }
+    
+    return {
+      version: ACTIVE_VERSION,
+      action,
+      confidence: assembled.confidence ?? 0.01,
+      reliability: data.reliability?.score ?? 0.70,
+      entropy: assembled.entropy ?? 0.90,
+      expectedReturn: assembled.expectedReturn ?? 0,
+      tailRiskP95dd: data.risk?.mcP95_DD ?? 0.50,
+      regime: data.meta?.phase ?? 'UNKNOWN',
+      sizeMultiplier: assembled.sizeMultiplier ?? 0.25,
+      dominantHorizon
+    };
+  }
+  
+  /**
+   * Get default signal when assembly fails
    */
   private getDefaultSignal(): SignalData {
     return {
@@ -208,6 +209,26 @@ export class SnapshotWriterService {
       };
     }
     
+    for (const doc of this.buildPresetDocs(asofDate, symbol, preset, active, shadow)) {
+      await SignalSnapshotModel.create(doc);
+    }
+    
+    return {
+      preset,
+      status: 'written'
+    };
+  }
+  
+  /**
+   * ACTIVE + SHADOW snapshot documents for one preset
+   */
+  buildPresetDocs(
+    asofDate: string,
+    symbol: string,
+    preset: PresetKey,
+    active: SignalData,
+    shadow: SignalData
+  ): Partial<SignalSnapshotDocument>[] {
     // Create snapshot document
     const doc: Partial<SignalSnapshotDocument> = {
       symbol,
@@ -256,9 +277,7 @@ export class SnapshotWriterService {
       createdAt: new Date()
     };
     
-    await SignalSnapshotModel.create(doc);
-    
-    // Also write shadow version
+    // Shadow version
     const shadowDoc: Partial<SignalSnapshotDocument> = {
       ...doc,
       version: shadow.version,
@@ -270,12 +289,7 @@ export class SnapshotWriterService {
       expectedReturn: shadow.expectedReturn
     };
     
-    await SignalSnapshotModel.create(shadowDoc);
-    
-    return {
-      preset,
-      status: 'written'
-    };
+    return [doc, shadowDoc];
   }
   
   /**
@@ -288,24 +302,41 @@ export class SnapshotWriterService {
     const asofDate = asofDateOverride || await this.getLatestAsofDate(symbol);
     
     console.log(`[SnapshotWriter] Writing BTC snapshots for ${asofDate}`);
+    const t0 = Date.now();
+    
+    // Idempotency: presets already written for this date
+    const existing = new Set<string>(await SignalSnapshotModel.distinct('strategy.preset', {
+      symbol,
+      asOf: new Date(asofDate)
+    }));
     
     const items: SnapshotWriteItem[] = [];
+    const docs: Partial<SignalSnapshotDocument>[] = [];
     let written = 0;
     let skipped = 0;
     
+    const pending = PRESETS.filter(p => !existing.has(p.toUpperCase()));
+    
+    // One signal for the run (same for all presets, but strategy differs)
+    const active = pending.length > 0 ? await this.fetchSignal(symbol) : null;
+    const shadow = active ? this.generateShadowSignal(active) : null;
+    
     for (const preset of PRESETS) {
-      // Fetch signal (same for all presets, but strategy differs)
-      const active = await this.fetchSignal(symbol, preset);
-      const shadow = this.generateShadowSignal(active);
-      
-      const item = await this.writePresetSnapshot(asofDate, symbol, preset, active, shadow);
-      items.push(item);
-      
-      if (item.status === 'written') written++;
-      else skipped++;
+      if (!active || !shadow || existing.has(preset.toUpperCase())) {
+        items.push({ preset, status: 'skipped', reason: 'already_exists' });
+        skipped++;
+        continue;
+      }
+      docs.push(...this.buildPresetDocs(asofDate, symbol, preset, active, shadow));
+      items.push({ preset, status: 'written' });
+      written++;
+    }
+    
+    if (docs.length > 0) {
+      await SignalSnapshotModel.insertMany(docs);
     }
     
-    console.log(`[SnapshotWriter] Done: written=${written}, skipped=${skipped}`);
+    console.log(`[SnapshotWriter] Done: written=${written}, skipped=${skipped} (${Date.now() - t0}ms)`);
     
     return {
       asofDate,
@@ -25,6 +25,7 @@ import { forwardEquityRoutes } from '../strategy/forward/forward.routes.js';
 import { snapshotWriterRoutes } from '../lifecycle/snapshot.writer.routes.js';
 import { outcomeResolverRoutes } from '../lifecycle/outcome.resolver.routes.js';
 import { fractalJobRoutes } from '../jobs/fractal.job.routes.js';
+import { registerAsyncJobHook } from '../jobs/fractal.async.job.js';
 import { shadowDivergenceRoutes } from '../admin/shadow_divergence.routes.js';
 import { registerOpsRoutes } from '../ops/ops.routes.js';
 import { registerHardenedOpsRoutes } from '../ops/ops.hardened.routes.js';
@@ -88,6 +89,10 @@ export async function registerFractalModule(fastify: FastifyInstance, deps?: Par
     return;
   }
 
+  // BLOCK 56.7: POST <long admin route>?async=1 → background job
+  // (hook added before the route plugins so they inherit it)
+  registerAsyncJobHook(fastify);
+
   // Register main routes
   await fastify.register(fractalRoutes);
 
@@ -167,6 +172,7 @@ export async function registerFractalModule(fastify: FastifyInstance, deps?: Par
   console.log('[Fractal] BLOCK 56.3: Outcome Resolver registered');
   console.log('[Fractal] BLOCK 56.4: Forward Equity registered');
   console.log('[Fractal] BLOCK 56.6: Daily Job Scheduler registered');
+  console.log('[Fractal] BLOCK 56.7: Async Jobs (queue + SSE progress) registered');
   console.log('[Fractal] BLOCK 57: Shadow Divergence registered');
   console.log('[Fractal] OPS: Telegram + Cron routes registered');
   console.log('[Fractal] BLOCK E: Hardened OPS (rate limit, retry, idempotency) registered');
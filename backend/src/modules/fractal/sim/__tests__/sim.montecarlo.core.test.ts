@@ -0,0 +1,98 @@
+/**
+ * Monte Carlo Core Tests
+ *
+ * Selection-based quantiles vs sorted percentiles, index draws and the
+ * fused path pass.
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+  makeRng,
+  drawPermutation,
+  drawBlockShuffle,
+  drawStationaryBootstrap,
+  computePathStats,
+  createPathStats,
+  quantiles,
+  summarize,
+} from '../sim.montecarlo.core.js';
+
+function sortedPercentile(sorted: number[], p: number): number {
+  const idx = (sorted.length - 1) * p;
+  const lo = Math.floor(idx);
+  const hi = Math.ceil(idx);
+  return sorted[lo] * (1 - (idx - lo)) + sorted[hi] * (idx - lo);
+}
+
+describe('MC core quantiles', () => {
+  it('should match sorted percentiles, including ties', () => {
+    const rnd = makeRng(7);
+    for (const n of [1, 2, 3, 10, 101, 3000]) {
+      const xs = Array.from({ length: n }, () => Math.round(rnd() * 50) / 10);
+      const sorted = xs.slice().sort((a, b) => a - b);
+      const ps = [0, 0.05, 0.5, 0.95, 1];
+
+      expect(quantiles(Float64Array.from(xs), n, ps)).toEqual(ps.map(p => sortedPercentile(sorted, p)));
+    }
+  });
+
+  it('should ignore NaN values', () => {
+    const rnd = makeRng(3);
+    const xs = Array.from({ length: 200 }, () => rnd() * 10);
+    const withNaN = xs.flatMap((x, i) => (i % 7 === 0 ? [NaN, x] : [x]));
+    const sorted = xs.slice().sort((a, b) => a - b);
+    const ps = [0, 0.05, 0.5, 0.95, 1];
+
+    expect(quantiles(Float64Array.from(withNaN), withNaN.length, ps)).toEqual(ps.map(p => sortedPercentile(sorted, p)));
+    expect(summarize(Float64Array.from([NaN, 5, 1, NaN, 3, 2, 4]), 7, 4))
+      .toEqual({ p05: 1.2, p50: 3, p95: 4.8, min: 1, max: 5, mean: 3 });
+
+    const allNaN = quantiles(Float64Array.from([NaN, NaN]), 2, [0.5]);
+    expect(allNaN[0]).toBeNaN();
+  });
+
+  it('should summarize min / max / mean with rounding', () => {
+    const s = summarize(Float64Array.from([5, 1, 3, 2, 4.00004]), 5, 4);
+    expect(s).toEqual({ p05: 1.2, p50: 3, p95: 4.8, min: 1, max: 5, mean: 3 });
+  });
+});
+
+describe('MC core draws', () => {
+  it('should draw permutations and block shuffles covering every index once', () => {
+    const rnd = makeRng(1);
+    const idx = new Int32Array(10);
+    drawPermutation(idx, 10, rnd);
+    expect(Array.from(idx).sort((a, b) => a - b)).toEqual([0, 1, 2, 3, 4, 5, 6, 7, 8, 9]);
+
+    drawBlockShuffle(idx, 10, 3, rnd, new Int32Array(4));
+    expect(Array.from(idx).sort((a, b) => a - b)).toEqual([0, 1, 2, 3, 4, 5, 6, 7, 8, 9]);
+    // Blocks stay contiguous
+    const pos = Array.from(idx).indexOf(0);
+    expect(Array.from(idx.slice(pos, pos + 3))).toEqual([0, 1, 2]);
+  });
+
+  it('should draw stationary bootstrap indices in range and be seed-deterministic', () => {
+    const a = new Int32Array(50);
+    const b = new Int32Array(50);
+    drawStationaryBootstrap(a, 50, 5, makeRng(3));
+    drawStationaryBootstrap(b, 50, 5, makeRng(3));
+
+    expect(Array.from(a)).toEqual(Array.from(b));
+    expect(Array.from(a).every(i => i >= 0 && i < 50)).toBe(true);
+  });
+});
+
+describe('MC core path stats', () => {
+  it('should compute equity, drawdown and return moments in one pass', () => {
+    const returns = Float64Array.from([0.1, -0.2, 0.05, 0.3]);
+    const idx = Int32Array.from([0, 1, 2, 3]);
+    const s = computePathStats(returns, idx, 4, 1, createPathStats());
+
+    expect(s.finalEquity).toBeCloseTo(1.1 * 0.8 * 1.05 * 1.3, 12);
+    expect(s.maxDD).toBeCloseTo(0.2, 12);
+    expect(s.meanReturn).toBeCloseTo(0.0625, 12);
+    const m = 0.0625;
+    const sd = Math.sqrt(Array.from(returns).reduce((acc, r) => acc + (r - m) ** 2, 0) / 3);
+    expect(s.sdReturn).toBeCloseTo(sd, 12);
+  });
+});
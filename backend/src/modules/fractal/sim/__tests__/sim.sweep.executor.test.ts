@@ -0,0 +1,98 @@
+/**
+ * Sweep Executor Tests
+ *
+ * In-process path (maxConcurrency 1) with a stubbed runner: outcome order,
+ * streaming and the serial "first N successful runs" semantics.
+ * Signal grid points: test window slicing and results equal to a direct run.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { SimSweepExecutor } from '../sim.sweep.executor.js';
+import { buildPriceTimeline } from '../sim.timeline.js';
+import { runSignalSim, windowRange, SignalSimTask } from '../sim.signal-sweep.core.js';
+import { randomWalk } from '../../../../common/__tests__/seeded.fixtures.js';
+
+function makeExecutor(failAt: Set<number>) {
+  const ex = new SimSweepExecutor();
+  (ex as any).runner = {
+    loadInputs: async () => ({ timeline: null, baseSettings: null }),
+    run: async (config: any) => {
+      if (failAt.has(config.n)) throw new Error(`fail ${config.n}`);
+      return { ok: true, n: config.n };
+    },
+  };
+  return ex;
+}
+
+const DAY_MS = 86400000;
+
+function makeTimeline(n: number, seed: number) {
+  const start = Date.UTC(2018, 0, 1);
+  const closes = randomWalk(n, seed, { start: 10000, vol: 0.08, drift: i => 0.02 * Math.sin(i / 45) });
+  const ts = closes.map((_, i) => new Date(start + i * DAY_MS));
+  return buildPriceTimeline('BTC', ts, closes);
+}
+
+const configs = Array.from({ length: 8 }, (_, n) => ({ symbol: 'BTC', from: '', to: '', n })) as any[];
+
+describe('SimSweepExecutor', () => {
+  it('should return outcomes aligned with configs and stream each one', async () => {
+    const streamed: number[] = [];
+    const outcomes = await makeExecutor(new Set([2])).runAll(configs, {
+      maxConcurrency: 1,
+      onResult: (i) => streamed.push(i),
+    });
+
+    expect(outcomes.map(o => o.ok)).toEqual([true, true, false, true, true, true, true, true]);
+    expect((outcomes[5] as any).result.n).toBe(5);
+    expect(streamed.sort((a, b) => a - b)).toEqual([0, 1, 2, 3, 4, 5, 6, 7]);
+  });
+
+  it('should keep walking the grid until N runs succeed', async () => {
+    const done = await makeExecutor(new Set([1, 3])).runUntil(configs, 4, { maxConcurrency: 1 });
+
+    expect(done.map(d => d.index)).toEqual([0, 1, 2, 3, 4, 5]);
+    expect(done.filter(d => d.outcome.ok).length).toBe(4);
+  });
+
+  it('should reject configs for different symbols', async () => {
+    const mixed = [configs[0], { ...configs[1], symbol: 'ETH' }];
+    await expect(makeExecutor(new Set()).runAll(mixed, { maxConcurrency: 1 })).rejects.toThrow();
+  });
+
+  it('should run signal grid points in order, same as a direct run', async () => {
+    const timeline = makeTimeline(900, 5);
+    const ex = new SimSweepExecutor();
+    (ex as any).runner = { loadInputs: async () => ({ timeline, baseSettings: null }) };
+
+    const fromMs = timeline.tsMs[100];
+    const toMs = timeline.tsMs[850];
+    const grid: SignalSimTask[] = [];
+    for (const m of [0.01, 0.02, 0.03]) {
+      for (const s of [0.6, 0.75]) {
+        grid.push({ fromMs, toMs, signalConfig: { momentumThreshold: m, similarityThreshold: s, minMatches: 5 }, stepDays: 7 });
+      }
+    }
+    // Window too short for the 90-bar warm-up
+    grid.push({ ...grid[0], toMs: timeline.tsMs[130] });
+
+    const outcomes = await ex.runSignalGrid('BTC', grid, { maxConcurrency: 1 });
+
+    expect(outcomes.length).toBe(grid.length);
+    for (let i = 0; i < grid.length - 1; i++) {
+      expect(outcomes[i]).toEqual({ ok: true, result: runSignalSim(timeline, grid[i]) });
+    }
+    expect(outcomes[grid.length - 1]).toEqual({ ok: false, error: 'Insufficient price data' });
+    expect(outcomes.some(o => o.ok && o.result.tradesOpened > 0)).toBe(true);
+  });
+
+  it('should select the candles of the test window like ts $gte / $lte', () => {
+    const timeline = makeTimeline(50, 9);
+    const ts = Array.from(timeline.tsMs);
+    for (const [from, to] of [[ts[0], ts[49]], [ts[10] - 1, ts[20]], [ts[10] + 1, ts[20] + 1], [ts[49] + 1, ts[49] + DAY_MS]]) {
+      const { start, end } = windowRange(timeline, from, to);
+      const expected = ts.map((t, i) => (t >= from && t <= to ? i : -1)).filter(i => i >= 0);
+      expect(Array.from({ length: end - start }, (_, k) => start + k)).toEqual(expected);
+    }
+  });
+});
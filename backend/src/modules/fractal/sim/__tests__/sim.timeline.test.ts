@@ -0,0 +1,38 @@
+/**
+ * Sim Price Timeline Tests
+ *
+ * Lookups must match the old Mongo queries:
+ * findOne({ ts: { $lte: asOf } }).sort({ ts: -1 }) and the 90-bar lookback.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { buildPriceTimeline, indexAtOrBefore, closeAt, lookback } from '../sim.timeline.js';
+
+const DAY_MS = 86400000;
+const start = Date.UTC(2020, 0, 1);
+const ts = Array.from({ length: 200 }, (_, i) => new Date(start + i * DAY_MS));
+const closes = ts.map((_, i) => 100 + i);
+const timeline = buildPriceTimeline('BTC', ts, closes);
+
+describe('PriceTimeline', () => {
+  it('should find the last candle at or before asOf', () => {
+    expect(indexAtOrBefore(timeline, start - 1)).toBe(-1);
+    expect(indexAtOrBefore(timeline, start)).toBe(0);
+    expect(indexAtOrBefore(timeline, start + 10 * DAY_MS + 5)).toBe(10);
+    expect(indexAtOrBefore(timeline, start + 1000 * DAY_MS)).toBe(199);
+
+    expect(closeAt(timeline, start - 1)).toBeNull();
+    expect(closeAt(timeline, start + 50 * DAY_MS)).toBe(150);
+  });
+
+  it('should return the lookback as an oldest-first view', () => {
+    const view = lookback(timeline, start + 120 * DAY_MS, 90);
+    expect(view.length).toBe(90);
+    expect(view[0]).toBe(100 + 31);
+    expect(view[89]).toBe(100 + 120);
+    expect(view.buffer).toBe(timeline.closes.buffer);
+
+    expect(lookback(timeline, start + 10 * DAY_MS, 90).length).toBe(11);
+    expect(lookback(timeline, start - DAY_MS, 90).length).toBe(0);
+  });
+});
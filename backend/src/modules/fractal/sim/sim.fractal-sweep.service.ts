@@ -111,6 +111,12 @@ export class FractalSignalSweepService {
     console.log(`[FractalSweep] Starting sweep: ${totalConfigs} configurations`);
     console.log(`[FractalSweep] Test window: ${params.testWindow.from} → ${params.testWindow.to}`);
 
+    // Candles of the test window, shared by every config
+    const prices = await CanonicalOhlcvModel.find({
+      'meta.symbol': 'BTC',
+      ts: { $gte: new Date(params.testWindow.from), $lte: new Date(params.testWindow.to) }
+    }).sort({ ts: 1 }).lean() as any[];
+
     const results: FractalSweepResult[] = [];
     let processed = 0;
 
@@ -123,7 +129,7 @@ export class FractalSignalSweepService {
 
             try {
               const simResult = await this.runSimWithFractalSignal({
-                testWindow: params.testWindow,
+                prices,
                 config: { windowLen, minSimilarity, minMatches, neutralBand, horizonDays },
                 stepDays
               });
@@ -208,7 +214,7 @@ export class FractalSignalSweepService {
    * Run simulation with fractal signal
    */
   private async runSimWithFractalSignal(params: {
-    testWindow: { from: string; to: string };
+    prices: any[];
     config: FractalSweepConfig;
     stepDays: number;
   }): Promise<{
@@ -221,16 +227,7 @@ export class FractalSignalSweepService {
     avgHoldDays: number;
     avgMatchCount: number;
   }> {
-    const { testWindow, config, stepDays } = params;
-
-    const from = new Date(testWindow.from);
-    const to = new Date(testWindow.to);
-
-    // Get all prices
-    const prices = await CanonicalOhlcvModel.find({
-      'meta.symbol': 'BTC',
-      ts: { $gte: from, $lte: to }
-    }).sort({ ts: 1 }).lean() as any[];
+    const { prices, config, stepDays } = params;
 
     if (prices.length < config.windowLen + config.horizonDays + 10) {
       throw new Error('Insufficient price data');
@@ -5,6 +5,7 @@
 
 import { FractalSimulationRunner, SimConfig } from './sim.runner.js';
 import { GateConfig, formatGateConfig } from './sim.confidence-gate.js';
+import { simSweepExecutor } from './sim.sweep.executor.js';
 
 export interface GateSweepRow {
   minEnter: number;
@@ -75,6 +76,7 @@ export class GateSweepService {
     softGate?: boolean;
     maxRuns?: number;
     mode?: 'AUTOPILOT' | 'FROZEN';
+    maxConcurrency?: number;
   }): Promise<GateSweepResult> {
     const startTime = Date.now();
     const maxRuns = params.maxRuns ?? 50;
@@ -106,6 +108,7 @@ export class GateSweepService {
     // Grid sweep
     console.log(`[GateSweep] Starting grid: ${params.enter.length}×${params.full.length}×${params.flip.length} = ${params.enter.length * params.full.length * params.flip.length} combinations`);
 
+    const points: Array<{ minEnter: number; minFull: number; minFlip: number; config: SimConfig }> = [];
     for (const minEnter of params.enter) {
       for (const minFull of params.full) {
         // Sanity: minFull should be > minEnter
@@ -115,8 +118,6 @@ export class GateSweepService {
           // Sanity: minFlip should be >= minEnter
           if (minFlip < minEnter) continue;
 
-          if (runs >= maxRuns) break;
-
           const gateConfig: GateConfig = {
             enabled: true,
             minEnterConfidence: minEnter,
@@ -125,10 +126,11 @@ export class GateSweepService {
             softGate
           };
 
-          console.log(`[GateSweep] Run ${runs + 1}/${maxRuns}: ${formatGateConfig(gateConfig)}`);
-
-          try {
-            const result = await this.sim.run({
+          points.push({
+            minEnter,
+            minFull,
+            minFlip,
+            config: {
               symbol: params.symbol,
               from: params.from,
               to: params.to,
@@ -136,54 +138,67 @@ export class GateSweepService {
               mode: params.mode ?? 'AUTOPILOT',
               experiment: 'E0',
               gateConfig
-            });
+            }
+          });
+        }
+      }
+    }
+
+    // Grid points run in parallel; outcomes come back in grid order
+    const done = await simSweepExecutor.runUntil(points.map(p => p.config), maxRuns, {
+      maxConcurrency: params.maxConcurrency,
+      onResult: (i) => {
+        console.log(`[GateSweep] Done ${i + 1}/${points.length}: ${formatGateConfig(points[i].config.gateConfig!)}`);
+      }
+    });
+
+    for (const { index, outcome } of done) {
+      const { minEnter, minFull, minFlip } = points[index];
+      if (!outcome.ok) {
+        console.error(`[GateSweep] Error:`, outcome.error);
+        continue;
+      }
+      const result = outcome.result;
 
-            // Extract gate telemetry
-            const events = result.events || [];
-            const gateBlockEnter = events.filter(e => e.type === 'GATE_BLOCK_ENTER').length;
-            const gateBlockFlip = events.filter(e => e.type === 'GATE_BLOCK_FLIP').length;
-            const confScaleEvents = events.filter(e => e.type === 'CONF_SCALE');
-            const avgConfScale = confScaleEvents.length > 0
-              ? confScaleEvents.reduce((a, e) => a + (e.meta?.scale ?? 1), 0) / confScaleEvents.length
-              : 1;
+      // Extract gate telemetry
+      const events = result.events || [];
+      const gateBlockEnter = events.filter(e => e.type === 'GATE_BLOCK_ENTER').length;
+      const gateBlockFlip = events.filter(e => e.type === 'GATE_BLOCK_FLIP').length;
+      const confScaleEvents = events.filter(e => e.type === 'CONF_SCALE');
+      const avgConfScale = confScaleEvents.length > 0
+        ? confScaleEvents.reduce((a, e) => a + (e.meta?.scale ?? 1), 0) / confScaleEvents.length
+        : 1;
 
-            // Composite score
-            const trades = result.summary.tradesOpened;
-            const sharpe = result.summary.sharpe;
-            const maxDD = result.summary.maxDD;
-            const softKills = result.telemetry?.softKills ?? 0;
+      // Composite score
+      const trades = result.summary.tradesOpened;
+      const sharpe = result.summary.sharpe;
+      const maxDD = result.summary.maxDD;
+      const softKills = result.telemetry?.softKills ?? 0;
 
-            // Score = sharpe - 0.5*maxDD - 0.1*(softKills/trades)
-            const softKillPenalty = trades > 0 ? 0.1 * (softKills / trades) : 0;
-            const score = sharpe - 0.5 * maxDD - softKillPenalty;
+      // Score = sharpe - 0.5*maxDD - 0.1*(softKills/trades)
+      const softKillPenalty = trades > 0 ? 0.1 * (softKills / trades) : 0;
+      const score = sharpe - 0.5 * maxDD - softKillPenalty;
 
-            rows.push({
-              minEnter,
-              minFull,
-              minFlip,
-              softGate,
-              sharpe: this.round(sharpe, 4),
-              maxDD: this.round(maxDD, 4),
-              cagr: this.round(result.summary.cagr, 4),
-              trades,
-              gateBlockEnter,
-              gateBlockFlip,
-              avgConfScale: this.round(avgConfScale, 3),
-              avgPosSize: this.round(result.summary.turnover / Math.max(1, trades), 3),
-              softKills,
-              hardKills: result.telemetry?.hardKills ?? 0,
-              score: this.round(score, 4),
-              finalEquity: this.round(result.summary.finalEquity, 4)
-            });
+      rows.push({
+        minEnter,
+        minFull,
+        minFlip,
+        softGate,
+        sharpe: this.round(sharpe, 4),
+        maxDD: this.round(maxDD, 4),
+        cagr: this.round(result.summary.cagr, 4),
+        trades,
+        gateBlockEnter,
+        gateBlockFlip,
+        avgConfScale: this.round(avgConfScale, 3),
+        avgPosSize: this.round(result.summary.turnover / Math.max(1, trades), 3),
+        softKills,
+        hardKills: result.telemetry?.hardKills ?? 0,
+        score: this.round(score, 4),
+        finalEquity: this.round(result.summary.finalEquity, 4)
+      });
 
-            runs++;
-          } catch (err) {
-            console.error(`[GateSweep] Error:`, err);
-          }
-        }
-        if (runs >= maxRuns) break;
-      }
-      if (runs >= maxRuns) break;
+      runs++;
     }
 
     // Sort by: 1) trades >= 10, 2) maxDD < 0.30, 3) score desc
@@ -12,6 +12,9 @@
  * Input: trades array from multi-horizon simulation
  * Output: Statistical validation with P95 MaxDD, Worst Sharpe, etc.
  * 
+ * Bootstrap paths are index sequences over a Float64Array of net returns
+ * (sim.montecarlo.core.ts): no per-iteration trade arrays, no full sorts.
+ * 
  * ACCEPTANCE CRITERIA:
  * - P95 MaxDD ≤ 35%
  * - Worst MaxDD ≤ 50%
@@ -20,6 +23,17 @@
  */
 
 import type { SimTrade } from './sim.montecarlo.js';
+import {
+  makeRng,
+  createSamples,
+  runBootstrapRange,
+  summarize,
+  argMin,
+  argMax,
+  McPathSpec,
+  McSamples,
+} from './sim.montecarlo.core.js';
+import { monteCarloShardExecutor, McShardOptions, McEarlyStopConfig } from './sim.montecarlo.shard.js';
 
 // ═══════════════════════════════════════════════════════════════
 // TYPES
@@ -34,6 +48,15 @@ export interface MonteCarloV2Input {
   yearsForCAGR?: number;       // years for CAGR calc (default: auto from trades)
 }
 
+/**
+ * Sharded run options (runMonteCarloV2Sharded)
+ */
+export interface MonteCarloV2ShardInput extends MonteCarloV2Input {
+  shardSize?: number;          // iterations per shard (default 250)
+  maxConcurrency?: number;     // worker threads (default: cores - 1)
+  earlyStop?: boolean | Partial<Pick<McEarlyStopConfig, 'minIterations' | 'z'>>;
+}
+
 export interface BlockSizeResult {
   blockSize: number;
   iterations: number;
@@ -124,225 +147,42 @@ export interface MonteCarloV2Result {
 
   verdict: string;
   executionTimeMs: number;
+
+  // Sharded runs only
+  sharding?: {
+    seed: number;
+    shardSize: number;
+    shards: number;
+    workers: number;
+    earlyStoppedBlocks: number[];
+  };
 }
 
 // ═══════════════════════════════════════════════════════════════
 // UTILITIES
 // ═══════════════════════════════════════════════════════════════
 
-function percentile(sorted: number[], p: number): number {
-  if (sorted.length === 0) return NaN;
-  const idx = (sorted.length - 1) * p;
-  const lo = Math.floor(idx);
-  const hi = Math.ceil(idx);
-  if (lo === hi) return sorted[lo];
-  const w = idx - lo;
-  return sorted[lo] * (1 - w) + sorted[hi] * w;
-}
+const P95_MAXDD_TARGET = 0.35;
+const WORST_MAXDD_TARGET = 0.50;
+const WORST_SHARPE_TARGET = 0;
+const P05_CAGR_TARGET = 0.05;
 
 function mean(xs: number[]): number {
   if (!xs.length) return NaN;
   return xs.reduce((a, b) => a + b, 0) / xs.length;
 }
 
-function stdev(xs: number[]): number {
-  if (xs.length < 2) return NaN;
-  const m = mean(xs);
-  const v = xs.reduce((acc, x) => acc + (x - m) * (x - m), 0) / (xs.length - 1);
-  return Math.sqrt(v);
-}
-
-/**
- * Simple LCG for reproducible randomness
- */
-function makeRng(seed: number) {
-  let s = seed >>> 0;
-  return () => {
-    s = (1664525 * s + 1013904223) >>> 0;
-    return s / 0xffffffff;
-  };
-}
-
-/**
- * Fisher-Yates shuffle
- */
-function shuffle<T>(arr: T[], rnd: () => number): T[] {
-  const a = arr.slice();
-  for (let i = a.length - 1; i > 0; i--) {
-    const j = Math.floor(rnd() * (i + 1));
-    [a[i], a[j]] = [a[j], a[i]];
-  }
-  return a;
-}
-
-/**
- * Circular Block Bootstrap: 
- * For short sequences, creates overlapping blocks starting from random positions
- * This is the statistically correct approach for small samples.
- * 
- * Process:
- * 1. Treat the sequence as circular (wraps around)
- * 2. Randomly select N/blockSize start positions
- * 3. Extract blocks of blockSize from each start position
- * 4. Concatenate to form new sequence
- */
-function circularBlockBootstrap<T>(arr: T[], blockSize: number, rnd: () => number): T[] {
-  const n = arr.length;
-  if (n === 0) return [];
-  
-  // Number of blocks to draw (enough to cover original length)
-  const numBlocks = Math.ceil(n / blockSize);
-  const result: T[] = [];
-  
-  for (let b = 0; b < numBlocks; b++) {
-    // Random start position in circular array
-    const startIdx = Math.floor(rnd() * n);
-    
-    // Extract block with wrap-around
-    for (let i = 0; i < blockSize && result.length < n; i++) {
-      const idx = (startIdx + i) % n;
-      result.push(arr[idx]);
-    }
-  }
-  
-  return result;
-}
-
-/**
- * Moving Block Bootstrap (MBB):
- * Creates overlapping blocks of length b from the original sequence.
- * Randomly samples ceil(n/b) blocks with replacement.
- * Better variance properties than non-overlapping block bootstrap.
- */
-function movingBlockBootstrap<T>(arr: T[], blockSize: number, rnd: () => number): T[] {
-  const n = arr.length;
-  if (n === 0) return [];
-  if (blockSize >= n) return shuffle(arr, rnd);
-  
-  // Number of possible starting positions (overlapping)
-  const numStartPositions = n - blockSize + 1;
-  
-  // Number of blocks needed
-  const numBlocks = Math.ceil(n / blockSize);
-  const result: T[] = [];
-  
-  for (let b = 0; b < numBlocks; b++) {
-    // Randomly select a starting position
-    const startIdx = Math.floor(rnd() * numStartPositions);
-    
-    // Extract block
-    for (let i = 0; i < blockSize && result.length < n; i++) {
-      result.push(arr[startIdx + i]);
-    }
-  }
-  
-  return result;
-}
-
-/**
- * Stationary Block Bootstrap:
- * - Block lengths are geometrically distributed with mean = blockSize
- * - This gives smooth transitions and better preserves dependency structure
- * - For short sequences, falls back to full shuffle
- */
-function stationaryBlockBootstrap<T>(arr: T[], avgBlockSize: number, rnd: () => number): T[] {
-  const n = arr.length;
-  if (n === 0) return [];
-  if (n <= 5) return shuffle(arr, rnd);
-  
-  // Probability of starting new block
-  const p = 1 / avgBlockSize;
-  
-  const result: T[] = [];
-  let currentStart = Math.floor(rnd() * n);  // Random start
-  
-  while (result.length < n) {
-    // Add current element
-    result.push(arr[currentStart]);
-    
-    // With probability p, jump to new random position
-    // Otherwise, continue to next element (with wrap-around)
-    if (rnd() < p) {
-      currentStart = Math.floor(rnd() * n);
-    } else {
-      currentStart = (currentStart + 1) % n;
-    }
-  }
-  
-  return result;
-}
-
-/**
- * Standard Block bootstrap: shuffle blocks of consecutive trades
- * Good for longer sequences, preserves local regime structure
- */
-function blockShuffle<T>(arr: T[], blockSize: number, rnd: () => number): T[] {
-  const n = arr.length;
-  if (n === 0) return [];
-  if (blockSize >= n) return shuffle(arr, rnd);
-  
-  const blocks: T[][] = [];
-  for (let i = 0; i < n; i += blockSize) {
-    blocks.push(arr.slice(i, Math.min(i + blockSize, n)));
-  }
-  const shuffledBlocks = shuffle(blocks, rnd);
-  return shuffledBlocks.flat();
-}
-
-/**
- * Compute path statistics from trade sequence
- * - Max Drawdown
- * - Sharpe ratio (path-based)
- * - Final equity
- */
-function computePathStats(
-  trades: SimTrade[],
-  initialEquity: number,
-  years: number
-): {
-  finalEquity: number;
-  maxDD: number;
-  sharpe: number;
-  cagr: number;
-} {
-  if (trades.length === 0) {
-    return { finalEquity: initialEquity, maxDD: 0, sharpe: 0, cagr: 0 };
-  }
-
-  // Build equity curve from trades
-  let eq = initialEquity;
-  let peak = initialEquity;
-  let maxDD = 0;
-  const returns: number[] = [];
-
-  for (const trade of trades) {
-    const ret = trade.netReturn;
-    returns.push(ret);
-    eq *= (1 + ret);
-    
-    if (eq > peak) peak = eq;
-    const dd = peak > 0 ? (peak - eq) / peak : 0;
-    if (dd > maxDD) maxDD = dd;
-  }
-
-  // Path-based Sharpe
-  const m = mean(returns);
-  const sd = stdev(returns);
-  // Annualize: assume each trade is roughly ~30 days, so ~12 trades/year
-  const tradesPerYear = trades.length / Math.max(1, years);
-  const sharpe = sd > 0 ? (m / sd) * Math.sqrt(tradesPerYear) : 0;
-
-  // CAGR
-  const cagr = years > 0 && eq > 0 ? Math.pow(eq / initialEquity, 1 / years) - 1 : 0;
-
-  return { finalEquity: eq, maxDD, sharpe, cagr };
+interface RunParams {
+  startTime: number;
+  iterations: number;
+  seed: number;
+  blockSizes: number[];
+  tradeCount: number;
+  returns: Float64Array;
+  specFor: (blockSize: number) => McPathSpec;
 }
 
-// ═══════════════════════════════════════════════════════════════
-// MAIN MONTE CARLO V2 FUNCTION
-// ═══════════════════════════════════════════════════════════════
-
-export function runMonteCarloV2(input: MonteCarloV2Input): MonteCarloV2Result {
+function prepare(input: MonteCarloV2Input): RunParams {
   const startTime = Date.now();
   
   const iterations = input.iterations ?? 3000;
@@ -365,134 +205,114 @@ export function runMonteCarloV2(input: MonteCarloV2Input): MonteCarloV2Result {
   console.log(`[MC V2 36.8] Trades: ${tradeCount}, Block sizes: [${blockSizes.join(', ')}], Years: ${years.toFixed(1)}`);
   console.log(`[MC V2 36.8] Method: Stationary Block Bootstrap (geometric block lengths)`);
 
-  if (tradeCount < 5) {
-    return {
-      ok: false,
-      version: 2,
-      mode: 'block_bootstrap',
-      totalIterations: 0,
-      tradeCount,
-      blockResults: [],
-      aggregated: {
-        p95MaxDD: NaN,
-        worstMaxDD: NaN,
-        worstSharpe: NaN,
-        p05CAGR: NaN,
-        medianSharpe: NaN,
-      },
-      acceptance: {
-        p95MaxDD: { value: NaN, target: 0.35, pass: false },
-        worstMaxDD: { value: NaN, target: 0.50, pass: false },
-        worstSharpe: { value: NaN, target: 0, pass: false },
-        p05CAGR: { value: NaN, target: 0.05, pass: false },
-        overallPass: false,
-      },
-      tailRisk: { ddOver35pct: 100, ddOver45pct: 100, ddOver55pct: 100 },
-      verdict: '🔴 INSUFFICIENT TRADES — Need at least 5 trades for MC validation',
-      executionTimeMs: Date.now() - startTime,
-    };
-  }
+  return {
+    startTime,
+    iterations,
+    seed,
+    blockSizes,
+    tradeCount,
+    returns: Float64Array.from(input.trades, t => t.netReturn),
+    // Stationary Block Bootstrap: block lengths are geometrically distributed
+    // This provides better variance while preserving local dependency structure
+    specFor: (blockSize) => ({
+      draw: 'stationary',
+      blockSize,
+      initialEquity,
+      // Annualize: assume each trade is roughly ~30 days, so ~12 trades/year
+      tradesPerYear: tradeCount / Math.max(1, years),
+      years,
+    }),
+  };
+}
 
-  const rnd = makeRng(seed);
-  const blockResults: BlockSizeResult[] = [];
+function insufficientResult(tradeCount: number, startTime: number): MonteCarloV2Result {
+  return {
+    ok: false,
+    version: 2,
+    mode: 'block_bootstrap',
+    totalIterations: 0,
+    tradeCount,
+    blockResults: [],
+    aggregated: {
+      p95MaxDD: NaN,
+      worstMaxDD: NaN,
+      worstSharpe: NaN,
+      p05CAGR: NaN,
+      medianSharpe: NaN,
+    },
+    acceptance: {
+      p95MaxDD: { value: NaN, target: P95_MAXDD_TARGET, pass: false },
+      worstMaxDD: { value: NaN, target: WORST_MAXDD_TARGET, pass: false },
+      worstSharpe: { value: NaN, target: WORST_SHARPE_TARGET, pass: false },
+      p05CAGR: { value: NaN, target: P05_CAGR_TARGET, pass: false },
+      overallPass: false,
+    },
+    tailRisk: { ddOver35pct: 100, ddOver45pct: 100, ddOver55pct: 100 },
+    verdict: '🔴 INSUFFICIENT TRADES — Need at least 5 trades for MC validation',
+    executionTimeMs: Date.now() - startTime,
+  };
+}
 
-  // Run MC for each block size
-  for (const blockSize of blockSizes) {
-    console.log(`[MC V2 36.8] Running block size ${blockSize}...`);
+/**
+ * One block size's result from samples [0, iterations). Worst cases and
+ * tail counts are taken before summarizing (which reorders the samples).
+ */
+function buildBlockResult(
+  blockSize: number,
+  samples: McSamples,
+  iterations: number,
+  tradeCount: number
+): BlockSizeResult {
+  const { equity, maxDD, sharpe, cagr } = samples;
+  const worstSharpeIter = argMin(sharpe, iterations);
+  const worstDDIter = argMax(maxDD, iterations);
+  const worstCAGRIter = argMin(cagr, iterations);
+  const worstSharpe = sharpe[worstSharpeIter];
+  const worstDD = maxDD[worstDDIter];
+  const worstCAGR = cagr[worstCAGRIter];
+
+  // Track tail risk
+  let ddOver35 = 0;
+  let ddOver45 = 0;
+  let ddOver55 = 0;
+  for (let k = 0; k < iterations; k++) {
+    const dd = maxDD[k];
+    if (dd > 0.35) ddOver35++;
+    if (dd > 0.45) ddOver45++;
+    if (dd > 0.55) ddOver55++;
+  }
 
-    const equities: number[] = [];
-    const dds: number[] = [];
-    const sharpes: number[] = [];
-    const cagrs: number[] = [];
-
-    let worstSharpe = { value: Infinity, iter: -1 };
-    let worstDD = { value: -Infinity, iter: -1 };
-    let worstCAGR = { value: Infinity, iter: -1 };
-
-    let ddOver35 = 0;
-    let ddOver45 = 0;
-    let ddOver55 = 0;
-
-    for (let k = 0; k < iterations; k++) {
-      // Stationary Block Bootstrap: block lengths are geometrically distributed
-      // This provides better variance while preserving local dependency structure
-      const shuffledTrades = stationaryBlockBootstrap(input.trades, blockSize, rnd);
-      
-      // Compute stats for this shuffled sequence
-      const stats = computePathStats(shuffledTrades, initialEquity, years);
-
-      equities.push(stats.finalEquity);
-      dds.push(stats.maxDD);
-      sharpes.push(stats.sharpe);
-      cagrs.push(stats.cagr);
-
-      // Track worst cases
-      if (stats.sharpe < worstSharpe.value) worstSharpe = { value: stats.sharpe, iter: k };
-      if (stats.maxDD > worstDD.value) worstDD = { value: stats.maxDD, iter: k };
-      if (stats.cagr < worstCAGR.value) worstCAGR = { value: stats.cagr, iter: k };
-
-      // Track tail risk
-      if (stats.maxDD > 0.35) ddOver35++;
-      if (stats.maxDD > 0.45) ddOver45++;
-      if (stats.maxDD > 0.55) ddOver55++;
-    }
+  const maxDDSummary = summarize(maxDD, iterations, 4);
+  const sharpeSummary = summarize(sharpe, iterations, 3);
 
-    // Sort for percentile calculations
-    const eqS = equities.slice().sort((a, b) => a - b);
-    const ddS = dds.slice().sort((a, b) => a - b);
-    const shS = sharpes.slice().sort((a, b) => a - b);
-    const cagrS = cagrs.slice().sort((a, b) => a - b);
+  console.log(`[MC V2 36.8] Block ${blockSize}: P95 MaxDD=${(maxDDSummary.p95 * 100).toFixed(1)}%, Median Sharpe=${sharpeSummary.p50.toFixed(3)}`);
 
-    blockResults.push({
-      blockSize,
-      iterations,
-      tradeCount,
-      maxDD: {
-        p05: Math.round(percentile(ddS, 0.05) * 10000) / 10000,
-        p50: Math.round(percentile(ddS, 0.50) * 10000) / 10000,
-        p95: Math.round(percentile(ddS, 0.95) * 10000) / 10000,
-        min: Math.round(ddS[0] * 10000) / 10000,
-        max: Math.round(ddS[ddS.length - 1] * 10000) / 10000,
-        mean: Math.round(mean(ddS) * 10000) / 10000,
-      },
-      sharpe: {
-        p05: Math.round(percentile(shS, 0.05) * 1000) / 1000,
-        p50: Math.round(percentile(shS, 0.50) * 1000) / 1000,
-        p95: Math.round(percentile(shS, 0.95) * 1000) / 1000,
-        min: Math.round(shS[0] * 1000) / 1000,
-        max: Math.round(shS[shS.length - 1] * 1000) / 1000,
-        mean: Math.round(mean(shS) * 1000) / 1000,
-      },
-      cagr: {
-        p05: Math.round(percentile(cagrS, 0.05) * 10000) / 10000,
-        p50: Math.round(percentile(cagrS, 0.50) * 10000) / 10000,
-        p95: Math.round(percentile(cagrS, 0.95) * 10000) / 10000,
-        min: Math.round(cagrS[0] * 10000) / 10000,
-        max: Math.round(cagrS[cagrS.length - 1] * 10000) / 10000,
-        mean: Math.round(mean(cagrS) * 10000) / 10000,
-      },
-      finalEquity: {
-        p05: Math.round(percentile(eqS, 0.05) * 10000) / 10000,
-        p50: Math.round(percentile(eqS, 0.50) * 10000) / 10000,
-        p95: Math.round(percentile(eqS, 0.95) * 10000) / 10000,
-        min: Math.round(eqS[0] * 10000) / 10000,
-        max: Math.round(eqS[eqS.length - 1] * 10000) / 10000,
-        mean: Math.round(mean(eqS) * 10000) / 10000,
-      },
-      worstCases: {
-        worstSharpe: { value: Math.round(worstSharpe.value * 1000) / 1000, iter: worstSharpe.iter },
-        worstDD: { value: Math.round(worstDD.value * 10000) / 10000, iter: worstDD.iter },
-        worstCAGR: { value: Math.round(worstCAGR.value * 10000) / 10000, iter: worstCAGR.iter },
-      },
-      tailRisk: {
-        ddOver35pct: Math.round((ddOver35 / iterations) * 10000) / 100,
-        ddOver45pct: Math.round((ddOver45 / iterations) * 10000) / 100,
-        ddOver55pct: Math.round((ddOver55 / iterations) * 10000) / 100,
-      },
-    });
+  return {
+    blockSize,
+    iterations,
+    tradeCount,
+    maxDD: maxDDSummary,
+    sharpe: sharpeSummary,
+    cagr: summarize(cagr, iterations, 4),
+    finalEquity: summarize(equity, iterations, 4),
+    worstCases: {
+      worstSharpe: { value: Math.round(worstSharpe * 1000) / 1000, iter: worstSharpeIter },
+      worstDD: { value: Math.round(worstDD * 10000) / 10000, iter: worstDDIter },
+      worstCAGR: { value: Math.round(worstCAGR * 10000) / 10000, iter: worstCAGRIter },
+    },
+    tailRisk: {
+      ddOver35pct: Math.round((ddOver35 / iterations) * 10000) / 100,
+      ddOver45pct: Math.round((ddOver45 / iterations) * 10000) / 100,
+      ddOver55pct: Math.round((ddOver55 / iterations) * 10000) / 100,
+    },
+  };
+}
 
-    console.log(`[MC V2 36.8] Block ${blockSize}: P95 MaxDD=${(percentile(ddS, 0.95) * 100).toFixed(1)}%, Median Sharpe=${percentile(shS, 0.50).toFixed(3)}`);
-  }
+/**
+ * Aggregate block results into acceptance + verdict
+ */
+function buildResult(params: RunParams, blockResults: BlockSizeResult[]): MonteCarloV2Result {
+  const startTime = params.startTime;
 
   // Aggregate worst-case metrics across all block sizes
   const allP95MaxDD = blockResults.map(r => r.maxDD.p95);
@@ -513,10 +333,10 @@ export function runMonteCarloV2(input: MonteCarloV2Input): MonteCarloV2Result {
   const worstTailDD55 = Math.max(...blockResults.map(r => r.tailRisk.ddOver55pct));
 
   // Acceptance criteria
-  const p95MaxDDPass = aggregatedP95MaxDD <= 0.35;
-  const worstMaxDDPass = aggregatedWorstMaxDD <= 0.50;
-  const worstSharpePass = aggregatedWorstSharpe >= 0;
-  const p05CAGRPass = aggregatedP05CAGR >= 0.05;
+  const p95MaxDDPass = aggregatedP95MaxDD <= P95_MAXDD_TARGET;
+  const worstMaxDDPass = aggregatedWorstMaxDD <= WORST_MAXDD_TARGET;
+  const worstSharpePass = aggregatedWorstSharpe >= WORST_SHARPE_TARGET;
+  const p05CAGRPass = aggregatedP05CAGR >= P05_CAGR_TARGET;
   const overallPass = p95MaxDDPass && worstMaxDDPass && worstSharpePass && p05CAGRPass;
 
   // Generate verdict
@@ -536,8 +356,8 @@ export function runMonteCarloV2(input: MonteCarloV2Input): MonteCarloV2Result {
     ok: true,
     version: 2,
     mode: 'block_bootstrap',
-    totalIterations: iterations * blockSizes.length,
-    tradeCount,
+    totalIterations: blockResults.reduce((acc, r) => acc + r.iterations, 0),
+    tradeCount: params.tradeCount,
     blockResults,
     aggregated: {
       p95MaxDD: Math.round(aggregatedP95MaxDD * 10000) / 10000,
@@ -549,22 +369,22 @@ export function runMonteCarloV2(input: MonteCarloV2Input): MonteCarloV2Result {
     acceptance: {
       p95MaxDD: { 
         value: Math.round(aggregatedP95MaxDD * 10000) / 10000, 
-        target: 0.35, 
+        target: P95_MAXDD_TARGET, 
         pass: p95MaxDDPass 
       },
       worstMaxDD: { 
         value: Math.round(aggregatedWorstMaxDD * 10000) / 10000, 
-        target: 0.50, 
+        target: WORST_MAXDD_TARGET, 
         pass: worstMaxDDPass 
       },
       worstSharpe: { 
         value: Math.round(aggregatedWorstSharpe * 1000) / 1000, 
-        target: 0, 
+        target: WORST_SHARPE_TARGET,
         pass: worstSharpePass 
       },
       p05CAGR: { 
         value: Math.round(aggregatedP05CAGR * 10000) / 10000, 
-        target: 0.05, 
+        target: P05_CAGR_TARGET, 
         pass: p05CAGRPass 
       },
       overallPass,
@@ -579,6 +399,85 @@ export function runMonteCarloV2(input: MonteCarloV2Input): MonteCarloV2Result {
   };
 }
 
+// ═══════════════════════════════════════════════════════════════
+// MAIN MONTE CARLO V2 FUNCTION
+// ═══════════════════════════════════════════════════════════════
+
+export function runMonteCarloV2(input: MonteCarloV2Input): MonteCarloV2Result {
+  const params = prepare(input);
+  if (params.tradeCount < 5) return insufficientResult(params.tradeCount, params.startTime);
+
+  // One RNG stream across all block sizes; buffers reused per block size
+  const rnd = makeRng(params.seed);
+  const samples = createSamples(params.iterations);
+  const blockResults: BlockSizeResult[] = [];
+
+  // Run MC for each block size
+  for (const blockSize of params.blockSizes) {
+    console.log(`[MC V2 36.8] Running block size ${blockSize}...`);
+    runBootstrapRange(params.returns, params.specFor(blockSize), rnd, samples, 0, params.iterations);
+    blockResults.push(buildBlockResult(blockSize, samples, params.iterations, params.tradeCount));
+  }
+
+  return buildResult(params, blockResults);
+}
+
+/**
+ * Sharded run on worker threads: every (block size, shard) pair has its
+ * own RNG stream derived from the seed, so results are bit-identical for
+ * any maxConcurrency (though not equal to runMonteCarloV2's single-stream
+ * run for the same seed).
+ *
+ * earlyStop: per block size, stop once the p95 MaxDD and worst Sharpe
+ * verdicts are settled; other metrics then cover fewer iterations.
+ */
+export async function runMonteCarloV2Sharded(input: MonteCarloV2ShardInput): Promise<MonteCarloV2Result> {
+  const params = prepare(input);
+  if (params.tradeCount < 5) return insufficientResult(params.tradeCount, params.startTime);
+
+  const opts: McShardOptions = {
+    seed: params.seed,
+    shardSize: input.shardSize,
+    maxConcurrency: input.maxConcurrency,
+  };
+  if (input.earlyStop) {
+    const es = input.earlyStop === true ? {} : input.earlyStop;
+    opts.earlyStop = {
+      minIterations: es.minIterations ?? 1000,
+      z: es.z ?? 2.576,
+      checks: [
+        { kind: 'quantile', metric: 'maxDD', p: 0.95, op: '<=', target: P95_MAXDD_TARGET },
+        { kind: 'worst', metric: 'sharpe', op: '>=', target: WORST_SHARPE_TARGET },
+      ],
+    };
+  }
+
+  const run = await monteCarloShardExecutor.run(
+    params.returns,
+    params.blockSizes.map(blockSize => ({
+      spec: params.specFor(blockSize),
+      iterations: params.iterations,
+      streamId: blockSize,
+    })),
+    opts
+  );
+
+  const blockResults = run.results.map((r, i) =>
+    buildBlockResult(params.blockSizes[i], r.samples, r.iterations, params.tradeCount)
+  );
+
+  return {
+    ...buildResult(params, blockResults),
+    sharding: {
+      seed: run.seed,
+      shardSize: run.shardSize,
+      shards: run.shards,
+      workers: run.workers,
+      earlyStoppedBlocks: params.blockSizes.filter((_, i) => run.results[i].earlyStopped),
+    },
+  };
+}
+
 // ═══════════════════════════════════════════════════════════════
 // SERVICE CLASS
 // ═══════════════════════════════════════════════════════════════
@@ -595,6 +494,9 @@ export class SimMonteCarloV2Service {
     iterations?: number;
     blockSizes?: number[];
     seed?: number;
+    maxConcurrency?: number;
+    shardSize?: number;
+    earlyStop?: boolean;
   } = {}): Promise<MonteCarloV2Result> {
     // First run the multi-horizon simulation to get trades
     const { SimMultiHorizonService } = await import('./sim.multi-horizon.service.js');
@@ -620,13 +522,16 @@ export class SimMonteCarloV2Service {
     const endDate = new Date(params.end ?? '2026-02-15').getTime();
     const yearsForCAGR = (endDate - startDate) / (365.25 * 24 * 60 * 60 * 1000);
 
-    // Run Monte Carlo on the trades
-    return runMonteCarloV2({
+    // Run Monte Carlo on the trades (sharded across workers)
+    return runMonteCarloV2Sharded({
       trades: simResult.trades,
       iterations: params.iterations ?? 3000,
       blockSizes: params.blockSizes ?? [5, 7, 10],
       seed: params.seed,
       yearsForCAGR,
+      maxConcurrency: params.maxConcurrency,
+      shardSize: params.shardSize,
+      earlyStop: params.earlyStop,
     });
   }
 
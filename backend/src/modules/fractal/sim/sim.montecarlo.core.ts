@@ -0,0 +1,365 @@
+/**
+ * BLOCK 35.x — Monte Carlo Core (index-based bootstrap)
+ *
+ * Shared kernel for MC V1 (35.1/35.3) and V2 (36.8):
+ * - trade net returns live once in a Float64Array
+ * - each iteration draws a bootstrap path as an index sequence into a
+ *   preallocated Int32Array (no per-iteration trade arrays)
+ * - equity / drawdown / return moments are computed in one fused pass
+ * - percentiles use in-place selection instead of full sorts
+ *
+ * Draw functions consume the RNG exactly like the array-based versions
+ * they replace, so a given seed yields the same paths.
+ *
+ * runBootstrapRange() fills any [start, start + count) slice of a sample
+ * set, which is what the sharded executor (sim.montecarlo.shard.ts) hands
+ * to each worker.
+ */
+
+// ═══════════════════════════════════════════════════════════════
+// RNG
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * Simple LCG for reproducible randomness
+ */
+export function makeRng(seed: number): () => number {
+  let s = seed >>> 0;
+  return () => {
+    s = (1664525 * s + 1013904223) >>> 0;
+    return s / 0xffffffff;
+  };
+}
+
+/**
+ * Independent sub-stream seed (splitmix32 finalizer over seed + stream)
+ */
+export function deriveSeed(seed: number, stream: number): number {
+  let z = (seed + Math.imul(stream + 1, 0x9e3779b9)) >>> 0;
+  z = Math.imul(z ^ (z >>> 16), 0x85ebca6b) >>> 0;
+  z = Math.imul(z ^ (z >>> 13), 0xc2b2ae35) >>> 0;
+  return (z ^ (z >>> 16)) >>> 0;
+}
+
+// ═══════════════════════════════════════════════════════════════
+// PATH DRAWS (write n indices into idx)
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * Fisher-Yates permutation of 0..n-1
+ */
+export function drawPermutation(idx: Int32Array, n: number, rnd: () => number): void {
+  for (let i = 0; i < n; i++) idx[i] = i;
+  for (let i = n - 1; i > 0; i--) {
+    const j = Math.floor(rnd() * (i + 1));
+    const t = idx[i];
+    idx[i] = idx[j];
+    idx[j] = t;
+  }
+}
+
+/**
+ * Block shuffle: consecutive blocks of blockSize, block order permuted.
+ * `blocks` is scratch space of at least ceil(n / blockSize).
+ */
+export function drawBlockShuffle(
+  idx: Int32Array,
+  n: number,
+  blockSize: number,
+  rnd: () => number,
+  blocks: Int32Array
+): void {
+  const numBlocks = Math.ceil(n / blockSize);
+  drawPermutation(blocks, numBlocks, rnd);
+
+  let k = 0;
+  for (let b = 0; b < numBlocks; b++) {
+    const start = blocks[b] * blockSize;
+    const end = Math.min(start + blockSize, n);
+    for (let i = start; i < end; i++) idx[k++] = i;
+  }
+}
+
+/**
+ * Stationary block bootstrap: geometric block lengths with mean
+ * avgBlockSize, circular wrap. Short samples (n <= 5) fall back to a
+ * permutation.
+ */
+export function drawStationaryBootstrap(
+  idx: Int32Array,
+  n: number,
+  avgBlockSize: number,
+  rnd: () => number
+): void {
+  if (n <= 5) {
+    drawPermutation(idx, n, rnd);
+    return;
+  }
+
+  const p = 1 / avgBlockSize;
+  let current = Math.floor(rnd() * n);
+  for (let k = 0; k < n; k++) {
+    idx[k] = current;
+    if (rnd() < p) {
+      current = Math.floor(rnd() * n);
+    } else {
+      current = (current + 1) % n;
+    }
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════
+// FUSED PATH STATS
+// ═══════════════════════════════════════════════════════════════
+
+export interface PathStats {
+  finalEquity: number;
+  maxDD: number;
+  meanReturn: number;
+  sdReturn: number;     // sample stdev, NaN for n < 2
+}
+
+export function createPathStats(): PathStats {
+  return { finalEquity: 0, maxDD: 0, meanReturn: 0, sdReturn: NaN };
+}
+
+/**
+ * Equity, max drawdown and return mean / stdev of returns[idx[0..n)]
+ * in one pass (Welford). Writes into `out` and returns it.
+ */
+export function computePathStats(
+  returns: Float64Array,
+  idx: Int32Array,
+  n: number,
+  initialEquity: number,
+  out: PathStats
+): PathStats {
+  let eq = initialEquity;
+  let peak = initialEquity;
+  let maxDD = 0;
+  let m = 0;
+  let m2 = 0;
+
+  for (let k = 0; k < n; k++) {
+    const r = returns[idx[k]];
+    eq *= 1 + r;
+    if (eq > peak) peak = eq;
+    const dd = peak > 0 ? (peak - eq) / peak : 0;
+    if (dd > maxDD) maxDD = dd;
+
+    const delta = r - m;
+    m += delta / (k + 1);
+    m2 += delta * (r - m);
+  }
+
+  out.finalEquity = eq;
+  out.maxDD = maxDD;
+  out.meanReturn = n > 0 ? m : NaN;
+  out.sdReturn = n > 1 ? Math.sqrt(m2 / (n - 1)) : NaN;
+  return out;
+}
+
+// ═══════════════════════════════════════════════════════════════
+// ITERATION LOOP
+// ═══════════════════════════════════════════════════════════════
+
+export type McDraw = 'permute' | 'block' | 'stationary';
+
+export interface McPathSpec {
+  draw: McDraw;
+  blockSize: number;
+  initialEquity: number;
+  tradesPerYear: number;   // Sharpe annualization
+  years: number;           // CAGR horizon (0 = no CAGR)
+}
+
+export type McMetric = 'equity' | 'maxDD' | 'sharpe' | 'cagr';
+
+/**
+ * Per-iteration samples, one slot per iteration
+ */
+export type McSamples = Record<McMetric, Float64Array>;
+
+export const MC_METRICS: McMetric[] = ['equity', 'maxDD', 'sharpe', 'cagr'];
+
+export function createSamples(iterations: number, shared = false): McSamples {
+  const make = () => shared
+    ? new Float64Array(new SharedArrayBuffer(iterations * 8))
+    : new Float64Array(iterations);
+  return { equity: make(), maxDD: make(), sharpe: make(), cagr: make() };
+}
+
+/**
+ * Run `count` bootstrap iterations drawing from `rnd` and write their
+ * samples to slots [start, start + count)
+ */
+export function runBootstrapRange(
+  returns: Float64Array,
+  spec: McPathSpec,
+  rnd: () => number,
+  samples: McSamples,
+  start: number,
+  count: number
+): void {
+  const n = returns.length;
+  const idx = new Int32Array(n);
+  const blocks = new Int32Array(spec.draw === 'block' ? Math.ceil(n / spec.blockSize) : 0);
+  const stats = createPathStats();
+  const annualize = Math.sqrt(spec.tradesPerYear);
+
+  for (let k = start; k < start + count; k++) {
+    if (spec.draw === 'stationary') {
+      drawStationaryBootstrap(idx, n, spec.blockSize, rnd);
+    } else if (spec.draw === 'block') {
+      drawBlockShuffle(idx, n, spec.blockSize, rnd, blocks);
+    } else {
+      drawPermutation(idx, n, rnd);
+    }
+    computePathStats(returns, idx, n, spec.initialEquity, stats);
+
+    const eq = stats.finalEquity;
+    samples.equity[k] = eq;
+    samples.maxDD[k] = stats.maxDD;
+    samples.sharpe[k] = n >= 2 && stats.sdReturn > 0 ? (stats.meanReturn / stats.sdReturn) * annualize : 0;
+    samples.cagr[k] = spec.years > 0 && eq > 0 ? Math.pow(eq / spec.initialEquity, 1 / spec.years) - 1 : 0;
+  }
+}
+
+/**
+ * First index of the smallest / largest value in values[0..count)
+ */
+export function argMin(values: Float64Array, count: number): number {
+  let best = -1;
+  for (let i = 0; i < count; i++) if (best < 0 || values[i] < values[best]) best = i;
+  return best;
+}
+
+export function argMax(values: Float64Array, count: number): number {
+  let best = -1;
+  for (let i = 0; i < count; i++) if (best < 0 || values[i] > values[best]) best = i;
+  return best;
+}
+
+// ═══════════════════════════════════════════════════════════════
+// DISTRIBUTION SUMMARY (selection, no sort)
+// ═══════════════════════════════════════════════════════════════
+
+export interface DistributionSummary {
+  p05: number;
+  p50: number;
+  p95: number;
+  min: number;
+  max: number;
+  mean: number;
+}
+
+/**
+ * Partially reorder a[left..right] so a[k] holds the k-th smallest value
+ * (Wirth / Hoare selection, median-of-three pivot)
+ */
+function selectKth(a: Float64Array, left: number, right: number, k: number): void {
+  while (left < right) {
+    const x0 = a[left];
+    const x1 = a[(left + right) >> 1];
+    const x2 = a[right];
+    const x = x0 < x1
+      ? (x1 < x2 ? x1 : (x0 < x2 ? x2 : x0))
+      : (x0 < x2 ? x0 : (x1 < x2 ? x2 : x1));
+
+    let i = left;
+    let j = right;
+    do {
+      while (a[i] < x) i++;
+      while (x < a[j]) j--;
+      if (i <= j) {
+        const t = a[i];
+        a[i] = a[j];
+        a[j] = t;
+        i++;
+        j--;
+      }
+    } while (i <= j);
+
+    if (j < k) left = i;
+    if (k < i) right = j;
+  }
+}
+
+/**
+ * Swap the non-NaN values of a[0..count) to the front (order not kept);
+ * returns how many there are. Selection needs a total order.
+ */
+function packNonNaN(a: Float64Array, count: number): number {
+  let n = 0;
+  for (let i = 0; i < count; i++) {
+    const v = a[i];
+    if (v !== v) continue;
+    a[i] = a[n];
+    a[n++] = v;
+  }
+  return n;
+}
+
+/**
+ * Linearly interpolated quantiles (same definition as percentile() on a
+ * sorted array). `ps` must be ascending. NaN values are ignored (NaN if
+ * none are left). Reorders values[0..count).
+ */
+export function quantiles(values: Float64Array, count: number, ps: readonly number[]): number[] {
+  const out: number[] = new Array(ps.length);
+  count = packNonNaN(values, count);
+  if (count === 0) return out.fill(NaN);
+
+  let left = 0;
+  for (let q = 0; q < ps.length; q++) {
+    const pos = (count - 1) * ps[q];
+    const lo = Math.floor(pos);
+    const hi = Math.ceil(pos);
+
+    selectKth(values, left, count - 1, lo);
+    const vLo = values[lo];
+    if (lo === hi) {
+      out[q] = vLo;
+    } else {
+      // Everything right of lo is >= vLo: the next order statistic is its min
+      let vHi = Infinity;
+      for (let i = lo + 1; i < count; i++) if (values[i] < vHi) vHi = values[i];
+      const w = pos - lo;
+      out[q] = vLo * (1 - w) + vHi * w;
+    }
+    left = lo;
+  }
+  return out;
+}
+
+const SUMMARY_PS = [0.05, 0.5, 0.95];
+
+/**
+ * p05 / p50 / p95 / min / max / mean of values[0..count), rounded to
+ * `decimals`. NaN values are ignored. Reorders values.
+ */
+export function summarize(values: Float64Array, count: number, decimals: number): DistributionSummary {
+  count = packNonNaN(values, count);
+  let min = Infinity;
+  let max = -Infinity;
+  let sum = 0;
+  for (let i = 0; i < count; i++) {
+    const v = values[i];
+    if (v < min) min = v;
+    if (v > max) max = v;
+    sum += v;
+  }
+
+  const [p05, p50, p95] = quantiles(values, count, SUMMARY_PS);
+  const f = Math.pow(10, decimals);
+  const round = (v: number) => Math.round(v * f) / f;
+
+  return {
+    p05: round(p05),
+    p50: round(p50),
+    p95: round(p95),
+    min: round(count ? min : NaN),
+    max: round(count ? max : NaN),
+    mean: round(count ? sum / count : NaN),
+  };
+}
@@ -0,0 +1,359 @@
+/**
+ * BLOCK 35.x — Sharded Monte Carlo Executor
+ *
+ * Splits Monte Carlo runs into fixed-size shards that run on a worker pool:
+ * - each shard draws from its own RNG stream, derived from the master seed,
+ *   the stream (e.g. block size) and the shard index, never from the
+ *   worker that runs it
+ * - workers write samples straight into SharedArrayBuffers at the shard's
+ *   slot range, so the merged sample set (and every percentile / worst
+ *   case computed from it) is bit-identical for any worker count
+ * - early stop is decided only at fixed shard checkpoints over the
+ *   completed shard prefix, so it is as deterministic as the full run
+ * - maxConcurrency <= 1 (or a worker failure) runs shards in-process
+ */
+
+import { Worker } from 'node:worker_threads';
+import {
+  McMetric,
+  McPathSpec,
+  McSamples,
+  MC_METRICS,
+  createSamples,
+  deriveSeed,
+  makeRng,
+  quantiles,
+  runBootstrapRange,
+} from './sim.montecarlo.core.js';
+import { defaultSweepConcurrency } from './sim.sweep.executor.js';
+import { currentAsyncJob } from '../jobs/fractal.async.job.js';
+
+// ═══════════════════════════════════════════════════════════════
+// TYPES
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * Verdict checks early stop waits on:
+ * - quantile: p-quantile of metric vs target
+ * - worst: min (op '>=') or max (op '<=') of metric vs target
+ */
+export type McCheck =
+  | { kind: 'quantile'; metric: McMetric; p: number; op: '<=' | '>='; target: number }
+  | { kind: 'worst'; metric: McMetric; op: '<=' | '>='; target: number };
+
+export interface McEarlyStopConfig {
+  checks: McCheck[];
+  minIterations: number;   // never stop before this many iterations
+  z: number;               // confidence for quantile bounds (2.576 ≈ 99%)
+}
+
+export interface McStream {
+  spec: McPathSpec;
+  iterations: number;
+  streamId: number;        // RNG stream (e.g. block size); must be unique per run
+}
+
+export interface McShardOptions {
+  seed: number;
+  shardSize?: number;             // iterations per shard (default 250)
+  maxConcurrency?: number;
+  earlyStop?: McEarlyStopConfig;
+}
+
+export interface McStreamResult {
+  samples: McSamples;
+  iterations: number;             // iterations kept (shard prefix)
+  earlyStopped: boolean;
+}
+
+export interface McShardRun {
+  results: McStreamResult[];
+  seed: number;
+  shardSize: number;
+  shards: number;                 // shards actually run
+  workers: number;
+}
+
+export interface McWorkerData {
+  returns: SharedArrayBuffer;
+  samples: Array<Record<McMetric, SharedArrayBuffer>>;
+}
+
+export interface McWorkerRequest {
+  id: number;
+  stream: number;
+  spec: McPathSpec;
+  seed: number;
+  start: number;
+  count: number;
+}
+
+export interface McWorkerResponse {
+  id: number;
+  error?: string;
+}
+
+export const DEFAULT_MC_SHARD_SIZE = 250;
+
+const WORKER_URL = new URL(
+  import.meta.url.endsWith('.ts') ? './sim.montecarlo.worker.ts' : './sim.montecarlo.worker.js',
+  import.meta.url
+);
+
+/**
+ * Seed of one shard: depends only on (master seed, stream, shard index)
+ */
+export function shardSeed(seed: number, streamId: number, shard: number): number {
+  return deriveSeed(deriveSeed(seed, streamId), shard);
+}
+
+// ═══════════════════════════════════════════════════════════════
+// EARLY STOP
+// ═══════════════════════════════════════════════════════════════
+
+function checkSettled(check: McCheck, samples: McSamples, count: number, total: number, z: number): boolean {
+  const values = samples[check.metric];
+  const passes = (v: number) => (check.op === '<=' ? v <= check.target : v >= check.target);
+
+  if (check.kind === 'quantile') {
+    // Order-statistic confidence interval for the p-quantile
+    const half = z * Math.sqrt(count * check.p * (1 - check.p));
+    const lo = Math.max(0, (count * check.p - half) / (count - 1));
+    const hi = Math.min(1, (count * check.p + half) / (count - 1));
+    const [qLo, qHi] = quantiles(values.slice(0, count), count, [lo, hi]);
+    return passes(qLo) === passes(qHi);
+  }
+
+  // Worst case: a breach is final; otherwise require the Gaussian
+  // extreme-value projection over the full run to clear the target
+  let worst = check.op === '>=' ? Infinity : -Infinity;
+  let sum = 0;
+  let sumSq = 0;
+  for (let i = 0; i < count; i++) {
+    const v = values[i];
+    worst = check.op === '>=' ? Math.min(worst, v) : Math.max(worst, v);
+    sum += v;
+    sumSq += v * v;
+  }
+  if (!passes(worst)) return true;
+
+  const mean = sum / count;
+  const sd = Math.sqrt(Math.max(0, sumSq / count - mean * mean));
+  const reach = sd * (Math.sqrt(2 * Math.log(total)) + 1);
+  return passes(check.op === '>=' ? mean - reach : mean + reach);
+}
+
+/**
+ * True when every check's verdict can no longer change (at confidence z)
+ */
+export function verdictsSettled(
+  config: McEarlyStopConfig,
+  samples: McSamples,
+  count: number,
+  total: number
+): boolean {
+  if (count < config.minIterations) return false;
+  return config.checks.every(c => checkSettled(c, samples, count, total, config.z));
+}
+
+// ═══════════════════════════════════════════════════════════════
+// EXECUTOR
+// ═══════════════════════════════════════════════════════════════
+
+interface ShardTask {
+  id: number;
+  stream: number;
+  shard: number;
+  start: number;
+  count: number;
+}
+
+interface StreamState {
+  stream: McStream;
+  samples: McSamples;
+  shards: number;
+  done: boolean[];
+  prefix: number;         // completed shards from 0
+  stopAt: number;         // shards kept (all unless early stopped)
+}
+
+export class MonteCarloShardExecutor {
+  /**
+   * Run streams (e.g. one per block size) over the same trade returns
+   */
+  async run(returns: Float64Array, streams: McStream[], opts: McShardOptions): Promise<McShardRun> {
+    const shardSize = Math.max(1, opts.shardSize ?? DEFAULT_MC_SHARD_SIZE);
+    const job = currentAsyncJob();
+
+    const states: StreamState[] = streams.map(stream => {
+      const shards = Math.ceil(stream.iterations / shardSize);
+      return {
+        stream,
+        samples: createSamples(stream.iterations, true),
+        shards,
+        done: new Array(shards).fill(false),
+        prefix: 0,
+        stopAt: shards,
+      };
+    });
+
+    const queue: ShardTask[] = [];
+    states.forEach((st, s) => {
+      for (let shard = 0; shard < st.shards; shard++) {
+        const start = shard * shardSize;
+        queue.push({ id: queue.length, stream: s, shard, start, count: Math.min(shardSize, st.stream.iterations - start) });
+      }
+    });
+    const totalShards = queue.length;
+    let completed = 0;
+
+    const onDone = (task: ShardTask) => {
+      const st = states[task.stream];
+      st.done[task.shard] = true;
+      completed++;
+      job?.progress(completed, totalShards, `shard ${task.shard} of stream ${st.stream.streamId}`);
+
+      // Advance the prefix one shard at a time so every checkpoint is seen
+      while (st.prefix < st.stopAt && st.done[st.prefix]) {
+        st.prefix++;
+        if (opts.earlyStop && st.prefix < st.stopAt &&
+            verdictsSettled(opts.earlyStop, st.samples, st.prefix * shardSize, st.stream.iterations)) {
+          st.stopAt = st.prefix;
+          // Drop this stream's pending shards
+          for (let i = queue.length - 1; i >= 0; i--) if (queue[i].stream === task.stream) queue.splice(i, 1);
+        }
+      }
+    };
+
+    const concurrency = Math.min(totalShards, opts.maxConcurrency ?? defaultSweepConcurrency());
+    const workers = concurrency > 1
+      ? await this.runPool(returns, states, queue, opts.seed, concurrency, onDone)
+      : 0;
+
+    // In-process: everything (concurrency 1) or whatever workers left over
+    while (queue.length && !job?.signal.aborted) {
+      const task = queue.shift()!;
+      this.runTask(returns, states, task, opts.seed);
+      onDone(task);
+    }
+    if (job?.signal.aborted) throw new Error('Monte Carlo cancelled');
+
+    return {
+      results: states.map(st => ({
+        samples: st.samples,
+        iterations: Math.min(st.stopAt * shardSize, st.stream.iterations),
+        earlyStopped: st.stopAt < st.shards,
+      })),
+      seed: opts.seed,
+      shardSize,
+      shards: states.reduce((acc, st) => acc + st.stopAt, 0),
+      workers,
+    };
+  }
+
+  // Private Methods
+
+  private runTask(returns: Float64Array, states: StreamState[], task: ShardTask, seed: number): void {
+    const st = states[task.stream];
+    const rnd = makeRng(shardSeed(seed, st.stream.streamId, task.shard));
+    runBootstrapRange(returns, st.stream.spec, rnd, st.samples, task.start, task.count);
+  }
+
+  /**
+   * Drain the queue on worker threads; returns how many workers started.
+   * Shards of dead workers are pushed back for in-process completion.
+   */
+  private async runPool(
+    returns: Float64Array,
+    states: StreamState[],
+    queue: ShardTask[],
+    seed: number,
+    concurrency: number,
+    onDone: (task: ShardTask) => void
+  ): Promise<number> {
+    const sharedReturns = new SharedArrayBuffer(returns.byteLength);
+    new Float64Array(sharedReturns).set(returns);
+
+    const workerData: McWorkerData = {
+      returns: sharedReturns,
+      samples: states.map(st => {
+        const bufs = {} as Record<McMetric, SharedArrayBuffer>;
+        for (const m of MC_METRICS) bufs[m] = st.samples[m].buffer as SharedArrayBuffer;
+        return bufs;
+      }),
+    };
+
+    const signal = currentAsyncJob()?.signal;
+    const leftovers: ShardTask[] = [];
+
+    const drive = (worker: Worker) => new Promise<void>((resolve) => {
+      let current: ShardTask | null = null;
+
+      const dispatch = () => {
+        const task = signal?.aborted ? undefined : queue.shift();
+        if (!task) {
+          worker.terminate().finally(resolve);
+          return;
+        }
+        current = task;
+        const st = states[task.stream];
+        const request: McWorkerRequest = {
+          id: task.id,
+          stream: task.stream,
+          spec: st.stream.spec,
+          seed: shardSeed(seed, st.stream.streamId, task.shard),
+          start: task.start,
+          count: task.count,
+        };
+        worker.postMessage(request);
+      };
+
+      worker.on('message', (msg: McWorkerResponse) => {
+        const task = current!;
+        current = null;
+        if (msg.error) {
+          console.error(`[MC Shard] Worker shard failed (${msg.error}), retrying in-process`);
+          leftovers.push(task);
+        } else {
+          onDone(task);
+        }
+        dispatch();
+      });
+
+      const abandon = () => {
+        if (current) leftovers.push(current);
+        current = null;
+        resolve();
+      };
+      worker.on('error', (err) => {
+        console.error('[MC Shard] Worker failed:', err);
+        abandon();
+      });
+      worker.on('exit', abandon);
+
+      dispatch();
+    });
+
+    const workers: Worker[] = [];
+    for (let w = 0; w < concurrency; w++) {
+      try {
+        workers.push(new Worker(WORKER_URL, { workerData }));
+      } catch (err) {
+        console.error('[MC Shard] Cannot start worker, running in-process:', err);
+        break;
+      }
+    }
+
+    await Promise.all(workers.map(drive));
+
+    // Early stop may have dropped a leftover's stream meanwhile
+    for (const task of leftovers) {
+      if (task.shard < states[task.stream].stopAt) queue.push(task);
+    }
+    queue.sort((a, b) => a.id - b.id);
+    return workers.length;
+  }
+}
+
+// Export singleton
+export const monteCarloShardExecutor = new MonteCarloShardExecutor();
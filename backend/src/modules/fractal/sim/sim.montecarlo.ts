@@ -8,8 +8,24 @@
  * Pass criteria:
  * - sharpe.p05 >= 0.30
  * - maxDD.p95 <= 0.45
+ *
+ * Runs on the index-based core (sim.montecarlo.core.ts): returns are held
+ * once in a Float64Array and every iteration reuses the same buffers.
  */
 
+import {
+  makeRng,
+  createSamples,
+  runBootstrapRange,
+  summarize,
+  quantiles,
+  argMin,
+  argMax,
+  McPathSpec,
+  McSamples,
+} from './sim.montecarlo.core.js';
+import { monteCarloShardExecutor, McShardOptions, McEarlyStopConfig } from './sim.montecarlo.shard.js';
+
 export type SimTrade = {
   entryTs: string;
   exitTs: string;
@@ -28,6 +44,15 @@ export type MonteCarloInput = {
   blockSize?: number;      // default 3 for block mode
 };
 
+/**
+ * Sharded run options (runMonteCarloSharded)
+ */
+export type MonteCarloShardInput = MonteCarloInput & {
+  shardSize?: number;
+  maxConcurrency?: number;
+  earlyStop?: boolean | Partial<Pick<McEarlyStopConfig, 'minIterations' | 'z'>>;
+};
+
 export type MonteCarloResult = {
   iterations: number;
   tradeCount: number;
@@ -72,197 +97,92 @@ export type MonteCarloResult = {
     maxDDP95Pass: boolean;
     overallPass: boolean;
   };
-};
-
-function percentile(sorted: number[], p: number): number {
-  if (sorted.length === 0) return NaN;
-  const idx = (sorted.length - 1) * p;
-  const lo = Math.floor(idx);
-  const hi = Math.ceil(idx);
-  if (lo === hi) return sorted[lo];
-  const w = idx - lo;
-  return sorted[lo] * (1 - w) + sorted[hi] * w;
-}
-
-function mean(xs: number[]): number {
-  if (!xs.length) return NaN;
-  return xs.reduce((a, b) => a + b, 0) / xs.length;
-}
-
-function stdev(xs: number[]): number {
-  if (xs.length < 2) return NaN;
-  const m = mean(xs);
-  const v = xs.reduce((acc, x) => acc + (x - m) * (x - m), 0) / (xs.length - 1);
-  return Math.sqrt(v);
-}
-
-/**
- * Path-based Sharpe: Computed from the equity curve, not individual returns.
- * This IS sensitive to trade order (unlike simple mean/stdev of returns).
- */
-function pathSharpe(returns: number[], initialEquity: number): number {
-  if (returns.length < 2) return 0;
-  
-  // Build equity curve
-  const equityCurve: number[] = [initialEquity];
-  let eq = initialEquity;
-  for (const r of returns) {
-    eq *= (1 + r);
-    equityCurve.push(eq);
-  }
-  
-  // Calculate period returns from equity curve
-  const periodReturns: number[] = [];
-  for (let i = 1; i < equityCurve.length; i++) {
-    periodReturns.push(equityCurve[i] / equityCurve[i - 1] - 1);
-  }
-  
-  // Sharpe = mean(returns) / stdev(returns) * sqrt(N)
-  // But we weight by time (annualize assuming 66 trades over ~12 years = ~5.5 trades/year)
-  const m = mean(periodReturns);
-  const sd = stdev(periodReturns);
-  if (!Number.isFinite(sd) || sd === 0) return 0;
-  
-  // Annualize: assume ~5 trades per year average
-  const tradesPerYear = returns.length / 12;  // rough estimate for 2014-2026
-  return (m / sd) * Math.sqrt(tradesPerYear);
-}
 
-function computePathStats(returns: number[], initialEquity: number) {
-  let eq = initialEquity;
-  let peak = initialEquity;
-  let maxDD = 0;
-
-  for (const r of returns) {
-    eq *= (1 + r);
-    if (eq > peak) peak = eq;
-    const dd = peak > 0 ? (peak - eq) / peak : 0;
-    if (dd > maxDD) maxDD = dd;
-  }
-
-  // Compute path-based Sharpe
-  const sharpe = pathSharpe(returns, initialEquity);
-
-  return { finalEquity: eq, maxDD, sharpe };
-}
+  // Sharded runs only
+  sharding?: MonteCarloSharding;
+};
 
-/**
- * Simple LCG for reproducible randomness
- */
-function makeRng(seed: number) {
-  let s = seed >>> 0;
-  return () => {
-    s = (1664525 * s + 1013904223) >>> 0;
-    return s / 0xffffffff;
-  };
-}
+export type MonteCarloSharding = {
+  seed: number;
+  shardSize: number;
+  shards: number;
+  workers: number;
+  earlyStopped: boolean;
+};
 
-function shuffle<T>(arr: T[], rnd: () => number): T[] {
-  const a = arr.slice();
-  for (let i = a.length - 1; i > 0; i--) {
-    const j = Math.floor(rnd() * (i + 1));
-    [a[i], a[j]] = [a[j], a[i]];
-  }
-  return a;
-}
+const SHARPE_P05_TARGET = 0.30;
+const MAXDD_P95_TARGET = 0.45;
 
-/**
- * BLOCK 35.3: Block shuffle - preserves local regime structure
- * Shuffles blocks of consecutive trades instead of individual trades
- */
-function blockShuffle(base: number[], blockSize: number, rnd: () => number): number[] {
-  const blocks: number[][] = [];
-  for (let i = 0; i < base.length; i += blockSize) {
-    blocks.push(base.slice(i, i + blockSize));
-  }
-  
-  const shuffledBlocks = shuffle(blocks, rnd);
-  return shuffledBlocks.flat();
-}
+type RunParams = {
+  iterations: number;
+  seed: number;
+  mode: 'permute' | 'block';
+  blockSize: number;
+  returns: Float64Array;
+  spec: McPathSpec;
+};
 
-export function runMonteCarlo(input: MonteCarloInput): MonteCarloResult {
+function prepare(input: MonteCarloInput): RunParams {
   const iterations = input.iterations ?? 1000;
   const initialEquity = input.initialEquity ?? 1.0;
   const seed = input.seed ?? Math.floor(Math.random() * 1e9);
   const mode = input.mode ?? 'permute';
   const blockSize = input.blockSize ?? 3;
 
-  const base = input.trades.map(t => t.netReturn).filter(x => Number.isFinite(x));
-  const tradeCount = base.length;
-
-  console.log(`[MC 35.1/35.3] Starting Monte Carlo: ${iterations} iterations, ${tradeCount} trades, mode=${mode}, blockSize=${blockSize}, seed=${seed}`);
-
-  const rnd = makeRng(seed);
+  const returns = Float64Array.from(input.trades.map(t => t.netReturn).filter(x => Number.isFinite(x)));
 
-  const equities: number[] = [];
-  const dds: number[] = [];
-  const sharpes: number[] = [];
+  console.log(`[MC 35.1/35.3] Starting Monte Carlo: ${iterations} iterations, ${returns.length} trades, mode=${mode}, blockSize=${blockSize}, seed=${seed}`);
 
-  let worstSharpe = { value: Infinity, iter: -1 };
-  let worstDD = { value: -Infinity, iter: -1 };
-  let worstEquity = { value: Infinity, iter: -1 };
-
-  for (let k = 0; k < iterations; k++) {
-    // BLOCK 35.3: Use block shuffle or permutation based on mode
-    const seq = mode === 'block' 
-      ? blockShuffle(base, blockSize, rnd)
-      : shuffle(base, rnd);
-    const { finalEquity, maxDD, sharpe: sh } = computePathStats(seq, initialEquity);
-
-    equities.push(finalEquity);
-    dds.push(maxDD);
-    sharpes.push(sh);
-
-    if (sh < worstSharpe.value) worstSharpe = { value: sh, iter: k };
-    if (maxDD > worstDD.value) worstDD = { value: maxDD, iter: k };
-    if (finalEquity < worstEquity.value) worstEquity = { value: finalEquity, iter: k };
-  }
+  return {
+    iterations,
+    seed,
+    mode,
+    blockSize,
+    returns,
+    spec: {
+      draw: mode,
+      blockSize,
+      initialEquity,
+      // Path-based Sharpe, annualized assuming the trades span ~12 years (2014-2026)
+      tradesPerYear: returns.length / 12,
+      years: 0,
+    },
+  };
+}
 
-  const eqS = equities.slice().sort((a, b) => a - b);
-  const ddS = dds.slice().sort((a, b) => a - b);
-  const shS = sharpes.slice().sort((a, b) => a - b);
+/**
+ * Result from per-iteration samples [0, iterations). Worst cases are taken
+ * before summarizing (which reorders the sample arrays).
+ */
+function buildResult(params: RunParams, samples: McSamples, iterations: number): MonteCarloResult {
+  const { equity, maxDD, sharpe } = samples;
+  const worstSharpeIter = argMin(sharpe, iterations);
+  const worstDDIter = argMax(maxDD, iterations);
+  const worstEquityIter = argMin(equity, iterations);
+  const worstSharpe = sharpe[worstSharpeIter];
+  const worstDD = maxDD[worstDDIter];
+  const worstEquity = equity[worstEquityIter];
 
-  const sharpeP05 = percentile(shS, 0.05);
-  const maxDDP95 = percentile(ddS, 0.95);
+  const sharpeP05 = quantiles(sharpe, iterations, [0.05])[0];
+  const maxDDP95 = quantiles(maxDD, iterations, [0.95])[0];
 
-  const sharpeP05Pass = sharpeP05 >= 0.30;
-  const maxDDP95Pass = maxDDP95 <= 0.45;
+  const sharpeP05Pass = sharpeP05 >= SHARPE_P05_TARGET;
+  const maxDDP95Pass = maxDDP95 <= MAXDD_P95_TARGET;
 
   console.log(`[MC 35.1/35.3] Complete: sharpe.p05=${sharpeP05.toFixed(3)}, maxDD.p95=${(maxDDP95*100).toFixed(1)}%`);
 
   return {
     iterations,
-    tradeCount,
-    mode,
-    blockSize: mode === 'block' ? blockSize : undefined,
-    finalEquity: {
-      p05: Math.round(percentile(eqS, 0.05) * 10000) / 10000,
-      p50: Math.round(percentile(eqS, 0.50) * 10000) / 10000,
-      p95: Math.round(percentile(eqS, 0.95) * 10000) / 10000,
-      min: Math.round(eqS[0] * 10000) / 10000,
-      max: Math.round(eqS[eqS.length - 1] * 10000) / 10000,
-      mean: Math.round(mean(eqS) * 10000) / 10000,
-    },
-    maxDD: {
-      p05: Math.round(percentile(ddS, 0.05) * 10000) / 10000,
-      p50: Math.round(percentile(ddS, 0.50) * 10000) / 10000,
-      p95: Math.round(maxDDP95 * 10000) / 10000,
-      min: Math.round(ddS[0] * 10000) / 10000,
-      max: Math.round(ddS[ddS.length - 1] * 10000) / 10000,
-      mean: Math.round(mean(ddS) * 10000) / 10000,
-    },
-    sharpe: {
-      p05: Math.round(sharpeP05 * 1000) / 1000,
-      p50: Math.round(percentile(shS, 0.50) * 1000) / 1000,
-      p95: Math.round(percentile(shS, 0.95) * 1000) / 1000,
-      min: Math.round(shS[0] * 1000) / 1000,
-      max: Math.round(shS[shS.length - 1] * 1000) / 1000,
-      mean: Math.round(mean(shS) * 1000) / 1000,
-    },
+    tradeCount: params.returns.length,
+    mode: params.mode,
+    blockSize: params.mode === 'block' ? params.blockSize : undefined,
+    finalEquity: summarize(equity, iterations, 4),
+    maxDD: summarize(maxDD, iterations, 4),
+    sharpe: summarize(sharpe, iterations, 3),
     worstCases: {
-      worstSharpe: { value: Math.round(worstSharpe.value * 1000) / 1000, iter: worstSharpe.iter },
-      worstDD: { value: Math.round(worstDD.value * 10000) / 10000, iter: worstDD.iter },
-      worstEquity: { value: Math.round(worstEquity.value * 10000) / 10000, iter: worstEquity.iter },
+      worstSharpe: { value: Math.round(worstSharpe * 1000) / 1000, iter: worstSharpeIter },
+      worstDD: { value: Math.round(worstDD * 10000) / 10000, iter: worstDDIter },
+      worstEquity: { value: Math.round(worstEquity * 10000) / 10000, iter: worstEquityIter },
     },
     passCriteria: {
       sharpeP05Pass,
@@ -271,3 +191,54 @@ export function runMonteCarlo(input: MonteCarloInput): MonteCarloResult {
     },
   };
 }
+
+export function runMonteCarlo(input: MonteCarloInput): MonteCarloResult {
+  const params = prepare(input);
+  const samples = createSamples(params.iterations);
+  runBootstrapRange(params.returns, params.spec, makeRng(params.seed), samples, 0, params.iterations);
+  return buildResult(params, samples, params.iterations);
+}
+
+/**
+ * Sharded run on worker threads. Each shard has its own RNG stream derived
+ * from the seed, so results are identical for any maxConcurrency (but not
+ * equal to runMonteCarlo's single-stream run for the same seed).
+ * earlyStop halts once sharpe.p05 and maxDD.p95 verdicts are settled.
+ */
+export async function runMonteCarloSharded(input: MonteCarloShardInput): Promise<MonteCarloResult> {
+  const params = prepare(input);
+  const opts: McShardOptions = {
+    seed: params.seed,
+    shardSize: input.shardSize,
+    maxConcurrency: input.maxConcurrency,
+  };
+  if (input.earlyStop) {
+    const es = input.earlyStop === true ? {} : input.earlyStop;
+    opts.earlyStop = {
+      minIterations: es.minIterations ?? 500,
+      z: es.z ?? 2.576,
+      checks: [
+        { kind: 'quantile', metric: 'sharpe', p: 0.05, op: '>=', target: SHARPE_P05_TARGET },
+        { kind: 'quantile', metric: 'maxDD', p: 0.95, op: '<=', target: MAXDD_P95_TARGET },
+      ],
+    };
+  }
+
+  const run = await monteCarloShardExecutor.run(
+    params.returns,
+    [{ spec: params.spec, iterations: params.iterations, streamId: 0 }],
+    opts
+  );
+  const [stream] = run.results;
+
+  return {
+    ...buildResult(params, stream.samples, stream.iterations),
+    sharding: {
+      seed: run.seed,
+      shardSize: run.shardSize,
+      shards: run.shards,
+      workers: run.workers,
+      earlyStopped: stream.earlyStopped,
+    },
+  };
+}
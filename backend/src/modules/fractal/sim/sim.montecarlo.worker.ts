@@ -0,0 +1,30 @@
+/**
+ * BLOCK 35.x: Monte Carlo Shard Worker
+ * Runs shards posted by MonteCarloShardExecutor. Trade returns and the
+ * sample buffers are SharedArrayBuffers from workerData; each shard writes
+ * its own slot range, so nothing is copied back.
+ */
+
+import { parentPort, workerData } from 'node:worker_threads';
+import { McSamples, MC_METRICS, makeRng, runBootstrapRange } from './sim.montecarlo.core.js';
+import type { McWorkerData, McWorkerRequest, McWorkerResponse } from './sim.montecarlo.shard.js';
+
+const data = workerData as McWorkerData;
+
+const returns = new Float64Array(data.returns);
+const samples: McSamples[] = data.samples.map(bufs => {
+  const s = {} as McSamples;
+  for (const m of MC_METRICS) s[m] = new Float64Array(bufs[m]);
+  return s;
+});
+
+parentPort!.on('message', (msg: McWorkerRequest) => {
+  let response: McWorkerResponse;
+  try {
+    runBootstrapRange(returns, msg.spec, makeRng(msg.seed), samples[msg.stream], msg.start, msg.count);
+    response = { id: msg.id };
+  } catch (err) {
+    response = { id: msg.id, error: err instanceof Error ? err.message : String(err) };
+  }
+  parentPort!.postMessage(response);
+});
@@ -9,7 +9,7 @@
  */
 
 import { SimMultiHorizonService } from './sim.multi-horizon.service.js';
-import { runMonteCarloV2, MonteCarloV2Result } from './sim.montecarlo-v2.service.js';
+import { runMonteCarloV2Sharded, MonteCarloV2Result } from './sim.montecarlo-v2.service.js';
 import { DEFAULT_MULTI_HORIZON_CONFIG, MultiHorizonConfig } from '../engine/multi-horizon.engine.js';
 import { EntropyGuardConfig, DEFAULT_ENTROPY_GUARD_CONFIG } from '../engine/v2/entropy.guard.js';
 
@@ -167,7 +167,7 @@ export class SimMultiHorizonCertifyService {
 
     // MC on OFF trades
     console.log(`[CERTIFY] Running MC (OFF)...`);
-    const mcOff = await runMonteCarloV2({
+    const mcOff = await runMonteCarloV2Sharded({
       trades: wfOff.trades,
       iterations,
       blockSizes,
@@ -192,7 +192,7 @@ export class SimMultiHorizonCertifyService {
 
     // MC on ON trades
     console.log(`[CERTIFY] Running MC (ON)...`);
-    const mcOn = await runMonteCarloV2({
+    const mcOn = await runMonteCarloV2Sharded({
       trades: wfOn.trades,
       iterations,
       blockSizes,
@@ -151,6 +151,14 @@ export class SimParameterPerturbationServiceV2 {
 
     console.log(`[BLOCK 35.5 v2] Testing ${configs.length} configurations with FULL simulation (all guards)...`);
 
+    // Candles for the longest lookback of any config, loaded once and
+    // trimmed per config
+    const maxLookbackDays = Math.max(...configs.map(c => c.windowLen + c.baselineLookbackDays + 100));
+    const candles = await CanonicalOhlcvModel.find({
+      'meta.symbol': symbol,
+      ts: { $gte: new Date(new Date(start).getTime() - maxLookbackDays * 86400000), $lte: new Date(end) }
+    }).sort({ ts: 1 }).lean() as any[];
+
     const results: PerturbationResult[] = [];
     const fragileParams: Set<string> = new Set();
 
@@ -160,7 +168,7 @@ export class SimParameterPerturbationServiceV2 {
       console.log(`[BLOCK 35.5 v2] [${i + 1}/${configs.length}] Testing: ${label}`);
       
       try {
-        const result = await this.runFullSimWithConfig(start, end, symbol, cfg);
+        const result = await this.runFullSimWithConfig(start, symbol, candles, cfg);
         results.push({
           config: cfg,
           configLabel: label,
@@ -277,8 +285,8 @@ export class SimParameterPerturbationServiceV2 {
    */
   private async runFullSimWithConfig(
     startDate: string,
-    endDate: string,
     symbol: string,
+    candles: any[],
     cfg: PerturbationConfig
   ): Promise<{
     sharpe: number;
@@ -290,14 +298,11 @@ export class SimParameterPerturbationServiceV2 {
   }> {
     const stepDays = 7;
     const from = new Date(startDate);
-    const to = new Date(endDate);
 
-    // Get prices with lookback
+    // Prices with this config's lookback
     const lookbackStart = new Date(from.getTime() - (cfg.windowLen + cfg.baselineLookbackDays + 100) * 86400000);
-    const prices = await CanonicalOhlcvModel.find({
-      'meta.symbol': symbol,
-      ts: { $gte: lookbackStart, $lte: to }
-    }).sort({ ts: 1 }).lean() as any[];
+    const first = candles.findIndex(c => new Date(c.ts) >= lookbackStart);
+    const prices = first < 0 ? [] : candles.slice(first);
 
     if (prices.length < cfg.windowLen + 100) {
       throw new Error(`Insufficient data: ${prices.length} candles`);
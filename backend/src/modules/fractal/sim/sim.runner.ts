@@ -16,7 +16,7 @@ import { GateConfig, DEFAULT_GATE_CONFIG, canEnter, canFlip, confidenceScale } f
 import { FractalSettingsModel } from '../data/schemas/fractal-settings.schema.js';
 import { FractalRiskStateModel } from '../data/schemas/fractal-risk-state.schema.js';
 import { FractalAutopilotRunModel } from '../data/schemas/fractal-autopilot-run.schema.js';
-import { CanonicalOhlcvModel } from '../data/schemas/fractal-canonical-ohlcv.schema.js';
+import { PriceTimeline, loadPriceTimeline, closeAt, lookback } from './sim.timeline.js';
 import { FractalPositionStateModel } from '../data/schemas/fractal-position-state.schema.js';
 
 const DAY_MS = 86400000;
@@ -117,8 +117,23 @@ export interface SimResult {
   error?: string;
 }
 
+/**
+ * Read-only data a run needs from Mongo. Loaded once and reused across
+ * sweep runs (and shipped to sweep workers), so run() does no I/O.
+ */
+export interface SimInputs {
+  timeline: PriceTimeline;
+  baseSettings: any;
+}
+
 export class FractalSimulationRunner {
-  async run(config: SimConfig): Promise<SimResult> {
+  async loadInputs(symbol: string): Promise<SimInputs> {
+    const baseSettings = await FractalSettingsModel.findOne({ symbol }).lean() as any;
+    const timeline = await loadPriceTimeline(symbol);
+    return { timeline, baseSettings };
+  }
+
+  async run(config: SimConfig, inputs?: SimInputs): Promise<SimResult> {
     const {
       symbol,
       from,
@@ -181,7 +196,9 @@ export class FractalSimulationRunner {
     let currentConfidence = 0;
 
     // Load settings and apply direct overrides (BLOCK 34.2)
-    const baseSettings = await FractalSettingsModel.findOne({ symbol }).lean() as any;
+    const baseSettings = inputs
+      ? inputs.baseSettings
+      : await FractalSettingsModel.findOne({ symbol }).lean() as any;
     const settings = applyOverrides(baseSettings, config.overrides);
     
     const posRules = settings?.positionModel ?? {};
@@ -212,17 +229,15 @@ export class FractalSimulationRunner {
     let tradePnl = 0;
 
     try {
+      // Candle series loaded once; per-step lookups are in-memory
+      const timeline = inputs?.timeline ?? await loadPriceTimeline(symbol);
+
       while (clock.now() <= end) {
         const asOf = clock.now();
         stepCount++;
 
         // Get price at asOf
-        const priceDoc = await CanonicalOhlcvModel.findOne({
-          'meta.symbol': symbol,
-          ts: { $lte: asOf }
-        }).sort({ ts: -1 }).lean() as any;
-
-        const price = priceDoc?.ohlcv?.c ?? lastPrice;
+        const price = closeAt(timeline, asOf.getTime()) ?? lastPrice;
         if (!price) {
           clock.addDays(stepDays);
           continue;
@@ -248,7 +263,7 @@ export class FractalSimulationRunner {
         const currentDD = peakEquity > 0 ? (peakEquity - equity) / peakEquity : 0;
 
         // Get signal (simplified - use rule-based from canonical data)
-        const signal = await this.getSignalAtDate(symbol, asOf, settings, currentHorizon);
+        const signal = this.getSignalAtDate(timeline, asOf, settings, currentHorizon);
         currentConfidence = signal.confidence;
         
         // Track regime changes
@@ -620,23 +635,20 @@ export class FractalSimulationRunner {
     }
   }
 
-  private async getSignalAtDate(symbol: string, asOf: Date, settings: any, horizon: number): Promise<{
+  private getSignalAtDate(timeline: PriceTimeline, asOf: Date, settings: any, horizon: number): {
     direction: 'LONG' | 'SHORT' | 'NEUTRAL';
     confidence: number;
     horizon: number;
     regime?: { trend: string; volatility: string };
-  }> {
-    // Get last 90 days of prices
-    const prices = await CanonicalOhlcvModel.find({
-      'meta.symbol': symbol,
-      ts: { $lte: asOf }
-    }).sort({ ts: -1 }).limit(90).lean() as any[];
-
-    if (prices.length < 60) {
+  } {
+    // Last 90 days of prices (view into the timeline)
+    const closes = lookback(timeline, asOf.getTime(), 90);
+
+    if (closes.length < 60) {
       return { direction: 'NEUTRAL', confidence: 0, horizon };
     }
 
-    const closes = prices.map(p => p.ohlcv?.c ?? 0).reverse();
+    const n = closes.length;
     
     // Simple momentum signal
     const recent = closes.slice(-Math.min(horizon, 30));
@@ -648,11 +660,12 @@ export class FractalSimulationRunner {
     const momentum = (recentMean / olderMean - 1);
     
     // Volatility
-    const returns = [];
-    for (let i = 1; i < closes.length; i++) {
-      returns.push(Math.log(closes[i] / closes[i - 1]));
+    let sumSq = 0;
+    for (let i = 1; i < n; i++) {
+      const r = Math.log(closes[i] / closes[i - 1]);
+      sumSq += r * r;
     }
-    const vol = Math.sqrt(returns.reduce((a, b) => a + b * b, 0) / returns.length) * Math.sqrt(365);
+    const vol = Math.sqrt(sumSq / (n - 1)) * Math.sqrt(365);
     
     // Regime
     const trend = momentum > 0.05 ? 'UP_TREND' : momentum < -0.05 ? 'DOWN_TREND' : 'SIDEWAYS';
@@ -0,0 +1,264 @@
+/**
+ * BLOCK 34.7 — Signal Surface Sweep core
+ *
+ * The per-config simulation of the signal sweep as a pure function of the
+ * price timeline: momentum / volatility signal from closes, frozen risk.
+ * No I/O, so SimSweepExecutor runs grid points on its worker pool over the
+ * shared timeline instead of re-reading the candles per config.
+ */
+
+import { FIXED_CONFIG } from './sim.oos.splits.js';
+import { PriceTimeline, indexAtOrBefore } from './sim.timeline.js';
+
+export interface SignalConfig {
+  momentumThreshold: number;    // Default was 0.03
+  similarityThreshold: number;  // Not used in current simple signal, for future
+  minMatches: number;           // Not used in current simple signal, for future
+}
+
+/**
+ * One grid point: test window (epoch ms, inclusive) + signal config
+ */
+export interface SignalSimTask {
+  fromMs: number;
+  toMs: number;
+  signalConfig: SignalConfig;
+  stepDays: number;
+}
+
+export interface SignalSimResult {
+  sharpe: number;
+  maxDD: number;
+  cagr: number;
+  finalEquity: number;
+  tradesOpened: number;
+  totalDays: number;
+  regimeBreakdown: Record<string, { trades: number; pnl: number }>;
+}
+
+/**
+ * Candle range of the test window: ts in [fromMs, toMs]
+ */
+export function windowRange(timeline: PriceTimeline, fromMs: number, toMs: number): { start: number; end: number } {
+  const start = indexAtOrBefore(timeline, fromMs - 1) + 1;
+  const end = Math.max(start, indexAtOrBefore(timeline, toMs) + 1);
+  return { start, end };
+}
+
+/**
+ * Run simulation with custom signal config over the task's test window
+ */
+export function runSignalSim(timeline: PriceTimeline, task: SignalSimTask): SignalSimResult {
+  const { signalConfig, stepDays } = task;
+  const { start, end } = windowRange(timeline, task.fromMs, task.toMs);
+  const tsMs = timeline.tsMs.subarray(start, end);
+  const closes = timeline.closes.subarray(start, end);
+
+  if (closes.length < 60) {
+    throw new Error('Insufficient price data');
+  }
+
+  // Simulation state
+  let equity = 1.0;
+  let peakEquity = 1.0;
+  let position: 'FLAT' | 'LONG' | 'SHORT' = 'FLAT';
+  let posSize = 0;
+  let lastPrice = 0;
+  let tradesOpened = 0;
+  let holdDays = 0;
+  let tradePnl = 0;
+  const returns: number[] = [];
+  const regimeBreakdown: Record<string, { trades: number; pnl: number }> = {};
+  let currentRegimeKey = '';
+
+  // Fixed risk config (from OOS)
+  const softDD = FIXED_CONFIG.risk.soft;
+  const hardDD = FIXED_CONFIG.risk.hard;
+  // Entry threshold scales with momentum config
+  // momentum=0.01 → enterThr=0.03, momentum=0.03 → enterThr=0.09
+  const enterThr = signalConfig.momentumThreshold * 3;
+  const minHold = Math.max(5, signalConfig.minMatches);  // minMatches affects min hold
+  const maxHold = 45;
+  // Cooldown scales inversely with similarity (higher similarity = faster re-entry)
+  const cdDays = Math.max(3, Math.round(5 * (1 - signalConfig.similarityThreshold + 0.4)));
+  const roundTripCost = 2 * (4 + 6 + 2) / 10000; // 24 bps round trip
+
+  let cooldownUntil = -Infinity;
+  const actualStep = Math.max(1, stepDays);  // Ensure integer step
+
+  // Process in steps
+  for (let i = 90; i < closes.length; i += actualStep) {
+    const asOf = tsMs[i];
+    const price = closes[i] || 0;
+    if (!price) continue;
+
+    // Calculate step PnL
+    let stepPnl = 0;
+    if (position !== 'FLAT' && lastPrice > 0) {
+      const ret = price / lastPrice - 1;
+      stepPnl = position === 'LONG' ? ret * posSize : -ret * posSize;
+      equity *= (1 + stepPnl);
+      holdDays += actualStep;  // Use integer step
+      tradePnl += stepPnl;
+    }
+    returns.push(stepPnl);
+
+    if (equity > peakEquity) peakEquity = equity;
+    const currentDD = peakEquity > 0 ? (peakEquity - equity) / peakEquity : 0;
+
+    // Get signal with custom config
+    const signal = signalAt(closes, i, signalConfig);
+    // Apply similarity as confidence multiplier (higher similarity = more confidence)
+    const adjustedConfidence = signal.confidence * (0.7 + signalConfig.similarityThreshold * 0.5);
+    currentRegimeKey = `${signal.regime.trend}_${signal.regime.volatility}`;
+
+    const inCooldown = asOf < cooldownUntil;
+    const closeTrade = () => {
+      if (!regimeBreakdown[currentRegimeKey]) regimeBreakdown[currentRegimeKey] = { trades: 0, pnl: 0 };
+      regimeBreakdown[currentRegimeKey].pnl += tradePnl;
+      position = 'FLAT';
+      posSize = 0;
+      holdDays = 0;
+      tradePnl = 0;
+    };
+
+    // Position management (same as runner)
+
+    // Hard kill
+    if (currentDD >= hardDD && position !== 'FLAT') {
+      equity *= (1 - roundTripCost / 2 * posSize);
+      closeTrade();
+      cooldownUntil = asOf + cdDays * 2 * 86400000;
+    }
+    // Soft kill
+    else if (currentDD >= softDD && position !== 'FLAT') {
+      const reduceSize = posSize * 0.5;
+      equity *= (1 - roundTripCost / 2 * reduceSize);
+      posSize -= reduceSize;
+    }
+    // Max hold force exit
+    else if (position !== 'FLAT' && holdDays >= maxHold) {
+      equity *= (1 - roundTripCost / 2 * posSize);
+      closeTrade();
+      cooldownUntil = asOf + cdDays * 86400000;
+    }
+    // Exit on signal flip (opposite direction)
+    else if (position !== 'FLAT' && holdDays >= minHold) {
+      const oppositeSignal = (position === 'LONG' && signal.direction === 'SHORT') ||
+                             (position === 'SHORT' && signal.direction === 'LONG');
+      const weakSignal = signal.direction === 'NEUTRAL' || adjustedConfidence < 0.08;
+
+      if (oppositeSignal || weakSignal) {
+        equity *= (1 - roundTripCost / 2 * posSize);
+        closeTrade();
+        cooldownUntil = asOf + cdDays * 86400000;
+      }
+    }
+    // Enter
+    else if (position === 'FLAT' && !inCooldown) {
+      if (signal.direction !== 'NEUTRAL' && adjustedConfidence >= enterThr) {
+        const exposure = Math.min(2, adjustedConfidence * 2);
+        if (exposure > 0.01) {
+          equity *= (1 - roundTripCost / 2 * exposure);
+          position = signal.direction as 'LONG' | 'SHORT';
+          posSize = exposure;
+          holdDays = 0;
+          tradePnl = 0;
+          tradesOpened++;
+          if (!regimeBreakdown[currentRegimeKey]) regimeBreakdown[currentRegimeKey] = { trades: 0, pnl: 0 };
+          regimeBreakdown[currentRegimeKey].trades++;
+        }
+      }
+    }
+
+    lastPrice = price;
+  }
+
+  // Calculate metrics
+  const mean = returns.length ? returns.reduce((a, b) => a + b, 0) / returns.length : 0;
+  const variance = returns.length > 1
+    ? returns.reduce((a, b) => a + (b - mean) ** 2, 0) / (returns.length - 1)
+    : 0;
+  const vol = Math.sqrt(variance);
+  const sharpe = vol > 0 ? (mean * Math.sqrt(52)) / vol : 0;
+
+  let peak = 1;
+  let maxDD = 0;
+  let cumEquity = 1;
+  for (const ret of returns) {
+    cumEquity *= (1 + ret);
+    if (cumEquity > peak) peak = cumEquity;
+    const dd = (peak - cumEquity) / peak;
+    if (dd > maxDD) maxDD = dd;
+  }
+
+  const years = returns.length / 52;
+  const cagr = years > 0 ? Math.pow(equity, 1 / years) - 1 : 0;
+
+  return {
+    sharpe,
+    maxDD,
+    cagr,
+    finalEquity: equity,
+    tradesOpened,
+    totalDays: returns.length * stepDays,
+    regimeBreakdown
+  };
+}
+
+/**
+ * Signal with custom momentum threshold from the 90 closes up to currentIdx
+ */
+export function signalAt(prices: ArrayLike<number>, currentIdx: number, config: SignalConfig): {
+  direction: 'LONG' | 'SHORT' | 'NEUTRAL';
+  confidence: number;
+  regime: { trend: string; volatility: string };
+} {
+  const closes: number[] = [];
+  for (let i = Math.max(0, currentIdx - 89); i <= currentIdx; i++) {
+    closes.push(prices[i] || 0);
+  }
+
+  if (closes.length < 60) {
+    return { direction: 'NEUTRAL', confidence: 0, regime: { trend: 'UNK', volatility: 'UNK' } };
+  }
+
+  // Momentum calculation
+  const recent = closes.slice(-30);
+  const older = closes.slice(-60, -30);
+
+  const recentMean = recent.reduce((a, b) => a + b, 0) / recent.length;
+  const olderMean = older.reduce((a, b) => a + b, 0) / older.length;
+  const momentum = olderMean > 0 ? (recentMean / olderMean - 1) : 0;
+
+  // Volatility
+  const returns: number[] = [];
+  for (let i = 1; i < closes.length; i++) {
+    if (closes[i] > 0 && closes[i - 1] > 0) {
+      returns.push(Math.log(closes[i] / closes[i - 1]));
+    }
+  }
+  const vol = Math.sqrt(returns.reduce((a, b) => a + b * b, 0) / Math.max(1, returns.length)) * Math.sqrt(365);
+
+  // Regime
+  const trend = momentum > 0.05 ? 'UP_TREND' : momentum < -0.05 ? 'DOWN_TREND' : 'SIDEWAYS';
+  const volatility = vol > 0.8 ? 'HIGH_VOL' : vol < 0.4 ? 'LOW_VOL' : 'NORMAL_VOL';
+
+  // Signal with CONFIGURABLE threshold
+  let direction: 'LONG' | 'SHORT' | 'NEUTRAL' = 'NEUTRAL';
+  let confidence = Math.abs(momentum) * 2;
+
+  if (momentum > config.momentumThreshold) direction = 'LONG';
+  else if (momentum < -config.momentumThreshold) direction = 'SHORT';
+
+  // Reduce confidence in crash regime
+  if (trend === 'DOWN_TREND' && volatility === 'HIGH_VOL') {
+    confidence *= 0.3;
+  }
+
+  return {
+    direction,
+    confidence: Math.min(1, confidence),
+    regime: { trend, volatility }
+  };
+}
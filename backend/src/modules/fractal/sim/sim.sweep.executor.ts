@@ -0,0 +1,310 @@
+/**
+ * BLOCK 34.x: Parallel Sweep Executor
+ * Fans simulation configs out to a pool of worker threads
+ *
+ * - Read-only inputs (price timeline, settings) are loaded once in the main
+ *   thread; the timeline is copied once into SharedArrayBuffers that every
+ *   worker maps without copying
+ * - Results come back in config order regardless of completion order, so
+ *   callers build exactly the rows the serial loop would
+ * - onResult streams each outcome as soon as its config finishes
+ * - maxConcurrency <= 1 (or a worker start failure) runs in-process
+ * - Inside an async job (BLOCK 56.7) progress and per-config summaries are
+ *   reported to the job, and cancelling it stops dispatching new configs
+ * - Besides SimConfigs (FractalSimulationRunner) it runs the pure signal
+ *   sweep grid points (see sim.sweep.task.ts) over the same timeline
+ */
+
+import { Worker } from 'node:worker_threads';
+import { availableParallelism } from 'node:os';
+import { FractalSimulationRunner, SimConfig, SimInputs, SimResult } from './sim.runner.js';
+import { PriceTimeline } from './sim.timeline.js';
+import { SweepTask, SweepTaskResult, runSweepTask } from './sim.sweep.task.js';
+import { SignalSimTask, SignalSimResult } from './sim.signal-sweep.core.js';
+import { currentAsyncJob } from '../jobs/fractal.async.job.js';
+
+export type SweepOutcome<R = SimResult> =
+  | { ok: true; result: R }
+  | { ok: false; error: string };
+
+export interface SweepExecutorOptions<R = SimResult> {
+  maxConcurrency?: number;
+  onResult?: (index: number, outcome: SweepOutcome<R>) => void;
+}
+
+/**
+ * Payload handed to each worker via workerData
+ */
+export interface SweepWorkerData {
+  symbol: string;
+  tsMs: SharedArrayBuffer;
+  closes: SharedArrayBuffer;
+  baseSettings: any;
+}
+
+export interface SweepWorkerRequest {
+  id: number;
+  task: SweepTask;
+}
+
+export interface SweepWorkerResponse {
+  id: number;
+  outcome: SweepOutcome<SweepTaskResult>;
+}
+
+type Outcome = SweepOutcome<SweepTaskResult>;
+
+// Workers run the same module format as the caller (tsx in dev, dist in prod)
+const WORKER_URL = new URL(
+  import.meta.url.endsWith('.ts') ? './sim.sweep.worker.ts' : './sim.sweep.worker.js',
+  import.meta.url
+);
+
+export function defaultSweepConcurrency(): number {
+  return Math.max(1, availableParallelism() - 1);
+}
+
+function toShared(src: Float64Array): SharedArrayBuffer {
+  const buf = new SharedArrayBuffer(src.byteLength);
+  new Float64Array(buf).set(src);
+  return buf;
+}
+
+// One shared copy per timeline, reused by every sweep over it
+const sharedTimelines = new WeakMap<PriceTimeline, { tsMs: SharedArrayBuffer; closes: SharedArrayBuffer }>();
+
+export function shareTimeline(timeline: PriceTimeline): { tsMs: SharedArrayBuffer; closes: SharedArrayBuffer } {
+  let shared = sharedTimelines.get(timeline);
+  if (!shared) {
+    shared = { tsMs: toShared(timeline.tsMs), closes: toShared(timeline.closes) };
+    sharedTimelines.set(timeline, shared);
+  }
+  return shared;
+}
+
+export class SimSweepExecutor {
+  private runner = new FractalSimulationRunner();
+
+  /**
+   * Run every config; outcomes are aligned with configs
+   */
+  async runAll(configs: SimConfig[], opts: SweepExecutorOptions = {}): Promise<SweepOutcome[]> {
+    const symbol = sweepSymbol(configs);
+    const report = this.reporter(configs.length, opts, simSummary);
+    return this.runBatch(symbol, simTasks(configs), opts.maxConcurrency, report) as Promise<SweepOutcome[]>;
+  }
+
+  /**
+   * Signal sweep grid points over the symbol's timeline; outcomes are
+   * aligned with tasks
+   */
+  async runSignalGrid(
+    symbol: string,
+    tasks: SignalSimTask[],
+    opts: SweepExecutorOptions<SignalSimResult> = {}
+  ): Promise<SweepOutcome<SignalSimResult>[]> {
+    const report = this.reporter(tasks.length, opts, signalSummary);
+    const sweep: SweepTask[] = tasks.map(task => ({ kind: 'signal', task }));
+    return this.runBatch(symbol, sweep, opts.maxConcurrency, report) as Promise<SweepOutcome<SignalSimResult>[]>;
+  }
+
+  /**
+   * Serial-loop semantics for capped grids: walk configs in order until
+   * `needed` runs succeed (failed configs are skipped, like the old
+   * try/catch + runs counter). Returns the processed prefix, in order.
+   */
+  async runUntil(
+    configs: SimConfig[],
+    needed: number,
+    opts: SweepExecutorOptions = {}
+  ): Promise<Array<{ index: number; outcome: SweepOutcome }>> {
+    const done: Array<{ index: number; outcome: SweepOutcome }> = [];
+    if (!configs.length) return done;
+    const symbol = sweepSymbol(configs);
+    const tasks = simTasks(configs);
+    const report = this.reporter(Math.min(needed, configs.length), opts, simSummary);
+    const signal = currentAsyncJob()?.signal;
+    let next = 0;
+    let succeeded = 0;
+
+    while (succeeded < needed && next < configs.length && !signal?.aborted) {
+      const wave = tasks.slice(next, next + (needed - succeeded));
+      const offset = next;
+      const outcomes = await this.runBatch(symbol, wave, opts.maxConcurrency, (i, o) => report(offset + i, o)) as SweepOutcome[];
+
+      outcomes.forEach((outcome, i) => {
+        done.push({ index: offset + i, outcome });
+        if (outcome.ok) succeeded++;
+      });
+      next += wave.length;
+    }
+    return done;
+  }
+
+  // Private Methods
+
+  /**
+   * onResult + async job progress / partial summaries
+   */
+  private reporter<R>(
+    total: number,
+    opts: SweepExecutorOptions<R>,
+    summarize: (result: R) => unknown
+  ): (index: number, outcome: Outcome) => void {
+    const job = currentAsyncJob();
+    let completed = 0;
+    return (index, outcome) => {
+      opts.onResult?.(index, outcome as SweepOutcome<R>);
+      if (!job) return;
+      completed++;
+      job.progress(Math.min(completed, total), total, `config ${index}`);
+      job.partial(outcome.ok
+        ? { index, ok: true, summary: summarize(outcome.result as R) }
+        : { index, ok: false, error: outcome.error });
+    };
+  }
+
+  private async runBatch(
+    symbol: string,
+    tasks: SweepTask[],
+    maxConcurrency: number | undefined,
+    report: (index: number, outcome: Outcome) => void
+  ): Promise<Outcome[]> {
+    const outcomes: Outcome[] = new Array(tasks.length);
+    if (!tasks.length) return outcomes;
+
+    const inputs = await this.runner.loadInputs(symbol);
+    const concurrency = Math.min(tasks.length, maxConcurrency ?? defaultSweepConcurrency());
+    const signal = currentAsyncJob()?.signal;
+
+    const record = (index: number, outcome: Outcome) => {
+      outcomes[index] = outcome;
+      report(index, outcome);
+    };
+
+    const indices = tasks.map((_, i) => i);
+    if (concurrency <= 1) {
+      await this.runSerial(tasks, indices, inputs, record, signal);
+    } else {
+      await this.runPool(tasks, indices, inputs, concurrency, record, signal);
+    }
+
+    // Cancelled job: configs never run are reported as such
+    for (let i = 0; i < outcomes.length; i++) {
+      if (!outcomes[i]) outcomes[i] = { ok: false, error: 'cancelled' };
+    }
+    return outcomes;
+  }
+
+  private async runSerial(
+    tasks: SweepTask[],
+    indices: number[],
+    inputs: SimInputs,
+    record: (index: number, outcome: Outcome) => void,
+    signal?: AbortSignal
+  ): Promise<void> {
+    for (const i of indices) {
+      if (signal?.aborted) return;
+      try {
+        record(i, { ok: true, result: await runSweepTask(tasks[i], inputs, this.runner) });
+      } catch (err) {
+        record(i, { ok: false, error: err instanceof Error ? err.message : String(err) });
+      }
+    }
+  }
+
+  private async runPool(
+    tasks: SweepTask[],
+    indices: number[],
+    inputs: SimInputs,
+    concurrency: number,
+    record: (index: number, outcome: Outcome) => void,
+    signal?: AbortSignal
+  ): Promise<void> {
+    const shared = shareTimeline(inputs.timeline);
+    const workerData: SweepWorkerData = {
+      symbol: inputs.timeline.symbol,
+      tsMs: shared.tsMs,
+      closes: shared.closes,
+      baseSettings: inputs.baseSettings,
+    };
+
+    const queue = indices.slice();
+    const leftovers: number[] = [];
+
+    const drive = (worker: Worker) => new Promise<void>((resolve) => {
+      let current = -1;
+
+      const dispatch = () => {
+        const i = signal?.aborted ? undefined : queue.shift();
+        if (i === undefined) {
+          worker.terminate().finally(resolve);
+          return;
+        }
+        current = i;
+        const request: SweepWorkerRequest = { id: i, task: tasks[i] };
+        worker.postMessage(request);
+      };
+
+      worker.on('message', (msg: SweepWorkerResponse) => {
+        current = -1;
+        record(msg.id, msg.outcome);
+        dispatch();
+      });
+
+      // Worker died: hand its config back to the main thread
+      const abandon = () => {
+        if (current >= 0) leftovers.push(current);
+        current = -1;
+        resolve();
+      };
+      worker.on('error', (err) => {
+        console.error('[SweepExecutor] Worker failed:', err);
+        abandon();
+      });
+      worker.on('exit', abandon);
+
+      dispatch();
+    });
+
+    const workers: Worker[] = [];
+    for (let w = 0; w < concurrency; w++) {
+      try {
+        workers.push(new Worker(WORKER_URL, { workerData }));
+      } catch (err) {
+        console.error('[SweepExecutor] Cannot start worker, running in-process:', err);
+        break;
+      }
+    }
+
+    // Cancellation drops in-flight configs too
+    const stop = () => workers.forEach(w => w.terminate());
+    signal?.addEventListener('abort', stop, { once: true });
+    await Promise.all(workers.map(drive));
+    signal?.removeEventListener('abort', stop);
+
+    // Configs left by failed or missing workers run in-process
+    const rest = leftovers.concat(queue).sort((a, b) => a - b);
+    if (rest.length) await this.runSerial(tasks, rest, inputs, record, signal);
+  }
+}
+
+function sweepSymbol(configs: SimConfig[]): string {
+  const symbol = configs[0]?.symbol;
+  if (configs.some(c => c.symbol !== symbol)) {
+    throw new Error('Sweep configs must share one symbol');
+  }
+  return symbol;
+}
+
+function simTasks(configs: SimConfig[]): SweepTask[] {
+  return configs.map(config => ({ kind: 'sim', config }));
+}
+
+const simSummary = (result: SimResult) => result.summary;
+
+// Regime breakdown stays out of the job's partial rows
+const signalSummary = ({ regimeBreakdown: _, ...metrics }: SignalSimResult) => metrics;
+
+// Export singleton
+export const simSweepExecutor = new SimSweepExecutor();
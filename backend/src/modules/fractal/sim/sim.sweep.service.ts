@@ -4,9 +4,10 @@
  * + Gate × Risk Combo Sweep support
  */
 
-import { FractalSimulationRunner, SimConfig, SimResult } from './sim.runner.js';
+import { SimConfig } from './sim.runner.js';
 import { SimOverrides, formatOverrides } from './sim.overrides.js';
 import { GateConfig } from './sim.confidence-gate.js';
+import { simSweepExecutor } from './sim.sweep.executor.js';
 
 export interface SweepRow {
   soft: number;
@@ -92,12 +93,33 @@ function clampRuns(
   };
 }
 
-export class SimSweepService {
-  private sim: FractalSimulationRunner;
+interface RiskGridPoint {
+  soft: number;
+  hard: number;
+  taper: number;
+  config: SimConfig;
+}
 
-  constructor() {
-    this.sim = new FractalSimulationRunner();
+/**
+ * Risk grid in serial-loop order (hard must be > soft)
+ */
+function riskGridPoints(
+  grids: { soft: number[]; hard: number[]; taper: number[] },
+  makeConfig: (overrides: SimOverrides) => SimConfig
+): RiskGridPoint[] {
+  const points: RiskGridPoint[] = [];
+  for (const soft of grids.soft) {
+    for (const hard of grids.hard) {
+      if (hard <= soft) continue;
+      for (const taper of grids.taper) {
+        points.push({ soft, hard, taper, config: makeConfig({ dd: { soft, hard }, risk: { taper } }) });
+      }
+    }
   }
+  return points;
+}
+
+export class SimSweepService {
 
   /**
    * BLOCK 34.5: Run Gate × Risk Combo Sweep
@@ -113,6 +135,7 @@ export class SimSweepService {
     taper: number[];
     maxRuns?: number;
     mode?: 'AUTOPILOT' | 'FROZEN';
+    maxConcurrency?: number;
   }): Promise<SweepResult> {
     const startTime = Date.now();
     const maxRuns = params.maxRuns ?? 30;
@@ -124,71 +147,66 @@ export class SimSweepService {
     console.log(`[GateRiskSweep] Gate: enter=${params.gateConfig.minEnterConfidence} full=${params.gateConfig.minFullSizeConfidence} flip=${params.gateConfig.minFlipConfidence}`);
     console.log(`[GateRiskSweep] Risk grid: ${grids.soft.length}×${grids.hard.length}×${grids.taper.length} = ${grids.soft.length * grids.hard.length * grids.taper.length} combinations`);
 
-    for (const soft of grids.soft) {
-      for (const hard of grids.hard) {
-        if (hard <= soft) continue;
-
-        for (const taper of grids.taper) {
-          if (runs >= maxRuns) break;
-
-          const overrides: SimOverrides = {
-            dd: { soft, hard },
-            risk: { taper }
-          };
-
-          console.log(`[GateRiskSweep] Run ${runs + 1}/${maxRuns}: soft=${(soft*100).toFixed(0)}% hard=${(hard*100).toFixed(0)}% taper=${taper}`);
-
-          try {
-            const res = await this.sim.run({
-              symbol: params.symbol,
-              from: params.from,
-              to: params.to,
-              stepDays: 7,
-              mode: params.mode ?? 'AUTOPILOT',
-              experiment: 'E0',
-              overrides,
-              gateConfig: params.gateConfig
-            });
-
-            // Extract gate telemetry
-            const events = res.events || [];
-            const gateBlockEnter = events.filter(e => e.type === 'GATE_BLOCK_ENTER').length;
-            const confScaleEvents = events.filter(e => e.type === 'CONF_SCALE');
-            const avgConfScale = confScaleEvents.length > 0
-              ? confScaleEvents.reduce((a, e) => a + (e.meta?.scale ?? 1), 0) / confScaleEvents.length
-              : 1;
-
-            const row: SweepRow = {
-              soft,
-              hard,
-              taper,
-              sharpe: this.round(res.summary.sharpe, 4),
-              cagr: this.round(res.summary.cagr, 4),
-              maxDD: this.round(res.summary.maxDD, 4),
-              trades: res.summary.tradesOpened,
-              costs: this.round(res.summary.totalCosts, 6),
-              rollbacks: res.summary.rollbackCount,
-              retrains: res.summary.retrainCount,
-              horizonChanges: res.telemetry?.horizonChanges ?? 0,
-              hardKills: res.telemetry?.hardKills ?? 0,
-              softKills: res.telemetry?.softKills ?? 0,
-              finalEquity: this.round(res.summary.finalEquity, 4),
-              ddPeriod: res.ddAttribution?.maxDDPeriod?.start
-                ? `${res.ddAttribution.maxDDPeriod.start} → ${res.ddAttribution.maxDDPeriod.end}`
-                : '',
-              gateBlockEnter,
-              avgConfScale: this.round(avgConfScale, 3)
-            };
-
-            rows.push(row);
-            runs++;
-          } catch (err) {
-            console.error(`[GateRiskSweep] Error at soft=${soft} hard=${hard} taper=${taper}:`, err);
-          }
-        }
-        if (runs >= maxRuns) break;
+    const points = riskGridPoints(grids, overrides => ({
+      symbol: params.symbol,
+      from: params.from,
+      to: params.to,
+      stepDays: 7,
+      mode: params.mode ?? 'AUTOPILOT',
+      experiment: 'E0',
+      overrides,
+      gateConfig: params.gateConfig
+    }));
+
+    // Grid points run in parallel; outcomes come back in grid order
+    const done = await simSweepExecutor.runUntil(points.map(p => p.config), maxRuns, {
+      maxConcurrency: params.maxConcurrency,
+      onResult: (i) => {
+        const { soft, hard, taper } = points[i];
+        console.log(`[GateRiskSweep] Done ${i + 1}/${points.length}: soft=${(soft*100).toFixed(0)}% hard=${(hard*100).toFixed(0)}% taper=${taper}`);
+      }
+    });
+
+    for (const { index, outcome } of done) {
+      const { soft, hard, taper } = points[index];
+      if (!outcome.ok) {
+        console.error(`[GateRiskSweep] Error at soft=${soft} hard=${hard} taper=${taper}:`, outcome.error);
+        continue;
       }
-      if (runs >= maxRuns) break;
+      const res = outcome.result;
+
+      // Extract gate telemetry
+      const events = res.events || [];
+      const gateBlockEnter = events.filter(e => e.type === 'GATE_BLOCK_ENTER').length;
+      const confScaleEvents = events.filter(e => e.type === 'CONF_SCALE');
+      const avgConfScale = confScaleEvents.length > 0
+        ? confScaleEvents.reduce((a, e) => a + (e.meta?.scale ?? 1), 0) / confScaleEvents.length
+        : 1;
+
+      const row: SweepRow = {
+        soft,
+        hard,
+        taper,
+        sharpe: this.round(res.summary.sharpe, 4),
+        cagr: this.round(res.summary.cagr, 4),
+        maxDD: this.round(res.summary.maxDD, 4),
+        trades: res.summary.tradesOpened,
+        costs: this.round(res.summary.totalCosts, 6),
+        rollbacks: res.summary.rollbackCount,
+        retrains: res.summary.retrainCount,
+        horizonChanges: res.telemetry?.horizonChanges ?? 0,
+        hardKills: res.telemetry?.hardKills ?? 0,
+        softKills: res.telemetry?.softKills ?? 0,
+        finalEquity: this.round(res.summary.finalEquity, 4),
+        ddPeriod: res.ddAttribution?.maxDDPeriod?.start
+          ? `${res.ddAttribution.maxDDPeriod.start} → ${res.ddAttribution.maxDDPeriod.end}`
+          : '',
+        gateBlockEnter,
+        avgConfScale: this.round(avgConfScale, 3)
+      };
+
+      rows.push(row);
+      runs++;
     }
 
     // Filter & Sort: trades >= 20, DD <= 30%, rollbacks < 15, then by Sharpe desc
@@ -245,6 +263,7 @@ export class SimSweepService {
     mode?: 'AUTOPILOT' | 'FROZEN';
     stepDays?: number;
     gateConfig?: GateConfig;  // BLOCK 34.5: Optional gate config
+    maxConcurrency?: number;
   }): Promise<SweepResult> {
     const startTime = Date.now();
     const maxRuns = params.maxRuns ?? 120;
@@ -255,76 +274,70 @@ export class SimSweepService {
 
     console.log(`[Sweep] Starting risk sweep: ${grids.soft.length}×${grids.hard.length}×${grids.taper.length} = ${grids.soft.length * grids.hard.length * grids.taper.length} combinations`);
 
-    for (const soft of grids.soft) {
-      for (const hard of grids.hard) {
-        // Sanity: hard must be > soft
-        if (hard <= soft) continue;
-
-        for (const taper of grids.taper) {
-          if (runs >= maxRuns) break;
-
-          const overrides: SimOverrides = {
-            dd: { soft, hard },
-            risk: { taper }
-          };
-
-          console.log(`[Sweep] Run ${runs + 1}/${maxRuns}: ${formatOverrides(overrides)}`);
-
-          try {
-            const res = await this.sim.run({
-              symbol: params.symbol,
-              from: params.from,
-              to: params.to,
-              stepDays: params.stepDays ?? 7,
-              mode: params.mode ?? 'AUTOPILOT',
-              experiment: 'E0',
-              overrides,
-              gateConfig: params.gateConfig  // BLOCK 34.5
-            });
-
-            // Extract gate telemetry if gateConfig provided
-            let gateBlockEnter = 0;
-            let avgConfScale = 1;
-            if (params.gateConfig) {
-              const events = res.events || [];
-              gateBlockEnter = events.filter(e => e.type === 'GATE_BLOCK_ENTER').length;
-              const confScaleEvents = events.filter(e => e.type === 'CONF_SCALE');
-              avgConfScale = confScaleEvents.length > 0
-                ? confScaleEvents.reduce((a, e) => a + (e.meta?.scale ?? 1), 0) / confScaleEvents.length
-                : 1;
-            }
-
-            const row: SweepRow = {
-              soft,
-              hard,
-              taper,
-              sharpe: this.round(res.summary.sharpe, 4),
-              cagr: this.round(res.summary.cagr, 4),
-              maxDD: this.round(res.summary.maxDD, 4),
-              trades: res.summary.tradesOpened,
-              costs: this.round(res.summary.totalCosts, 6),
-              rollbacks: res.summary.rollbackCount,
-              retrains: res.summary.retrainCount,
-              horizonChanges: res.telemetry?.horizonChanges ?? 0,
-              hardKills: res.telemetry?.hardKills ?? 0,
-              softKills: res.telemetry?.softKills ?? 0,
-              finalEquity: this.round(res.summary.finalEquity, 4),
-              ddPeriod: res.ddAttribution?.maxDDPeriod?.start
-                ? `${res.ddAttribution.maxDDPeriod.start} → ${res.ddAttribution.maxDDPeriod.end}`
-                : '',
-              gateBlockEnter: params.gateConfig ? gateBlockEnter : undefined,
-              avgConfScale: params.gateConfig ? this.round(avgConfScale, 3) : undefined
-            };
-
-            rows.push(row);
-            runs++;
-          } catch (err) {
-            console.error(`[Sweep] Error at soft=${soft} hard=${hard} taper=${taper}:`, err);
-          }
-        }
-        if (runs >= maxRuns) break;
+    // Sanity: hard must be > soft (filtered by riskGridPoints)
+    const points = riskGridPoints(grids, overrides => ({
+      symbol: params.symbol,
+      from: params.from,
+      to: params.to,
+      stepDays: params.stepDays ?? 7,
+      mode: params.mode ?? 'AUTOPILOT',
+      experiment: 'E0',
+      overrides,
+      gateConfig: params.gateConfig  // BLOCK 34.5
+    }));
+
+    // Grid points run in parallel; outcomes come back in grid order
+    const done = await simSweepExecutor.runUntil(points.map(p => p.config), maxRuns, {
+      maxConcurrency: params.maxConcurrency,
+      onResult: (i) => {
+        console.log(`[Sweep] Done ${i + 1}/${points.length}: ${formatOverrides(points[i].config.overrides!)}`);
       }
-      if (runs >= maxRuns) break;
+    });
+
+    for (const { index, outcome } of done) {
+      const { soft, hard, taper } = points[index];
+      if (!outcome.ok) {
+        console.error(`[Sweep] Error at soft=${soft} hard=${hard} taper=${taper}:`, outcome.error);
+        continue;
+      }
+      const res = outcome.result;
+
+      // Extract gate telemetry if gateConfig provided
+      let gateBlockEnter = 0;
+      let avgConfScale = 1;
+      if (params.gateConfig) {
+        const events = res.events || [];
+        gateBlockEnter = events.filter(e => e.type === 'GATE_BLOCK_ENTER').length;
+        const confScaleEvents = events.filter(e => e.type === 'CONF_SCALE');
+        avgConfScale = confScaleEvents.length > 0
+          ? confScaleEvents.reduce((a, e) => a + (e.meta?.scale ?? 1), 0) / confScaleEvents.length
+          : 1;
+      }
+
+      const row: SweepRow = {
+        soft,
+        hard,
+        taper,
+        sharpe: this.round(res.summary.sharpe, 4),
+        cagr: this.round(res.summary.cagr, 4),
+        maxDD: this.round(res.summary.maxDD, 4),
+        trades: res.summary.tradesOpened,
+        costs: this.round(res.summary.totalCosts, 6),
+        rollbacks: res.summary.rollbackCount,
+        retrains: res.summary.retrainCount,
+        horizonChanges: res.telemetry?.horizonChanges ?? 0,
+        hardKills: res.telemetry?.hardKills ?? 0,
+        softKills: res.telemetry?.softKills ?? 0,
+        finalEquity: this.round(res.summary.finalEquity, 4),
+        ddPeriod: res.ddAttribution?.maxDDPeriod?.start
+          ? `${res.ddAttribution.maxDDPeriod.start} → ${res.ddAttribution.maxDDPeriod.end}`
+          : '',
+        gateBlockEnter: params.gateConfig ? gateBlockEnter : undefined,
+        avgConfScale: params.gateConfig ? this.round(avgConfScale, 3) : undefined
+      };
+
+      rows.push(row);
+      runs++;
     }
 
     // Sort by: 1) DD constraint (<=25%), 2) sharpe desc, 3) cagr desc
@@ -0,0 +1,31 @@
+/**
+ * BLOCK 34.x: Sweep Tasks
+ * Units of work SimSweepExecutor hands to its workers (or runs in-process).
+ * Every kind is a function of the shared SimInputs only, so a task runs the
+ * same in the main thread and in a worker.
+ *
+ * - sim:    FractalSimulationRunner over a SimConfig (parameter / gate sweeps)
+ * - signal: signal-surface grid point over a test window (signal sweep)
+ */
+
+import { FractalSimulationRunner, SimConfig, SimInputs, SimResult } from './sim.runner.js';
+import { SignalSimTask, SignalSimResult, runSignalSim } from './sim.signal-sweep.core.js';
+
+export type SweepTask =
+  | { kind: 'sim'; config: SimConfig }
+  | { kind: 'signal'; task: SignalSimTask };
+
+export type SweepTaskResult = SimResult | SignalSimResult;
+
+export async function runSweepTask(
+  task: SweepTask,
+  inputs: SimInputs,
+  runner: FractalSimulationRunner
+): Promise<SweepTaskResult> {
+  switch (task.kind) {
+    case 'sim':
+      return runner.run(task.config, inputs);
+    case 'signal':
+      return runSignalSim(inputs.timeline, task.task);
+  }
+}
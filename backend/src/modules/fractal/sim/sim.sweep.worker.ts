@@ -0,0 +1,36 @@
+/**
+ * BLOCK 34.x: Sweep Worker
+ * Runs the sweep tasks (simulation configs, signal grid points) posted by
+ * SimSweepExecutor.
+ * All inputs arrive via workerData (timeline in SharedArrayBuffers), so the
+ * worker never touches Mongo.
+ */
+
+import { parentPort, workerData } from 'node:worker_threads';
+import { FractalSimulationRunner, SimInputs } from './sim.runner.js';
+import { runSweepTask } from './sim.sweep.task.js';
+import type { SweepWorkerData, SweepWorkerRequest, SweepWorkerResponse } from './sim.sweep.executor.js';
+
+const data = workerData as SweepWorkerData;
+
+const inputs: SimInputs = {
+  timeline: {
+    symbol: data.symbol,
+    tsMs: new Float64Array(data.tsMs),
+    closes: new Float64Array(data.closes),
+  },
+  baseSettings: data.baseSettings,
+};
+
+const runner = new FractalSimulationRunner();
+
+parentPort!.on('message', async (msg: SweepWorkerRequest) => {
+  let response: SweepWorkerResponse;
+  try {
+    const result = await runSweepTask(msg.task, inputs, runner);
+    response = { id: msg.id, outcome: { ok: true, result } };
+  } catch (err) {
+    response = { id: msg.id, outcome: { ok: false, error: err instanceof Error ? err.message : String(err) } };
+  }
+  parentPort!.postMessage(response);
+});
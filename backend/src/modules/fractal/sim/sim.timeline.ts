@@ -0,0 +1,74 @@
+/**
+ * BLOCK 34.x: Sim Price Timeline
+ * Columnar in-memory candle series for the simulation loop
+ *
+ * The runner used to hit Mongo twice per step (price findOne + 90-bar
+ * lookback find). The timeline is loaded once per series and shared via
+ * the series cache, so every step is a binary search + subarray view.
+ */
+
+import { seriesCache } from '../data/series.cache.js';
+import { FRACTAL_TIMEFRAME } from '../domain/constants.js';
+
+export interface PriceTimeline {
+  symbol: string;
+  tsMs: Float64Array;    // epoch ms, ascending
+  closes: Float64Array;  // aligned with tsMs
+}
+
+export function buildPriceTimeline(symbol: string, ts: Date[], closes: ArrayLike<number>): PriceTimeline {
+  const n = ts.length;
+  const tsMs = new Float64Array(n);
+  const c = new Float64Array(n);
+  for (let i = 0; i < n; i++) {
+    tsMs[i] = ts[i].getTime();
+    c[i] = closes[i];
+  }
+  return { symbol, tsMs, closes: c };
+}
+
+/**
+ * Shared timeline for a symbol (built once per cached series)
+ */
+export async function loadPriceTimeline(symbol: string, timeframe = FRACTAL_TIMEFRAME): Promise<PriceTimeline> {
+  const series = await seriesCache.get(symbol, timeframe);
+  const existing = seriesCache.derived(series, 'simTimeline', () =>
+    buildPriceTimeline(symbol, series.ts, series.closes)
+  );
+  // Series grew since the timeline was built (append-only sync)
+  if (existing.tsMs.length === series.ts.length) return existing;
+
+  const rebuilt = buildPriceTimeline(symbol, series.ts, series.closes);
+  series.derived.set('simTimeline', rebuilt);
+  return rebuilt;
+}
+
+/**
+ * Index of the last candle with ts <= asOfMs, -1 if none
+ */
+export function indexAtOrBefore(timeline: PriceTimeline, asOfMs: number): number {
+  const { tsMs } = timeline;
+  let lo = 0, hi = tsMs.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (tsMs[mid] <= asOfMs) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo - 1;
+}
+
+/**
+ * Close of the last candle at or before asOf (null before the first candle)
+ */
+export function closeAt(timeline: PriceTimeline, asOfMs: number): number | null {
+  const idx = indexAtOrBefore(timeline, asOfMs);
+  return idx >= 0 ? timeline.closes[idx] : null;
+}
+
+/**
+ * Last `bars` closes at or before asOf, oldest first (view, no copy)
+ */
+export function lookback(timeline: PriceTimeline, asOfMs: number, bars: number): Float64Array {
+  const end = indexAtOrBefore(timeline, asOfMs) + 1;
+  return timeline.closes.subarray(Math.max(0, end - bars), end);
+}
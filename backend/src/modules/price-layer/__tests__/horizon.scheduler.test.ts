@@ -0,0 +1,192 @@
+/**
+ * Horizon Scheduler Tests
+ *
+ * Due order, catch-up of the persisted backlog, retries / stale jobs and
+ * recovery when the status write after a batch fails. Storage is an
+ * in-memory stand-in for the price_horizon_jobs collection.
+ */
+
+import { describe, it, expect, afterEach } from 'vitest';
+import {
+  HorizonScheduler,
+  type DueHorizonJob,
+  type HorizonJob,
+  type HorizonJobResult,
+} from '../horizon.scheduler.js';
+
+const MIN = 60 * 1000;
+
+function matches(doc: any, filter: any): boolean {
+  return Object.entries(filter).every(([k, cond]: [string, any]) => {
+    const v = doc[k];
+    if (cond && typeof cond === 'object') {
+      if ('$lte' in cond && !(v <= cond.$lte)) return false;
+      if ('$gt' in cond && !(v > cond.$gt)) return false;
+      return true;
+    }
+    return v === cond;
+  });
+}
+
+class FakeJobs {
+  docs: HorizonJob[] = [];
+  failWrites = 0;
+
+  async createIndex() {}
+
+  async insertMany(docs: HorizonJob[]) {
+    for (const d of docs) {
+      if (this.docs.some(x => x.signal_id === d.signal_id && x.horizon === d.horizon)) {
+        throw { code: 11000 };
+      }
+      this.docs.push({ ...d });
+    }
+  }
+
+  find(filter: any) {
+    const rows = () => this.docs.filter(d => matches(d, filter)).map(d => ({ ...d }));
+    return {
+      sort: () => ({
+        async *[Symbol.asyncIterator]() {
+          yield* rows().sort((a, b) => a.due_at - b.due_at);
+        },
+      }),
+    };
+  }
+
+  async bulkWrite(ops: any[]) {
+    if (this.failWrites > 0) {
+      this.failWrites--;
+      throw new Error('write concern timeout');
+    }
+    for (const { updateOne } of ops) {
+      const doc: any = this.docs.find(d => matches(d, updateOne.filter));
+      Object.assign(doc, updateOne.update.$set);
+      for (const [k, n] of Object.entries(updateOne.update.$inc ?? {})) doc[k] += n;
+    }
+  }
+
+  async countDocuments(filter: any) {
+    return this.docs.filter(d => matches(d, filter)).length;
+  }
+
+  get(signal_id: string, horizon = '5m') {
+    return this.docs.find(d => d.signal_id === signal_id && d.horizon === horizon)!;
+  }
+}
+
+function job(signal_id: string, due_at: number, asset = 'ETH'): Omit<HorizonJob, 'status' | 'attempts' | 'created_at'> {
+  return { signal_id, asset, horizon: '5m', target_ts: due_at, due_at };
+}
+
+function pending(doc: Omit<HorizonJob, 'status' | 'attempts' | 'created_at'>): HorizonJob {
+  return { ...doc, status: 'pending', attempts: 0, created_at: new Date() };
+}
+
+describe('HorizonScheduler', () => {
+  const schedulers: HorizonScheduler[] = [];
+  const make = (config = {}) => {
+    const s = new HorizonScheduler({ tickMs: 1000, lookaheadMs: 10 * MIN, refillMs: MIN, retryDelayMs: MIN, ...config });
+    schedulers.push(s);
+    return s;
+  };
+  afterEach(() => schedulers.splice(0).forEach(s => s.stop()));
+
+  it('should hand jobs over at their due time, earliest first', async () => {
+    const now = Date.now();
+    const store = new FakeJobs();
+    const runs: Array<{ at: number; ids: string[] }> = [];
+    const scheduler = make();
+    await scheduler.start(store as any, async (jobs) => {
+      runs.push({ at: clock, ids: jobs.map(j => j.signal_id) });
+      return jobs.map(() => undefined);
+    });
+    let clock = now;
+
+    await scheduler.schedule([job('c', now + 30_000), job('a', now + 5_000), job('b', now + 5_000)]);
+    await scheduler.schedule([job('far', now + 30 * MIN)]);   // outside the lookahead
+
+    for (clock = now; clock <= now + 31 * MIN; clock += 1000) await scheduler.tick(clock);
+
+    expect(runs.map(r => r.ids)).toEqual([['a', 'b'], ['c'], ['far']]);
+    expect(runs[0].at).toBeGreaterThanOrEqual(now + 5_000);
+    expect(runs[0].at).toBeLessThan(now + 7_000);
+    expect(runs[1].at).toBeGreaterThanOrEqual(now + 30_000);
+    expect(runs[2].at).toBeGreaterThanOrEqual(now + 30 * MIN);
+    expect(store.docs.every(d => d.status === 'done' && d.attempts === 1)).toBe(true);
+    expect(scheduler.getStats().processed).toBe(4);
+  });
+
+  it('should work off an overdue backlog in batches on start', async () => {
+    const now = Date.now();
+    const store = new FakeJobs();
+    for (let i = 0; i < 25; i++) store.docs.push(pending(job(`old${String(i).padStart(2, '0')}`, now - (25 - i) * MIN)));
+    store.docs.push({ ...pending(job('done', now - MIN)), status: 'done' });
+    store.docs.push(pending(job('soon', now + 10_000)));
+
+    const batches: string[][] = [];
+    const scheduler = make({ batchSize: 10 });
+    await scheduler.start(store as any, async (jobs) => {
+      batches.push(jobs.map(j => j.signal_id));
+      return jobs.map(() => undefined);
+    });
+    expect(scheduler.getStats().ready).toBe(25);
+
+    for (let t = now; t <= now + 12_000; t += 1000) await scheduler.tick(t);
+
+    expect(batches.map(b => b.length)).toEqual([10, 10, 5, 1]);
+    expect(batches.flat().slice(0, 25)).toEqual([...store.docs.slice(0, 25)].map(d => d.signal_id));
+    expect(batches[3]).toEqual(['soon']);
+    expect(await scheduler.getBacklog()).toEqual({ pending: 0, overdue: 0, failed: 0, stale: 0 });
+  });
+
+  it('should retry failed jobs, give up after maxAttempts and close stale ones', async () => {
+    const now = Date.now();
+    const store = new FakeJobs();
+    const calls = new Map<string, number>();
+    const scheduler = make({ maxAttempts: 3 });
+    await scheduler.start(store as any, async (jobs: DueHorizonJob[]) => jobs.map((j): HorizonJobResult => {
+      const n = (calls.get(j.signal_id) ?? 0) + 1;
+      calls.set(j.signal_id, n);
+      if (j.signal_id === 'flaky') return n < 2 ? 'price timeout' : undefined;
+      if (j.signal_id === 'broken') return 'no price';
+      if (j.signal_id === 'stale') return { stale: 'no stored price near target' };
+      return undefined;
+    }));
+
+    await scheduler.schedule([job('flaky', now + 1000), job('broken', now + 1000), job('stale', now + 1000)]);
+    for (let t = now; t <= now + 4 * MIN; t += 1000) await scheduler.tick(t);
+
+    expect(store.get('flaky')).toMatchObject({ status: 'done', attempts: 2 });
+    expect(store.get('broken')).toMatchObject({ status: 'failed', attempts: 3, last_error: 'no price' });
+    expect(store.get('stale')).toMatchObject({ status: 'stale', attempts: 1 });
+    expect(calls).toEqual(new Map([['flaky', 2], ['broken', 3], ['stale', 1]]));
+    // Retries run retryDelayMs after the failure
+    expect(store.get('broken').due_at).toBeGreaterThanOrEqual(now + 2 * MIN);
+
+    const stats = scheduler.getStats();
+    expect([stats.processed, stats.failed, stats.stale, stats.retried]).toEqual([1, 1, 1, 3]);
+  });
+
+  it('should reload jobs whose status write failed', async () => {
+    const now = Date.now();
+    const store = new FakeJobs();
+    let runs = 0;
+    const scheduler = make();
+    await scheduler.start(store as any, async (jobs) => {
+      runs += jobs.length;
+      return jobs.map(() => undefined);
+    });
+
+    await scheduler.schedule([job('a', now + 1000), job('b', now + 2000)]);
+    store.failWrites = 1;
+    await scheduler.tick(now + 1000);
+    expect(store.get('a').status).toBe('pending');
+
+    for (let t = now + 2000; t <= now + 5000; t += 1000) await scheduler.tick(t);
+
+    expect(store.docs.map(d => d.status)).toEqual(['done', 'done']);
+    expect(runs).toBe(3);   // a ran again after the failed write
+    expect(scheduler.getStats().inMemory).toBe(0);
+  });
+});
@@ -0,0 +1,82 @@
+/**
+ * Timer Wheel Tests
+ *
+ * Every timer comes out exactly once, on the first advance() that reaches
+ * its tick, in due order, whichever level (or the overflow list) it
+ * waited in.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { TimerWheel } from '../timer-wheel.js';
+import { lcg } from '../../../common/__tests__/seeded.fixtures.js';
+
+const TICK = 10;
+const START = 1_000_000 * TICK;
+
+describe('TimerWheel', () => {
+  it('should release timers at their tick in due order across levels', () => {
+    // 4 slots x 3 levels: level spans 1, 4, 16 ticks, overflow beyond 64
+    const wheel = new TimerWheel<number>(TICK, 4, 3, START);
+    const rand = lcg(17);
+
+    const due = new Map<number, number>();
+    for (let id = 0; id < 400; id++) {
+      const dueMs = START + TICK + Math.floor(rand() * 300 * TICK);
+      due.set(id, dueMs);
+      expect(wheel.add(dueMs, id)).toBe(true);
+    }
+    expect(wheel.size).toBe(400);
+
+    const seen = new Set<number>();
+    let now = START;
+    let lastTick = -Infinity;
+    while (now < START + 320 * TICK) {
+      now += Math.floor(1 + rand() * 7) * TICK;
+      const out = wheel.advance(now);
+      for (const id of out) {
+        const tick = Math.floor(due.get(id)! / TICK);
+        expect(seen.has(id)).toBe(false);
+        expect(tick).toBeLessThanOrEqual(Math.floor(now / TICK));
+        expect(tick).toBeGreaterThanOrEqual(lastTick);   // due order
+        lastTick = tick;
+        seen.add(id);
+      }
+      // Nothing due by now is left behind
+      for (const [id, dueMs] of due) {
+        if (dueMs <= now) expect(seen.has(id)).toBe(true);
+      }
+    }
+
+    expect(seen.size).toBe(400);
+    expect(wheel.size).toBe(0);
+  });
+
+  it('should cascade timers added while the cursor moves', () => {
+    const wheel = new TimerWheel<string>(TICK, 4, 2, START);
+    const out: string[] = [];
+
+    wheel.add(START + 20 * TICK, 'overflow');   // beyond 16 ticks
+    wheel.add(START + 9 * TICK, 'level1');
+    out.push(...wheel.advance(START + 5 * TICK));
+    wheel.add(START + 6 * TICK, 'level0');
+    wheel.add(START + 12 * TICK, 'late-level1');
+    out.push(...wheel.advance(START + 9 * TICK));
+    out.push(...wheel.advance(START + 19 * TICK));
+    expect(out).toEqual(['level0', 'level1', 'late-level1']);
+
+    expect(wheel.advance(START + 20 * TICK)).toEqual(['overflow']);
+    expect(wheel.size).toBe(0);
+  });
+
+  it('should refuse timers already due and jump an empty wheel', () => {
+    const wheel = new TimerWheel<string>(TICK, 4, 2, START);
+    expect(wheel.add(START, 'now')).toBe(false);
+    expect(wheel.add(START - 5 * TICK, 'past')).toBe(false);
+    expect(wheel.size).toBe(0);
+
+    expect(wheel.advance(START + 1e6 * TICK)).toEqual([]);
+    expect(wheel.add(START + 1e6 * TICK, 'behind cursor')).toBe(false);
+    expect(wheel.add(START + 1e6 * TICK + TICK, 'next')).toBe(true);
+    expect(wheel.advance(START + 1e6 * TICK + TICK)).toEqual(['next']);
+  });
+});
@@ -0,0 +1,344 @@
+/**
+ * S5.2 — HORIZON SCHEDULER
+ *
+ * Durable, batched scheduling of future price snapshots (5m … 24h after a
+ * signal).
+ *
+ * - Every (signal, horizon) is a document in `price_horizon_jobs` with its
+ *   due time, indexed by (status, due_at), so nothing is lost on restart
+ * - Only jobs due within `lookaheadMs` are held in memory, in one
+ *   TimerWheel driven by a single interval
+ * - Each tick hands the due jobs to the handler as one batch (the price
+ *   layer groups them by asset for a single price lookup each)
+ * - On start, everything already overdue is loaded and worked off in
+ *   `batchSize` chunks
+ * - Failed jobs are retried `maxAttempts` times, `retryDelayMs` apart;
+ *   jobs the handler reports stale (snapshot can no longer be taken) are
+ *   closed without retries
+ * - If the status write after a batch fails, the loaded window is rewound
+ *   so the next refill reloads whatever is still pending in storage
+ */
+
+import type { Collection } from 'mongodb';
+import { TimerWheel } from './timer-wheel.js';
+
+// ============================================================
+// TYPES
+// ============================================================
+
+export type SnapshotHorizon = '5m' | '15m' | '1h' | '4h' | '24h';
+
+export interface HorizonJob {
+  signal_id: string;
+  asset: string;
+  horizon: SnapshotHorizon;
+  target_ts: number;          // t0 + horizon delay (snapshot timestamp)
+  due_at: number;             // when to collect (ms epoch)
+  status: 'pending' | 'done' | 'failed' | 'stale';
+  attempts: number;
+  last_error?: string;
+  created_at: Date;
+  completed_at?: Date;
+}
+
+/**
+ * A due job as handed to the batch handler
+ */
+export type DueHorizonJob = Pick<HorizonJob, 'signal_id' | 'asset' | 'horizon' | 'target_ts' | 'due_at' | 'attempts'>;
+
+/**
+ * Outcome of one job: undefined = done, an error message = retried,
+ * { stale } = the snapshot can no longer be taken (not retried)
+ */
+export type HorizonJobResult = string | { stale: string } | undefined;
+
+/**
+ * Runs one batch; returns one result per job
+ */
+export type HorizonBatchHandler = (jobs: DueHorizonJob[]) => Promise<HorizonJobResult[]>;
+
+export interface HorizonSchedulerConfig {
+  tickMs: number;
+  lookaheadMs: number;        // due window loaded into the wheel
+  refillMs: number;           // how often the next window is loaded
+  batchSize: number;          // jobs handed to the handler per tick
+  retryDelayMs: number;
+  maxAttempts: number;
+}
+
+export const DEFAULT_HORIZON_SCHEDULER_CONFIG: HorizonSchedulerConfig = {
+  tickMs: 1000,
+  lookaheadMs: 10 * 60 * 1000,
+  refillMs: 60 * 1000,
+  batchSize: 500,
+  retryDelayMs: 60 * 1000,
+  maxAttempts: 3,
+};
+
+export interface HorizonSchedulerStats {
+  running: boolean;
+  inMemory: number;           // jobs in the wheel or ready queue
+  ready: number;              // due, waiting for a batch slot
+  processed: number;
+  failed: number;
+  stale: number;
+  retried: number;
+  maxLagMs: number;           // worst due → collected delay seen
+  lastTickAt: number | null;
+}
+
+const jobKey = (j: { signal_id: string; horizon: string }) => `${j.signal_id}:${j.horizon}`;
+
+// ============================================================
+// SCHEDULER
+// ============================================================
+
+export class HorizonScheduler {
+  private cfg: HorizonSchedulerConfig;
+  private jobs: Collection<HorizonJob> | null = null;
+  private handler: HorizonBatchHandler | null = null;
+
+  private wheel: TimerWheel<DueHorizonJob>;
+  private ready: DueHorizonJob[] = [];
+  private loaded = new Set<string>();
+  private loadedUntil = -Infinity;     // jobs due <= this are in memory
+  private lastRefillAt = 0;
+
+  private timer: NodeJS.Timeout | null = null;
+  private ticking = false;
+  private stats: HorizonSchedulerStats = {
+    running: false,
+    inMemory: 0,
+    ready: 0,
+    processed: 0,
+    failed: 0,
+    stale: 0,
+    retried: 0,
+    maxLagMs: 0,
+    lastTickAt: null,
+  };
+
+  constructor(config?: Partial<HorizonSchedulerConfig>) {
+    this.cfg = { ...DEFAULT_HORIZON_SCHEDULER_CONFIG, ...config };
+    this.wheel = new TimerWheel<DueHorizonJob>(this.cfg.tickMs);
+  }
+
+  get started(): boolean {
+    return this.timer !== null;
+  }
+
+  /**
+   * Attach storage + handler, load the backlog and start ticking
+   */
+  async start(jobs: Collection<HorizonJob>, handler: HorizonBatchHandler): Promise<void> {
+    if (this.timer) return;
+    this.jobs = jobs;
+    this.handler = handler;
+
+    await jobs.createIndex({ signal_id: 1, horizon: 1 }, { unique: true });
+    await jobs.createIndex({ status: 1, due_at: 1 });
+
+    await this.refill(Date.now());
+    const backlog = this.ready.length;
+
+    this.timer = setInterval(() => void this.tick(), this.cfg.tickMs);
+    this.timer.unref?.();
+    this.stats.running = true;
+
+    console.log(`[HorizonScheduler] Started: ${this.loaded.size} jobs loaded, ${backlog} overdue`);
+  }
+
+  stop(): void {
+    if (this.timer) clearInterval(this.timer);
+    this.timer = null;
+    this.stats.running = false;
+  }
+
+  /**
+   * Persist new jobs; those inside the loaded window go straight to the wheel
+   */
+  async schedule(entries: Array<Omit<HorizonJob, 'status' | 'attempts' | 'created_at'>>): Promise<void> {
+    if (!this.jobs) throw new Error('HorizonScheduler not started');
+    if (entries.length === 0) return;
+
+    const docs: HorizonJob[] = entries.map(e => ({
+      ...e,
+      status: 'pending',
+      attempts: 0,
+      created_at: new Date(),
+    }));
+
+    try {
+      await this.jobs.insertMany(docs, { ordered: false });
+    } catch (error: any) {
+      // Duplicate (signal, horizon) = already scheduled
+      if (error?.code !== 11000 && !error?.writeErrors?.every((e: any) => e.code === 11000)) throw error;
+    }
+
+    for (const doc of docs) {
+      if (doc.due_at <= this.loadedUntil) this.enqueue(doc);
+    }
+  }
+
+  getStats(): HorizonSchedulerStats {
+    return {
+      ...this.stats,
+      inMemory: this.wheel.size + this.ready.length,
+      ready: this.ready.length,
+    };
+  }
+
+  /**
+   * Pending / overdue counts straight from storage
+   */
+  async getBacklog(): Promise<{ pending: number; overdue: number; failed: number; stale: number }> {
+    if (!this.jobs) return { pending: 0, overdue: 0, failed: 0, stale: 0 };
+    const now = Date.now();
+    const [pending, overdue, failed, stale] = await Promise.all([
+      this.jobs.countDocuments({ status: 'pending' }),
+      this.jobs.countDocuments({ status: 'pending', due_at: { $lte: now } }),
+      this.jobs.countDocuments({ status: 'failed' }),
+      this.jobs.countDocuments({ status: 'stale' }),
+    ]);
+    return { pending, overdue, failed, stale };
+  }
+
+  // ============================================================
+  // TICK
+  // ============================================================
+
+  async tick(now = Date.now()): Promise<void> {
+    if (this.ticking || !this.jobs || !this.handler) return;
+    this.ticking = true;
+
+    try {
+      if (now - this.lastRefillAt >= this.cfg.refillMs) await this.refill(now);
+
+      for (const entry of this.wheel.advance(now)) this.ready.push(entry);
+      this.stats.lastTickAt = now;
+      if (this.ready.length === 0) return;
+
+      const batch = this.ready.splice(0, this.cfg.batchSize);
+      await this.runBatch(batch, now);
+    } catch (error: any) {
+      console.error(`[HorizonScheduler] Tick error: ${error.message}`);
+    } finally {
+      this.ticking = false;
+    }
+  }
+
+  // ============================================================
+  // INTERNALS
+  // ============================================================
+
+  /**
+   * Load pending jobs due up to now + lookahead that are not in memory yet
+   */
+  private async refill(now: number): Promise<void> {
+    const from = this.loadedUntil;
+    const until = now + this.cfg.lookaheadMs;
+    // Advance first: schedule() calls from here on enqueue directly
+    this.loadedUntil = until;
+    this.lastRefillAt = now;
+
+    const filter = from === -Infinity
+      ? { status: 'pending' as const, due_at: { $lte: until } }
+      : { status: 'pending' as const, due_at: { $gt: from, $lte: until } };
+
+    const cursor = this.jobs!
+      .find(filter, {
+        projection: { _id: 0, signal_id: 1, asset: 1, horizon: 1, target_ts: 1, due_at: 1, attempts: 1 },
+      })
+      .sort({ due_at: 1 });
+
+    for await (const doc of cursor) this.enqueue(doc as HorizonJob);
+  }
+
+  private enqueue(job: DueHorizonJob): void {
+    const key = jobKey(job);
+    if (this.loaded.has(key)) return;
+    this.loaded.add(key);
+
+    const entry: DueHorizonJob = {
+      signal_id: job.signal_id,
+      horizon: job.horizon,
+      asset: job.asset,
+      target_ts: job.target_ts,
+      due_at: job.due_at,
+      attempts: job.attempts ?? 0,
+    };
+    if (!this.wheel.add(entry.due_at, entry)) this.ready.push(entry);
+  }
+
+  private async runBatch(batch: DueHorizonJob[], now: number): Promise<void> {
+    let results: HorizonJobResult[];
+    try {
+      results = await this.handler!(batch);
+    } catch (error: any) {
+      results = batch.map(() => error.message ?? 'batch failed');
+    }
+
+    const completedAt = new Date();
+    const ops = batch.map((entry, i) => {
+      this.loaded.delete(jobKey(entry));
+      const result = results[i];
+      const filter = { signal_id: entry.signal_id, horizon: entry.horizon };
+
+      if (!result) {
+        this.stats.processed++;
+        this.stats.maxLagMs = Math.max(this.stats.maxLagMs, now - entry.due_at);
+        return {
+          updateOne: {
+            filter,
+            update: { $set: { status: 'done' as const, completed_at: completedAt }, $inc: { attempts: 1 } },
+          },
+        };
+      }
+
+      const attempts = entry.attempts + 1;
+      if (typeof result === 'object') {
+        this.stats.stale++;
+        return {
+          updateOne: {
+            filter,
+            update: { $set: { status: 'stale' as const, attempts, last_error: result.stale, completed_at: completedAt } },
+          },
+        };
+      }
+
+      const error = result;
+      if (attempts >= this.cfg.maxAttempts) {
+        this.stats.failed++;
+        return {
+          updateOne: {
+            filter,
+            update: { $set: { status: 'failed' as const, attempts, last_error: error, completed_at: completedAt } },
+          },
+        };
+      }
+
+      this.stats.retried++;
+      const retryAt = now + this.cfg.retryDelayMs;
+      if (retryAt <= this.loadedUntil) this.enqueue({ ...entry, due_at: retryAt, attempts });
+      return {
+        updateOne: {
+          filter,
+          update: { $set: { due_at: retryAt, attempts, last_error: error } },
+        },
+      };
+    });
+
+    try {
+      await this.jobs!.bulkWrite(ops, { ordered: false });
+    } catch (error: any) {
+      // Jobs whose write failed are still pending in storage with their old
+      // due_at, below loadedUntil, so refill would never see them again:
+      // rewind the window and refill on the next tick (a rerun upserts the
+      // same snapshot)
+      const earliest = Math.min(...batch.map(e => e.due_at));
+      this.loadedUntil = Math.min(this.loadedUntil, earliest - 1);
+      this.lastRefillAt = -Infinity;
+      console.error(`[HorizonScheduler] Status write failed, reloading from storage: ${error.message}`);
+    }
+  }
+}
@@ -12,3 +12,5 @@ export type {
   Outcome, 
   OutcomeLabel 
 } from './price-layer.service.js';
+export { HorizonScheduler } from './horizon.scheduler.js';
+export type { HorizonJob, HorizonJobResult, HorizonSchedulerStats } from './horizon.scheduler.js';
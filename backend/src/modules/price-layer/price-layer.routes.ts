@@ -10,6 +10,7 @@
  * - GET /api/v5/price-layer/signal/:id — Get signal with all price data
  * - GET /api/v5/price-layer/correlation — Get correlation matrix
  * - GET /api/v5/price-layer/price/:asset — Get current price
+ * - GET /api/v5/price-layer/scheduler — Horizon scheduler state + backlog
  */
 
 import { FastifyInstance, FastifyRequest, FastifyReply } from 'fastify';
@@ -547,5 +548,26 @@ export async function priceLayerRoutes(app: FastifyInstance): Promise<void> {
     }
   });
   
+  /**
+   * GET /api/v5/price-layer/scheduler
+   * Horizon scheduler state and persisted backlog
+   */
+  app.get('/api/v5/price-layer/scheduler', async (req: FastifyRequest, reply: FastifyReply) => {
+    try {
+      const stats = await priceLayerService.getSchedulerStats();
+      
+      return reply.send({
+        ok: true,
+        data: stats,
+      });
+    } catch (error: any) {
+      return reply.status(500).send({
+        ok: false,
+        error: 'SCHEDULER_ERROR',
+        message: error.message,
+      });
+    }
+  });
+  
   console.log('[PriceLayer] S5.2 + S5.3 routes registered');
 }
@@ -6,7 +6,8 @@
  * Architecture:
  * - PriceProvider: Unified interface for price data
  * - SnapshotCollector: Collects price at signal timestamps
- * - HorizonScheduler: Schedules future price snapshots
+ * - HorizonScheduler: Schedules future price snapshots (durable, batched —
+ *   see horizon.scheduler.ts)
  * - ReactionCalculator: Calculates price deltas
  * 
  * Status: S5.2 IMPLEMENTATION
@@ -15,6 +16,13 @@
  */
 
 import { MongoClient, Collection, Db, ObjectId } from 'mongodb';
+import {
+  HorizonScheduler,
+  type DueHorizonJob,
+  type HorizonJob,
+  type HorizonJobResult,
+  type HorizonSchedulerStats,
+} from './horizon.scheduler.js';
 
 // S6.1 — Observation Model integration (lazy import to avoid circular deps)
 let observationServiceModule: typeof import('../observation/observation.service.js') | null = null;
@@ -173,6 +181,11 @@ const OUTCOME_CONFIDENCE = {
   NONE: 0.50,     // Low confidence when flat (could go either way)
 };
 
+// A horizon snapshot collected later than this after its target time
+// uses the historical price at the target (spot would be a later price);
+// without a stored price that close to the target it is marked stale
+const SNAPSHOT_LAG_TOLERANCE_MS = 2 * 60 * 1000;
+
 // Asset mapping for CoinGecko
 const ASSET_MAP: Record<string, string> = {
   'BTC': 'bitcoin',
@@ -265,18 +278,9 @@ class PriceProvider {
       const db = await this.connectDb();
       const collection = db.collection('price_points');
       
-      // Map asset to tokenSymbol in price_points
-      const symbolMap: Record<string, string> = {
-        'ETH': 'WETH',
-        'WETH': 'WETH',
-        // BTC doesn't have DEX price, only ETH-based
-      };
-      
-      const symbol = symbolMap[asset] || asset;
-      
       // Get latest price
       const latest = await collection.findOne(
-        { tokenSymbol: symbol },
+        { tokenSymbol: dbSymbol(asset) },
         { sort: { timestamp: -1 } }
       );
       
@@ -297,6 +301,48 @@ class PriceProvider {
     }
   }
   
+  /**
+   * Historical prices from price_points for many timestamps of one asset
+   * (one range query): for each timestamp the latest point at or before
+   * it, at most `toleranceMs` older. Timestamps without one are missing.
+   */
+  async getPricesAt(asset: string, timestamps: number[], toleranceMs: number): Promise<Map<number, PricePoint>> {
+    const normalizedAsset = asset.toUpperCase();
+    const prices = new Map<number, PricePoint>();
+    if (timestamps.length === 0) return prices;
+    
+    const targets = [...new Set(timestamps)].sort((a, b) => a - b);
+    try {
+      const db = await this.connectDb();
+      const points = await db.collection('price_points')
+        .find(
+          {
+            tokenSymbol: dbSymbol(normalizedAsset),
+            timestamp: {
+              $gte: new Date(targets[0] - toleranceMs),
+              $lte: new Date(targets[targets.length - 1]),
+            },
+          },
+          { projection: { _id: 0, timestamp: 1, priceUsd: 1 }, sort: { timestamp: 1 } }
+        )
+        .toArray();
+      
+      // Both sorted: walk the points once
+      let k = -1;
+      for (const target of targets) {
+        while (k + 1 < points.length && new Date(points[k + 1].timestamp).getTime() <= target) k++;
+        if (k < 0) continue;
+        const ts = new Date(points[k].timestamp).getTime();
+        const price = parseFloat(points[k].priceUsd);
+        if (target - ts > toleranceMs || !price) continue;
+        prices.set(target, { asset: normalizedAsset, timestamp: ts, price, source: 'dex' });
+      }
+    } catch (error) {
+      console.error(`[PriceProvider] DB error: ${error}`);
+    }
+    return prices;
+  }
+  
   /**
    * Get price from CoinGecko API
    */
@@ -358,6 +404,18 @@ class PriceProvider {
   }
 }
 
+/**
+ * tokenSymbol of an asset in price_points
+ */
+function dbSymbol(asset: string): string {
+  const symbolMap: Record<string, string> = {
+    'ETH': 'WETH',
+    'WETH': 'WETH',
+    // BTC doesn't have DEX price, only ETH-based
+  };
+  return symbolMap[asset] || asset;
+}
+
 // ============================================================
 // PRICE LAYER SERVICE
 // ============================================================
@@ -370,8 +428,11 @@ class PriceLayerService {
   private priceReactions: Collection<PriceReaction> | null = null;
   private outcomes: Collection<Outcome> | null = null;
   
+  private horizonJobs: Collection<HorizonJob> | null = null;
+  
   private priceProvider = new PriceProvider();
-  private pendingSnapshots: Map<string, NodeJS.Timeout[]> = new Map();
+  private scheduler = new HorizonScheduler();
+  private schedulerStart: Promise<void> | null = null;
   
   /**
    * Connect to MongoDB
@@ -388,6 +449,7 @@ class PriceLayerService {
     this.priceObservations = this.db.collection('price_observations');
     this.priceReactions = this.db.collection('price_reactions');
     this.outcomes = this.db.collection('outcomes');
+    this.horizonJobs = this.db.collection('price_horizon_jobs');
     
     // Create indexes
     await this.signalEvents.createIndex({ signal_id: 1 }, { unique: true });
@@ -430,36 +492,110 @@ class PriceLayerService {
     await this.collectPriceSnapshot(signal_id, data.asset, data.timestamp, 't0');
     
     // Schedule future snapshots
-    this.scheduleSnapshots(signal_id, data.asset, data.timestamp);
+    await this.scheduleSnapshots(signal_id, data.asset, data.timestamp);
     
     console.log(`[PriceLayer] Created SignalEvent: ${signal_id} for ${data.asset}`);
     
     return signalEvent;
   }
   
+  /**
+   * Start the horizon scheduler (loads and catches up the persisted
+   * backlog). Safe to call repeatedly.
+   */
+  async startScheduler(): Promise<void> {
+    if (!this.schedulerStart) {
+      this.schedulerStart = (async () => {
+        await this.connect();
+        if (!this.horizonJobs) throw new Error('Not connected');
+        await this.scheduler.start(this.horizonJobs, (jobs) => this.runDueSnapshots(jobs));
+      })();
+      this.schedulerStart.catch(() => { this.schedulerStart = null; });
+    }
+    return this.schedulerStart;
+  }
+  
   /**
    * Schedule price snapshots for all horizons
    */
-  private scheduleSnapshots(signal_id: string, asset: string, t0: number): void {
-    const timeouts: NodeJS.Timeout[] = [];
+  private async scheduleSnapshots(signal_id: string, asset: string, t0: number): Promise<void> {
+    await this.startScheduler();
+    
+    // Due times are relative to creation (as the per-signal timers were)
+    const now = Date.now();
+    await this.scheduler.schedule(
+      HORIZONS.filter(h => h.key !== 't0').map(h => ({
+        signal_id,
+        asset,
+        horizon: h.key as HorizonJob['horizon'],
+        target_ts: t0 + h.delay,
+        due_at: now + h.delay,
+      }))
+    );
+  }
+  
+  /**
+   * Run one batch of due snapshots: per asset one spot price for the jobs
+   * on time and one historical lookup for the late ones (backlog after a
+   * restart, retries), then collect + react for every job. A late job
+   * never gets the spot price; without a price near its target it is stale.
+   */
+  private async runDueSnapshots(jobs: DueHorizonJob[]): Promise<HorizonJobResult[]> {
+    const now = Date.now();
+    const isLate = (job: DueHorizonJob) => now - job.target_ts > SNAPSHOT_LAG_TOLERANCE_MS;
     
-    for (const horizon of HORIZONS) {
-      if (horizon.key === 't0') continue; // Already collected
+    const assets = [...new Set(jobs.map(j => j.asset))];
+    const spot = new Map<string, PricePoint | null>();
+    const historical = new Map<string, Map<number, PricePoint>>();
+    await Promise.all(assets.map(async (asset) => {
+      const assetJobs = jobs.filter(j => j.asset === asset);
+      const late = assetJobs.filter(isLate).map(j => j.target_ts);
+      if (late.length < assetJobs.length) {
+        spot.set(asset, await this.priceProvider.getPrice(asset));
+      }
+      if (late.length > 0) {
+        historical.set(asset, await this.priceProvider.getPricesAt(asset, late, SNAPSHOT_LAG_TOLERANCE_MS));
+      }
+    }));
+    
+    return Promise.all(jobs.map(async (job): Promise<HorizonJobResult> => {
+      const late = isLate(job);
+      const pricePoint = late
+        ? historical.get(job.asset)?.get(job.target_ts)
+        : spot.get(job.asset);
+      if (!pricePoint) {
+        return late
+          ? { stale: `No stored price for ${job.asset} near target (${Math.round((now - job.target_ts) / 1000)}s late)` }
+          : `No price for ${job.asset}`;
+      }
       
-      const timeout = setTimeout(async () => {
-        const targetTs = t0 + horizon.delay;
-        await this.collectPriceSnapshot(signal_id, asset, targetTs, horizon.key);
-        
-        // Calculate reaction after collecting
-        if (horizon.key !== 't0') {
-          await this.calculateReaction(signal_id, horizon.key as any);
-        }
-      }, horizon.delay);
+      const observation = await this.collectPriceSnapshot(
+        job.signal_id, job.asset, job.target_ts, job.horizon, pricePoint
+      );
+      if (!observation) return 'Snapshot not stored';
       
-      timeouts.push(timeout);
-    }
-    
-    this.pendingSnapshots.set(signal_id, timeouts);
+      await this.calculateReaction(job.signal_id, job.horizon);
+      return undefined;
+    }));
+  }
+  
+  /**
+   * Horizon scheduler state + persisted backlog
+   */
+  async getSchedulerStats(): Promise<HorizonSchedulerStats & {
+    pending: number;
+    overdue: number;
+    failedTotal: number;
+    staleTotal: number;
+  }> {
+    const backlog = await this.scheduler.getBacklog();
+    return {
+      ...this.scheduler.getStats(),
+      pending: backlog.pending,
+      overdue: backlog.overdue,
+      failedTotal: backlog.failed,
+      staleTotal: backlog.stale,
+    };
   }
   
   /**
@@ -469,13 +605,14 @@ class PriceLayerService {
     signal_id: string,
     asset: string,
     timestamp: number,
-    horizon: PriceObservation['horizon']
+    horizon: PriceObservation['horizon'],
+    knownPrice?: PricePoint
   ): Promise<PriceObservation | null> {
     await this.connect();
     if (!this.priceObservations) throw new Error('Not connected');
     
     try {
-      const pricePoint = await this.priceProvider.getPrice(asset);
+      const pricePoint = knownPrice ?? await this.priceProvider.getPrice(asset);
       if (!pricePoint) {
         console.error(`[PriceLayer] Failed to get price for ${asset} at ${horizon}`);
         return null;
@@ -0,0 +1,131 @@
+/**
+ * S5.2 — HIERARCHICAL TIMER WHEEL
+ *
+ * One in-memory wheel for many timers (instead of one setTimeout each).
+ *
+ * - Level 0 has `slots` buckets of one tick; level l buckets span
+ *   slots^l ticks. A timer goes to the lowest level whose span covers its
+ *   distance from the cursor, in the bucket of its absolute due tick.
+ * - When the cursor enters a new level-l bucket range, that bucket is
+ *   cascaded down, so a timer is touched O(levels) times in total.
+ * - Timers beyond the top level wait in an overflow list.
+ *
+ * add() and advance() are O(1) amortized per timer; an empty wheel jumps
+ * straight to `now`.
+ */
+
+export class TimerWheel<T> {
+  private buckets: T[][][];          // [level][slot] -> items
+  private dueTicks: number[][][];    // parallel to buckets
+  private overflow: Array<{ tick: number; item: T }> = [];
+  private cursor: number;            // last processed tick
+  private count = 0;
+
+  constructor(
+    private tickMs = 1000,
+    private slots = 64,
+    private levels = 3,
+    startMs = Date.now()
+  ) {
+    this.cursor = Math.floor(startMs / tickMs);
+    this.buckets = Array.from({ length: levels }, () => Array.from({ length: slots }, () => []));
+    this.dueTicks = Array.from({ length: levels }, () => Array.from({ length: slots }, () => []));
+  }
+
+  get size(): number {
+    return this.count;
+  }
+
+  /**
+   * Add an item due at `dueMs`. Returns false when it is already due
+   * (the caller should run it now).
+   */
+  add(dueMs: number, item: T): boolean {
+    const tick = Math.floor(dueMs / this.tickMs);
+    if (tick <= this.cursor) return false;
+    this.place(tick, item);
+    this.count++;
+    return true;
+  }
+
+  /**
+   * Move the cursor to `nowMs` and return every item due by then
+   */
+  advance(nowMs: number): T[] {
+    const target = Math.floor(nowMs / this.tickMs);
+    const due: T[] = [];
+
+    while (this.cursor < target) {
+      if (this.count === 0) {
+        this.cursor = target;
+        break;
+      }
+      this.cursor++;
+      this.cascade(due);
+
+      const slot = this.cursor % this.slots;
+      const items = this.buckets[0][slot];
+      if (items.length) {
+        for (const item of items) due.push(item);
+        this.count -= items.length;
+        this.buckets[0][slot] = [];
+        this.dueTicks[0][slot] = [];
+      }
+    }
+
+    return due;
+  }
+
+  // ============================================================
+  // INTERNALS
+  // ============================================================
+
+  private place(tick: number, item: T): void {
+    const delta = tick - this.cursor;
+    let span = 1;
+    for (let level = 0; level < this.levels; level++) {
+      if (delta < span * this.slots) {
+        const slot = Math.floor(tick / span) % this.slots;
+        this.buckets[level][slot].push(item);
+        this.dueTicks[level][slot].push(tick);
+        return;
+      }
+      span *= this.slots;
+    }
+    this.overflow.push({ tick, item });
+  }
+
+  /**
+   * Re-place buckets whose range starts at the cursor, top level first
+   */
+  private cascade(due: T[]): void {
+    let span = Math.pow(this.slots, this.levels);
+    if (this.cursor % span === 0 && this.overflow.length) {
+      const overflow = this.overflow;
+      this.overflow = [];
+      for (const { tick, item } of overflow) this.replace(tick, item, due);
+    }
+
+    for (let level = this.levels - 1; level >= 1; level--) {
+      span /= this.slots;
+      if (this.cursor % span !== 0) continue;
+
+      const slot = Math.floor(this.cursor / span) % this.slots;
+      const items = this.buckets[level][slot];
+      if (!items.length) continue;
+      const ticks = this.dueTicks[level][slot];
+      this.buckets[level][slot] = [];
+      this.dueTicks[level][slot] = [];
+      for (let i = 0; i < items.length; i++) this.replace(ticks[i], items[i], due);
+    }
+  }
+
+  private replace(tick: number, item: T, due: T[]): void {
+    if (tick <= this.cursor) {
+      due.push(item);
+      this.count--;
+    } else {
+      this.place(tick, item);
+    }
+  }
+}
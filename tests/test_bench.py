@@ -0,0 +1,164 @@
+"""
+Benchmark harness (backend/bench): nearest-rank percentiles, baseline
+regression rules and the load generator's measure window. The load
+generator runs against an in-process httpx mock transport.
+"""
+import asyncio
+import os
+import sys
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from bench import loadgen  # noqa: E402
+from bench.baseline import Thresholds, compare  # noqa: E402
+from bench.scenarios import Endpoint, Scenario  # noqa: E402
+from bench.stats import EndpointStats, Recorder, RunResult, percentile  # noqa: E402
+
+
+def stats(name: str = "TOTAL", requests: int = 100, errors: int = 0, rps: float = 50.0,
+          p50: float = 20.0, p95: float = 40.0, p99: float = 60.0) -> EndpointStats:
+    return EndpointStats(
+        name=name,
+        requests=requests,
+        errors=errors,
+        error_rate=errors / requests if requests else 0.0,
+        throughput_rps=rps,
+        mean_ms=p50,
+        p50_ms=p50,
+        p95_ms=p95,
+        p99_ms=p99,
+        max_ms=p99,
+    )
+
+
+def run(total: EndpointStats, **endpoints: EndpointStats) -> RunResult:
+    return RunResult(
+        scenario="dashboard",
+        target="direct",
+        base_url="http://127.0.0.1:8002",
+        concurrency=8,
+        duration_s=10.0,
+        started_at="2026-01-01T00:00:00+00:00",
+        endpoints=endpoints,
+        total=total,
+    )
+
+
+# ═══════════════════════════════════════════════════════════════
+# percentile
+# ═══════════════════════════════════════════════════════════════
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile(values, 0) == 1.0
+
+
+def test_percentile_small_and_empty_lists():
+    assert percentile([], 95) == 0.0
+    assert percentile([7.0], 1) == 7.0
+    assert percentile([7.0], 99) == 7.0
+    # Rank ceil(0.95 * 3) = 3: the slowest of three samples
+    assert percentile([1.0, 2.0, 30.0], 95) == 30.0
+    assert percentile([1.0, 2.0, 30.0], 50) == 2.0
+
+
+def test_recorder_summary():
+    rec = Recorder()
+    for latency in (30.0, 10.0, 20.0):
+        rec.record(latency, "200", True, 100)
+    rec.record(40.0, "500", False)
+    s = rec.summarize("x", 2.0)
+    assert (s.requests, s.errors, s.error_rate, s.throughput_rps) == (4, 1, 0.25, 2.0)
+    assert (s.p50_ms, s.max_ms, s.mean_ms) == (20.0, 40.0, 25.0)
+    assert s.status_counts == {"200": 3, "500": 1}
+    assert s.bytes == 300
+
+
+# ═══════════════════════════════════════════════════════════════
+# baseline.compare
+# ═══════════════════════════════════════════════════════════════
+
+def test_compare_equal_runs_has_no_regressions():
+    base = run(stats(), terminal=stats("terminal"))
+    assert compare(base, run(stats(), terminal=stats("terminal"))) == []
+
+
+def test_compare_latency_needs_relative_and_absolute_growth():
+    base = run(stats(p50=2.0, p95=100.0))
+    # p50 doubled but only by 2ms; p95 grew 10% only
+    assert compare(base, run(stats(p50=4.0, p95=110.0))) == []
+
+    regressions = compare(base, run(stats(p50=8.0, p95=130.0)))
+    assert [(r.metric, r.baseline, r.current) for r in regressions] == [
+        ("p50_ms", 2.0, 8.0),
+        ("p95_ms", 100.0, 130.0),
+    ]
+    assert round(regressions[1].change, 6) == 0.3
+
+
+def test_compare_throughput_and_error_rate():
+    base = run(stats(rps=100.0, errors=0))
+    assert compare(base, run(stats(rps=86.0, errors=1))) == []
+
+    regressions = compare(base, run(stats(rps=80.0, errors=5)))
+    assert sorted(r.metric for r in regressions) == ["error_rate", "throughput_rps"]
+
+
+def test_compare_judges_throughput_on_total_only():
+    base = run(stats(), terminal=stats("terminal", rps=40.0), chart=stats("chart", requests=0))
+    current = run(
+        stats(),
+        terminal=stats("terminal", rps=10.0, p99=200.0),
+        chart=stats("chart", p99=500.0),    # no baseline samples: not judged
+        health=stats("health", p99=500.0),  # not in the baseline
+    )
+    regressions = compare(base, current)
+    assert [(r.endpoint, r.metric) for r in regressions] == [("terminal", "p99_ms")]
+
+
+def test_compare_custom_thresholds():
+    base = run(stats(p95=100.0))
+    current = run(stats(p95=110.0))
+    assert compare(base, current) == []
+    assert [r.metric for r in compare(base, current, Thresholds(latency_pct=0.05))] == ["p95_ms"]
+
+
+# ═══════════════════════════════════════════════════════════════
+# run_scenario measure window
+# ═══════════════════════════════════════════════════════════════
+
+def test_requests_finishing_after_the_deadline_are_recorded(monkeypatch):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.6 if request.url.path == "/slow" else 0.01)
+        return httpx.Response(200, json={"ok": True})
+
+    real_client = httpx.AsyncClient
+
+    def mock_client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(loadgen.httpx, "AsyncClient", mock_client)
+    scenario = Scenario(
+        name="mixed",
+        description="one slow endpoint",
+        endpoints=[Endpoint("slow", "/slow", weight=1), Endpoint("fast", "/fast", weight=1)],
+        concurrency=4,
+        duration=0.3,
+        warmup=0.0,
+    )
+    result = asyncio.run(loadgen.run_scenario(scenario, loadgen.LoadConfig(base_url="http://bench.test")))
+
+    # Slow requests started inside the 0.3s window all finish after it
+    slow = result.endpoints["slow"]
+    assert slow.requests >= 1
+    assert slow.p99_ms >= 600.0
+    assert result.total.requests == slow.requests + result.endpoints["fast"].requests
+    # Throughput is taken over the real span up to the last finish
+    assert result.duration_s >= 0.6
+    assert abs(result.total.throughput_rps - result.total.requests / result.duration_s) < 0.1
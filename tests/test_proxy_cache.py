@@ -0,0 +1,249 @@
+"""
+Proxy response cache (backend/proxy_cache.py): TTL expiry, single-flight
+coalescing, ETag / 304 decisions and purge semantics. Pure asyncio, no
+running backend needed.
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from proxy_cache import (  # noqa: E402
+    CachedResponse,
+    ResponseCache,
+    cache_key,
+    cache_ttl,
+    etag_matches,
+    not_modified,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_loader(body: bytes = b'{"ok":true}', status_code: int = 200):
+    calls = []
+
+    async def load() -> CachedResponse:
+        calls.append(1)
+        return CachedResponse(status_code=status_code, headers=[("content-type", "application/json")], body=body)
+
+    return load, calls
+
+
+def test_hit_until_ttl_expires():
+    async def run():
+        clock = FakeClock()
+        cache = ResponseCache(clock=clock)
+        load, calls = make_loader()
+
+        _, first = await cache.fetch("k", 10.0, load)
+        _, second = await cache.fetch("k", 10.0, load)
+        clock.now += 9.9
+        _, third = await cache.fetch("k", 10.0, load)
+        clock.now += 0.2
+        _, fourth = await cache.fetch("k", 10.0, load)
+
+        assert [first, second, third, fourth] == ["MISS", "HIT", "HIT", "MISS"]
+        assert len(calls) == 2
+
+    asyncio.run(run())
+
+
+def test_concurrent_misses_share_one_load():
+    async def run():
+        cache = ResponseCache()
+        release = asyncio.Event()
+        calls = []
+
+        async def load() -> CachedResponse:
+            calls.append(1)
+            await release.wait()
+            return CachedResponse(status_code=200, headers=[], body=b"shared")
+
+        tasks = [asyncio.ensure_future(cache.fetch("k", 10.0, load)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert len(calls) == 1
+        assert sorted(outcome for _, outcome in results) == ["COALESCED", "COALESCED", "MISS"]
+        assert all(response.body == b"shared" for response, _ in results)
+        assert cache.stats()["inflight"] == 0
+
+    asyncio.run(run())
+
+
+def test_cancelled_first_caller_does_not_cancel_shared_load():
+    async def run():
+        cache = ResponseCache()
+        release = asyncio.Event()
+
+        async def load() -> CachedResponse:
+            await release.wait()
+            return CachedResponse(status_code=200, headers=[], body=b"x")
+
+        first = asyncio.ensure_future(cache.fetch("k", 10.0, load))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(cache.fetch("k", 10.0, load))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        response, outcome = await second
+        assert (response.body, outcome) == (b"x", "COALESCED")
+        assert cache.get("k") is not None
+
+    asyncio.run(run())
+
+
+def test_only_200_responses_are_stored():
+    async def run():
+        cache = ResponseCache()
+        load, calls = make_loader(body=b'{"ok":false}', status_code=503)
+
+        await cache.fetch("k", 10.0, load)
+        _, outcome = await cache.fetch("k", 10.0, load)
+
+        assert outcome == "MISS"
+        assert len(calls) == 2
+
+    asyncio.run(run())
+
+
+def test_etag_and_not_modified():
+    a = CachedResponse(status_code=200, headers=[], body=b"alpha")
+    b = CachedResponse(status_code=200, headers=[], body=b"beta")
+
+    assert a.etag == CachedResponse(status_code=200, headers=[], body=b"alpha").etag
+    assert a.etag != b.etag
+    assert a.etag.startswith('"') and a.etag.endswith('"')
+
+    assert etag_matches(a.etag, a.etag)
+    assert etag_matches(f"W/{a.etag}", a.etag)
+    assert etag_matches(f"{b.etag}, {a.etag}", a.etag)
+    assert etag_matches("*", a.etag)
+    assert not etag_matches(b.etag, a.etag)
+
+    assert not_modified(a, a.etag)
+    assert not not_modified(a, "")
+    assert not not_modified(a, b.etag)
+    # Errors are never answered with 304
+    error = CachedResponse(status_code=500, headers=[], body=b"alpha")
+    assert not not_modified(error, error.etag)
+
+
+def test_purge_drops_entries_and_inflight_results():
+    async def run():
+        cache = ResponseCache()
+        load, _ = make_loader()
+        await cache.fetch("a", 10.0, load)
+        await cache.fetch("b", 10.0, load)
+
+        assert cache.purge() == 2
+        assert cache.get("a") is None
+        assert cache.stats()["bytes"] == 0
+
+        # A load that started before the purge is returned but not stored
+        release = asyncio.Event()
+
+        async def slow() -> CachedResponse:
+            await release.wait()
+            return CachedResponse(status_code=200, headers=[], body=b"stale")
+
+        pending = asyncio.ensure_future(cache.fetch("c", 10.0, slow))
+        await asyncio.sleep(0)
+        cache.purge()
+        release.set()
+        response, _ = await pending
+
+        assert response.body == b"stale"
+        assert cache.get("c") is None
+        assert cache.stats()["purges"] == 2
+
+    asyncio.run(run())
+
+
+def test_requests_after_purge_do_not_join_an_older_load():
+    async def run():
+        cache = ResponseCache()
+        releases = {b"old": asyncio.Event(), b"new": asyncio.Event()}
+        calls = []
+
+        def loader(body: bytes):
+            async def load() -> CachedResponse:
+                calls.append(body)
+                await releases[body].wait()
+                return CachedResponse(status_code=200, headers=[], body=body)
+            return load
+
+        async def settle():
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+        old = asyncio.ensure_future(cache.fetch("k", 10.0, loader(b"old")))
+        await settle()
+        cache.purge()
+        assert cache.stats()["inflight"] == 0
+
+        new = asyncio.ensure_future(cache.fetch("k", 10.0, loader(b"new")))
+        joined = asyncio.ensure_future(cache.fetch("k", 10.0, loader(b"unused")))
+        await settle()
+        assert calls == [b"old", b"new"]
+
+        # The old load finishing must not drop the new load's in-flight entry
+        releases[b"old"].set()
+        old_response, old_outcome = await old
+        assert (old_response.body, old_outcome) == (b"old", "MISS")
+        assert cache.stats()["inflight"] == 1
+        late = asyncio.ensure_future(cache.fetch("k", 10.0, loader(b"unused")))
+        await settle()
+
+        releases[b"new"].set()
+        results = await asyncio.gather(new, joined, late)
+        assert [(r.body, outcome) for r, outcome in results] == [
+            (b"new", "MISS"), (b"new", "COALESCED"), (b"new", "COALESCED"),
+        ]
+        assert calls == [b"old", b"new"]
+        assert cache.get("k").body == b"new"
+        assert cache.stats()["inflight"] == 0
+
+    asyncio.run(run())
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    async def run():
+        cache = ResponseCache(max_entries=2, max_bytes=10, max_entry_bytes=8)
+        load4, _ = make_loader(body=b"1234")
+        load9, _ = make_loader(body=b"123456789")
+
+        await cache.fetch("a", 10.0, load4)
+        await cache.fetch("b", 10.0, load4)
+        cache.get("a")                       # a is now most recent
+        await cache.fetch("c", 10.0, load4)  # evicts b
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+
+        await cache.fetch("big", 10.0, load9)  # above max_entry_bytes
+        assert cache.get("big") is None
+        assert cache.stats()["bytes"] == 8
+
+    asyncio.run(run())
+
+
+def test_routes_and_keys():
+    assert cache_ttl("fractal/v2.1/admin/overview") is None
+    assert cache_ttl("fractal/signal") == 10.0
+    assert cache_ttl("fractal/v2.1/chart") == 30.0
+    assert cache_ttl("fractal/v2.1/terminal") == 15.0
+    assert cache_ttl("twitter/accounts") is None
+
+    assert cache_key("GET", "fractal/signal", [("b", "2"), ("a", "1")]) == \
+        cache_key("GET", "fractal/signal", [("a", "1"), ("b", "2")])